@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+
+import os
+import queue
+import shutil
+import contextlib
+import tarfile
+import zipfile
+import tempfile
+import threading
+
+# zstd-compressed archives need the zstandard package, the other compressions are in the standard library
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Members of an archive that are logs: binary logs, or darshan-parser output
+LOG_SUFFIXES = ('.darshan', '.txt', '.txt.gz')
+
+# Logs extracted ahead of the analysis, so decompression overlaps with it
+PREFETCH = 4
+
+# Extracted logs are kept in memory when the system has a RAM-backed file system, instead of on disk
+BUFFERS = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+CHUNK = 4 * 1024 ** 2
+
+
+def is_zstd(path):
+    with open(path, 'rb') as f:
+        return f.read(len(ZSTD_MAGIC)) == ZSTD_MAGIC
+
+
+def is_archive(path):
+    """
+    Whether a path is a tar archive (plain, or gzip, bzip2, xz, or zstd-compressed) or a zip archive.
+    """
+    if not os.path.isfile(path):
+        return False
+
+    return is_zstd(path) or zipfile.is_zipfile(path) or tarfile.is_tarfile(path)
+
+
+def members(path):
+    """
+    Iterate over the logs of an archive, as pairs of the name of the member and a file object to read it from.
+
+    Tar archives are read as a stream, so each member must be read before the next one, and compressed archives
+    are decompressed only once, from start to end.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and info.filename.endswith(LOG_SUFFIXES):
+                    with archive.open(info) as source:
+                        yield info.filename, source
+
+        return
+
+    if is_zstd(path):
+        if zstandard is None:
+            raise RuntimeError('Reading zstd-compressed archives requires the zstandard package: {}'.format(path))
+
+        stream = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+        archive = tarfile.open(fileobj=stream, mode='r|')
+    else:
+        stream = None
+        archive = tarfile.open(path, mode='r|*')
+
+    try:
+        for member in archive:
+            if member.isfile() and member.name.endswith(LOG_SUFFIXES):
+                yield member.name, archive.extractfile(member)
+    finally:
+        archive.close()
+
+        if stream is not None:
+            stream.close()
+
+
+def extract(name, source, directory=BUFFERS):
+    """
+    Copy a member of an archive to a temporary file, since the Darshan library only reads logs from a path.
+    """
+    suffix = next(suffix for suffix in LOG_SUFFIXES[::-1] if name.endswith(suffix))
+
+    with tempfile.NamedTemporaryFile('wb', dir=directory, prefix='drishti-', suffix=suffix, delete=False) as f:
+        try:
+            shutil.copyfileobj(source, f, CHUNK)
+        except BaseException:
+            os.remove(f.name)
+
+            raise
+
+    return f.name
+
+
+def locate(spec):
+    """
+    Split a log named as archive:member into the path of the archive and the name of the member, or return None
+    when it names a file.
+    """
+    if os.path.exists(spec):
+        return None
+
+    position = spec.find(':')
+
+    while position > 0:
+        if is_archive(spec[:position]):
+            return spec[:position], spec[position + 1:]
+
+        position = spec.find(':', position + 1)
+
+    return None
+
+
+@contextlib.contextmanager
+def opened(spec, directory=BUFFERS):
+    """
+    Path to read a log from, for a file or for a member of an archive named as archive:member. A member is copied
+    to a temporary buffer, which is removed on exit.
+    """
+    location = locate(spec)
+
+    if location is None:
+        yield spec
+
+        return
+
+    path, name = location
+
+    filename = None
+
+    with contextlib.closing(members(path)) as logs:
+        for member, source in logs:
+            if member == name:
+                filename = extract(name, source, directory)
+
+                break
+
+    if filename is None:
+        raise FileNotFoundError('No log named {} in {}'.format(name, path))
+
+    try:
+        yield filename
+    finally:
+        os.remove(filename)
+
+
+def _put(items, stop, item):
+    """
+    Wait for room in the queue, unless the consumer has stopped, in which case the extracted log is removed.
+    """
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+
+            return True
+        except queue.Full:
+            pass
+
+    if isinstance(item, tuple) and item[2]:
+        os.remove(item[1])
+
+    return False
+
+
+def _produce(paths, items, stop):
+    try:
+        for path in paths:
+            if not is_archive(path):
+                if not _put(items, stop, (path, path, False)):
+                    return
+
+                continue
+
+            for name, source in members(path):
+                if stop.is_set():
+                    return
+
+                item = ('{}:{}'.format(path, name), extract(name, source), True)
+
+                if not _put(items, stop, item):
+                    return
+    except Exception as e:
+        _put(items, stop, e)
+
+        return
+
+    _put(items, stop, None)
+
+
+def logs(paths, prefetch=PREFETCH):
+    """
+    Iterate over the logs of files and archives, as pairs of a name and a path to analyze.
+
+    Archives are never extracted to their directory: a thread copies their members to temporary buffers, up to
+    prefetch logs ahead of the analysis, and each buffer is removed once the analysis asks for the next log.
+    Files that are not archives are analyzed in place.
+    """
+    items = queue.Queue(maxsize=max(prefetch, 1))
+    stop = threading.Event()
+
+    producer = threading.Thread(target=_produce, args=(paths, items, stop), daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item = items.get()
+
+            if item is None:
+                break
+
+            if isinstance(item, Exception):
+                raise item
+
+            name, path, temporary = item
+
+            try:
+                yield name, path
+            finally:
+                if temporary:
+                    os.remove(path)
+    finally:
+        stop.set()
+
+        producer.join()
+
+        # Logs extracted after the analysis stopped
+        while not items.empty():
+            item = items.get()
+
+            if isinstance(item, tuple) and item[2]:
+                os.remove(item[1])
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+
+import os
+import json
+import math
+import tempfile
+import contextlib
+
+import numpy as np
+
+# Concurrent runs lock the baselines while they update them, where the platform supports it
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from drishti import imbalance
+
+
+# Number of runs after which older runs start to fade out of the baseline
+WINDOW = 30
+
+# Every metric is worse when it grows, so only the runs above their baseline have regressed
+METRICS = {
+    'bytes': 'bytes transferred',
+    'operations': 'read and write requests',
+    'small_fraction': 'fraction of small requests (< 1MB)',
+    'random_fraction': 'fraction of random requests',
+    'metadata_time': 'metadata time (seconds)',
+    'imbalance': 'coefficient of variation of the I/O time across ranks'
+}
+
+
+class RunningStats:
+    """
+    Mean and variance of a metric, updated one run at a time with Welford's algorithm in constant memory.
+
+    Once the window is full, each new run is weighted as if the baseline had the window size, so the
+    statistics follow the recent runs instead of the whole history. Besides the windowed count, it keeps the
+    number of runs in the baseline, and the values of the latest runs that regressed from it in a row.
+    """
+    __slots__ = ('count', 'mean', 'm2', 'runs', 'regressed')
+
+    def __init__(self, count=0, mean=0.0, m2=0.0, runs=None, regressed=()):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.runs = count if runs is None else runs
+        self.regressed = list(regressed)
+
+    def update(self, value, window=WINDOW):
+        self.runs += 1
+        self.regressed = []
+
+        count = min(self.count, window - 1) + 1
+
+        # Scale the accumulated squares down with the count when the window is full
+        m2 = self.m2 * (count - 1) / self.count if self.count else 0.0
+
+        delta = value - self.mean
+
+        self.mean += delta / count
+        self.m2 = m2 + delta * (value - self.mean)
+        self.count = count
+
+    def regress(self, value, runs):
+        """
+        Leave out a value that regressed from the baseline, until runs of them in a row show a lasting change,
+        which then becomes the new baseline.
+        """
+        self.regressed.append(value)
+
+        if len(self.regressed) < runs:
+            return
+
+        regressed = self.regressed
+
+        self.count, self.mean, self.m2, self.runs = 0, 0.0, 0.0, 0
+
+        for value in regressed:
+            self.update(value)
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def deviation(self, value):
+        """
+        Number of standard deviations between a value and the mean.
+        """
+        if not self.std:
+            return 0.0
+
+        return (value - self.mean) / self.std
+
+    def to_dict(self):
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2, 'runs': self.runs, 'regressed': self.regressed}
+
+
+def key(executable, nprocs):
+    """
+    Baseline of an executable for jobs of similar size, with the number of processes rounded up to a power of two.
+    """
+    return '{}:{}'.format(executable, 2 ** math.ceil(math.log2(max(nprocs, 1))))
+
+
+def metrics(counters, fcounters, nprocs):
+    """
+    Key metrics of a run, from its POSIX records.
+    """
+    operations = float((counters['POSIX_READS'] + counters['POSIX_WRITES']).sum())
+
+    small = sum(
+        counters['POSIX_SIZE_{}_{}'.format(operation, size)].sum()
+        for operation in ('READ', 'WRITE')
+        for size in ('0_100', '100_1K', '1K_10K', '10K_100K', '100K_1M')
+    )
+
+    # Sequential requests include the consecutive ones
+    sequential = (counters['POSIX_SEQ_READS'] + counters['POSIX_SEQ_WRITES']).sum()
+
+    distribution = imbalance.distribution(counters, fcounters, nprocs)
+    distribution = distribution.loc[distribution['ranks'] > 1]
+
+    return {
+        'bytes': float((counters['POSIX_BYTES_READ'] + counters['POSIX_BYTES_WRITTEN']).sum()),
+        'operations': operations,
+        'small_fraction': float(small / operations) if operations else 0.0,
+        'random_fraction': float((operations - sequential) / operations) if operations else 0.0,
+        'metadata_time': float(fcounters['POSIX_F_META_TIME'].sum()),
+        'imbalance': float(np.nan_to_num(distribution['time_cv'].max())) if len(distribution) else 0.0
+    }
+
+
+class Baselines:
+    """
+    Running statistics of the metrics of each executable, kept in a JSON file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.baselines = self.read()
+
+    def read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    @contextlib.contextmanager
+    def lock(self):
+        """
+        Hold an exclusive lock on the baselines, so the runs that update them at the same time do not lose updates.
+        """
+        if fcntl is None:
+            yield
+
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+
+            f = open('{}.lock'.format(self.path), 'a')
+        except OSError:
+            yield
+
+            return
+
+        with f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def get(self, key):
+        """
+        Running statistics of each metric of a baseline.
+        """
+        return {
+            metric: RunningStats(**stats) for metric, stats in self.baselines.get(key, {}).items()
+        }
+
+    def update(self, key, values):
+        """
+        Add the metrics of a run to its baseline and save it.
+        """
+        with self.lock():
+            self.baselines = self.read()
+
+            self.add(key, values)
+
+            self.save()
+
+    def check(self, key, values, threshold, runs):
+        """
+        Compare the metrics of a run with its baseline, and add to it the metrics that did not regress.
+
+        A regressed metric is left out, so an occasional regression never shifts the baseline towards it, but after
+        runs regressions in a row the baseline restarts from them, so a lasting change is only reported until then.
+        Returns the baseline the run was compared with, and its deviations (see deviations()).
+        """
+        with self.lock():
+            self.baselines = self.read()
+
+            baseline = self.get(key)
+
+            deviating = deviations(baseline, values, threshold, runs)
+
+            self.add(key, values, {metric for metric, _, _, _ in deviating}, runs)
+
+            self.save()
+
+        return baseline, deviating
+
+    def add(self, key, values, regressed=(), runs=None):
+        baseline = self.get(key)
+
+        for metric, value in values.items():
+            stats = baseline.setdefault(metric, RunningStats())
+
+            if metric in regressed:
+                stats.regress(value, runs)
+            else:
+                stats.update(value)
+
+        self.baselines[key] = {metric: stats.to_dict() for metric, stats in baseline.items()}
+
+    def save(self):
+        """
+        Write the baselines atomically, so concurrent runs never read a partial file.
+        """
+        directory = os.path.dirname(self.path) or '.'
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile('w', dir=directory, delete=False) as f:
+                json.dump(self.baselines, f)
+
+            os.replace(f.name, self.path)
+        except OSError:
+            pass
+
+
+def deviations(baseline, values, threshold, runs):
+    """
+    Metrics of a run that grew above the baseline by more than a number (threshold) of standard deviations.
+
+    Baselines with fewer runs than required are not trusted yet. Returns a list of (metric, value, mean, deviation) tuples.
+    """
+    result = []
+
+    for metric, value in values.items():
+        stats = baseline.get(metric)
+
+        if stats is None or stats.count < runs:
+            continue
+
+        deviation = stats.deviation(value)
+
+        if deviation > threshold:
+            result.append((metric, value, stats.mean, deviation))
+
+    return result
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+
+
+DIRECTORY = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')),
+    'drishti',
+    'results'
+)
+
+# Least recently used results are evicted beyond this total size, or once they have not been used for this long
+MAX_BYTES = 256 * 1024 ** 2
+MAX_AGE = 30 * 24 * 3600
+
+CHUNK = 4 * 1024 ** 2
+
+
+def digest(path):
+    """
+    Hash of the contents of a log, read in chunks so memory does not grow with the size of the log.
+    """
+    h = hashlib.sha256()
+
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK), b''):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def key(path, thresholds, version, options):
+    """
+    Key of the results of a log, which change with its contents, the thresholds, the version of Drishti, and the
+    options that change the analysis (but not the ones that only change how the results are displayed).
+    """
+    document = json.dumps(
+        {
+            'log': digest(path),
+            'thresholds': thresholds,
+            'version': version,
+            'options': options
+        },
+        sort_keys=True,
+        default=str
+    )
+
+    return hashlib.sha256(document.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Results of previous analyses, one JSON file per key, evicted by least recent use once they take too much
+    space or are too old.
+    """
+
+    def __init__(self, directory=DIRECTORY, max_bytes=MAX_BYTES, max_age=MAX_AGE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def path(self, key):
+        return os.path.join(self.directory, '{}.json'.format(key))
+
+    def get(self, key):
+        """
+        Return the results cached for a key, or None.
+        """
+        path = self.path(key)
+
+        try:
+            with open(path) as f:
+                results = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        # The modification time tracks the last use, so a hit keeps the entry from being evicted
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return results
+
+    def put(self, key, results, default=None):
+        """
+        Write the results of a key atomically, so concurrent runs never read a partial entry, and evict old entries.
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile('w', dir=self.directory, suffix='.tmp', delete=False) as f:
+                json.dump(results, f, default=default)
+
+            os.replace(f.name, self.path(key))
+        except OSError:
+            return
+
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the entries not used for longer than the maximum age, and the least recently used ones beyond the
+        maximum size.
+        """
+        entries = []
+
+        try:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.json'):
+                    stat = entry.stat()
+
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+
+        now = time.time()
+        total = 0
+
+        for mtime, size, path in sorted(entries, reverse=True):
+            total += size
+
+            if now - mtime > self.max_age or total > self.max_bytes:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
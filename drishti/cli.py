@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+import sys
+
+
+def main():
+    """
+    Dispatch to the comparison of two logs (drishti diff), the merge of fleet sketches (drishti sketch),
+    the evaluation of threshold sets over many logs (drishti sweep), or to the report of a single log.
+    """
+    if len(sys.argv) > 1 and sys.argv[1] == 'diff':
+        from drishti import diff
+
+        diff.main(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == 'sketch':
+        from drishti import sketches
+
+        sketches.main(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == 'sweep':
+        from drishti import sweep
+
+        sweep.main(sys.argv[2:])
+    else:
+        # The report parses the command line when it is imported
+        from drishti import main as report
+
+        report.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import time
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised at a checkpoint once the time budget of the analysis has run out.
+    """
+
+    def __init__(self, stage):
+        super().__init__('Time budget exceeded after stage {}'.format(stage))
+
+        self.stage = stage
+
+
+class Deadline:
+    """
+    Time budget of an analysis, checked between its stages. Without a budget (seconds is None) it never expires.
+
+    An optional check is called at every checkpoint as well, and may stop the analysis early by raising.
+    """
+
+    def __init__(self, seconds=None, start=None, check=None):
+        self.seconds = seconds
+        self.start = time.monotonic() if start is None else start
+        self.end = None if seconds is None else self.start + seconds
+        self.check = check
+
+        self.completed = []
+
+    def remaining(self):
+        if self.end is None:
+            return float('inf')
+
+        return max(self.end - time.monotonic(), 0.0)
+
+    def expired(self):
+        return self.remaining() <= 0.0
+
+    def share(self, fraction):
+        """
+        Budget for an expensive stage that may only use a fraction of the time left, so cheaper stages still run.
+        """
+        if self.end is None:
+            return Deadline()
+
+        return Deadline(self.remaining() * fraction)
+
+    def checkpoint(self, stage):
+        """
+        Record that a stage is complete, and stop the analysis if there is no time left for the next ones.
+        """
+        self.completed.append(stage)
+
+        if self.check is not None:
+            self.check()
+
+        if self.expired():
+            raise DeadlineExceeded(stage)
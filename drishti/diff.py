@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+import contextlib
+import subprocess
+
+import numpy as np
+import pandas as pd
+
+# Without the Darshan library only darshan-parser output can be compared
+try:
+    import darshan
+except (ImportError, RuntimeError):
+    darshan = None
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.padding import Padding
+from rich.table import Table
+from rich import box
+
+from drishti import archives
+from drishti import imbalance
+from drishti import textlog
+
+
+SIZE_BINS = ['0_100', '100_1K', '1K_10K', '10K_100K', '100K_1M', '1M_4M', '4M_10M', '10M_100M', '100M_1G', '1G_PLUS']
+
+COUNTERS = {
+    'bytes_read': 'POSIX_BYTES_READ',
+    'bytes_written': 'POSIX_BYTES_WRITTEN',
+    'reads': 'POSIX_READS',
+    'writes': 'POSIX_WRITES',
+    'opens': 'POSIX_OPENS',
+    'stats': 'POSIX_STATS',
+    'seeks': 'POSIX_SEEKS'
+}
+
+COUNTERS.update({'read_size_{}'.format(size): 'POSIX_SIZE_READ_{}'.format(size) for size in SIZE_BINS})
+COUNTERS.update({'write_size_{}'.format(size): 'POSIX_SIZE_WRITE_{}'.format(size) for size in SIZE_BINS})
+
+FCOUNTERS = {
+    'read_time': 'POSIX_F_READ_TIME',
+    'write_time': 'POSIX_F_WRITE_TIME',
+    'meta_time': 'POSIX_F_META_TIME'
+}
+
+COLUMNS = list(COUNTERS) + list(FCOUNTERS) + ['io_time']
+
+# Seconds to wait for the analysis of each log
+TIMEOUT = 600
+
+# Directory with the drishti package, for the analyses that run in temporary directories
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load(filename):
+    """
+    Read the POSIX records of a log into one DataFrame with the file path, the rank, and the compared counters.
+
+    Also returns the number of processes of the job and the coefficient of variation of the bytes and time
+    across the ranks of each file, indexed by path.
+    """
+    if textlog.is_text(filename):
+        report = textlog.TextReport(filename)
+    else:
+        if darshan is None:
+            raise RuntimeError('Reading {} requires the Darshan library, compare the darshan-parser output of the logs instead'.format(filename))
+
+        report = darshan.DarshanReport(filename, read_all=False)
+
+        report.mod_read_all_records('POSIX')
+
+    nprocs = report.metadata['job']['nprocs']
+
+    if 'POSIX' not in report.records:
+        return pd.DataFrame(columns=['id', 'path', 'rank'] + COLUMNS), nprocs, pd.DataFrame(columns=['bytes_cv', 'time_cv'])
+
+    df = report.records['POSIX'].to_df()
+
+    records = pd.DataFrame({
+        'id': df['counters']['id'],
+        'rank': df['counters']['rank']
+    })
+
+    for name, counter in COUNTERS.items():
+        records[name] = df['counters'][counter].to_numpy(dtype=np.float64)
+
+    for name, counter in FCOUNTERS.items():
+        records[name] = df['fcounters'][counter].to_numpy(dtype=np.float64)
+
+    records['io_time'] = records['read_time'] + records['write_time'] + records['meta_time']
+    records['path'] = records['id'].map(report.name_records)
+
+    distribution = imbalance.distribution(df['counters'], df['fcounters'], nprocs)
+
+    variation = distribution[['bytes_cv', 'time_cv']].groupby(distribution.index.map(report.name_records)).max()
+
+    return records, nprocs, variation
+
+
+def align(old, new, keys):
+    """
+    Aggregate both logs by the keys and align them with an outer join, with the delta of every counter.
+    """
+    old = old.groupby(keys)[COLUMNS].sum()
+    new = new.groupby(keys)[COLUMNS].sum()
+
+    aligned = old.join(new, how='outer', lsuffix='_old', rsuffix='_new').fillna(0.0)
+
+    for column in COLUMNS:
+        aligned['{}_delta'.format(column)] = aligned['{}_new'.format(column)] - aligned['{}_old'.format(column)]
+
+    aligned['status'] = np.select(
+        [~aligned.index.isin(new.index), ~aligned.index.isin(old.index)],
+        ['removed', 'added'],
+        'both'
+    )
+
+    return aligned
+
+
+def compare(old_filename, new_filename):
+    """
+    Compare the POSIX counters of two logs, aligning files by path and records by path and rank.
+
+    Returns a dictionary with the aligned files, the aligned ranks, the totals, and the imbalance of each file
+    (coefficient of variation of the bytes and time across ranks) in both logs.
+    """
+    old, old_nprocs, old_variation = load(old_filename)
+    new, new_nprocs, new_variation = load(new_filename)
+
+    files = align(old, new, ['path'])
+    ranks = align(old, new, ['path', 'rank'])
+
+    totals = {
+        column: (float(old[column].sum()), float(new[column].sum())) for column in COLUMNS
+    }
+
+    totals['processes'] = (old_nprocs, new_nprocs)
+
+    files = files.join(
+        old_variation.add_suffix('_old').join(new_variation.add_suffix('_new'), how='outer'),
+        how='left'
+    )
+
+    return {
+        'files': files,
+        'ranks': ranks,
+        'totals': totals
+    }
+
+
+def insights(filename, timeout=TIMEOUT):
+    """
+    Codes and issues of the insights detected in a log, as a list of (code, issue) pairs, running the analysis with
+    the JSON output. Returns None if the analysis failed or did not finish within the timeout.
+
+    The analysis runs in a temporary directory, where it writes the logs it converts, and without the result cache.
+    """
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (ROOT, os.environ.get('PYTHONPATH')))))
+
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            result = subprocess.run(
+                [sys.executable, '-m', 'drishti.main', '--format', 'json', '--no-cache', os.path.abspath(filename)],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=timeout, cwd=directory, env=environment
+            )
+        except subprocess.TimeoutExpired:
+            return None
+
+    if result.returncode != 0:
+        return None
+
+    try:
+        document = json.loads(result.stdout.decode('utf-8'))
+    except ValueError:
+        return None
+
+    return [(insight['code'], insight['issue']) for insight in document['insights']]
+
+
+def changes(old_insights, new_insights):
+    """
+    Insights that appeared in the new log and the ones that cleared, as (code, issue) lists.
+
+    A code can be detected several times in a log (e.g., once per module). The insights of a code are first
+    matched by their issue, and the remaining ones in order, since the same insight with different figures
+    did not appear nor clear. Only the insights left over on either side changed.
+    """
+    appeared = []
+    cleared = []
+
+    for code in sorted(set(code for code, _ in old_insights + new_insights)):
+        old = [issue for insight_code, issue in old_insights if insight_code == code]
+        new = [issue for insight_code, issue in new_insights if insight_code == code]
+
+        unmatched_old = [issue for issue in old if issue not in new]
+        unmatched_new = [issue for issue in new if issue not in old]
+
+        appeared.extend((code, issue) for issue in unmatched_new[len(unmatched_old):])
+        cleared.extend((code, issue) for issue in unmatched_old[len(unmatched_new):])
+
+    return appeared, cleared
+
+
+def variation(old, new):
+    """
+    Change of a coefficient of variation, with a dash for a log without the file.
+    """
+    return ' to '.join('-' if pd.isna(value) else '{:.2f}'.format(value) for value in (old, new))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='drishti diff',
+        description='Drishti: compare two Darshan logs of the same application'
+    )
+
+    parser.add_argument(
+        'old',
+        help='Input .darshan file or darshan-parser output before the change, or a log in a tar/zip archive as archive:member'
+    )
+
+    parser.add_argument(
+        'new',
+        help='Input .darshan file or darshan-parser output after the change, or a log in a tar/zip archive as archive:member'
+    )
+
+    parser.add_argument(
+        '--top',
+        default=10,
+        type=int,
+        dest='top',
+        help='Maximum number of files listed, ranked by the change in I/O time (0 lists all files)'
+    )
+
+    parser.add_argument(
+        '--format',
+        default='rich',
+        choices=['rich', 'json'],
+        dest='format',
+        help='Output format: a rich report (default) or a JSON document'
+    )
+
+    parser.add_argument(
+        '--timeout',
+        default=TIMEOUT,
+        type=int,
+        dest='timeout',
+        metavar='SECONDS',
+        help='Maximum number of seconds to analyze each log to compare their insights (default: {})'.format(TIMEOUT)
+    )
+
+    parser.add_argument(
+        '--path',
+        default=False,
+        action='store_true',
+        dest='full_path',
+        help='Display the full file path for the files that changed'
+    )
+
+    args = parser.parse_args(argv)
+
+    # Logs in archives are copied to temporary buffers, removed once both are analyzed
+    with contextlib.ExitStack() as stack:
+        try:
+            old, new = (stack.enter_context(archives.opened(spec)) for spec in (args.old, args.new))
+        except OSError as e:
+            sys.stderr.write('{}\n'.format(e))
+
+            sys.exit(os.EX_NOINPUT)
+
+        try:
+            result = compare(old, new)
+        except RuntimeError as e:
+            sys.stderr.write('{}\n'.format(e))
+
+            sys.exit(os.EX_UNAVAILABLE)
+
+        old_insights = insights(old, args.timeout)
+        new_insights = insights(new, args.timeout)
+
+    if old_insights is not None and new_insights is not None:
+        appeared, cleared = changes(old_insights, new_insights)
+    else:
+        appeared, cleared = None, None
+
+    files = result['files']
+
+    ranked = files.reindex(files['io_time_delta'].abs().sort_values(ascending=False).index)
+
+    if args.top:
+        ranked = ranked.head(args.top)
+
+    if args.format == 'json':
+        document = {
+            'old': os.path.basename(args.old),
+            'new': os.path.basename(args.new),
+            'totals': {
+                column: {'old': old, 'new': new, 'delta': new - old} for column, (old, new) in result['totals'].items()
+            },
+            'files': json.loads(ranked.reset_index().to_json(orient='records')),
+            'ranks': json.loads(
+                result['ranks'].reindex(
+                    result['ranks']['io_time_delta'].abs().sort_values(ascending=False).index
+                ).head(args.top if args.top else None).reset_index().to_json(orient='records')
+            ),
+            'appeared': appeared,
+            'cleared': cleared
+        }
+
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+        return
+
+    console = Console()
+
+    old_time, new_time = result['totals']['io_time']
+
+    summary = [
+        ' [b]OLD[/b]:        [white]{}[/white]'.format(os.path.basename(args.old)),
+        ' [b]NEW[/b]:        [white]{}[/white]'.format(os.path.basename(args.new)),
+        ' [b]PROCESSES[/b]:  [white]{} to {}[/white]'.format(*result['totals']['processes']),
+        ' [b]I/O TIME[/b]:   [white]{:.2f} to {:.2f} seconds ({:+.2f}%)[/white]'.format(
+            old_time, new_time, (new_time - old_time) / old_time * 100.0 if old_time else 0.0
+        ),
+        ' [b]FILES[/b]:      [white]{} in both, {} added, {} removed[/white]'.format(
+            (files['status'] == 'both').sum(), (files['status'] == 'added').sum(), (files['status'] == 'removed').sum()
+        )
+    ]
+
+    console.print(
+        Panel(
+            '\n'.join(summary),
+            title='[b][slate_blue3]DRISHTI[/slate_blue3] DIFF[/b]',
+            title_align='left',
+            padding=1
+        )
+    )
+
+    table = Table(box=box.SIMPLE)
+
+    table.add_column('FILE')
+    table.add_column('STATUS')
+    table.add_column('I/O TIME (s)', justify='right')
+    table.add_column('BYTES', justify='right')
+    table.add_column('REQUESTS', justify='right')
+    table.add_column('SMALL (<1MB)', justify='right')
+    table.add_column('META TIME (s)', justify='right')
+    table.add_column('TIME CV', justify='right')
+
+    small = ['{}_size_{}'.format(operation, size) for operation in ('read', 'write') for size in SIZE_BINS[:5]]
+
+    for path, row in ranked.iterrows():
+        small_old = sum(row['{}_old'.format(column)] for column in small)
+        small_new = sum(row['{}_new'.format(column)] for column in small)
+
+        table.add_row(
+            path if args.full_path else os.path.basename(path),
+            row['status'],
+            '{:+.2f}'.format(row['io_time_delta']),
+            '{:+,.0f}'.format(row['bytes_read_delta'] + row['bytes_written_delta']),
+            '{:+,.0f}'.format(row['reads_delta'] + row['writes_delta']),
+            '{:+,.0f}'.format(small_new - small_old),
+            '{:+.2f}'.format(row['meta_time_delta']),
+            variation(row['time_cv_old'], row['time_cv_new'])
+        )
+
+    console.print(
+        Panel(
+            table,
+            title='FILES WITH THE LARGEST CHANGE IN I/O TIME',
+            title_align='left'
+        )
+    )
+
+    if appeared is None:
+        message = 'Could not analyze both logs to compare their insights'
+    else:
+        message = '\n'.join(
+            ['[red]:arrow_forward: [{}] {}[/red]'.format(code, issue) for code, issue in appeared] +
+            ['[green]:heavy_check_mark: [{}] {}[/green]'.format(code, issue) for code, issue in cleared]
+        ) or 'No insights appeared or cleared'
+
+    console.print(
+        Panel(
+            Padding(message, (1, 1)),
+            title='INSIGHTS (APPEARED AND CLEARED)',
+            title_align='left'
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+
+# The traces are only in binary logs, which need the Darshan library
+try:
+    import darshan.backend.cffi_backend as darshanll
+except (ImportError, RuntimeError):
+    darshanll = None
+
+
+DXT_MODULES = ('DXT_POSIX', 'DXT_MPIIO')
+
+SEGMENT = np.dtype([
+    ('offset', np.int64),
+    ('length', np.int64),
+    ('start_time', np.float64),
+    ('end_time', np.float64)
+])
+
+# Same request size bins used by the POSIX and MPI-IO modules
+SIZE_BINS = np.array([100, 1024, 10 * 1024, 100 * 1024, 1024 ** 2, 4 * 1024 ** 2, 10 * 1024 ** 2, 100 * 1024 ** 2, 1024 ** 3])
+SIZE_LABELS = ['0_100', '100_1K', '1K_10K', '10K_100K', '100K_1M', '1M_4M', '4M_10M', '10M_100M', '100M_1G', '1G_PLUS']
+SIZE_RANGES = [
+    'up to 100 B', '100 B to 1 KB', '1 KB to 10 KB', '10 KB to 100 KB', '100 KB to 1 MB',
+    '1 MB to 4 MB', '4 MB to 10 MB', '10 MB to 100 MB', '100 MB to 1 GB', 'over 1 GB'
+]
+
+OPERATIONS = ('read', 'write')
+
+PATTERNS = ('consecutive', 'strided', 'sequential', 'random')
+
+# Byte ranges of a file kept before they are folded into its coverage profile
+COMPACT_RANGES = 1024 ** 2
+
+
+def request_sizes(files):
+    """
+    Number of read and write requests of each size range, for the files of a DataFrame returned by analyze().
+    """
+    return pd.DataFrame(
+        {
+            size_range: files['read_size_{}'.format(label)] + files['write_size_{}'.format(label)]
+            for label, size_range in zip(SIZE_LABELS, SIZE_RANGES)
+        },
+        index=files.index
+    )
+
+
+def records(filename, module):
+    """
+    Iterate over the DXT records of a module, one rank and file at a time.
+
+    Each record is a tuple with the file id, the rank, the hostname, and the write and read segments
+    decoded straight from the log buffer into NumPy structured arrays (offset, length, start_time, end_time).
+    """
+    log = darshanll.log_open(filename)
+
+    try:
+        modules = darshanll.log_get_modules(log)
+
+        if module not in modules:
+            return
+
+        record_type = darshanll._structdefs[module]
+        record_size = darshanll.ffi.sizeof('struct dxt_file_record')
+
+        buffer = darshanll.ffi.new('void **')
+
+        while darshanll.libdutil.darshan_log_get_record(log['handle'], modules[module]['idx'], buffer) >= 1:
+            record = darshanll.ffi.cast(record_type, buffer)[0]
+
+            write_count = record.write_count
+            read_count = record.read_count
+
+            segments = np.frombuffer(
+                darshanll.ffi.buffer(
+                    darshanll.ffi.cast('char *', buffer[0]) + record_size,
+                    (write_count + read_count) * SEGMENT.itemsize
+                ),
+                dtype=SEGMENT
+            ).copy()
+
+            id = record.base_rec.id
+            rank = record.base_rec.rank
+            hostname = darshanll.ffi.string(record.hostname).decode('utf-8')
+
+            # The library allocates a new record buffer whenever the pointer is NULL
+            darshanll.libdutil.darshan_free(buffer[0])
+            buffer[0] = darshanll.ffi.NULL
+
+            yield id, rank, hostname, segments[:write_count], segments[write_count:]
+    finally:
+        darshanll.log_close(log)
+
+
+def hostnames(filename, nprocs, deadline=None):
+    """
+    Map each rank to the hostname of the node it ran on, from the DXT records.
+
+    The records are only read until every rank has been seen. Returns an empty mapping if the deadline expires
+    before, since a partial mapping would undercount the nodes.
+    """
+    hosts = {}
+
+    for module in DXT_MODULES:
+        for id, rank, hostname, write_segments, read_segments in records(filename, module):
+            if deadline is not None and deadline.expired():
+                return {}
+
+            hosts.setdefault(rank, hostname)
+
+            if len(hosts) >= nprocs:
+                return hosts
+
+    return hosts
+
+
+def access_pattern(segments):
+    """
+    Classify the requests of one rank into consecutive, strided, sequential, and random.
+
+    A request is consecutive if it starts where the previous one ended, and strided if it is not, but its offset
+    moved by the same distance from the previous request as that one did from the request before (a regular
+    stride, forward or backward). Otherwise it is sequential if it starts after the previous one ended, as Darshan
+    does for its counters, and random if not. The first request of a rank is not classified.
+    """
+    if len(segments) < 2:
+        return 0, 0, 0, 0
+
+    previous_end = segments['offset'][:-1] + segments['length'][:-1]
+    offsets = segments['offset'][1:]
+
+    is_consecutive = offsets == previous_end
+
+    strides = np.diff(segments['offset'])
+
+    is_strided = np.zeros(len(offsets), dtype=bool)
+    is_strided[1:] = (strides[1:] == strides[:-1]) & (strides[1:] != 0)
+    is_strided &= ~is_consecutive
+
+    is_sequential = (offsets > previous_end) & ~is_strided
+
+    consecutive = np.count_nonzero(is_consecutive)
+    strided = np.count_nonzero(is_strided)
+    sequential = np.count_nonzero(is_sequential)
+
+    return consecutive, strided, sequential, len(offsets) - consecutive - strided - sequential
+
+
+def union(starts, ends):
+    """
+    Merge byte ranges [start, end) into disjoint ranges, sorting them by offset and sweeping once (O(n log n)).
+    """
+    if not len(starts):
+        return starts, ends
+
+    order = np.argsort(starts, kind='stable')
+
+    starts = starts[order]
+    ends = ends[order]
+
+    # A range opens a new merged range if it starts after everything seen so far has ended
+    reach = np.maximum.accumulate(ends)
+
+    opens = np.empty(len(starts), dtype=bool)
+    opens[0] = True
+    opens[1:] = starts[1:] > reach[:-1]
+
+    first = np.flatnonzero(opens)
+
+    return starts[first], np.maximum.reduceat(ends, first)
+
+
+def coverage(starts, ends, weights=None):
+    """
+    Split byte ranges [start, end), each counted weight times, into the disjoint pieces covered by the same number
+    of ranges, with a sweep over the sorted range bounds (O(n log n)).
+
+    Returns the start, end, and depth of the pieces covered at least once. Abutting pieces of the same depth are
+    merged, so the profile only grows with the number of changes of depth along the file, and can be given back
+    as weighted ranges to fold more ranges into it.
+    """
+    if weights is None:
+        weights = np.ones(len(starts), dtype=np.int64)
+
+    if not len(starts):
+        return starts, ends, weights
+
+    positions = np.concatenate([starts, ends])
+    events = np.concatenate([weights, -weights])
+
+    order = np.argsort(positions, kind='stable')
+
+    positions = positions[order]
+    depth = np.cumsum(events[order])
+
+    # Depth after all the bounds at the same position, so pieces between equal bounds never appear
+    last = np.append(np.flatnonzero(positions[1:] != positions[:-1]), len(positions) - 1)
+
+    positions = positions[last]
+    depth = depth[last][:-1]
+
+    if not len(depth):
+        return positions[:0], positions[:0], depth
+
+    opens = np.empty(len(depth), dtype=bool)
+    opens[0] = True
+    opens[1:] = depth[1:] != depth[:-1]
+
+    first = np.flatnonzero(opens)
+
+    starts = positions[first]
+    ends = np.append(positions[first[1:]], positions[-1])
+    depth = depth[first]
+
+    covered = depth > 0
+
+    return starts[covered], ends[covered], depth[covered]
+
+
+def redundancy(starts, ends, weights=None):
+    """
+    Measure how often the same bytes of a file were accessed, from the ranges accessed by each rank.
+
+    Returns the number of unique bytes and the hottest range, given as its start, end, and the highest
+    number of ranges covering it. The ranges can be weighted, as the pieces of a coverage profile are.
+    """
+    starts, ends, depth = coverage(starts, ends, weights)
+
+    widths = ends - starts
+
+    unique = int(widths.sum())
+
+    if not len(depth) or depth.max() < 2:
+        return unique, (0, 0, int(depth.max(initial=0)))
+
+    # The piece with the most redundant bytes, which already spans its neighbours with the same coverage
+    hottest = np.argmax((depth - 1) * widths)
+
+    return unique, (int(starts[hottest]), int(ends[hottest]), int(depth[hottest]))
+
+
+def _accumulate(ranges, starts, ends):
+    """
+    Add the byte ranges of a rank to those of a file, folding them into its coverage profile once there are many.
+
+    The profile keeps the unique bytes and the redundancy exact, while its size only depends on how the coverage
+    varies along the file, not on the number of requests.
+    """
+    ranges['starts'].append(starts)
+    ranges['ends'].append(ends)
+    ranges['weights'].append(np.ones(len(starts), dtype=np.int64))
+    ranges['count'] += len(starts)
+
+    # Compacting again only once the ranges double, so each range is folded a constant number of times on average
+    if ranges['count'] > max(COMPACT_RANGES, 2 * ranges['compacted']):
+        starts, ends, weights = coverage(
+            np.concatenate(ranges['starts']), np.concatenate(ranges['ends']), np.concatenate(ranges['weights'])
+        )
+
+        ranges.update(starts=[starts], ends=[ends], weights=[weights], count=len(starts), compacted=len(starts))
+
+
+def max_concurrency(starts, ends):
+    """
+    Maximum number of intervals that overlap at any point in time, with a sweep over the sorted interval bounds.
+    """
+    if not len(starts):
+        return 0
+
+    times = np.concatenate([starts, ends])
+    events = np.concatenate([np.ones(len(starts), dtype=np.int64), -np.ones(len(ends), dtype=np.int64)])
+
+    # Close intervals before opening new ones at the same instant
+    order = np.lexsort((events, times))
+
+    return int(np.cumsum(events[order]).max())
+
+
+def analyze(filename, module, deadline=None):
+    """
+    Compute per-file features from the DXT traces of a module.
+
+    The segments of each rank are reduced as soon as they are decoded, so memory stays bounded by the size of
+    one record plus the per-file accumulators, whose byte ranges are periodically folded into a coverage profile.
+    Returns a DataFrame indexed by file id with the request size distribution, the access pattern, the number
+    of ranks, the highest number of ranks accessing the file at the same time, the time spent in I/O requests,
+    and the unique, redundant (read or written more than once), and most re-accessed byte ranges.
+
+    Returns None if the deadline expires before all the records are reduced.
+    """
+    files = {}
+
+    for id, rank, hostname, write_segments, read_segments in records(filename, module):
+        if deadline is not None and deadline.expired():
+            return None
+
+        if id not in files:
+            files[id] = {
+                'sizes': np.zeros((2, len(SIZE_LABELS)), dtype=np.int64),
+                'patterns': np.zeros((2, len(PATTERNS)), dtype=np.int64),
+                'bytes': np.zeros(2, dtype=np.int64),
+                'time': 0.0,
+                'ranks': set(),
+                'starts': [],
+                'ends': [],
+                'ranges': tuple(
+                    {'starts': [], 'ends': [], 'weights': [], 'count': 0, 'compacted': 0} for _ in OPERATIONS
+                )
+            }
+
+        file = files[id]
+
+        for index, segments in enumerate((read_segments, write_segments)):
+            if not len(segments):
+                continue
+
+            file['sizes'][index] += np.bincount(
+                np.searchsorted(SIZE_BINS, segments['length'], side='right'),
+                minlength=len(SIZE_LABELS)
+            )
+
+            file['patterns'][index] += access_pattern(segments)
+            file['bytes'][index] += segments['length'].sum()
+            file['time'] += (segments['end_time'] - segments['start_time']).sum()
+
+            # Only keep the merged byte ranges of each rank, re-accesses within the rank are already in the byte count
+            starts, ends = union(segments['offset'], segments['offset'] + segments['length'])
+
+            _accumulate(file['ranges'][index], starts, ends)
+
+        if len(read_segments) or len(write_segments):
+            segments = np.concatenate([read_segments, write_segments])
+
+            file['ranks'].add(rank)
+
+            # Keep only the span of each rank, to measure concurrency across ranks
+            file['starts'].append(segments['start_time'].min())
+            file['ends'].append(segments['end_time'].max())
+
+    rows = []
+
+    for id, file in files.items():
+        row = {
+            'id': id,
+            'ranks': len(file['ranks']),
+            'concurrency': max_concurrency(np.array(file['starts']), np.array(file['ends'])),
+            'time': file['time'],
+            'span': max(file['ends']) - min(file['starts']) if file['starts'] else 0.0
+        }
+
+        for index, operation in enumerate(OPERATIONS):
+            row['{}_bytes'.format(operation)] = file['bytes'][index]
+            row['{}_requests'.format(operation)] = file['sizes'][index].sum()
+
+            for label, count in zip(SIZE_LABELS, file['sizes'][index]):
+                row['{}_size_{}'.format(operation, label)] = count
+
+            for pattern, count in zip(PATTERNS, file['patterns'][index]):
+                row['{}_{}'.format(operation, pattern)] = count
+
+            ranges = file['ranges'][index]
+
+            if ranges['starts']:
+                unique, hottest = redundancy(
+                    np.concatenate(ranges['starts']),
+                    np.concatenate(ranges['ends']),
+                    np.concatenate(ranges['weights'])
+                )
+            else:
+                unique, hottest = 0, (0, 0, 0)
+
+            row['{}_unique'.format(operation)] = unique
+            row['{}_redundant'.format(operation)] = file['bytes'][index] - unique
+            row['{}_hottest_start'.format(operation)] = hottest[0]
+            row['{}_hottest_end'.format(operation)] = hottest[1]
+            row['{}_hottest_ranks'.format(operation)] = hottest[2]
+
+        rows.append(row)
+
+    return pd.DataFrame(rows).set_index('id') if rows else pd.DataFrame()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+
+HEATMAP_MODULES = ('POSIX', 'MPIIO', 'STDIO')
+
+OPERATIONS = ('read', 'write')
+
+
+def matrix(heatmap, operations=OPERATIONS):
+    """
+    Dense rank by time bin matrix with the bytes transferred by each rank in each bin of a heatmap.
+
+    Returns the ranks (rows), the bounds of the time bins in seconds (one more than the columns), and the matrix.
+    """
+    df = heatmap.to_df(ops=list(operations), interval_index=True)
+
+    bounds = np.append(df.columns.left.to_numpy(dtype=np.float64), df.columns.right[-1:].to_numpy(dtype=np.float64))
+
+    return df.index.to_numpy(dtype=np.int64), bounds, df.to_numpy(dtype=np.float64)
+
+
+def analyze(heatmap, skew):
+    """
+    Measure how the I/O of a heatmap is spread over time and ranks.
+
+    Only the window between the first and the last bin with I/O is considered. Returns a dictionary
+    with the bin width, the bytes per bin, the burstiness (peak to mean ratio of the bytes per bin),
+    the idle bins inside the window and the longest idle period, and the bins where a single rank
+    transferred more than a share (skew) of the bytes.
+    """
+    ranks, bounds, bins = matrix(heatmap)
+
+    # Bins have the same width, which is what the library chose for the run time
+    width = float(bounds[1] - bounds[0]) if len(bounds) > 1 else 0.0
+
+    totals = bins.sum(axis=0)
+
+    active = np.flatnonzero(totals)
+
+    if not len(active):
+        return None
+
+    first = active[0]
+    last = active[-1] + 1
+
+    bins = bins[:, first:last]
+    totals = totals[first:last]
+
+    idle = totals == 0
+
+    # Bins where one rank did most of the I/O while other ranks were also doing I/O
+    busiest = bins.max(axis=0)
+    reporting = np.count_nonzero(bins, axis=0)
+
+    skewed = (reporting > 1) & (busiest > totals * skew)
+
+    return {
+        'ranks': len(ranks),
+        'bin_width': width,
+        'start': float(bounds[first]),
+        'end': float(bounds[last]),
+        'bins': len(totals),
+        'bytes': totals,
+        'burstiness': float(totals.max() / totals.mean()),
+        'idle_bins': int(np.count_nonzero(idle)),
+        'longest_idle': _longest_run(idle) * width,
+        'skewed_bins': int(np.count_nonzero(skewed)),
+        'skewed_ranks': np.unique(ranks[bins[:, skewed].argmax(axis=0)]) if skewed.any() else np.array([], dtype=np.int64)
+    }
+
+
+def _longest_run(mask):
+    """
+    Length of the longest run of True values.
+    """
+    changes = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+
+    lengths = np.flatnonzero(changes == -1) - np.flatnonzero(changes == 1)
+
+    return int(lengths.max(initial=0))
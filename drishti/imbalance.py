@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+
+
+PERCENTILES = (50, 90, 99)
+
+METRICS = ('bytes', 'time')
+
+
+def distribution(counters, fcounters, nprocs):
+    """
+    Statistics of the bytes and time of the ranks that accessed each file, for all files at once.
+
+    Files with per-rank records get percentiles, coefficient of variation, and Gini index computed from
+    the records, sorted once by file and value. Shared files (rank -1) only keep the variance across ranks,
+    so their coefficient of variation comes from POSIX_F_VARIANCE_RANK_* and the mean over all ranks,
+    and their percentiles and Gini index are left undefined. Returns a DataFrame indexed by file id.
+    """
+    ids = counters['id'].to_numpy(dtype=np.uint64)
+    ranks = counters['rank'].to_numpy(dtype=np.int64)
+
+    values = {
+        'bytes': (counters['POSIX_BYTES_READ'] + counters['POSIX_BYTES_WRITTEN']).to_numpy(dtype=np.float64),
+        'time': (fcounters['POSIX_F_READ_TIME'] + fcounters['POSIX_F_WRITE_TIME'] + fcounters['POSIX_F_META_TIME']).to_numpy(dtype=np.float64)
+    }
+
+    variances = {
+        'bytes': fcounters['POSIX_F_VARIANCE_RANK_BYTES'].to_numpy(dtype=np.float64),
+        'time': fcounters['POSIX_F_VARIANCE_RANK_TIME'].to_numpy(dtype=np.float64)
+    }
+
+    private = ranks >= 0
+    shared = ~private
+
+    frames = []
+
+    if private.any():
+        unique_ids, inverse = np.unique(ids[private], return_inverse=True)
+
+        columns = {
+            'ranks': np.bincount(inverse)
+        }
+
+        for metric in METRICS:
+            columns.update(_statistics(inverse, values[metric][private], metric))
+
+        frames.append(pd.DataFrame(columns, index=pd.Index(unique_ids, name='id')))
+
+    if shared.any():
+        columns = {
+            'ranks': np.full(np.count_nonzero(shared), nprocs)
+        }
+
+        for metric in METRICS:
+            mean = values[metric][shared] / nprocs
+
+            for percentile in PERCENTILES:
+                columns['{}_p{}'.format(metric, percentile)] = np.nan
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                columns['{}_cv'.format(metric)] = np.where(mean > 0, np.sqrt(variances[metric][shared]) / mean, 0.0)
+
+            columns['{}_gini'.format(metric)] = np.nan
+
+        frames.append(pd.DataFrame(columns, index=pd.Index(ids[shared], name='id')))
+
+    if not frames:
+        return pd.DataFrame()
+
+    return pd.concat(frames)
+
+
+def _statistics(groups, values, metric):
+    """
+    Percentiles, coefficient of variation, and Gini index of the values of each group.
+    """
+    order = np.lexsort((values, groups))
+
+    groups = groups[order]
+    values = values[order]
+
+    counts = np.bincount(groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    columns = {}
+
+    # Linear interpolation between the closest ranks, as numpy.percentile does
+    for percentile in PERCENTILES:
+        position = starts + (counts - 1) * percentile / 100.0
+
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+
+        columns['{}_p{}'.format(metric, percentile)] = values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    totals = np.bincount(groups, weights=values)
+    squares = np.bincount(groups, weights=values ** 2)
+
+    mean = totals / counts
+    deviation = np.sqrt(np.maximum(squares / counts - mean ** 2, 0.0))
+
+    # Gini index from the sorted values: sum((2i - n - 1) x_i) / (n sum(x)), with i starting at 1 in each group
+    positions = np.arange(len(values)) - starts[groups] + 1
+
+    weighted = np.bincount(groups, weights=(2 * positions - counts[groups] - 1) * values)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        columns['{}_cv'.format(metric)] = np.where(mean > 0, deviation / mean, 0.0)
+        columns['{}_gini'.format(metric)] = np.where(totals > 0, weighted / (counts * totals), 0.0)
+
+    return columns
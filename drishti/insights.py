@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Insight:
+    """
+    An insight detected in a Darshan log, kept as data until an output needs to display it.
+
+    The details are dictionaries with the id of the offending file, a message template whose
+    last placeholder is the file path, and the values used to fill in the other placeholders.
+    Details that summarize the files under a directory are marked as rollups instead.
+    """
+    __slots__ = ('code', 'target', 'level', 'issue', 'recommendations', 'details', 'metrics')
+
+    code: str
+    target: int
+    level: int
+    issue: str
+    recommendations: list
+    details: list
+    metrics: dict
+
+    @property
+    def files(self):
+        """
+        Ids of the files that triggered the insight.
+        """
+        return [detail['id'] for detail in self.details if 'id' in detail]
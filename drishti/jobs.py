@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+import io
+import os
+import abc
+import csv
+import json
+import time
+import shlex
+import tempfile
+import subprocess
+
+
+FIELDS = 'JobID,JobIDRaw,NNodes,NCPUs'
+
+CACHE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')),
+    'drishti',
+    'jobs.json'
+)
+
+# Job ids a provider did not know about are looked up again after this many seconds, since they may be pending
+NEGATIVE_TTL = 3600
+
+
+class Provider(abc.ABC):
+    """
+    Source of information about the jobs (number of nodes and CPUs), looked up for many job ids at once.
+    """
+
+    # Name of the provider in the cache, so the answers of different sources are never mixed
+    name = None
+
+    @abc.abstractmethod
+    def lookup(self, jobids):
+        """
+        Return a dictionary that maps each job id (as a string) found by the provider to its information, or None
+        if the lookup itself failed.
+        """
+
+
+class SlurmProvider(Provider):
+    """
+    Job information from the SLURM accounting database, with one sacct query for all the job ids.
+    """
+
+    name = 'slurm'
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+
+    def lookup(self, jobids):
+        if not jobids:
+            return {}
+
+        command = 'sacct --jobs {} --format={} --parsable2 --delimiter ","'.format(
+            ','.join(str(jobid) for jobid in jobids), FIELDS
+        )
+
+        try:
+            result = subprocess.run(
+                shlex.split(command), stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=self.timeout
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        return parse(io.StringIO(result.stdout.decode('utf-8')), jobids)
+
+
+class FileProvider(Provider):
+    """
+    Job information from a file with the output of sacct (--parsable2 --delimiter ","), for hosts without SLURM.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.name = 'file:{}'.format(os.path.abspath(path))
+
+    def lookup(self, jobids):
+        try:
+            with open(self.path) as f:
+                return parse(f, jobids)
+        except FileNotFoundError:
+            return None
+
+
+class CachedProvider(Provider):
+    """
+    Keep the answers of a provider in a local JSON file, so each job id is only looked up once.
+
+    The answers are kept apart for each provider. Job ids the provider did not know about are cached as well, but
+    only when the lookup itself succeeded, and only for negative_ttl seconds. Failed lookups are never cached.
+    """
+
+    def __init__(self, provider, path=CACHE, negative_ttl=NEGATIVE_TTL):
+        self.provider = provider
+        self.path = path
+        self.negative_ttl = negative_ttl
+
+        try:
+            with open(self.path) as f:
+                self.cache = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.cache = {}
+
+        if not isinstance(self.cache, dict):
+            self.cache = {}
+
+    def cached(self, entry, now):
+        """
+        Whether a cache entry can still be used: answers are kept forever, and unknown job ids until they expire.
+        """
+        if not isinstance(entry, dict) or 'time' not in entry:
+            return False
+
+        return entry.get('info') is not None or now - entry['time'] < self.negative_ttl
+
+    def lookup(self, jobids):
+        jobids = [str(jobid) for jobid in jobids]
+
+        now = time.time()
+
+        section = self.cache.setdefault(self.provider.name, {})
+
+        if not isinstance(section, dict):
+            section = self.cache[self.provider.name] = {}
+
+        missing = [jobid for jobid in jobids if not self.cached(section.get(jobid), now)]
+
+        if missing:
+            found = self.provider.lookup(missing)
+
+            if found is None:
+                return None
+
+            for jobid in missing:
+                section[jobid] = {'info': found.get(jobid), 'time': now}
+
+            self.save()
+
+        return {jobid: section[jobid]['info'] for jobid in jobids if section[jobid]['info']}
+
+    def save(self):
+        """
+        Write the cache atomically, so concurrent runs never read a partial file.
+        """
+        directory = os.path.dirname(self.path) or '.'
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile('w', dir=directory, delete=False) as f:
+                json.dump(self.cache, f)
+
+            os.replace(f.name, self.path)
+        except OSError:
+            pass
+
+
+def provider(path=None, timeout=10):
+    """
+    Provider of the job information: SLURM, with its answers cached across runs, or a file with sacct output.
+
+    The file is read directly, it is as fast as the cache and its answers would otherwise be mixed with the real ones.
+    """
+    if path:
+        return FileProvider(path)
+
+    return CachedProvider(SlurmProvider(timeout=timeout))
+
+
+def parse(lines, jobids):
+    """
+    Read the number of nodes and CPUs of each job from sacct output, ignoring the job steps.
+    """
+    jobids = set(str(jobid) for jobid in jobids)
+
+    jobs = {}
+
+    for row in csv.DictReader(lines):
+        jobid = row.get('JobIDRaw') or row.get('JobID')
+
+        if jobid not in jobids or jobid in jobs:
+            continue
+
+        try:
+            jobs[jobid] = {
+                'nodes': int(row['NNodes']),
+                'cpus': int(row['NCPUs'])
+            }
+        except (KeyError, ValueError):
+            continue
+
+    return jobs
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+
+OPERATIONS = {
+    'read': (
+        ['MPIIO_INDEP_READS', 'MPIIO_COLL_READS', 'MPIIO_SPLIT_READS', 'MPIIO_NB_READS'],
+        'MPIIO_BYTES_READ',
+        'POSIX_READS',
+        'POSIX_BYTES_READ'
+    ),
+    'write': (
+        ['MPIIO_INDEP_WRITES', 'MPIIO_COLL_WRITES', 'MPIIO_SPLIT_WRITES', 'MPIIO_NB_WRITES'],
+        'MPIIO_BYTES_WRITTEN',
+        'POSIX_WRITES',
+        'POSIX_BYTES_WRITTEN'
+    )
+}
+
+
+def amplification(mpiio, posix):
+    """
+    Join the MPI-IO and POSIX records of each file and measure how requests change from one layer to the other.
+
+    Both layers are reduced to one row per file id and merged, so files only accessed through POSIX are left out.
+    For each operation, returns the requests and bytes at each layer, the share of collective MPI-IO requests,
+    and the request and byte amplification (POSIX over MPI-IO).
+    """
+    mpiio_columns = {}
+    posix_columns = {}
+
+    for operation, (requests, transferred, posix_requests, posix_transferred) in OPERATIONS.items():
+        mpiio_columns['mpiio_{}_requests'.format(operation)] = mpiio[requests].sum(axis=1)
+        mpiio_columns['mpiio_{}_collective'.format(operation)] = mpiio[requests[1]]
+        mpiio_columns['mpiio_{}_bytes'.format(operation)] = mpiio[transferred]
+
+        posix_columns['posix_{}_requests'.format(operation)] = posix[posix_requests]
+        posix_columns['posix_{}_bytes'.format(operation)] = posix[posix_transferred]
+
+    layers = mpiio[['id']].assign(**mpiio_columns).groupby('id').sum().join(
+        posix[['id']].assign(**posix_columns).groupby('id').sum(),
+        how='inner'
+    )
+
+    for operation in OPERATIONS:
+        mpiio_requests = layers['mpiio_{}_requests'.format(operation)].to_numpy(dtype=np.float64)
+        mpiio_bytes = layers['mpiio_{}_bytes'.format(operation)].to_numpy(dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            layers['{}_request_amplification'.format(operation)] = np.where(
+                mpiio_requests > 0, layers['posix_{}_requests'.format(operation)] / mpiio_requests, 0.0
+            )
+            layers['{}_byte_amplification'.format(operation)] = np.where(
+                mpiio_bytes > 0, layers['posix_{}_bytes'.format(operation)] / mpiio_bytes, 0.0
+            )
+
+    return layers
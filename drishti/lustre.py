@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+
+
+def files(lustre, posix, nprocs):
+    """
+    Join the striping of each file in the LUSTRE records with its POSIX features.
+
+    Returns a DataFrame indexed by file id with the stripe size, stripe width, the number of OSTs
+    in the file system, the bytes transferred, the number of ranks that accessed the file (all of
+    them for shared records), and the dominant request size (the most common access size of the
+    record with the most accesses).
+    """
+    striping = lustre.drop_duplicates('id').set_index('id')[
+        ['LUSTRE_OSTS', 'LUSTRE_STRIPE_SIZE', 'LUSTRE_STRIPE_WIDTH', 'ost_ids']
+    ]
+
+    posix = posix.assign(
+        bytes=posix['POSIX_BYTES_READ'] + posix['POSIX_BYTES_WRITTEN'],
+        ranks=np.where(posix['rank'] == -1, nprocs, 1)
+    )
+
+    features = posix.groupby('id').agg(
+        bytes=('bytes', 'sum'),
+        ranks=('ranks', 'sum')
+    )
+
+    features['ranks'] = features['ranks'].clip(upper=nprocs)
+
+    dominant = posix.sort_values('POSIX_ACCESS1_COUNT', ascending=False, kind='stable').drop_duplicates('id')
+
+    features['request_size'] = dominant.set_index('id')['POSIX_ACCESS1_ACCESS']
+
+    return striping.join(features, how='inner')
+
+
+def ost_load(files):
+    """
+    Bytes stored on each OST, assuming the bytes of each file are spread evenly over its stripes.
+    """
+    widths = files['ost_ids'].map(len).to_numpy()
+
+    if not widths.sum():
+        return pd.Series(dtype=np.float64)
+
+    osts = np.concatenate(files['ost_ids'].to_numpy())
+    shares = np.repeat(files['bytes'].to_numpy(dtype=np.float64) / np.maximum(widths, 1), widths)
+
+    ids, inverse = np.unique(osts, return_inverse=True)
+
+    return pd.Series(np.bincount(inverse, weights=shares, minlength=len(ids)), index=ids)
+
+
+def misfit(files):
+    """
+    Files whose dominant request size is not a multiple or a divisor of the stripe size, so requests cross stripe boundaries.
+    """
+    size = files['request_size'].to_numpy(dtype=np.int64)
+    stripe = files['LUSTRE_STRIPE_SIZE'].to_numpy(dtype=np.int64)
+
+    valid = (size > 0) & (stripe > 0)
+
+    crossing = np.zeros(len(files), dtype=bool)
+    crossing[valid] = (size[valid] % stripe[valid] != 0) & (stripe[valid] % size[valid] != 0)
+
+    return files.loc[crossing]
+
+
+def understriped(files, ranks_per_ost):
+    """
+    Shared files striped over fewer OSTs than their number of ranks calls for, when the file system has more OSTs available.
+    """
+    wanted = np.minimum(np.ceil(files['ranks'] / ranks_per_ost), files['LUSTRE_OSTS'])
+
+    return files.loc[(files['ranks'] > 1) & (files['LUSTRE_STRIPE_WIDTH'] < wanted)]
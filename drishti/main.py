@@ -1,34 +1,62 @@
 #!/usr/bin/env python3
 
 import os
-import io
 import sys
 import csv
 import time
 import json
-import shlex
+import heapq
 import shutil
 import datetime
 import argparse
+import contextlib
 import subprocess
 import matplotlib.pyplot as plt
+import seaborn as sns
 
+import numpy as np
 import pandas as pd
 
-import darshan
-import darshan.backend.cffi_backend as darshanll
+# Without the Darshan library only darshan-parser output can be analyzed
+try:
+    import darshan
+    import darshan.backend.cffi_backend as darshanll
+except (ImportError, RuntimeError):
+    darshan = None
+    darshanll = None
 
-from rich import print, box, rule
+from rich import box, rule
 from rich.console import Console, Group
 from rich.padding import Padding
 from rich.text import Text
-from rich.syntax import Syntax
 from rich.panel import Panel
 from rich.terminal_theme import TerminalTheme
 from rich.terminal_theme import MONOKAI
 from subprocess import call
 
 from packaging import version
+from importlib import metadata
+
+from drishti import archives
+from drishti import baselines
+from drishti import cache
+from drishti import deadline
+from drishti import dxt
+from drishti import heatmap
+from drishti import imbalance
+from drishti import jobs
+from drishti import layers
+from drishti import nodes
+from drishti import lustre
+from drishti import sampling
+from drishti import sketches
+from drishti import snippets
+from drishti import textlog
+from drishti import thresholds
+from drishti import timeline
+from drishti.insights import Insight
+from drishti.parallel import aggregate_by_id
+from drishti.paths import PathTrie
 
 
 RECOMMENDATIONS = 0
@@ -43,30 +71,23 @@ TARGET_USER = 1
 TARGET_DEVELOPER = 2
 TARGET_SYSTEM = 3
 
+LEVELS = {
+    HIGH: 'HIGH',
+    WARN: 'WARN',
+    INFO: 'INFO',
+    OK: 'OK'
+}
+
+TARGETS = {
+    TARGET_USER: 'USER',
+    TARGET_DEVELOPER: 'DEVELOPER',
+    TARGET_SYSTEM: 'SYSTEM'
+}
+
 insights_operation = []
 insights_metadata = []
 insights_dxt = []
 
-insights_total = dict()
-
-insights_total[HIGH] = 0
-insights_total[WARN] = 0
-insights_total[RECOMMENDATIONS] = 0
-
-THRESHOLD_OPERATION_IMBALANCE = 0.1
-THRESHOLD_SMALL_REQUESTS = 0.1
-THRESHOLD_SMALL_REQUESTS_ABSOLUTE = 1000
-THRESHOLD_MISALIGNED_REQUESTS = 0.1
-THRESHOLD_METADATA = 0.1
-THRESHOLD_METADATA_TIME_RANK = 30  # seconds
-THRESHOLD_RANDOM_OPERATIONS = 0.2
-THRESHOLD_RANDOM_OPERATIONS_ABSOLUTE = 1000
-THRESHOLD_STRAGGLERS = 0.15
-THRESHOLD_IMBALANCE = 0.30
-THRESHOLD_INTERFACE_STDIO = 0.1
-THRESHOLD_COLLECTIVE_OPERATIONS = 0.5
-THRESHOLD_COLLECTIVE_OPERATIONS_ABSOLUTE = 1000
-
 INSIGHTS_STDIO_HIGH_USAGE = 'S01'
 INSIGHTS_POSIX_WRITE_COUNT_INTENSIVE = 'P01'
 INSIGHTS_POSIX_READ_COUNT_INTENSIVE = 'P02'
@@ -89,6 +110,10 @@ INSIGHTS_POSIX_SIZE_IMBALANCE = 'P18'
 INSIGHTS_POSIX_TIME_IMBALANCE = 'P19'
 INSIGHTS_POSIX_INDIVIDUAL_WRITE_SIZE_IMBALANCE = 'P21'
 INSIGHTS_POSIX_INDIVIDUAL_READ_SIZE_IMBALANCE = 'P22'
+INSIGHTS_POSIX_SERIALIZED_IO = 'P23'
+INSIGHTS_POSIX_RANK_BYTES_VARIATION = 'P24'
+INSIGHTS_POSIX_RANK_TIME_VARIATION = 'P25'
+INSIGHTS_POSIX_NODE_IMBALANCE = 'P26'
 INSIGHTS_MPI_IO_NO_USAGE = 'M01'
 INSIGHTS_MPI_IO_NO_COLLECTIVE_READ_USAGE = 'M02'
 INSIGHTS_MPI_IO_NO_COLLECTIVE_WRITE_USAGE = 'M03'
@@ -99,9 +124,54 @@ INSIGHTS_MPI_IO_BLOCKING_WRITE_USAGE = 'M07'
 INSIGHTS_MPI_IO_AGGREGATORS_INTRA = 'M08'
 INSIGHTS_MPI_IO_AGGREGATORS_INTER = 'M09'
 INSIGHTS_MPI_IO_AGGREGATORS_OK = 'M10'
+INSIGHTS_MPI_IO_REQUEST_AMPLIFICATION = 'M11'
+INSIGHTS_MPI_IO_BYTE_AMPLIFICATION = 'M12'
+INSIGHTS_DXT_HIGH_RANDOM_USAGE = 'D01'
+INSIGHTS_DXT_SERIALIZED_SHARED_FILE_USAGE = 'D02'
+INSIGHTS_DXT_STRIDED_USAGE = 'D03'
+INSIGHTS_HEATMAP_BURSTY_IO = 'H01'
+INSIGHTS_HEATMAP_IDLE_IO = 'H02'
+INSIGHTS_HEATMAP_RANK_SKEWED_IO = 'H03'
+INSIGHTS_LUSTRE_OST_IMBALANCE = 'L01'
+INSIGHTS_LUSTRE_STRIPE_SIZE_MISMATCH = 'L02'
+INSIGHTS_LUSTRE_SHARED_FILE_FEW_OSTS = 'L03'
+INSIGHTS_BASELINE_REGRESSION = 'B01'
+
+DXT_INSIGHTS = {INSIGHTS_DXT_HIGH_RANDOM_USAGE, INSIGHTS_DXT_SERIALIZED_SHARED_FILE_USAGE, INSIGHTS_DXT_STRIDED_USAGE}
+
+# Insights that need the DXT traces or their hostnames, which a CI gate only decodes when it checks them
+TRACED_INSIGHTS = DXT_INSIGHTS | {
+    INSIGHTS_POSIX_REDUNDANT_READ_USAGE, INSIGHTS_POSIX_REDUNDANT_WRITE_USAGE, INSIGHTS_POSIX_NODE_IMBALANCE,
+    INSIGHTS_MPI_IO_AGGREGATORS_INTRA, INSIGHTS_MPI_IO_AGGREGATORS_INTER, INSIGHTS_MPI_IO_AGGREGATORS_OK
+}
+
+# Modules read with --sample: the ones the estimated insights and the file counts need
+SAMPLED_MODULES = ('STDIO', 'POSIX', 'MPI-IO')
+
+# Exit codes of a CI gate (--fail-on)
+EXIT_GATE_WARN = 3
+EXIT_GATE_HIGH = 4
+EXIT_GATE_PARTIAL = 5
+
+try:
+    VERSION = metadata.version('drishti-io')
+except metadata.PackageNotFoundError:
+    VERSION = None
+
+
+def fail_on(value):
+    """
+    Parse the level and the optional comma-separated codes of a CI gate (e.g., HIGH or WARN:P05,P08).
+    """
+    level, _, codes = value.partition(':')
+
+    if level.upper() not in ('HIGH', 'WARN'):
+        raise argparse.ArgumentTypeError('expected HIGH or WARN, optionally followed by :CODES')
+
+    codes = frozenset(code.strip().upper() for code in codes.split(',') if code.strip())
+
+    return HIGH if level.upper() == 'HIGH' else WARN, codes or None
 
-# TODO: need to verify the threashold to be between 0 and 1
-# TODO: read thresholds from file
 
 parser = argparse.ArgumentParser(
     description='Drishti: '
@@ -109,7 +179,7 @@ parser = argparse.ArgumentParser(
 
 parser.add_argument(
     'darshan',
-    help='Input .darshan file'
+    help='Input .darshan file, or darshan-parser output (optionally gzip-compressed, - to read it from the standard input), or a log in a tar/zip archive as archive:member'
 )
 
 parser.add_argument(
@@ -175,6 +245,107 @@ parser.add_argument(
     help='Display the full file path for the files that triggered the issue'
 )
 
+parser.add_argument(
+    '--top',
+    default=10,
+    type=int,
+    dest='top',
+    help='Maximum number of files listed for each issue in the report, ranked by impact (0 lists all files)'
+)
+
+parser.add_argument(
+    '--timeline',
+    default=None,
+    dest='timeline',
+    metavar='PATH',
+    help='Save a chart of the estimated bandwidth and active ranks over the job to PATH'
+)
+
+parser.add_argument(
+    '--job-info',
+    default=None,
+    dest='job_info',
+    metavar='PATH',
+    help='Read the number of compute nodes from a file with sacct output (--parsable2 --delimiter ",") instead of querying SLURM'
+)
+
+parser.add_argument(
+    '--sacct-timeout',
+    default=10,
+    type=int,
+    dest='sacct_timeout',
+    help='Maximum number of seconds to wait for SLURM to answer the compute nodes query'
+)
+
+parser.add_argument(
+    '--baselines',
+    default=None,
+    dest='baselines',
+    metavar='PATH',
+    help='Compare the log with the baseline of previous runs of the same executable kept in PATH, and add it to the baseline'
+)
+
+parser.add_argument(
+    '--sketch',
+    default=None,
+    dest='sketch',
+    metavar='PATH',
+    help='Save mergeable sketches of the log (distinct files, request sizes, I/O times, and bytes per file) to PATH, to aggregate many logs with drishti sketch'
+)
+
+parser.add_argument(
+    '--config',
+    default=None,
+    dest='config',
+    metavar='PATH',
+    help='Read the thresholds of the insights from a JSON file that maps their names to values (e.g., {"small_requests": 0.2})'
+)
+
+parser.add_argument(
+    '--sample',
+    default=None,
+    type=int,
+    dest='sample',
+    metavar='N',
+    help='Only analyze a sample of about N records of each module (plus one per rank when stratified), drawn while the records of a binary log are decoded, and estimate the ratio-based insights (small, random, misaligned, and independent requests) with confidence intervals. Every record is still decoded, but only the sample is kept. darshan-parser output is read in full before it is sampled'
+)
+
+parser.add_argument(
+    '--sample-by',
+    default='rank',
+    choices=['rank', 'uniform'],
+    dest='sample_by',
+    help='Draw the sample uniformly or stratified by rank, with every rank represented (default)'
+)
+
+parser.add_argument(
+    '--deadline',
+    default=None,
+    type=float,
+    dest='deadline',
+    metavar='SECONDS',
+    help='Time budget of the analysis: when it runs out, report the insights detected so far, marked as partial'
+)
+
+parser.add_argument(
+    '--fail-on',
+    default=None,
+    type=fail_on,
+    dest='fail_on',
+    metavar='HIGH|WARN[:CODES]',
+    help='Run as a CI gate: stop as soon as an insight of this level or above (among CODES, if given) is detected, only render the report when another format or export is requested, and exit with {} (WARN), {} (HIGH), or {} (stopped by --deadline before any failure)'.format(
+        EXIT_GATE_WARN, EXIT_GATE_HIGH, EXIT_GATE_PARTIAL
+    )
+)
+
+parser.add_argument(
+    '--no-cache',
+    default=False,
+    action='store_true',
+    dest='no_cache',
+    help='Always analyze the log, instead of displaying the results cached for the same log, thresholds, and version'
+)
+
 parser.add_argument(
     '--csv',
     default=False,
@@ -183,6 +354,22 @@ parser.add_argument(
     help='Export a CSV with the code of all issues that were triggered'
 )
 
+parser.add_argument(
+    '--format',
+    default='rich',
+    choices=['rich', 'json', 'ndjson'],
+    dest='format',
+    help='Output format: a rich report (default), a JSON document, or one JSON record per insight (NDJSON)'
+)
+
+parser.add_argument(
+    '--workers',
+    default=1,
+    type=int,
+    dest='workers',
+    help='Number of processes used to aggregate the per-rank records of large logs'
+)
+
 parser.add_argument(
     '--json', 
     default=False, 
@@ -191,25 +378,28 @@ parser.add_argument(
 
 args = parser.parse_args()
 
-if args.export_size:
+if args.format != 'rich':
+    # Machine-readable output goes to stdout, so keep any warnings out of the way and do not record them
+    console = Console(stderr=True)
+elif args.export_size:
     console = Console(record=True, width=int(args.export_size))
 else:
     console = Console(record=True)
 
-csv_report = []
+# Warnings and errors are never part of the report, nor of the document of the machine-readable formats
+error_console = Console(stderr=True)
 
 
 def validate_thresholds():
     """
     Validate thresholds defined by the user.
     """
-    assert(THRESHOLD_OPERATION_IMBALANCE >= 0.0 and THRESHOLD_OPERATION_IMBALANCE <= 1.0)
-    assert(THRESHOLD_SMALL_REQUESTS >= 0.0 and THRESHOLD_SMALL_REQUESTS <= 1.0)
-    assert(THRESHOLD_MISALIGNED_REQUESTS >= 0.0 and THRESHOLD_MISALIGNED_REQUESTS <= 1.0)
-    assert(THRESHOLD_METADATA >= 0.0 and THRESHOLD_METADATA <= 1.0)
-    assert(THRESHOLD_RANDOM_OPERATIONS >= 0.0 and THRESHOLD_RANDOM_OPERATIONS <= 1.0)
+    try:
+        thresholds.validate(thresholds.current())
+    except ValueError as e:
+        error_console.print('Invalid thresholds: {}'.format(e))
 
-    assert(THRESHOLD_METADATA_TIME_RANK >= 0.0)
+        sys.exit(os.EX_CONFIG)
 
 
 def clear():
@@ -250,1569 +440,3037 @@ def is_available(name):
     return shutil.which(name) is not None
 
 
-def message(code, target, level, issue, recommendations=None, details=None):
+def plot_imbalance(ids, imbalance, label, title, path):
     """
-    Display the message on the screen with level, issue, and recommendation.
+    Heatmap of the imbalance of each file, annotated with its value when there are few files.
     """
-    icon = ':arrow_forward:'
+    if not charts():
+        return
 
-    if level in (HIGH, WARN):
-        insights_total[level] += 1
+    values = pd.Series(imbalance.to_numpy(), index=ids.astype(str).to_numpy(), name=label).dropna()
 
-    if level == HIGH:
-        color = '[red]'
-    elif level == WARN:
-        color = '[orange1]'
-    elif level == OK:
-        color = '[green]'
-    else:
-        color = ''
+    plt.figure(figsize=(10, 6))
 
-    messages = [
-        '{}{}{} {}'.format(
-            color,
-            icon,
-            ' [' + code + ']' if args.code else '',
-            issue
-        )
-    ]
+    if not values.empty:
+        sns.heatmap(values.to_frame(), cmap='coolwarm', annot=len(values) <= 50, fmt='.2f', cbar_kws={'label': label})
 
-    if args.export_csv:
-        csv_report.append(code)
+    plt.title(title)
+    plt.ylabel('File ID')
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
 
-    if details:
-        for detail in details:
-            messages.append('  {}:left_arrow_curving_right: {}'.format(
-                    color,
-                    detail['message']
-                )
-            )
 
-    if recommendations:
-        if not args.only_issues:
-            messages.append('  [white]:left_arrow_curving_right: [b]Recommendations:[/b]')
+def show_graphs(recommendation, viewer='xdg-open'):
+    """
+    Open the charts of the recommendations of an insight with an external viewer, only for the rich report.
+    """
+    if not charts():
+        return
 
-            for recommendation in recommendations:
-                messages.append('    :left_arrow_curving_right: {}'.format(recommendation['message']))
+    for rec in recommendation:
+        if rec.get('graph'):
+            if not is_available(viewer):
+                error_console.print('Warning: {} is not available to display the graphs'.format(viewer))
 
-                if args.verbose and 'sample' in recommendation:
-                    messages.append(
-                        Padding(
-                            Panel(
-                                recommendation['sample'],
-                                title='Solution Example Snippet',
-                                title_align='left',
-                                padding=(1, 2)
-                            ),
-                            (1, 0, 1, 7)
-                        )
-                    )
+                return
 
-        insights_total[RECOMMENDATIONS] += len(recommendations)
+            subprocess.run([viewer, rec['graph']])
 
-    return Group(
-        *messages
+
+def message(code, target, level, issue, recommendations=None, details=None, metrics=None):
+    """
+    Record an insight with its level, issue, recommendations, and the evidence that triggered it.
+    """
+    return Insight(
+        code,
+        target,
+        level,
+        issue,
+        recommendations if recommendations else [],
+        details if details else [],
+        metrics if metrics else {}
     )
 
 
-def check_log_version(file, log_version, library_version):
-    use_file = file
+class GateFailed(Exception):
+    """
+    Raised at a checkpoint once an insight fails the CI gate, since the remaining stages cannot change the verdict.
+    """
 
-    if version.parse(log_version) < version.parse('3.4.0'):
-        # Check if darshan-convert is installed and available in the PATH
-        if not is_available('darshan-convert'):
-            console.print(
-                Panel(
-                    Padding(
-                        'Darshan file is using an old format and darshan-convert is not available in the PATH.',
-                        (1, 1)
-                    ),
-                    title='{}WARNING'.format('[orange1]'),
-                    title_align='left'
-                )
-            )
 
-            sys.exit(os.EX_DATAERR)
+def gate_failures():
+    """
+    Insights that fail the CI gate: at its level or above, and among its codes when it has any.
+    """
+    level, codes = args.fail_on
 
-        use_file = os.path.basename(file.replace('.darshan', '.converted.darshan'))
+    return [
+        insight for insight in insights_metadata + insights_operation + insights_dxt
+        if insight.level <= level and (codes is None or insight.code in codes)
+    ]
 
-        console.print(
-            Panel(
-                Padding(
-                    'Converting .darshan log from {} to 3.4.0: format: saving output file "{}" in the current working directory.'.format(
-                        log_version,
-                        use_file
-                    ),
-                    (1, 1)
-                ),
-                title='{}WARNING'.format('[orange1]'),
-                title_align='left'
-            )
-        )
 
-        if not os.path.isfile(use_file):
-            ret = os.system(
-                'darshan-convert {} {}'.format(
-                    file,
-                    use_file
-                )
-            )
+def needed(*codes):
+    """
+    Whether a stage that can detect the insights of the given codes has to run: a CI gate on some codes skips the
+    stages that cannot fail it.
+    """
+    return not args.fail_on or args.fail_on[1] is None or not args.fail_on[1].isdisjoint(codes)
 
-            if ret != 0:
-                print('Unable to convert .darshan file to version {}'.format(library_version))
 
-    return use_file
+def charts():
+    """
+    Whether to draw the charts of the recommendations, which only the rich report shows, and never under a CI gate.
+    """
+    return args.format == 'rich' and not args.fail_on
 
 
-def main():
-    if not os.path.isfile(args.darshan):
-        print('Unable to open .darshan file.')
+def check_gate():
+    if gate_failures():
+        raise GateFailed()
 
-        sys.exit(os.EX_NOINPUT)
 
-    # clear()
-    validate_thresholds()
+def gate_verdict(partial):
+    """
+    Write the insights that failed the CI gate to the standard error, and return the exit code of the gate.
+    """
+    failures = gate_failures()
 
-    insights_start_time = time.time()
+    for insight in failures:
+        sys.stderr.write('[{}] {}\n'.format(insight.code, insight.issue))
 
-    log = darshanll.log_open(args.darshan)
+    if failures:
+        return EXIT_GATE_HIGH if min(insight.level for insight in failures) == HIGH else EXIT_GATE_WARN
 
-    modules = darshanll.log_get_modules(log)
+    if partial:
+        sys.stderr.write('Analysis stopped by the deadline before any insight failed the gate\n')
 
-    information = darshanll.log_get_job(log)
+        return EXIT_GATE_PARTIAL
 
-    log_version = information['metadata']['lib_ver']
-    library_version = darshanll.darshan.backend.cffi_backend.get_lib_version()
+    return os.EX_OK
 
-    # Make sure log format is of the same version
-    filename = check_log_version(args.darshan, log_version, library_version)
- 
-    darshanll.log_close(log)
 
-    darshan.enable_experimental()
+def format_detail(detail):
+    """
+    Format the message of an insight detail with the path of the file that triggered it.
+    """
+    if 'path' not in detail:
+        return detail['message'].format(*detail['values']) if 'values' in detail else detail['message']
 
-    report = darshan.DarshanReport(filename)
+    return detail['message'].format(
+        *detail['values'],
+        detail['path'] if args.full_path else os.path.basename(detail['path'])
+    )
 
-    job = report.metadata
 
-    #########################################################################################################################################################################
+def impact(detail):
+    """
+    Rank of an insight detail in the report, given by its impact or the first value of its message (request count or imbalance).
+    """
+    if 'impact' in detail:
+        return detail['impact']
 
-    # Check usage of STDIO, POSIX, and MPI-IO per file
+    if 'values' not in detail:
+        return 0
 
-    if 'STDIO' in report.records:
-        df_stdio = report.records['STDIO'].to_df()
+    return detail['values'][0]
 
-        if df_stdio:
-            total_write_size_stdio = df_stdio['counters']['STDIO_BYTES_WRITTEN'].sum()
-            total_read_size_stdio = df_stdio['counters']['STDIO_BYTES_READ'].sum()
 
-            total_size_stdio = total_write_size_stdio + total_read_size_stdio 
-        else:
-            total_size_stdio = 0
+def render(insight):
+    """
+    Display the message on the screen with level, issue, and recommendation.
+    """
+    icon = ':arrow_forward:'
+
+    if insight.level == HIGH:
+        color = '[red]'
+    elif insight.level == WARN:
+        color = '[orange1]'
+    elif insight.level == OK:
+        color = '[green]'
     else:
-        df_stdio = None
+        color = ''
 
-        total_size_stdio = 0
+    messages = [
+        '{}{}{} {}'.format(
+            color,
+            icon,
+            ' [' + insight.code + ']' if args.code else '',
+            insight.issue
+        )
+    ]
 
-    if 'POSIX' in report.records:
-        df_posix = report.records['POSIX'].to_df()
+    # Directory rollups summarize the files, so they are always listed first
+    rollups = [detail for detail in insight.details if detail.get('rollup')]
+    details = [detail for detail in insight.details if not detail.get('rollup')]
 
-        if df_posix:
-            total_write_size_posix = df_posix['counters']['POSIX_BYTES_WRITTEN'].sum()
-            total_read_size_posix = df_posix['counters']['POSIX_BYTES_READ'].sum()
+    total_details = len(details)
 
-            total_size_posix = total_write_size_posix + total_read_size_posix
-        else:
-            total_size_posix = 0
-    else:
-        df_posix = None
+    if args.top and total_details > args.top:
+        # The machine-readable outputs keep every file, the report only lists the ones with the highest impact
+        details = heapq.nlargest(args.top, details, key=impact)
 
-        total_size_posix = 0
+    for detail in rollups + details:
+        messages.append('  {}:left_arrow_curving_right: {}'.format(
+                color,
+                format_detail(detail)
+            )
+        )
 
-    if 'MPI-IO' in report.records:
-        df_mpiio = report.records['MPI-IO'].to_df()
+    if len(details) < total_details:
+        messages.append('  {}:left_arrow_curving_right: ... and {} more {}'.format(
+                color,
+                total_details - len(details),
+                'files' if all('id' in detail for detail in insight.details if not detail.get('rollup')) else 'details'
+            )
+        )
 
-        if df_mpiio:
-            total_write_size_mpiio = df_mpiio['counters']['MPIIO_BYTES_WRITTEN'].sum()
-            total_read_size_mpiio = df_mpiio['counters']['MPIIO_BYTES_READ'].sum()
+    if insight.recommendations and not args.only_issues:
+        messages.append('  [white]:left_arrow_curving_right: [b]Recommendations:[/b]')
 
-            total_size_mpiio = total_write_size_mpiio + total_read_size_mpiio 
-        else:
-            total_size_mpiio = 0
-    else:
-        df_mpiio = None
+        for recommendation in insight.recommendations:
+            messages.append('    :left_arrow_curving_right: {}'.format(recommendation['message']))
 
-        total_size_mpiio = 0
+            if args.verbose and 'sample' in recommendation:
+                messages.append(
+                    Padding(
+                        Panel(
+                            snippets.load(recommendation['sample']),
+                            title='Solution Example Snippet',
+                            title_align='left',
+                            padding=(1, 2)
+                        ),
+                        (1, 0, 1, 7)
+                    )
+                )
 
-    # Since POSIX will capture both POSIX-only accesses and those comming from MPI-IO, we can subtract those
-    if total_size_posix > 0 and total_size_posix >= total_size_mpiio:
-        total_size_posix -= total_size_mpiio
+    return Group(
+        *messages
+    )
 
-    total_size = total_size_stdio + total_size_posix + total_size_mpiio
 
-    assert(total_size_stdio >= 0)
-    assert(total_size_posix >= 0)
-    assert(total_size_mpiio >= 0)
+def count_insights(insights):
+    """
+    Count the critical issues, warnings, and recommendations of the detected insights.
+    """
+    insights_total = dict()
 
-    files = {}
+    insights_total[HIGH] = 0
+    insights_total[WARN] = 0
+    insights_total[RECOMMENDATIONS] = 0
 
-    # Check interface usage for each file
-    file_map = report.name_records
+    for insight in insights:
+        if insight.level in (HIGH, WARN):
+            insights_total[insight.level] += 1
 
-    total_files = len(file_map)
+        insights_total[RECOMMENDATIONS] += len(insight.recommendations)
 
-    total_files_stdio = 0
-    total_files_posix = 0
-    total_files_mpiio = 0
+    return insights_total
 
-    for id, path in file_map.items():
-        if df_stdio:
-            uses_stdio = len(df_stdio['counters'][(df_stdio['counters']['id'] == id)]) > 0
-        else:
-            uses_stdio = 0
-        
-        if df_posix:
-            uses_posix = len(df_posix['counters'][(df_posix['counters']['id'] == id)]) > 0
-        else:
-            uses_posix = 0
 
-        if df_mpiio:
-            uses_mpiio = len(df_mpiio['counters'][(df_mpiio['counters']['id'] == id)]) > 0
-        else:
-            uses_mpiio = 0
+def record(insight):
+    """
+    Build the machine-readable record of an insight.
+    """
+    return {
+        'code': insight.code,
+        'level': LEVELS.get(insight.level, insight.level),
+        'target': TARGETS.get(insight.target, insight.target),
+        'issue': insight.issue,
+        'metrics': insight.metrics,
+        'files': insight.files,
+        'details': [format_detail(detail) for detail in insight.details],
+        'recommendations': [recommendation['message'] for recommendation in insight.recommendations]
+    }
+
+
+def to_json(value):
+    """
+    Convert NumPy scalars and arrays found in the metrics into native Python types.
+    """
+    if hasattr(value, 'tolist'):
+        return value.tolist()
 
-        total_files_stdio += uses_stdio
-        total_files_posix += uses_posix
-        total_files_mpiio += uses_mpiio
+    return str(value)
 
-        files[id] = {
-            'path': path,
-            'stdio': uses_stdio,
-            'posix': uses_posix,
-            'mpiio': uses_mpiio
-        }
 
-    df_posix_files = df_posix
+def export_name():
+    """
+    Path of the exported reports, without their extension: next to the log, or in the working directory for a log
+    in an archive.
+    """
+    location = archives.locate(args.darshan)
 
-    if total_size and total_size_stdio / total_size > THRESHOLD_INTERFACE_STDIO:
-        issue = 'Application is using STDIO, a low-performance interface, for {:.2f}% of its data transfers ({})'.format(
-            total_size_stdio / total_size * 100.0,
-            convert_bytes(total_size_stdio)
-        )
-       
-        recommendation = [
-            {
-                'message': 'Consider switching to a high-performance I/O interface such as MPI-IO'
-            }
-        ]
+    return args.darshan if location is None else os.path.basename(location[1])
 
-        insights_operation.append(
-            message(INSIGHTS_STDIO_HIGH_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation)
-        )
 
-    if 'MPI-IO' not in modules:
-        issue = 'Application is using low-performance interface'
+def export_records(job, job_start, job_end, elapsed, job_timeline=None, partial=None):
+    """
+    Write the insights as machine-readable records to the standard output, without rendering a report.
 
-        recommendation = [
-            {
-                'message' : 'Consider switching to a high-performance I/O interface such as MPI-IO'
-            }
-        ]
+    Every record says whether the analysis was stopped by its deadline. The JSON document also carries the
+    stages that completed, and the I/O timeline of the job, with one array per field of the bins.
+    """
+    header = {
+        'job': job['job']['jobid'],
+        'executable': job['exe'].split()[0],
+        'darshan': os.path.basename(args.darshan),
+        'start': job_start.isoformat(),
+        'end': job_end.isoformat(),
+        'processes': job['job']['nprocs'],
+        'partial': partial is not None
+    }
+
+    insights = insights_metadata + insights_operation + insights_dxt
+
+    if args.format == 'ndjson':
+        for insight in insights:
+            sys.stdout.write(json.dumps(dict(header, **record(insight)), default=to_json) + '\n')
+    else:
+        header['elapsed'] = elapsed
+
+        if partial:
+            header['stopped_by'] = partial['reason']
+            header['completed_stages'] = partial['completed']
+        header['insights'] = [record(insight) for insight in insights]
+
+        if job_timeline is not None:
+            header['timeline'] = {field: job_timeline[field] for field in job_timeline.dtype.names}
+            header['phases'] = timeline.phases(job_timeline)
+
+        json.dump(header, sys.stdout, default=to_json, indent=2)
+        sys.stdout.write('\n')
+
+    sys.stdout.flush()
+
+
+def sample_insights(posix, mpiio):
+    """
+    Estimate the ratio-based insights from the samples of the POSIX and MPI-IO records, with a confidence interval
+    for each ratio.
+
+    An insight is reported when its estimate is above the threshold, and its decision is certain when the whole
+    interval falls on the same side of the threshold. Uncertain decisions are flagged in the issue.
+    """
+    rules = {
+        'small_reads': (INSIGHTS_POSIX_HIGH_SMALL_READ_REQUESTS_USAGE, thresholds.SMALL_REQUESTS, thresholds.SMALL_REQUESTS_ABSOLUTE, insights_operation,
+            'Application issues a high number (~{:.0f}) of small read requests (i.e., < 1MB) which represents {:.2f}% of all read requests'),
+        'small_writes': (INSIGHTS_POSIX_HIGH_SMALL_WRITE_REQUESTS_USAGE, thresholds.SMALL_REQUESTS, thresholds.SMALL_REQUESTS_ABSOLUTE, insights_operation,
+            'Application issues a high number (~{:.0f}) of small write requests (i.e., < 1MB) which represents {:.2f}% of all write requests'),
+        'misaligned_memory': (INSIGHTS_POSIX_HIGH_MISALIGNED_MEMORY_USAGE, thresholds.MISALIGNED_REQUESTS, 0, insights_metadata,
+            'Application has a high number (~{:.0f}) of misaligned memory requests ({:.2f}%)'),
+        'misaligned_file': (INSIGHTS_POSIX_HIGH_MISALIGNED_FILE_USAGE, thresholds.MISALIGNED_REQUESTS, 0, insights_metadata,
+            'Application issues a high number (~{:.0f}) of misaligned file requests ({:.2f}%)'),
+        'random_reads': (INSIGHTS_POSIX_HIGH_RANDOM_READ_USAGE, thresholds.RANDOM_OPERATIONS, thresholds.RANDOM_OPERATIONS_ABSOLUTE, insights_operation,
+            'Application is issuing a high number (~{:.0f}) of random read operations ({:.2f}%)'),
+        'random_writes': (INSIGHTS_POSIX_HIGH_RANDOM_WRITE_USAGE, thresholds.RANDOM_OPERATIONS, thresholds.RANDOM_OPERATIONS_ABSOLUTE, insights_operation,
+            'Application is issuing a high number (~{:.0f}) of random write operations ({:.2f}%)'),
+        'independent_reads': (INSIGHTS_MPI_IO_NO_COLLECTIVE_READ_USAGE, thresholds.COLLECTIVE_OPERATIONS, thresholds.COLLECTIVE_OPERATIONS_ABSOLUTE, insights_operation,
+            'Application uses MPI-IO but it issues ~{:.0f} ({:.2f}%) independent read calls instead of collective ones'),
+        'independent_writes': (INSIGHTS_MPI_IO_NO_COLLECTIVE_WRITE_USAGE, thresholds.COLLECTIVE_OPERATIONS, thresholds.COLLECTIVE_OPERATIONS_ABSOLUTE, insights_operation,
+            'Application uses MPI-IO but it issues ~{:.0f} ({:.2f}%) independent write calls instead of collective ones')
+    }
+
+    estimated = sampling.estimates(posix, mpiio)
+
+    for name, (estimate, low, high, total, size, records) in estimated.items():
+        code, threshold, absolute, insights, text = rules[name]
+
+        if estimate <= threshold or total <= absolute:
+            continue
+
+        certain = sampling.certain(low, high, threshold)
+
+        issue = text.format(total, estimate * 100.0)
+
+        if not certain:
+            issue += ', but the sample is too small to be certain (95% confidence interval: {:.2f}% to {:.2f}%)'.format(
+                low * 100.0, high * 100.0
+            )
+
+        insights.append(
+            message(code, TARGET_DEVELOPER, HIGH if certain else WARN, issue, None, metrics={
+                'estimate': estimate,
+                'confidence_interval': [low, high],
+                'threshold': threshold,
+                'certain': certain,
+                'sample': size,
+                'records': records
+            })
+        )
+
+
+def output(job, summary, elapsed, codes=None, partial=None):
+    """
+    Display the report, or write the machine-readable records, with the insights detected in the log.
+
+    The summary has the number of files using each interface, the number of compute nodes, the MPI-IO hints,
+    and the I/O timeline. Results of an analysis stopped by its deadline are marked as partial in every format.
+    """
+    # Version 3.4.1 of py-darshan changed the contents on what is reported in 'job'
+    if 'start_time' in job['job']:
+        job_start = datetime.datetime.fromtimestamp(job['job']['start_time'], datetime.timezone.utc)
+        job_end = datetime.datetime.fromtimestamp(job['job']['end_time'], datetime.timezone.utc)
+    else:
+        job_start = datetime.datetime.fromtimestamp(job['job']['start_time_sec'], datetime.timezone.utc)
+        job_end = datetime.datetime.fromtimestamp(job['job']['end_time_sec'], datetime.timezone.utc)
+
+    if args.format != 'rich':
+        export_records(job, job_start, job_end, elapsed, summary['timeline'], partial)
+    else:
+        insights_total = count_insights(insights_metadata + insights_operation + insights_dxt)
+
+        console.print()
+
+        console.print(
+            Panel(
+                '\n'.join([
+                    ' [b]JOB[/b]:            [white]{}[/white]'.format(
+                        job['job']['jobid']
+                    ),
+                    ' [b]EXECUTABLE[/b]:     [white]{}[/white]'.format(
+                        job['exe'].split()[0]
+                    ),
+                    ' [b]DARSHAN[/b]:        [white]{}[/white]'.format(
+                        os.path.basename(args.darshan)
+                    ),
+                    ' [b]EXECUTION TIME[/b]: [white]{} to {} ({:.2f} hours)[/white]'.format(
+                        job_start,
+                        job_end,
+                        (job_end - job_start).total_seconds() / 3600
+                    ),
+                    ' [b]FILES[/b]:          [white]{} files ({} use STDIO, {} use POSIX, {} use MPI-IO)[/white]'.format(
+                        summary['files'],
+                        summary['files_stdio'],
+                        summary['files_posix'] - summary['files_mpiio'],  # Since MPI-IO files will always use POSIX, we can decrement to get a unique count
+                        summary['files_mpiio']
+                    ),
+                    ' [b]COMPUTE NODES[/b]   [white]{}[/white]'.format(
+                        summary['compute_nodes']
+                    ),
+                    ' [b]PROCESSES[/b]       [white]{}[/white]'.format(
+                        job['job']['nprocs']
+                    ),
+                    ' [b]HINTS[/b]:          [white]{}[/white]'.format(
+                        ' '.join(summary['hints'])
+                    )
+                ]),
+                title='[b][slate_blue3]DRISHTI[/slate_blue3] v.0.3[/b]',
+                title_align='left',
+                subtitle='[red][b]{} critical issues[/b][/red], [orange1][b]{} warnings[/b][/orange1], and [white][b]{} recommendations[/b][/white]'.format(
+                    insights_total[HIGH],
+                    insights_total[WARN],
+                    insights_total[RECOMMENDATIONS],
+                ),
+                subtitle_align='left',
+                padding=1
+            )
+        )
+
+        console.print()
+
+        if partial:
+            console.print(
+                Panel(
+                    Padding(
+                        'Partial results: {} after the {} stage, the insights of later stages were not evaluated.'.format(
+                            'the analysis ran out of its time budget of {} seconds'.format(partial['deadline']) if partial['reason'] == 'deadline' else 'the CI gate failed',
+                            partial['completed'][-1] if partial['completed'] else 'first'
+                        ),
+                        (1, 1)
+                    ),
+                    title='{}WARNING'.format('[orange1]'),
+                    title_align='left'
+                )
+            )
+
+            console.print()
+
+        if insights_metadata:
+            console.print(
+                Panel(
+                    Padding(
+                        Group(
+                            *[render(insight) for insight in insights_metadata]
+                        ),
+                        (1, 1)
+                    ),
+                    title='METADATA',
+                    title_align='left'
+                )
+            )
+
+        if insights_operation:
+            console.print(
+                Panel(
+                    Padding(
+                        Group(
+                            *[render(insight) for insight in insights_operation]
+                        ),
+                        (1, 1)
+                    ),
+                    title='OPERATIONS',
+                    title_align='left'
+                )
+            )
+
+        if insights_dxt:
+            console.print(
+                Panel(
+                    Padding(
+                        Group(
+                            *[render(insight) for insight in insights_dxt]
+                        ),
+                        (1, 1)
+                    ),
+                    title='DXT',
+                    title_align='left'
+                )
+            )
+        
+        console.print(
+            Panel(
+                ' {} | [white]LBNL[/white] | [white]Drishti report generated at {} in[/white] {:.3f} seconds'.format(
+                    datetime.datetime.now().year,
+                    datetime.datetime.now(),
+                    elapsed
+                ),
+                box=box.SIMPLE
+            )
+        )
+
+        if args.export_theme_light:
+            export_theme = TerminalTheme(
+                (255, 255, 255),
+                (0, 0, 0),
+                [
+                    (26, 26, 26),
+                    (244, 0, 95),
+                    (152, 224, 36),
+                    (253, 151, 31),
+                    (157, 101, 255),
+                    (244, 0, 95),
+                    (88, 209, 235),
+                    (120, 120, 120),
+                    (98, 94, 76),
+                ],
+                [
+                    (244, 0, 95),
+                    (152, 224, 36),
+                    (224, 213, 97),
+                    (157, 101, 255),
+                    (244, 0, 95),
+                    (88, 209, 235),
+                    (246, 246, 239),
+                ],
+            )
+        else:
+            export_theme = MONOKAI
+
+        if args.export_html:
+            console.save_html(
+                '{}.html'.format(export_name()),
+                theme=export_theme,
+                clear=False
+            )
+
+        if args.export_svg:
+            console.save_svg(
+                '{}.svg'.format(export_name()),
+                title='Drishti',
+                theme=export_theme,
+                clear=False
+            )
+
+    if args.export_csv:
+        issues = [
+            'JOB',
+            'PARTIAL',
+            INSIGHTS_STDIO_HIGH_USAGE,
+            INSIGHTS_POSIX_WRITE_COUNT_INTENSIVE,
+            INSIGHTS_POSIX_READ_COUNT_INTENSIVE,
+            INSIGHTS_POSIX_WRITE_SIZE_INTENSIVE,
+            INSIGHTS_POSIX_READ_SIZE_INTENSIVE,
+            INSIGHTS_POSIX_HIGH_SMALL_READ_REQUESTS_USAGE,
+            INSIGHTS_POSIX_HIGH_SMALL_WRITE_REQUESTS_USAGE,
+            INSIGHTS_POSIX_HIGH_MISALIGNED_MEMORY_USAGE,
+            INSIGHTS_POSIX_HIGH_MISALIGNED_FILE_USAGE,
+            INSIGHTS_POSIX_REDUNDANT_READ_USAGE,
+            INSIGHTS_POSIX_REDUNDANT_WRITE_USAGE,
+            INSIGHTS_POSIX_HIGH_RANDOM_READ_USAGE,
+            INSIGHTS_POSIX_HIGH_SEQUENTIAL_READ_USAGE,
+            INSIGHTS_POSIX_HIGH_RANDOM_WRITE_USAGE,
+            INSIGHTS_POSIX_HIGH_SEQUENTIAL_WRITE_USAGE,
+            INSIGHTS_POSIX_HIGH_SMALL_READ_REQUESTS_SHARED_FILE_USAGE,
+            INSIGHTS_POSIX_HIGH_SMALL_WRITE_REQUESTS_SHARED_FILE_USAGE,
+            INSIGHTS_POSIX_HIGH_METADATA_TIME,
+            INSIGHTS_POSIX_SIZE_IMBALANCE,
+            INSIGHTS_POSIX_TIME_IMBALANCE,
+            INSIGHTS_POSIX_INDIVIDUAL_WRITE_SIZE_IMBALANCE,
+            INSIGHTS_POSIX_INDIVIDUAL_READ_SIZE_IMBALANCE,
+            INSIGHTS_POSIX_SERIALIZED_IO,
+            INSIGHTS_POSIX_RANK_BYTES_VARIATION,
+            INSIGHTS_POSIX_RANK_TIME_VARIATION,
+            INSIGHTS_POSIX_NODE_IMBALANCE,
+            INSIGHTS_MPI_IO_NO_USAGE,
+            INSIGHTS_MPI_IO_NO_COLLECTIVE_READ_USAGE,
+            INSIGHTS_MPI_IO_NO_COLLECTIVE_WRITE_USAGE,
+            INSIGHTS_MPI_IO_COLLECTIVE_READ_USAGE,
+            INSIGHTS_MPI_IO_COLLECTIVE_WRITE_USAGE,
+            INSIGHTS_MPI_IO_BLOCKING_READ_USAGE,
+            INSIGHTS_MPI_IO_BLOCKING_WRITE_USAGE,
+            INSIGHTS_MPI_IO_AGGREGATORS_INTRA,
+            INSIGHTS_MPI_IO_AGGREGATORS_INTER,
+            INSIGHTS_MPI_IO_AGGREGATORS_OK,
+            INSIGHTS_MPI_IO_REQUEST_AMPLIFICATION,
+            INSIGHTS_MPI_IO_BYTE_AMPLIFICATION,
+            INSIGHTS_DXT_HIGH_RANDOM_USAGE,
+            INSIGHTS_DXT_SERIALIZED_SHARED_FILE_USAGE,
+            INSIGHTS_DXT_STRIDED_USAGE,
+            INSIGHTS_HEATMAP_BURSTY_IO,
+            INSIGHTS_HEATMAP_IDLE_IO,
+            INSIGHTS_HEATMAP_RANK_SKEWED_IO,
+            INSIGHTS_LUSTRE_OST_IMBALANCE,
+            INSIGHTS_LUSTRE_STRIPE_SIZE_MISMATCH,
+            INSIGHTS_LUSTRE_SHARED_FILE_FEW_OSTS,
+            INSIGHTS_BASELINE_REGRESSION
+        ]
+        if codes:
+            issues.extend(codes)
+
+        detected_issues = dict.fromkeys(issues, False)
+        detected_issues['JOB'] = job['job']['jobid']
+        detected_issues['PARTIAL'] = partial is not None
+
+        for insight in insights_metadata + insights_operation + insights_dxt:
+            detected_issues[insight.code] = True
+
+        filename = '{}-summary.csv'.format(
+            export_name().replace('.darshan', '')
+        )
+
+        with open(filename, 'w') as f:
+            w = csv.writer(f)
+            w.writerow(detected_issues.keys())
+            w.writerow(detected_issues.values())
+
+
+def check_log_version(file, log_version, library_version):
+    use_file = file
+
+    if version.parse(log_version) < version.parse('3.4.0'):
+        # Check if darshan-convert is installed and available in the PATH
+        if not is_available('darshan-convert'):
+            console.print(
+                Panel(
+                    Padding(
+                        'Darshan file is using an old format and darshan-convert is not available in the PATH.',
+                        (1, 1)
+                    ),
+                    title='{}WARNING'.format('[orange1]'),
+                    title_align='left'
+                )
+            )
+
+            sys.exit(os.EX_DATAERR)
+
+        use_file = os.path.basename(file.replace('.darshan', '.converted.darshan'))
+
+        console.print(
+            Panel(
+                Padding(
+                    'Converting .darshan log from {} to 3.4.0: format: saving output file "{}" in the current working directory.'.format(
+                        log_version,
+                        use_file
+                    ),
+                    (1, 1)
+                ),
+                title='{}WARNING'.format('[orange1]'),
+                title_align='left'
+            )
+        )
+
+        if not os.path.isfile(use_file):
+            # The converter output is not part of the report, nor of the machine-readable document
+            try:
+                ret = subprocess.call(
+                    ['darshan-convert', file, use_file],
+                    stdout=sys.stderr
+                )
+            except OSError:
+                ret = os.EX_UNAVAILABLE
+
+            if ret != 0:
+                error_console.print('Unable to convert .darshan file to version {}'.format(library_version))
+
+    return use_file
+
+
+def main():
+    if args.darshan != '-' and not os.path.isfile(args.darshan) and archives.locate(args.darshan) is None:
+        error_console.print('Unable to open .darshan file.')
+
+        sys.exit(os.EX_NOINPUT)
+
+    # clear()
+    if args.config:
+        try:
+            thresholds.load(args.config)
+        except (OSError, ValueError) as e:
+            error_console.print('Unable to read the thresholds from {}: {}'.format(args.config, e))
+
+            sys.exit(os.EX_CONFIG)
+
+    validate_thresholds()
+
+    with contextlib.ExitStack() as stack:
+        try:
+            # A log in an archive is copied to a temporary buffer, removed once the report is done
+            filename = stack.enter_context(archives.opened(args.darshan))
+        except OSError as e:
+            error_console.print('Unable to read {}: {}'.format(args.darshan, e))
+
+            sys.exit(os.EX_NOINPUT)
+
+        report(filename)
+
+
+def report(filename):
+    """
+    Analyze the log read from filename (or restore its cached results) and output the report.
+    """
+    insights_start_time = time.time()
+
+    results = None
+    results_key = None
+
+    # Analyses with side effects are not cached, so the timeline chart, baselines, and sketches are always written,
+    # and neither is the standard input, which can only be read once
+    if not args.no_cache and not (args.timeline or args.baselines or args.sketch) and args.darshan != '-':
+        result_cache = cache.ResultCache()
+
+        results_key = cache.key(filename, thresholds.current(), VERSION, {
+            'sample': args.sample,
+            'sample_by': args.sample_by,
+            'job_info': args.job_info
+        })
+
+        results = result_cache.get(results_key)
+
+    if results:
+        job, summary = restore(results)
+
+        partial = None
+    else:
+        job, summary, partial = run(filename)
+
+        # Runs under a deadline or a gate may skip stages or the DXT traces, and a failed sacct query leaves the
+        # compute nodes unknown, so only complete analyses are kept
+        if results_key and not (partial or summary['failed_lookups'] or args.deadline or args.fail_on):
+            result_cache.put(results_key, store(job, summary), default=to_json)
+
+    #########################################################################################################################################################################
+
+    codes = []
+    if args.json:
+        f = open(args.json)
+        data = json.load(f)
+
+        for key, values in data.items():
+            for value in values:
+                code = value['code']
+                codes.append(code)
+
+                level = value['level']
+                issue = value['issue']
+                recommendation = []
+                for rec in value['recommendations']:
+                    new_message = {'message': rec}
+                    recommendation.append(new_message)
+
+                insights_dxt.append(
+                    message(code, TARGET_DEVELOPER, level, issue, recommendation)
+                )
+
+    #########################################################################################################################################################################
+
+    insights_end_time = time.time()
+
+    if not args.fail_on or args.format != 'rich' or args.export_html or args.export_svg or args.export_csv:
+        output(job, summary, insights_end_time - insights_start_time, codes, partial)
+
+    if args.fail_on:
+        sys.exit(gate_verdict(partial if partial and partial['reason'] == 'deadline' else None))
+
+
+def store(job, summary):
+    """
+    Structured results of an analysis, as kept in the result cache.
+    """
+    job_timeline = summary['timeline']
+
+    return {
+        'job': job,
+        'summary': dict(
+            summary,
+            timeline={field: job_timeline[field] for field in job_timeline.dtype.names} if job_timeline is not None else None
+        ),
+        'insights': {
+            name: [{field: getattr(insight, field) for field in Insight.__slots__} for insight in insights]
+            for name, insights in (('metadata', insights_metadata), ('operation', insights_operation), ('dxt', insights_dxt))
+        }
+    }
+
+
+def restore(results):
+    """
+    Load the insights of cached results, and return the job metadata and summary needed to display them.
+    """
+    for name, insights in (('metadata', insights_metadata), ('operation', insights_operation), ('dxt', insights_dxt)):
+        insights.extend(Insight(**insight) for insight in results['insights'][name])
+
+    summary = results['summary']
+
+    if summary['timeline'] is not None:
+        fields = summary['timeline']
+
+        job_timeline = np.zeros(len(fields['start']), dtype=timeline.BIN)
+
+        for field, values in fields.items():
+            job_timeline[field] = values
+
+        summary['timeline'] = job_timeline
+
+    return results['job'], summary
+
+
+def run(path):
+    """
+    Read the log from its path (or - for the standard input) and detect its insights, returning the job metadata,
+    the summary, and why the analysis stopped early (or None).
+
+    The time budget starts before the log is read, since parsing it is the most expensive step of large logs.
+    """
+    budget = deadline.Deadline(args.deadline, check=check_gate if args.fail_on else None)
+
+    if textlog.is_text(path):
+        # darshan-parser output is streamed into the same records as the report, it has no DXT traces to decode
+        report = textlog.TextReport(path)
+
+        filename = path
+        modules = report.modules
+
+        if args.sample:
+            for module in SAMPLED_MODULES:
+                if module in report.records:
+                    report.records[module] = sampling.Sample.from_df(report.records[module].to_df(), args.sample, args.sample_by)
+    else:
+        if darshanll is None:
+            error_console.print('Unable to load the Darshan library, analyze the darshan-parser output of the log instead.')
+
+            sys.exit(os.EX_UNAVAILABLE)
+
+        log = darshanll.log_open(path)
+
+        modules = darshanll.log_get_modules(log)
+
+        information = darshanll.log_get_job(log)
+
+        log_version = information['metadata']['lib_ver']
+        library_version = darshanll.darshan.backend.cffi_backend.get_lib_version()
+
+        # Make sure log format is of the same version
+        filename = check_log_version(path, log_version, library_version)
+ 
+        darshanll.log_close(log)
+
+        darshan.enable_experimental()
+
+        # DXT traces are not decoded by the report, the DXT engine reduces them one record at a time
+        report = darshan.DarshanReport(filename, read_all=False)
+
+        if args.sample:
+            # A sample only estimates the ratio-based insights, which do not need the other modules. Records are
+            # sampled while they are decoded, so memory and DataFrames only grow with the sample
+            for module in SAMPLED_MODULES:
+                if module in modules:
+                    report.records[module] = sampling.Sample.from_log(filename, module, args.sample, args.sample_by)
+
+            # The report only reads the paths of the records it decodes, so the paths of the sampled modules are looked up
+            sampled_ids = set().union(*(report.records[module].ids for module in SAMPLED_MODULES if module in report.records))
+
+            report.name_records.update(darshanll.log_lookup_name_records(report.log, list(sampled_ids)))
+        else:
+            report.read_all_generic_records()
+
+            if 'LUSTRE' in report.data['modules']:
+                report.mod_read_all_lustre_records()
+
+            if 'HEATMAP' in report.data['modules']:
+                report.read_all_heatmap_records()
+
+    job = report.metadata
+
+    hints = job['job']['metadata'].get('h', '')
+
+    summary = {
+        'files': len(report.name_records),
+        'files_stdio': 0,
+        'files_posix': 0,
+        'files_mpiio': 0,
+        'compute_nodes': 0,
+        'hints': hints.split(';') if hints else [],
+        'timeline': None,
+        # Lookups that failed or were cut short, so the results depend on more than the log and the options
+        'failed_lookups': []
+    }
+
+    # The sketch only needs the POSIX records, so it is saved before a deadline or a gate can stop the analysis
+    if args.sketch and 'POSIX' in report.records:
+        save_sketch(report.records['POSIX'], report.name_records, job)
+
+    partial = None
+
+    try:
+        budget.checkpoint('log')
+
+        analyze(report, filename, modules, job, summary, budget)
+    except deadline.DeadlineExceeded:
+        partial = {
+            'reason': 'deadline',
+            'deadline': args.deadline,
+            'completed': budget.completed
+        }
+    except GateFailed:
+        partial = {
+            'reason': 'gate',
+            'deadline': args.deadline,
+            'completed': budget.completed
+        }
+
+    return job, summary, partial
+
+
+def save_sketch(records, names, job):
+    """
+    Save the mergeable sketches of the POSIX records of the log, with the sampled records weighted by their strata.
+    """
+    df = records.to_df()
+
+    if not df or df['counters'].empty:
+        return
+
+    if args.sample:
+        weights = (records.population / records.sizes)[records.strata]
+        files = np.fromiter(records.ids, dtype=np.uint64, count=len(records.ids))
+    else:
+        weights = files = None
+
+    fleet = sketches.Fleet()
+    fleet.add(job['exe'].split()[0], df['counters'], df['fcounters'], names, weights, files)
+    fleet.save(args.sketch)
+
+
+def traces(filename, modules, nprocs, budget, summary):
+    """
+    Per-file features from the DXT traces, shared by the insights that can be computed exactly from them, and the
+    node where each rank ran, from the hostnames in the DXT records, so no scheduler query is needed.
+
+    The traces are decoded with the time left in the budget. Traces or hostnames that could not be decoded within
+    it are added to the failed lookups of the summary.
+    """
+    dxt_features = {}
+
+    for module in dxt.DXT_MODULES:
+        if module in modules and not args.sample:
+            features = dxt.analyze(filename, module, budget)
+
+            if features is not None:
+                dxt_features[module] = features
+            else:
+                summary['failed_lookups'].append('traces')
+
+    hosts = dxt.hostnames(filename, nprocs, budget) if dxt_features else {}
+
+    if dxt_features and not hosts:
+        summary['failed_lookups'].append('hostnames')
+
+    return dxt_features, hosts
+
+
+def analyze(report, filename, modules, job, summary, budget):
+    """
+    Detect the insights of a log, filling the summary as the stages complete.
+
+    Cheap rules on the module counters run first, and the DXT traces are decoded last with the time left in the
+    budget, followed by the insights that need them. Each stage ends with a checkpoint that stops the analysis once
+    the budget has run out, or once a CI gate has failed.
+    """
+    # Check usage of STDIO, POSIX, and MPI-IO per file
+
+    if 'STDIO' in report.records:
+        df_stdio = report.records['STDIO'].to_df()
+
+        if df_stdio:
+            total_write_size_stdio = df_stdio['counters']['STDIO_BYTES_WRITTEN'].sum()
+            total_read_size_stdio = df_stdio['counters']['STDIO_BYTES_READ'].sum()
+
+            total_size_stdio = total_write_size_stdio + total_read_size_stdio 
+        else:
+            total_size_stdio = 0
+    else:
+        df_stdio = None
+
+        total_size_stdio = 0
+
+    if 'POSIX' in report.records:
+        df_posix = report.records['POSIX'].to_df()
+
+        if df_posix:
+            total_write_size_posix = df_posix['counters']['POSIX_BYTES_WRITTEN'].sum()
+            total_read_size_posix = df_posix['counters']['POSIX_BYTES_READ'].sum()
+
+            total_size_posix = total_write_size_posix + total_read_size_posix
+        else:
+            total_size_posix = 0
+    else:
+        df_posix = None
+
+        total_size_posix = 0
+
+    if 'MPI-IO' in report.records:
+        df_mpiio = report.records['MPI-IO'].to_df()
+
+        if df_mpiio:
+            total_write_size_mpiio = df_mpiio['counters']['MPIIO_BYTES_WRITTEN'].sum()
+            total_read_size_mpiio = df_mpiio['counters']['MPIIO_BYTES_READ'].sum()
+
+            total_size_mpiio = total_write_size_mpiio + total_read_size_mpiio 
+        else:
+            total_size_mpiio = 0
+    else:
+        df_mpiio = None
+
+        total_size_mpiio = 0
+
+    # Since POSIX will capture both POSIX-only accesses and those comming from MPI-IO, we can subtract those
+    if total_size_posix > 0 and total_size_posix >= total_size_mpiio:
+        total_size_posix -= total_size_mpiio
+
+    total_size = total_size_stdio + total_size_posix + total_size_mpiio
+
+    assert(total_size_stdio >= 0)
+    assert(total_size_posix >= 0)
+    assert(total_size_mpiio >= 0)
+
+    # Files using each interface, looked up by id instead of scanning the records of every file
+    if args.sample:
+        # The samples keep the ids of all the records
+        stdio_ids, posix_ids, mpiio_ids = (
+            report.records[module].ids if module in report.records else set() for module in SAMPLED_MODULES
+        )
+    else:
+        stdio_ids = set(df_stdio['counters']['id']) if df_stdio else set()
+        posix_ids = set(df_posix['counters']['id']) if df_posix else set()
+        mpiio_ids = set(df_mpiio['counters']['id']) if df_mpiio else set()
+
+    summary['files_stdio'] = len(stdio_ids)
+    summary['files_posix'] = len(posix_ids)
+    summary['files_mpiio'] = len(mpiio_ids)
+
+    if args.sample:
+        sample_insights(report.records.get('POSIX'), report.records.get('MPI-IO'))
+
+        return
+
+    files = {}
+
+    # Check interface usage for each file
+    file_map = PathTrie(report.name_records)
+
+    total_files = len(file_map)
+
+    total_files_stdio = 0
+    total_files_posix = 0
+    total_files_mpiio = 0
+
+    for id, path in file_map.items():
+        uses_stdio = id in stdio_ids
+        uses_posix = id in posix_ids
+        uses_mpiio = id in mpiio_ids
+
+        total_files_stdio += uses_stdio
+        total_files_posix += uses_posix
+        total_files_mpiio += uses_mpiio
+
+        files[id] = {
+            'path': path,
+            'stdio': uses_stdio,
+            'posix': uses_posix,
+            'mpiio': uses_mpiio
+        }
+
+    summary['files'] = total_files
+    summary['files_stdio'] = total_files_stdio
+    summary['files_posix'] = total_files_posix
+    summary['files_mpiio'] = total_files_mpiio
+
+    df_posix_files = df_posix
+
+    if total_size and total_size_stdio / total_size > thresholds.INTERFACE_STDIO:
+        issue = 'Application is using STDIO, a low-performance interface, for {:.2f}% of its data transfers ({})'.format(
+            total_size_stdio / total_size * 100.0,
+            convert_bytes(total_size_stdio)
+        )
+       
+        recommendation = [
+            {
+                'message': 'Consider switching to a high-performance I/O interface such as MPI-IO'
+            }
+        ]
+
+        insights_operation.append(
+            message(INSIGHTS_STDIO_HIGH_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, metrics={
+                'stdio_bytes': total_size_stdio,
+                'total_bytes': total_size
+            })
+        )
+
+    if 'MPI-IO' not in modules:
+        issue = 'Application is using low-performance interface'
+
+        recommendation = [
+            {
+                'message' : 'Consider switching to a high-performance I/O interface such as MPI-IO'
+            }
+        ]
+
+        insights_operation.append(
+            message(INSIGHTS_MPI_IO_NO_USAGE, TARGET_DEVELOPER, WARN, issue, recommendation, metrics={
+                'mpiio_bytes': total_size_mpiio,
+                'total_bytes': total_size
+            })
+        )
+
+    budget.checkpoint('interfaces')
+
+    #########################################################################################################################################################################
+
+    if 'POSIX' in report.records:
+        df = report.records['POSIX'].to_df()
+
+        #print(df)
+        #print(df['counters'].columns)
+        #print(df['fcounters'].columns)
+
+        #########################################################################################################################################################################
+
+        # Get number of write/read operations
+        total_reads = df['counters']['POSIX_READS'].sum()
+        total_writes = df['counters']['POSIX_WRITES'].sum()
+
+        # Get total number of I/O operations
+        total_operations = total_writes + total_reads 
+
+        # To check whether the application is write-intersive or read-intensive we only look at the POSIX level and check if the difference between reads and writes is larger than 10% (for more or less), otherwise we assume a balance
+        if total_writes > total_reads and total_operations and abs(total_writes - total_reads) / total_operations > thresholds.OPERATION_IMBALANCE:
+            issue = 'Application is write operation intensive ({:.2f}% writes vs. {:.2f}% reads)'.format(
+                total_writes / total_operations * 100.0, total_reads / total_operations * 100.0
+            )
+
+            insights_metadata.append(
+                message(INSIGHTS_POSIX_WRITE_COUNT_INTENSIVE, TARGET_DEVELOPER, INFO, issue, None, metrics={
+                    'reads': total_reads,
+                    'writes': total_writes
+                })
+            )
+
+        if total_reads > total_writes and total_operations and abs(total_writes - total_reads) / total_operations > thresholds.OPERATION_IMBALANCE:
+            issue = 'Application is read operation intensive ({:.2f}% writes vs. {:.2f}% reads)'.format(
+                total_writes / total_operations * 100.0, total_reads / total_operations * 100.0
+            )
+
+            insights_metadata.append(
+                message(INSIGHTS_POSIX_READ_COUNT_INTENSIVE, TARGET_DEVELOPER, INFO, issue, None, metrics={
+                    'reads': total_reads,
+                    'writes': total_writes
+                })
+            )
+
+        total_read_size = df['counters']['POSIX_BYTES_READ'].sum()
+        total_written_size = df['counters']['POSIX_BYTES_WRITTEN'].sum()
+
+        total_size = total_written_size + total_read_size
+
+        if total_written_size > total_read_size and abs(total_written_size - total_read_size) / (total_written_size + total_read_size) > thresholds.OPERATION_IMBALANCE:
+            issue = 'Application is write size intensive ({:.2f}% write vs. {:.2f}% read)'.format(
+                total_written_size / (total_written_size + total_read_size) * 100.0, total_read_size / (total_written_size + total_read_size) * 100.0
+            )
+
+            insights_metadata.append(
+                message(INSIGHTS_POSIX_WRITE_SIZE_INTENSIVE, TARGET_DEVELOPER, INFO, issue, None, metrics={
+                    'bytes_read': total_read_size,
+                    'bytes_written': total_written_size
+                })
+            )
+
+        if total_read_size > total_written_size and abs(total_written_size - total_read_size) / (total_written_size + total_read_size) > thresholds.OPERATION_IMBALANCE:
+            issue = 'Application is read size intensive ({:.2f}% write vs. {:.2f}% read)'.format(
+                total_written_size / (total_written_size + total_read_size) * 100.0, total_read_size / (total_written_size + total_read_size) * 100.0
+            )
+
+            insights_metadata.append(
+                message(INSIGHTS_POSIX_READ_SIZE_INTENSIVE, TARGET_DEVELOPER, INFO, issue, None, metrics={
+                    'bytes_read': total_read_size,
+                    'bytes_written': total_written_size
+                })
+            )
+
+        budget.checkpoint('operations')
+
+        #########################################################################################################################################################################
+        
+        # Get the number of small I/O operations (less than 1 MB)
+
+        # Get the files responsible for more than half of these accesses
+        files = []
+
+        df['counters']['INSIGHTS_POSIX_SMALL_READ'] = (
+            df['counters']['POSIX_SIZE_READ_0_100'] +
+            df['counters']['POSIX_SIZE_READ_100_1K'] +
+            df['counters']['POSIX_SIZE_READ_1K_10K'] +
+            df['counters']['POSIX_SIZE_READ_10K_100K'] +
+            df['counters']['POSIX_SIZE_READ_100K_1M']
+        )
+
+        df['counters']['INSIGHTS_POSIX_SMALL_WRITE'] = (
+            df['counters']['POSIX_SIZE_WRITE_0_100'] +
+            df['counters']['POSIX_SIZE_WRITE_100_1K'] +
+            df['counters']['POSIX_SIZE_WRITE_1K_10K'] +
+            df['counters']['POSIX_SIZE_WRITE_10K_100K'] +
+            df['counters']['POSIX_SIZE_WRITE_100K_1M']
+        )
+        total_reads_small = (
+                df['counters']['POSIX_SIZE_READ_0_100'].sum() +
+                df['counters']['POSIX_SIZE_READ_100_1K'].sum() +
+                df['counters']['POSIX_SIZE_READ_1K_10K'].sum() +
+                df['counters']['POSIX_SIZE_READ_10K_100K'].sum() +
+                df['counters']['POSIX_SIZE_READ_100K_1M'].sum()
+            )
+
+        posix_size_read_0_100 = df['counters']['POSIX_SIZE_READ_0_100'].sum()
+        posix_size_read_100_1K = df['counters']['POSIX_SIZE_READ_100_1K'].sum()
+        posix_size_read_1K_10K = df['counters']['POSIX_SIZE_READ_1K_10K'].sum()
+        posix_size_read_10K_100K = df['counters']['POSIX_SIZE_READ_10K_100K'].sum()
+        posix_size_read_100K_1M = df['counters']['POSIX_SIZE_READ_100K_1M'].sum()
+        read_larger_than_1MB = total_reads - total_reads_small
+
+        if charts():
+            data = [posix_size_read_0_100, posix_size_read_100_1K, posix_size_read_1K_10K, posix_size_read_10K_100K, posix_size_read_100K_1M, read_larger_than_1MB]  # Numeric data for each category
+            categories = ['0-100', '100-1K', '1K-10K', '100K-1M', '100K-1M', 'Everything else']  # Category labels
+
+            plt.pie(data, labels=categories, autopct='%1.1f%%')
+
+            plt.title('Small Read Size Intensive')
+
+            plt.savefig('graph1.png')
+
+        small_requests = needed(INSIGHTS_POSIX_HIGH_SMALL_READ_REQUESTS_USAGE, INSIGHTS_POSIX_HIGH_SMALL_WRITE_REQUESTS_USAGE)
+
+        if small_requests:
+            detected_files = aggregate_by_id(
+                df['counters'],
+                {
+                    'INSIGHTS_POSIX_SMALL_READ': ['sum'],
+                    'INSIGHTS_POSIX_SMALL_WRITE': ['sum']
+                },
+                args.workers
+            )
+            detected_files.columns = ['id', 'total_reads', 'total_writes']
+            detected_ids = detected_files['id'].to_numpy(dtype=np.uint64)
+            detected_files.loc[:, 'id'] = detected_files.loc[:, 'id'].astype(str)
+
+        if small_requests and total_reads_small and total_reads_small / total_reads > thresholds.SMALL_REQUESTS and total_reads_small > thresholds.SMALL_REQUESTS_ABSOLUTE:
+            issue = 'Application issues a high number ({}) of small read requests (i.e., < 1MB) which represents {:.2f}% of all read requests'.format(
+                total_reads_small, total_reads_small / total_reads * 100.0
+            )
+
+            detail = []
+            recommendation = []
+
+            for index, row in detected_files.iterrows():
+                if row['total_reads'] > (total_reads * thresholds.SMALL_REQUESTS / 2):
+                    detail.append(
+                        {
+                            'id': int(row['id']),
+                            'path': file_map[int(row['id'])],
+                            'message': '{} ({:.2f}%) small read requests are to "{}"',
+                            'values': (
+                                row['total_reads'],
+                                row['total_reads'] / total_reads * 100.0
+                            )
+                        }
+                    )
+
+            directory = file_map.dominant(detected_ids, detected_files['total_reads'], thresholds.DIRECTORY_ROLLUP)
+
+            if directory:
+                detail.insert(0,
+                    {
+                        'path': directory[0],
+                        'rollup': True,
+                        'message': '{:.2f}% of the small read requests are to files under "{}"',
+                        'values': (
+                            directory[1] * 100.0,
+                        )
+                    }
+                )
+
+            recommendation.append(
+                {
+                    'message': 'Consider buffering read operations into larger more contiguous ones',
+                    'graph' : "graph1.png"
+                }
+            )
+
+            if 'MPI-IO' in modules:
+                recommendation.append(
+                    {
+                        'message': 'Since the appplication already uses MPI-IO, consider using collective I/O calls (e.g. MPI_File_read_all() or MPI_File_read_at_all()) to aggregate requests into larger ones',
+                        'sample': 'mpi-io-collective-read.c',
+                        'graph' : "graph1.png"
+
+                    }
+                )
+            else:
+                recommendation.append(
+                    {
+                        'message': 'Application does not use MPI-IO for operations, consider use this interface instead to harness collective operations',
+                        'graph' : "graph1.png"
+
+                    }
+                )
+            show_graphs(recommendation, 'imgcat')
+
+            insights_operation.append(
+                message(INSIGHTS_POSIX_HIGH_SMALL_READ_REQUESTS_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail, metrics={
+                    'reads': total_reads,
+                    'small_reads': total_reads_small
+                })
+            )
+
+
+        total_writes_small = (
+                df['counters']['POSIX_SIZE_WRITE_0_100'].sum() +
+                df['counters']['POSIX_SIZE_WRITE_100_1K'].sum() +
+                df['counters']['POSIX_SIZE_WRITE_1K_10K'].sum() +
+                df['counters']['POSIX_SIZE_WRITE_10K_100K'].sum() +
+                df['counters']['POSIX_SIZE_WRITE_100K_1M'].sum()
+            )
+
+        posix_size_write_0_100 = df['counters']['POSIX_SIZE_WRITE_0_100'].sum()
+        posix_size_write_100_1K = df['counters']['POSIX_SIZE_WRITE_100_1K'].sum()
+        posix_size_write_1K_10K = df['counters']['POSIX_SIZE_WRITE_1K_10K'].sum()
+        posix_size_write_10K_100K = df['counters']['POSIX_SIZE_WRITE_10K_100K'].sum()
+        posix_size_write_100K_1M = df['counters']['POSIX_SIZE_WRITE_100K_1M'].sum()
+        write_larger_than_1MB = total_writes - total_writes_small
+
+        if charts():
+            #Sample data
+            data = [posix_size_write_0_100, posix_size_write_100_1K, posix_size_write_1K_10K, posix_size_write_10K_100K, posix_size_write_100K_1M, write_larger_than_1MB]  # Numeric data for each category
+            categories = ['0-100', '100-1K', '1K-10K', '100K-1M', '100K-1M', 'Everything else']  # Category labels
+
+            # Create a pie chart
+            plt.pie(data, labels=categories, autopct='%1.1f%%')
+
+            # Add a title
+            plt.title('Small Read Size Intensive')
+
+            # Display the chart
+            plt.savefig('graph2.png')
+        # Get the number of small I/O operations (less than the stripe size)
+
+        if small_requests and total_writes_small and total_writes_small / total_writes > thresholds.SMALL_REQUESTS and total_writes_small > thresholds.SMALL_REQUESTS_ABSOLUTE:
+            issue = 'Application issues a high number ({}) of small write requests (i.e., < 1MB) which represents {:.2f}% of all write requests'.format(
+                total_writes_small, total_writes_small / total_writes * 100.0
+            )
 
-        insights_operation.append(
-            message(INSIGHTS_MPI_IO_NO_USAGE, TARGET_DEVELOPER, WARN, issue, recommendation)
-        )
+            detail = []
+            recommendation = []
 
-    #########################################################################################################################################################################
+            for index, row in detected_files.iterrows():
+                if row['total_writes'] > (total_writes * thresholds.SMALL_REQUESTS / 2):
+                    detail.append(
+                        {
+                            'id': int(row['id']),
+                            'path': file_map[int(row['id'])],
+                            'message': '{} ({:.2f}%) small write requests are to "{}"',
+                            'values': (
+                                row['total_writes'],
+                                row['total_writes'] / total_writes * 100.0
+                            )
+                        }
+                    )
 
-    if 'POSIX' in report.records:
-        df = report.records['POSIX'].to_df()
+            directory = file_map.dominant(detected_ids, detected_files['total_writes'], thresholds.DIRECTORY_ROLLUP)
 
-        #print(df)
-        #print(df['counters'].columns)
-        #print(df['fcounters'].columns)
+            if directory:
+                detail.insert(0,
+                    {
+                        'path': directory[0],
+                        'rollup': True,
+                        'message': '{:.2f}% of the small write requests are to files under "{}"',
+                        'values': (
+                            directory[1] * 100.0,
+                        )
+                    }
+                )
+
+            recommendation.append(
+                {
+                    'message': 'Consider buffering write operations into larger more contiguous ones',
+                    'graph' : 'graph2.png'
+                }
+            )
+
+            if 'MPI-IO' in modules:
+                recommendation.append(
+                    {
+                        'message': 'Since the application already uses MPI-IO, consider using collective I/O calls (e.g. MPI_File_write_all() or MPI_File_write_at_all()) to aggregate requests into larger ones',
+                        'sample': 'mpi-io-collective-write.c',
+                        'graph' : 'graph2.png'
+
+                    }
+                )
+            else:
+                recommendation.append(
+                    {
+                        'message': 'Application does not use MPI-IO for operations, consider use this interface instead to harness collective operations',
+                        'graph' : 'graph2.png'
+
+                    }
+                )
+            show_graphs(recommendation)
+
+            insights_operation.append(
+                message(INSIGHTS_POSIX_HIGH_SMALL_WRITE_REQUESTS_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail, metrics={
+                    'writes': total_writes,
+                    'small_writes': total_writes_small
+                })
+            )
+
+        budget.checkpoint('small-requests')
 
         #########################################################################################################################################################################
 
-        # Get number of write/read operations
-        total_reads = df['counters']['POSIX_READS'].sum()
-        total_writes = df['counters']['POSIX_WRITES'].sum()
+        # How many requests are misaligned?
 
-        # Get total number of I/O operations
-        total_operations = total_writes + total_reads 
+        if charts():
+            # A log has a single job, so the misaligned requests are plotted per rank (-1 for shared records)
+            misaligned_requests = df['counters'].groupby('rank')['POSIX_FILE_NOT_ALIGNED'].sum()
+
+            # Plot the misaligned POSIX file requests for different ranks
+            plt.figure(figsize=(10, 6))
+            plt.bar(misaligned_requests.index.astype(str), misaligned_requests.to_numpy(), color='b')
+            plt.xlabel('Ranks')
+            plt.ylabel('Misaligned POSIX File Requests')
+            plt.title('Misaligned POSIX File Requests for Different Ranks')
+            plt.xticks(rotation=45)
+            plt.tight_layout()
+            plt.savefig('graph3.png')
+        total_mem_not_aligned = df['counters']['POSIX_MEM_NOT_ALIGNED'].sum()
+        total_file_not_aligned = df['counters']['POSIX_FILE_NOT_ALIGNED'].sum()
 
-        # To check whether the application is write-intersive or read-intensive we only look at the POSIX level and check if the difference between reads and writes is larger than 10% (for more or less), otherwise we assume a balance
-        if total_writes > total_reads and total_operations and abs(total_writes - total_reads) / total_operations > THRESHOLD_OPERATION_IMBALANCE:
-            issue = 'Application is write operation intensive ({:.2f}% writes vs. {:.2f}% reads)'.format(
-                total_writes / total_operations * 100.0, total_reads / total_operations * 100.0
+        if total_operations and total_mem_not_aligned / total_operations > thresholds.MISALIGNED_REQUESTS:
+            issue = 'Application has a high number ({:.2f}%) of misaligned memory requests'.format(
+                total_mem_not_aligned / total_operations * 100.0
             )
 
             insights_metadata.append(
-                message(INSIGHTS_POSIX_WRITE_COUNT_INTENSIVE, TARGET_DEVELOPER, INFO, issue, None)
+                message(INSIGHTS_POSIX_HIGH_MISALIGNED_MEMORY_USAGE, TARGET_DEVELOPER, HIGH, issue, None, metrics={
+                    'operations': total_operations,
+                    'memory_not_aligned': total_mem_not_aligned
+                })
             )
 
-        if total_reads > total_writes and total_operations and abs(total_writes - total_reads) / total_operations > THRESHOLD_OPERATION_IMBALANCE:
-            issue = 'Application is read operation intensive ({:.2f}% writes vs. {:.2f}% reads)'.format(
-                total_writes / total_operations * 100.0, total_reads / total_operations * 100.0
+        if total_operations and total_file_not_aligned / total_operations > thresholds.MISALIGNED_REQUESTS:
+            issue = 'Application issues a high number ({:.2f}%) of misaligned file requests'.format(
+                total_file_not_aligned / total_operations * 100.0
             )
 
+            recommendation = [
+                {
+                    'message': 'Consider aligning the requests to the file system block boundaries',
+                    'graph' : 'graph3.png'
+                }
+            ]
+
+            if 'H5F' in modules:
+                recommendation.extend([
+                    {
+                        'message': 'Since the appplication uses HDF5, consider using H5Pset_alignment() in a file access property list',
+                        'sample': 'hdf5-alignment.c',
+                        'graph' : 'graph3.png'
+
+                    },
+                    {
+                        'message': 'Any file object greater than or equal in size to threshold bytes will be aligned on an address which is a multiple of alignment',
+                        'graph' : 'graph3.png'
+
+                    }
+                ])
+
+            if 'LUSTRE' in modules:
+                recommendation.append(
+                    {
+                        'message': 'Consider using a Lustre alignment that matches the file system stripe configuration',
+                        'sample': 'lustre-striping.bash',
+                        'graph' : 'graph3.png'
+
+                    }
+                )
+            show_graphs(recommendation)
+
             insights_metadata.append(
-                message(INSIGHTS_POSIX_READ_COUNT_INTENSIVE, TARGET_DEVELOPER, INFO, issue, None)
+                message(INSIGHTS_POSIX_HIGH_MISALIGNED_FILE_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, metrics={
+                    'operations': total_operations,
+                    'file_not_aligned': total_file_not_aligned
+                })
             )
 
-        total_read_size = df['counters']['POSIX_BYTES_READ'].sum()
-        total_written_size = df['counters']['POSIX_BYTES_WRITTEN'].sum()
+        budget.checkpoint('misaligned')
 
-        total_size = total_written_size + total_read_size
+        #########################################################################################################################################################################
 
-        if total_written_size > total_read_size and abs(total_written_size - total_read_size) / (total_written_size + total_read_size) > THRESHOLD_OPERATION_IMBALANCE:
-            issue = 'Application is write size intensive ({:.2f}% write vs. {:.2f}% read)'.format(
-                total_written_size / (total_written_size + total_read_size) * 100.0, total_read_size / (total_written_size + total_read_size) * 100.0
+        if charts():
+            records = df['counters']
+
+            plt.figure(figsize=(12, 10))
+
+            # Scatter Plot for Read Operations, one point per record
+            plt.subplot(2, 2, 1)
+            plt.scatter(records['POSIX_MAX_BYTE_READ'], records['POSIX_BYTES_READ'], marker='o')
+            plt.xlabel('Highest Read Offset (POSIX_MAX_BYTE_READ)')
+            plt.ylabel('Bytes Read (POSIX_BYTES_READ)')
+            plt.title('Highest Read Offset vs. Bytes Read')
+
+            # Scatter Plot for Write Operations
+            plt.subplot(2, 2, 2)
+            plt.scatter(records['POSIX_MAX_BYTE_WRITTEN'], records['POSIX_BYTES_WRITTEN'], marker='o')
+            plt.xlabel('Highest Write Offset (POSIX_MAX_BYTE_WRITTEN)')
+            plt.ylabel('Bytes Written (POSIX_BYTES_WRITTEN)')
+            plt.title('Highest Write Offset vs. Bytes Written')
+
+            # Histogram for Redundant Read Ratio, of the records that read past the start of the file
+            read_records = records.loc[records['POSIX_MAX_BYTE_READ'] > 0]
+            plt.subplot(2, 2, 3)
+            plt.hist(read_records['POSIX_BYTES_READ'] / read_records['POSIX_MAX_BYTE_READ'], bins=10, color='blue', alpha=0.7)
+            plt.xlabel('Redundant Read Ratio')
+            plt.ylabel('Frequency')
+            plt.title('Distribution of Redundant Read Ratio')
+
+            # Histogram for Redundant Write Ratio
+            write_records = records.loc[records['POSIX_MAX_BYTE_WRITTEN'] > 0]
+            plt.subplot(2, 2, 4)
+            plt.hist(write_records['POSIX_BYTES_WRITTEN'] / write_records['POSIX_MAX_BYTE_WRITTEN'], bins=10, color='red', alpha=0.7)
+            plt.xlabel('Redundant Write Ratio')
+            plt.ylabel('Frequency')
+            plt.title('Distribution of Redundant Write Ratio')
+
+            plt.tight_layout()
+            plt.savefig('graphredundant.png')
+
+        #########################################################################################################################################################################
+
+ 
+        read_consecutive = df['counters']['POSIX_CONSEC_READS'].sum()
+        #print('READ Consecutive: {} ({:.2f}%)'.format(read_consecutive, read_consecutive / total_reads * 100))
+
+        read_sequential = df['counters']['POSIX_SEQ_READS'].sum()
+        read_sequential -= read_consecutive
+        #print('READ Sequential: {} ({:.2f}%)'.format(read_sequential, read_sequential / total_reads * 100))
+
+        read_random = total_reads - read_consecutive - read_sequential
+        #print('READ Random: {} ({:.2f}%)'.format(read_random, read_random / total_reads * 100))
+        total_reads = read_consecutive + read_sequential + read_random
+
+        if charts():
+            # Calculate percentages
+            percent_consecutive = read_consecutive / total_reads * 100
+            percent_sequential = read_sequential / total_reads * 100
+            percent_random = read_random / total_reads * 100
+
+            # Plot the breakdown of read operations into consecutive, sequential, and random
+            plt.figure(figsize=(8, 6))
+            plt.bar("Read Operations", percent_random, color='red', label='Random')
+            plt.bar("Read Operations", percent_sequential, bottom=percent_random, color='orange', label='Sequential')
+            plt.bar("Read Operations", percent_consecutive, bottom=percent_random + percent_sequential, color='green', label='Consecutive')
+
+            plt.xlabel('Operations')
+            plt.ylabel('Percentage of Total Reads')
+            plt.title('Breakdown of Read Operations')
+            plt.legend(loc='upper right')
+
+            plt.ylim(0, 100)  # Set the y-axis limit from 0 to 100 for percentage representation
+            plt.xticks(rotation=45)
+            plt.tight_layout()
+            plt.savefig('graph4.png')
+
+        if total_reads:
+            if read_random and read_random / total_reads > thresholds.RANDOM_OPERATIONS and read_random > thresholds.RANDOM_OPERATIONS_ABSOLUTE:
+                issue = 'Application is issuing a high number ({}) of random read operations ({:.2f}%)'.format(
+                    read_random, read_random / total_reads * 100.0
+                )
+
+                recommendation = [
+                    {
+                        'message': 'Consider changing your data model to have consecutive or sequential reads',
+                        'graph' : 'graph4.png'
+                    }
+                ]
+
+                insights_operation.append(
+                    message(INSIGHTS_POSIX_HIGH_RANDOM_READ_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, metrics={
+                        'reads': total_reads,
+                        'consecutive_reads': read_consecutive,
+                        'sequential_reads': read_sequential,
+                        'random_reads': read_random
+                    })
+                )
+            else:
+                issue = 'Application mostly uses consecutive ({:.2f}%) and sequential ({:.2f}%) read requests'.format(
+                    read_consecutive / total_reads * 100.0,
+                    read_sequential / total_reads * 100.0
+                )
+
+                insights_operation.append(
+                    message(INSIGHTS_POSIX_HIGH_SEQUENTIAL_READ_USAGE, TARGET_DEVELOPER, OK, issue, None, metrics={
+                        'reads': total_reads,
+                        'consecutive_reads': read_consecutive,
+                        'sequential_reads': read_sequential,
+                        'random_reads': read_random
+                    })
+                )
+
+        write_consecutive = df['counters']['POSIX_CONSEC_WRITES'].sum()
+        #print('WRITE Consecutive: {} ({:.2f}%)'.format(write_consecutive, write_consecutive / total_writes * 100))
+
+        write_sequential = df['counters']['POSIX_SEQ_WRITES'].sum()
+        write_sequential -= write_consecutive
+        #print('WRITE Sequential: {} ({:.2f}%)'.format(write_sequential, write_sequential / total_writes * 100))
+
+        write_random = total_writes - write_consecutive - write_sequential
+        #print('WRITE Random: {} ({:.2f}%)'.format(write_random, write_random / total_writes * 100))
+
+        if total_writes:
+            if write_random and write_random / total_writes > thresholds.RANDOM_OPERATIONS and write_random > thresholds.RANDOM_OPERATIONS_ABSOLUTE:
+                issue = 'Application is issuing a high number ({}) of random write operations ({:.2f}%)'.format(
+                    write_random, write_random / total_writes * 100.0
+                )
+
+                recommendation = [
+                    {
+                        'message': 'Consider changing your data model to have consecutive or sequential writes',
+                        'graph' : 'graph4.png'
+
+                    }
+                ]
+
+                insights_operation.append(
+                    message(INSIGHTS_POSIX_HIGH_RANDOM_WRITE_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, metrics={
+                        'writes': total_writes,
+                        'consecutive_writes': write_consecutive,
+                        'sequential_writes': write_sequential,
+                        'random_writes': write_random
+                    })
+                )
+            else:
+                issue = 'Application mostly uses consecutive ({:.2f}%) and sequential ({:.2f}%) write requests'.format(
+                    write_consecutive / total_writes * 100.0,
+                    write_sequential / total_writes * 100.0
+                )
+
+                insights_operation.append(
+                    message(INSIGHTS_POSIX_HIGH_SEQUENTIAL_WRITE_USAGE, TARGET_DEVELOPER, OK, issue, None, metrics={
+                        'writes': total_writes,
+                        'consecutive_writes': write_consecutive,
+                        'sequential_writes': write_sequential,
+                        'random_writes': write_random
+                    })
+                )
+
+        #########################################################################################################################################################################
+
+    
+            # Shared file with small operations
+            # print(df['counters'].loc[(df['counters']['rank'] == -1)])
+
+            shared_files = df['counters'].loc[(df['counters']['rank'] == -1)]
+
+            shared_files = shared_files.assign(id=lambda d: d['id'].astype(str))
+
+            total_shared_reads = shared_files['POSIX_READS'].sum()
+            total_shared_reads_small = (
+                shared_files['POSIX_SIZE_READ_0_100'].sum() +
+                shared_files['POSIX_SIZE_READ_100_1K'].sum() +
+                shared_files['POSIX_SIZE_READ_1K_10K'].sum() +
+                shared_files['POSIX_SIZE_READ_10K_100K'].sum() +
+                shared_files['POSIX_SIZE_READ_100K_1M'].sum()
             )
 
-            insights_metadata.append(
-                message(INSIGHTS_POSIX_WRITE_SIZE_INTENSIVE, TARGET_DEVELOPER, INFO, issue, None)
+            shared_files['INSIGHTS_POSIX_SMALL_READS'] = (
+                shared_files['POSIX_SIZE_READ_0_100'] +
+                shared_files['POSIX_SIZE_READ_100_1K'] +
+                shared_files['POSIX_SIZE_READ_1K_10K'] +
+                shared_files['POSIX_SIZE_READ_10K_100K'] +
+                shared_files['POSIX_SIZE_READ_100K_1M']
             )
 
-        if total_read_size > total_written_size and abs(total_written_size - total_read_size) / (total_written_size + total_read_size) > THRESHOLD_OPERATION_IMBALANCE:
-            issue = 'Application is read size intensive ({:.2f}% write vs. {:.2f}% read)'.format(
-                total_written_size / (total_written_size + total_read_size) * 100.0, total_read_size / (total_written_size + total_read_size) * 100.0
+            if charts():
+                # Distribution of the small reads of each shared file, with a density estimate when they differ
+                plt.figure(figsize=(8, 6))
+                sns.histplot(data=shared_files['INSIGHTS_POSIX_SMALL_READS'], color='lightblue', bins=10, kde=shared_files['INSIGHTS_POSIX_SMALL_READS'].nunique() > 1)
+
+                # Add x and y labels
+                plt.xlabel('Total Shared Reads (Small)')
+                plt.ylabel('Shared Files')
+                plt.title('Distribution of Small Reads per Shared File')
+
+                plt.tight_layout()
+                plt.savefig('graph5.png')
+
+            if total_shared_reads and total_shared_reads_small / total_shared_reads > thresholds.SMALL_REQUESTS and total_shared_reads_small > thresholds.SMALL_REQUESTS_ABSOLUTE:
+                issue = 'Application issues a high number ({}) of small read requests to a shared file (i.e., < 1MB) which represents {:.2f}% of all shared file read requests'.format(
+                    total_shared_reads_small, total_shared_reads_small / total_shared_reads * 100.0
+                )
+
+                detail = []
+
+                for index, row in shared_files.iterrows():
+                    if row['INSIGHTS_POSIX_SMALL_READS'] > (total_shared_reads * thresholds.SMALL_REQUESTS / 2):
+                        detail.append(
+                            {
+                                'id': int(row['id']),
+                                'path': file_map[int(row['id'])],
+                                'message': '{} ({:.2f}%) small read requests are to "{}"',
+                                'values': (
+                                    row['INSIGHTS_POSIX_SMALL_READS'],
+                                    row['INSIGHTS_POSIX_SMALL_READS'] / total_shared_reads * 100.0
+                                )
+                            }
+                        )
+
+                recommendation = [
+                    {
+                        'message': 'Consider coalesceing read requests into larger more contiguous ones using MPI-IO collective operations',
+                        'sample': 'mpi-io-collective-read.c',
+                        'graph' : 'graph5.png'
+                    }
+                ]
+
+                insights_operation.append(
+                    message(INSIGHTS_POSIX_HIGH_SMALL_READ_REQUESTS_SHARED_FILE_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail, metrics={
+                        'shared_reads': total_shared_reads,
+                        'shared_small_reads': total_shared_reads_small
+                    })
+                )
+
+            total_shared_writes = shared_files['POSIX_WRITES'].sum()
+            total_shared_writes_small = (
+                shared_files['POSIX_SIZE_WRITE_0_100'].sum() +
+                shared_files['POSIX_SIZE_WRITE_100_1K'].sum() +
+                shared_files['POSIX_SIZE_WRITE_1K_10K'].sum() +
+                shared_files['POSIX_SIZE_WRITE_10K_100K'].sum() +
+                shared_files['POSIX_SIZE_WRITE_100K_1M'].sum()
             )
 
-            insights_metadata.append(
-                message(INSIGHTS_POSIX_READ_SIZE_INTENSIVE, TARGET_DEVELOPER, INFO, issue, None)
+            shared_files['INSIGHTS_POSIX_SMALL_WRITES'] = (
+                shared_files['POSIX_SIZE_WRITE_0_100'] +
+                shared_files['POSIX_SIZE_WRITE_100_1K'] +
+                shared_files['POSIX_SIZE_WRITE_1K_10K'] +
+                shared_files['POSIX_SIZE_WRITE_10K_100K'] +
+                shared_files['POSIX_SIZE_WRITE_100K_1M']
             )
 
-        #########################################################################################################################################################################
-        
-        # Get the number of small I/O operations (less than 1 MB)
+            if charts():
+                # Distribution of the small writes of each shared file
+                plt.figure(figsize=(8, 6))
+                sns.histplot(data=shared_files['INSIGHTS_POSIX_SMALL_WRITES'], color='lightblue', bins=10, kde=shared_files['INSIGHTS_POSIX_SMALL_WRITES'].nunique() > 1)
 
-        # Get the files responsible for more than half of these accesses
-        files = []
+                # Add x and y labels
+                plt.xlabel('Total Shared Writes (Small)')
+                plt.ylabel('Shared Files')
+                plt.title('Distribution of Small Writes per Shared File')
 
-        df['counters']['INSIGHTS_POSIX_SMALL_READ'] = (
-            df['counters']['POSIX_SIZE_READ_0_100'] +
-            df['counters']['POSIX_SIZE_READ_100_1K'] +
-            df['counters']['POSIX_SIZE_READ_1K_10K'] +
-            df['counters']['POSIX_SIZE_READ_10K_100K'] +
-            df['counters']['POSIX_SIZE_READ_100K_1M']
-        )
+                plt.tight_layout()
+                plt.savefig('graph55.png')
+            if total_shared_writes and total_shared_writes_small / total_shared_writes > thresholds.SMALL_REQUESTS and total_shared_writes_small > thresholds.SMALL_REQUESTS_ABSOLUTE:
+                issue = 'Application issues a high number ({}) of small write requests to a shared file (i.e., < 1MB) which represents {:.2f}% of all shared file write requests'.format(
+                    total_shared_writes_small, total_shared_writes_small / total_shared_writes * 100.0
+                )
+
+                detail = []
+
+                for index, row in shared_files.iterrows():
+                    if row['INSIGHTS_POSIX_SMALL_WRITES'] > (total_shared_writes * thresholds.SMALL_REQUESTS / 2):
+                        detail.append(
+                            {
+                                'id': int(row['id']),
+                                'path': file_map[int(row['id'])],
+                                'message': '{} ({:.2f}%) small writes requests are to "{}"',
+                                'values': (
+                                    row['INSIGHTS_POSIX_SMALL_WRITES'],
+                                    row['INSIGHTS_POSIX_SMALL_WRITES'] / total_shared_writes * 100.0
+                                ),
+                                'graph' : 'graph55.png'
+                            }
+                        )
 
-        df['counters']['INSIGHTS_POSIX_SMALL_WRITE'] = (
-            df['counters']['POSIX_SIZE_WRITE_0_100'] +
-            df['counters']['POSIX_SIZE_WRITE_100_1K'] +
-            df['counters']['POSIX_SIZE_WRITE_1K_10K'] +
-            df['counters']['POSIX_SIZE_WRITE_10K_100K'] +
-            df['counters']['POSIX_SIZE_WRITE_100K_1M']
-        )
-        total_reads_small = (
-                df['counters']['POSIX_SIZE_READ_0_100'].sum() +
-                df['counters']['POSIX_SIZE_READ_100_1K'].sum() +
-                df['counters']['POSIX_SIZE_READ_1K_10K'].sum() +
-                df['counters']['POSIX_SIZE_READ_10K_100K'].sum() +
-                df['counters']['POSIX_SIZE_READ_100K_1M'].sum()
-            )
+                recommendation = [
+                    {
+                        'message': 'Consider coalescing write requests into larger more contiguous ones using MPI-IO collective operations',
+                        'sample': 'mpi-io-collective-write.c',
+                        'graph' : 'graph55.png'
 
-        posix_size_read_0_100 = df['counters']['POSIX_SIZE_READ_0_100'].sum()
-        posix_size_read_100_1K = df['counters']['POSIX_SIZE_READ_100_1K'].sum()
-        posix_size_read_1K_10K = df['counters']['POSIX_SIZE_READ_1K_10K'].sum()
-        posix_size_read_10K_100K = df['counters']['POSIX_SIZE_READ_10K_100K'].sum()
-        posix_size_read_100K_1M = df['counters']['POSIX_SIZE_READ_100K_1M'].sum()
-        read_larger_than_1MB = total_reads - total_reads_small
+                    }
+                ]
+
+                insights_operation.append(
+                    message(INSIGHTS_POSIX_HIGH_SMALL_WRITE_REQUESTS_SHARED_FILE_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail, metrics={
+                        'shared_writes': total_shared_writes,
+                        'shared_small_writes': total_shared_writes_small
+                    })
+                )
 
-        data = [posix_size_read_0_100, posix_size_read_100_1K, posix_size_read_1K_10K, posix_size_read_10K_100K, posix_size_read_100K_1M, read_larger_than_1MB]  # Numeric data for each category
-        categories = ['0-100', '100-1K', '1K-10K', '100K-1M', '100K-1M', 'Everything else']  # Category labels
+        budget.checkpoint('shared-small-requests')
 
-        plt.pie(data, labels=categories, autopct='%1.1f%%')
+        #########################################################################################################################################################################
 
-        plt.title('Small Read Size Intensive')
+        
+        has_long_metadata = df['fcounters'][(df['fcounters']['POSIX_F_META_TIME'] > thresholds.METADATA_TIME_RANK)]
 
-        graph = plt.savefig('graph1.png')
+        if charts():
+            # Create the grouped bar chart
+            metrics = ['Number of Ranks with Long Metadata']
+            values = [len(has_long_metadata)]
 
-        detected_files = pd.DataFrame(df['counters'].groupby('id')[['INSIGHTS_POSIX_SMALL_READ', 'INSIGHTS_POSIX_SMALL_WRITE']].sum()).reset_index()
-        detected_files.columns = ['id', 'total_reads', 'total_writes']
-        detected_files.loc[:, 'id'] = detected_files.loc[:, 'id'].astype(str)
+            plt.figure(figsize=(6, 6))
+            plt.bar(metrics, values, color='b')
+            plt.xlabel('Metrics')
+            plt.ylabel('Counts')
+            plt.title('Number of Ranks with Long Metadata Operations')
+            plt.ylim(0, max(max(values), 1) * 1.2)  # Set the y-axis limit with some buffer space
 
-        if total_reads_small and total_reads_small / total_reads > THRESHOLD_SMALL_REQUESTS and total_reads_small > THRESHOLD_SMALL_REQUESTS_ABSOLUTE:
-            issue = 'AppDIEEEEEElication issues a high number ({}) of small read requests (i.e., < 1MB) which represents {:.2f}% of all read requests'.format(
-                total_reads_small, total_reads_small / total_reads * 100.0
-            )
+            # Add annotations with specific Darshan counter information
+            plt.annotate('Threshold: {} seconds'.format(thresholds.METADATA_TIME_RANK), xy=(0, len(has_long_metadata)), xytext=(0.5, len(has_long_metadata) + 0.2),
+                        arrowprops=dict(arrowstyle='->'), ha='center')
 
-            detail = []
-            recommendation = []
+            plt.tight_layout()
+            plt.savefig('graph6.png')
 
-            for index, row in detected_files.iterrows():
-                if row['total_reads'] > (total_reads * THRESHOLD_SMALL_REQUESTS / 2):
-                    detail.append(
-                        {
-                            'message': '{} ({:.2f}%) small read requests are to "{}"'.format(
-                                row['total_reads'],
-                                row['total_reads'] / total_reads * 100.0,
-                                file_map[int(row['id'])] if args.full_path else os.path.basename(file_map[int(row['id'])])
-                            ) 
-                        }
-                    )
+        if not has_long_metadata.empty:
+            issue = 'There are {} ranks where metadata operations take over {} seconds'.format(
+                len(has_long_metadata), thresholds.METADATA_TIME_RANK
+            )
 
-            recommendation.append(
+            recommendation = [
                 {
-                    'message': 'Consider buffering read operations into larger more contiguous ones',
-                    'graph' : "graph1.png"
+                    'message': 'Attempt to combine files, reduce, or cache metadata operations',
+                    'graph' : 'graph6.png'
                 }
-            )
+            ]
 
-            if 'MPI-IO' in modules:
-                recommendation.append(
+            if 'H5F' in modules:
+                recommendation.extend([
                     {
-                        'message': 'Since the appplication already uses MPI-IO, consider using collective I/O calls (e.g. MPI_File_read_all() or MPI_File_read_at_all()) to aggregate requests into larger ones',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/mpi-io-collective-read.c'), line_numbers=True, background_color='default'),
-                        'graph' : "graph1.png"
+                        'message': 'Since your appplication uses HDF5, try enabling collective metadata calls with H5Pset_coll_metadata_write() and H5Pset_all_coll_metadata_ops()',
+                        'sample': 'hdf5-collective-metadata.c',
+                        'graph' : 'graph6.png'
 
-                    }
-                )
-            else:
-                recommendation.append(
+                    },
                     {
-                        'message': 'Application does not use MPI-IO for operations, consider use this interface instead to harness collective operations',
-                        'graph' : "graph1.png"
+                        'message': 'Since your appplication uses HDF5, try using metadata cache to defer metadata operations',
+                        'sample': 'hdf5-cache.c',
+                        'graph' : 'graph6.png'
 
                     }
-                )
-            for rec in recommendation:
-                graph_path = rec.get('graph')
-                if graph_path:
-                    try:
-                        subprocess.run(['imgcat', graph_path])
-                    except FileNotFoundError:
-                        print(f"Warning: 'imgcat' command not found. Please install 'imgcat' to display the graphs in the terminal.")
-                    except Exception as e:
-                        print(f"Error displaying graph: {e}")
-                    
-            insights_operation.append(
-                message(INSIGHTS_POSIX_HIGH_SMALL_WRITE_REQUESTS_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail, graph)
-            )
+                ])
 
+            insights_metadata.append(
+                message(INSIGHTS_POSIX_HIGH_METADATA_TIME, TARGET_DEVELOPER, HIGH, issue, recommendation, metrics={
+                    'ranks': len(has_long_metadata),
+                    'threshold_seconds': thresholds.METADATA_TIME_RANK
+                })
+            )
 
-            total_writes_small = (
-                    df['counters']['POSIX_SIZE_WRITE_0_100'].sum() +
-                    df['counters']['POSIX_SIZE_WRITE_100_1K'].sum() +
-                    df['counters']['POSIX_SIZE_WRITE_1K_10K'].sum() +
-                    df['counters']['POSIX_SIZE_WRITE_10K_100K'].sum() +
-                    df['counters']['POSIX_SIZE_WRITE_100K_1M'].sum()
-                )
+        # We already have a single line for each shared-file access
+        # To check for stragglers, we can check the difference between the 
 
-            posix_size_write_0_100 = df['counters']['POSIX_SIZE_WRITE_0_100'].sum()
-            posix_size_write_100_1K = df['counters']['POSIX_SIZE_WRITE_100_1K'].sum()
-            posix_size_write_1K_10K = df['counters']['POSIX_SIZE_WRITE_1K_10K'].sum()
-            posix_size_write_10K_100K = df['counters']['POSIX_SIZE_WRITE_10K_100K'].sum()
-            posix_size_write_100K_1M = df['counters']['POSIX_SIZE_WRITE_100K_1M'].sum()
-            write_larger_than_1MB = total_writes - total_writes_small
+        # POSIX_FASTEST_RANK_BYTES
+        # POSIX_SLOWEST_RANK_BYTES
+        # POSIX_F_VARIANCE_RANK_BYTES
+        shared_files = df['counters'].loc[(df['counters']['rank'] == -1)]
 
-            #Sample data
-            data = [posix_size_write_0_100, posix_size_write_100_1K, posix_size_write_1K_10K, posix_size_write_10K_100K, posix_size_write_100K_1M, write_larger_than_1MB]  # Numeric data for each category
-            categories = ['0-100', '100-1K', '1K-10K', '100K-1M', '100K-1M', 'Everything else']  # Category labels
+        # Create a heatmap to visualize the load imbalance for each shared file access
+        transfer_size = shared_files['POSIX_BYTES_WRITTEN'] + shared_files['POSIX_BYTES_READ']
+
+        plot_imbalance(
+            shared_files['id'],
+            (shared_files['POSIX_SLOWEST_RANK_BYTES'] - shared_files['POSIX_FASTEST_RANK_BYTES']).abs() / transfer_size.where(transfer_size > 0),
+            'Load Imbalance Percentage',
+            'Load Imbalance caused by Stragglers for Shared File Accesses',
+            'graph7.png'
+        )
 
-            # Create a pie chart
-            plt.pie(data, labels=categories, autopct='%1.1f%%')
+        stragglers_count = 0
 
-            # Add a title
-            plt.title('Small Read Size Intensive')
+        shared_files = shared_files.assign(id=lambda d: d['id'].astype(str))
 
-            # Display the chart
-            plt.savefig('graph2.png')
-        # Get the number of small I/O operations (less than the stripe size)
+        # Get the files responsible
+        detected_files = []
 
-        if total_writes_small and total_writes_small / total_writes > THRESHOLD_SMALL_REQUESTS and total_writes_small > THRESHOLD_SMALL_REQUESTS_ABSOLUTE:
-            issue = 'Application issues a high number ({}) of small write requests (i.e., < 1MB) which represents {:.2f}% of all write requests'.format(
-                total_writes_small, total_writes_small / total_writes * 100.0
-            )
+        for index, row in shared_files.iterrows():
+            total_transfer_size = row['POSIX_BYTES_WRITTEN'] + row['POSIX_BYTES_READ']
 
-            detail = []
-            recommendation = []
+            if total_transfer_size and abs(row['POSIX_SLOWEST_RANK_BYTES'] - row['POSIX_FASTEST_RANK_BYTES']) / total_transfer_size > thresholds.STRAGGLERS:
+                stragglers_count += 1
 
-            for index, row in detected_files.iterrows():
-                if row['total_writes'] > (total_writes * THRESHOLD_SMALL_REQUESTS / 2):
-                    detail.append(
-                        {
-                            'message': '{} ({:.2f}%) small write requests are to "{}"'.format(
-                                row['total_writes'],
-                                row['total_writes'] / total_writes * 100.0,
-                                file_map[int(row['id'])] if args.full_path else os.path.basename(file_map[int(row['id'])])
-                            ) 
-                        }
-                    )
+                detected_files.append([
+                    row['id'], abs(row['POSIX_SLOWEST_RANK_BYTES'] - row['POSIX_FASTEST_RANK_BYTES']) / total_transfer_size * 100
+                ])
 
-            recommendation.append(
-                {
-                    'message': 'Consider buffering write operations into larger more contiguous ones',
-                    'graph' : 'graph2.png'
-                }
+        if stragglers_count:
+            issue = 'Detected data transfer imbalance caused by stragglers when accessing {} shared file.'.format(
+                stragglers_count
             )
 
-            if 'MPI-IO' in modules:
-                recommendation.append(
+            detail = []
+            
+            for file in detected_files:
+                detail.append(
                     {
-                        'message': 'Since the application already uses MPI-IO, consider using collective I/O calls (e.g. MPI_File_write_all() or MPI_File_write_at_all()) to aggregate requests into larger ones',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/mpi-io-collective-write.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph2.png'
-
+                        'id': int(file[0]),
+                        'path': file_map[int(file[0])],
+                        'message': 'Load imbalance of {:.2f}% detected while accessing "{}"',
+                        'values': (
+                            file[1],
+                        ),
+                        'graph' : 'graph7.png'
                     }
                 )
-            else:
-                recommendation.append(
-                    {
-                        'message': 'Application does not use MPI-IO for operations, consider use this interface instead to harness collective operations',
-                        'graph' : 'graph2.png'
 
-                    }
-                )
-            for item in recommendation:
-                graph_path = item.get('graph')
-                if graph_path:
-                    subprocess.run(['xdg=open', graph_path])
+            recommendation = [
+                {
+                    'message': 'Consider better balancing the data transfer between the application ranks',
+                    'graph' : 'graph7.png'
+                },
+                {
+                    'message': 'Consider tuning how your data is distributed in the file system by changing the stripe size and count',
+                    'sample': 'lustre-striping.bash',
+                    'graph' : 'graph7.png'
+                }
+            ]
 
             insights_operation.append(
-                message(INSIGHTS_POSIX_HIGH_SMALL_READ_REQUESTS_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail)
+                message(INSIGHTS_POSIX_SIZE_IMBALANCE, TARGET_USER, HIGH, issue, recommendation, detail, metrics={
+                    'files': stragglers_count
+                })
             )
 
-        #########################################################################################################################################################################
+        # POSIX_F_FASTEST_RANK_TIME
+        # POSIX_F_SLOWEST_RANK_TIME
+        # POSIX_F_VARIANCE_RANK_TIME
 
-        # How many requests are misaligned?
 
-        jobs = df['counters']['jobid'].tolist()
-        misaligned_requests = df['counters']['POSIX_FILE_NOT_ALIGNED'].tolist()
-        # Assuming you also have the misaligned_requests data (similar to the 'misaligned_requests' list in your example)
-
-        # Plot the misaligned POSIX file requests for different jobs
-        plt.figure(figsize=(10, 6))
-        plt.bar(jobs, misaligned_requests, color='b')
-        plt.xlabel('Jobs')
-        plt.ylabel('Misaligned POSIX File Requests')
-        plt.title('Misaligned POSIX File Requests for Different Jobs')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig('graph3.png')
-        total_mem_not_aligned = df['counters']['POSIX_MEM_NOT_ALIGNED'].sum()
-        total_file_not_aligned = df['counters']['POSIX_FILE_NOT_ALIGNED'].sum()
+        shared_files_times = df['fcounters'].loc[(df['fcounters']['rank'] == -1)]
 
-        if total_operations and total_mem_not_aligned / total_operations > THRESHOLD_MISALIGNED_REQUESTS:
-            issue = 'Application has a high number ({:.2f}%) of misaligned memory requests'.format(
-                total_mem_not_aligned / total_operations * 100.0
-            )
+        # Create a heatmap to visualize the time imbalance for each shared file access
+        transfer_time = shared_files_times['POSIX_F_WRITE_TIME'] + shared_files_times['POSIX_F_READ_TIME'] + shared_files_times['POSIX_F_META_TIME']
+
+        plot_imbalance(
+            shared_files_times['id'],
+            (shared_files_times['POSIX_F_SLOWEST_RANK_TIME'] - shared_files_times['POSIX_F_FASTEST_RANK_TIME']).abs() / transfer_time.where(transfer_time > 0),
+            'Time Imbalance Percentage',
+            'Time Imbalance caused by Stragglers for Shared File Accesses',
+            'graph8.png'
+        )
 
-            insights_metadata.append(
-                message(INSIGHTS_POSIX_HIGH_MISALIGNED_MEMORY_USAGE, TARGET_DEVELOPER, HIGH, issue, None)
-            )
+        # Get the files responsible
+        detected_files = []
 
-        if total_operations and total_file_not_aligned / total_operations > THRESHOLD_MISALIGNED_REQUESTS:
-            issue = 'Application issues a high number ({:.2f}%) of misaligned file die dieDIE DIE DIE requests'.format(
-                total_file_not_aligned / total_operations * 100.0
+        stragglers_count = 0
+        stragglers_imbalance = {}
+
+        shared_files_times = shared_files_times.assign(id=lambda d: d['id'].astype(str))
+
+        for index, row in shared_files_times.iterrows():
+            total_transfer_time = row['POSIX_F_WRITE_TIME'] + row['POSIX_F_READ_TIME'] + row['POSIX_F_META_TIME']
+
+            if total_transfer_time and abs(row['POSIX_F_SLOWEST_RANK_TIME'] - row['POSIX_F_FASTEST_RANK_TIME']) / total_transfer_time > thresholds.STRAGGLERS:
+                stragglers_count += 1
+
+                detected_files.append([
+                    row['id'], abs(row['POSIX_F_SLOWEST_RANK_TIME'] - row['POSIX_F_FASTEST_RANK_TIME']) / total_transfer_time * 100
+                ])
+
+        if stragglers_count:
+            issue = 'Detected time imbalance caused by stragglers when accessing {} shared file.'.format(
+                stragglers_count
             )
 
+            detail = []
+            
+            for file in detected_files:
+                detail.append(
+                    {
+                        'id': int(file[0]),
+                        'path': file_map[int(file[0])],
+                        'message': 'Load imbalance of {:.2f}% detected while accessing "{}"',
+                        'values': (
+                            file[1],
+                        ),
+                        'graph' : 'graph8.png'
+                    }
+                )
+
             recommendation = [
                 {
-                    'message': 'Consider aligning the requests to the file system block boundaries',
-                    'graph' : 'graph3.png'
+                    'message': 'Consider better distributing the data in the parallel file system',
+                    'graph' : 'graph8.png' # needs to review what suggestion to give
+                },
+                {
+                    'message': 'Consider tuning how your data is distributed in the file system by changing the stripe size and count',
+                    'sample': 'lustre-striping.bash',
+                    'graph' : 'graph8.png'
                 }
             ]
 
-            if 'HF5' in modules:
-                recommendation.append(
-                    {
-                        'message': 'Since the appplication uses HDF5, consider using H5Pset_alignment() in a file access property list',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/hdf5-alignment.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph3.png'
+            insights_operation.append(
+                message(INSIGHTS_POSIX_TIME_IMBALANCE, TARGET_USER, HIGH, issue, recommendation, detail, metrics={
+                    'files': stragglers_count
+                })
+            )
 
-                    },
-                    {
-                        'message': 'Any file object greater than or equal in size to threshold bytes will be aligned on an address which is a multiple of alignment',
-                        'graph' : 'graph3.png'
+        budget.checkpoint('stragglers')
 
-                    }
-                )
+        #########################################################################################################################################################################
 
-            if 'LUSTRE' in modules:
-                recommendation.append(
-                    {
-                        'message': 'Consider using a Lustre alignment that matches the file system stripe configuration',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/lustre-striping.bash'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph3.png'
+        # Distribution of the bytes and time of the ranks accessing each file, beyond the fastest and slowest ranks
+        varied = set()
 
-                    }
-                )
-            for item in recommendation:
-                graph_path = item.get('graph')
-                if graph_path:
-                    subprocess.run(['xdg=open', graph_path])
+        if needed(INSIGHTS_POSIX_RANK_BYTES_VARIATION, INSIGHTS_POSIX_RANK_TIME_VARIATION):
+            rank_distribution = imbalance.distribution(df['counters'], df['fcounters'], job['job']['nprocs'])
+            rank_distribution = rank_distribution.loc[
+                (rank_distribution['ranks'] > 1) & file_map.contains(rank_distribution.index)
+            ]
 
-            insights_metadata.append(
-                message(INSIGHTS_POSIX_HIGH_MISALIGNED_FILE_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation)
-            )
+            for metric, code, unit in (
+                ('bytes', INSIGHTS_POSIX_RANK_BYTES_VARIATION, convert_bytes),
+                ('time', INSIGHTS_POSIX_RANK_TIME_VARIATION, '{:.2f} seconds'.format)
+            ):
+                varying = rank_distribution.loc[rank_distribution['{}_cv'.format(metric)] > thresholds.RANK_VARIATION]
 
-        #########################################################################################################################################################################
+                if varying.empty:
+                    continue
 
-        max_read_offset = df['counters']['POSIX_MAX_BYTE_READ'].tolist()
-        bytes_read = df['counters']['POSIX_BYTES_READ'].tolist()
-        max_write_offset = df['counters']['POSIX_MAX_BYTE_WRITE'].tolist()
-        bytes_written = bytes_read = df['counters']['POSIX_BYTES_WRITTEN'].tolist()
-
-        plt.figure(figsize=(12, 10))
-
-        # Scatter Plot for Read Operations
-        plt.subplot(2, 2, 1)
-        for i in range(len(jobs)):
-            plt.scatter(max_read_offset[i], bytes_read[i], marker='o', label=jobs[i])
-        plt.xlabel('Highest Read Offset (POSIX_MAX_BYTE_READ)')
-        plt.ylabel('Bytes Read (POSIX_BYTES_READ)')
-        plt.title('Highest Read Offset vs. Bytes Read')
-        plt.legend()
-
-        # Scatter Plot for Write Operations
-        plt.subplot(2, 2, 2)
-        for i in range(len(jobs)):
-            plt.scatter(max_write_offset[i], bytes_written[i], marker='o', label=jobs[i])
-        plt.xlabel('Highest Write Offset (POSIX_MAX_BYTE_WRITTEN)')
-        plt.ylabel('Bytes Written (POSIX_BYTES_WRITTEN)')
-        plt.title('Highest Write Offset vs. Bytes Written')
-        plt.legend()
-
-        # Histogram for Redundant Read Ratio
-        redundant_read_ratio = [bytes_read[i] / max_read_offset[i] for i in range(len(jobs))]
-        plt.subplot(2, 2, 3)
-        plt.hist(redundant_read_ratio, bins=10, color='blue', alpha=0.7)
-        plt.xlabel('Redundant Read Ratio')
-        plt.ylabel('Frequency')
-        plt.title('Distribution of Redundant Read Ratio')
-
-        # Histogram for Redundant Write Ratio
-        redundant_write_ratio = [bytes_written[i] / max_write_offset[i] for i in range(len(jobs))]
-        plt.subplot(2, 2, 4)
-        plt.hist(redundant_write_ratio, bins=10, color='red', alpha=0.7)
-        plt.xlabel('Redundant Write Ratio')
-        plt.ylabel('Frequency')
-        plt.title('Distribution of Redundant Write Ratio')
-
-        plt.tight_layout()
-        plt.savefig('graphredundant.png')
-        # Redundant read-traffic (based on Phill)
-        # POSIX_MAX_BYTE_READ (Highest offset in the file that was read)
-        max_read_offset = df['counters']['POSIX_MAX_BYTE_READ'].max()
+                if metric == 'bytes':
+                    varied = set(int(id) for id in varying.index)
 
-        if max_read_offset > total_read_size:
-            issue = 'Application might have redundant read traffic (more data read than the highest offset)'
+                issue = 'Detected variation of the {} the ranks accessing {} files (coefficient of variation above {:.2f})'.format(
+                    'data transferred by' if metric == 'bytes' else 'I/O time spent by', len(varying), thresholds.RANK_VARIATION
+                )
 
-            insights_metadata.append(
-            {
-                'message': message(INSIGHTS_POSIX_REDUNDANT_READ_USAGE, TARGET_DEVELOPER, WARN, issue, None),
-                'graph': 'graphredundant.png'
-            }
-        )
+                detail = []
+
+                for id, row in varying.iterrows():
+                    if np.isnan(row['{}_p50'.format(metric)]):
+                        # Shared records only keep the variance across ranks
+                        detail.append(
+                            {
+                                'id': int(id),
+                                'path': file_map[int(id)],
+                                'message': 'Coefficient of variation of {:.2f} across {} ranks in "{}"',
+                                'values': (
+                                    row['{}_cv'.format(metric)],
+                                    int(row['ranks'])
+                                ),
+                                'impact': row['{}_cv'.format(metric)]
+                            }
+                        )
+                    else:
+                        detail.append(
+                            {
+                                'id': int(id),
+                                'path': file_map[int(id)],
+                                'message': 'Coefficient of variation of {:.2f} and Gini index of {:.2f} across {} ranks (p50 {}, p90 {}, p99 {}) in "{}"',
+                                'values': (
+                                    row['{}_cv'.format(metric)],
+                                    row['{}_gini'.format(metric)],
+                                    int(row['ranks']),
+                                    unit(row['{}_p50'.format(metric)]),
+                                    unit(row['{}_p90'.format(metric)]),
+                                    unit(row['{}_p99'.format(metric)])
+                                ),
+                                'impact': row['{}_cv'.format(metric)]
+                            }
+                        )
+
+                recommendation = [
+                    {
+                        'message': 'Consider better balancing the data transfer between the application ranks'
+                        if metric == 'bytes' else
+                        'Consider checking for stragglers and balancing the I/O time between the application ranks'
+                    }
+                ]
 
+                insights_operation.append(
+                    message(code, TARGET_USER, WARN, issue, recommendation, detail, metrics={
+                        'files': len(varying),
+                        'max_cv': varying['{}_cv'.format(metric)].max(),
+                        'max_gini': varying['{}_gini'.format(metric)].max()
+                    })
+                )
 
-        max_write_offset = df['counters']['POSIX_MAX_BYTE_WRITTEN'].max()
-        for item in recommendation:
-                graph_path = item.get('graph')
-                if graph_path:
-                    subprocess.run(['xdg=open', graph_path])
-        if max_write_offset > total_written_size:
-            issue = 'Application might have redundant write traffic (more data written than the highest offset)'
+        budget.checkpoint('rank-variation')
 
-            insights_metadata.append(
-            {
-                'message' : message(INSIGHTS_POSIX_REDUNDANT_WRITE_USAGE, TARGET_DEVELOPER, WARN, issue, None),
-                'graph' : 'graphredundant.png'
-            }
-        )
-        for rec in recommendation:
-            graph_path = rec.get('graph')
-            if graph_path:
-                try:
-                    subprocess.run(['xdg-open', graph_path])
-                except FileNotFoundError:
-                    print(f"Warning: 'xdg-open' command not found. Please make sure 'xdg-utils' is installed to open the graph.")
-                except Exception as e:
-                    print(f"Error opening graph: {e}")
         #########################################################################################################################################################################
 
- 
-        read_consecutive = df['counters']['POSIX_CONSEC_READS'].sum()
-        #print('READ Consecutive: {} ({:.2f}%)'.format(read_consecutive, read_consecutive / total_reads * 100))
+        # Gap between the ranks that transferred the most and the least bytes of each file, except for the files whose
+        # bytes vary across ranks, which are already reported with the distribution of their bytes
+        if needed(INSIGHTS_POSIX_INDIVIDUAL_WRITE_SIZE_IMBALANCE, INSIGHTS_POSIX_INDIVIDUAL_READ_SIZE_IMBALANCE):
+            aggregated = aggregate_by_id(
+                df['counters'].loc[(df['counters']['rank'] != -1)],
+                {
+                    'rank': ['nunique'],
+                    'POSIX_BYTES_WRITTEN': ['sum', 'min', 'max'],
+                    'POSIX_BYTES_READ': ['sum', 'min', 'max']
+                },
+                args.workers
+            )
 
-        read_sequential = df['counters']['POSIX_SEQ_READS'].sum()
-        read_sequential -= read_consecutive
-        #print('READ Sequential: {} ({:.2f}%)'.format(read_sequential, read_sequential / total_reads * 100))
+            aggregated = aggregated.assign(id=lambda d: d['id_'].astype(str))
 
-        read_random = total_reads - read_consecutive - read_sequential
-        #print('READ Random: {} ({:.2f}%)'.format(read_random, read_random / total_reads * 100))
-        total_reads = read_consecutive + read_sequential + read_random
+            # Create a heatmap to visualize the write imbalance across the ranks of each individual file
+            plot_imbalance(
+                aggregated['id'],
+                (aggregated['POSIX_BYTES_WRITTEN_max'] - aggregated['POSIX_BYTES_WRITTEN_min']).abs() / aggregated['POSIX_BYTES_WRITTEN_max'].where(aggregated['POSIX_BYTES_WRITTEN_max'] > 0),
+                'Write Imbalance Percentage',
+                'Write Imbalance across the Ranks of Individual Files',
+                'graph9.png'
+            )
 
-        # Calculate percentages
-        percent_consecutive = read_consecutive / total_reads * 100
-        percent_sequential = read_sequential / total_reads * 100
-        percent_random = read_random / total_reads * 100
+            # Get the files responsible
+            imbalance_count = 0
 
-        # Plot the breakdown of read operations into consecutive, sequential, and random
-        plt.figure(figsize=(8, 6))
-        plt.bar("Read Operations", percent_random, color='red', label='Random')
-        plt.bar("Read Operations", percent_sequential, bottom=percent_random, color='orange', label='Sequential')
-        plt.bar("Read Operations", percent_consecutive, bottom=percent_random + percent_sequential, color='green', label='Consecutive')
+            detected_files = []
 
-        plt.xlabel('Operations')
-        plt.ylabel('Percentage of Total Reads')
-        plt.title('Breakdown of Read Operations')
-        plt.legend(loc='upper right')
+            for index, row in aggregated.iterrows():
+                if int(row['id']) not in varied and row['POSIX_BYTES_WRITTEN_max'] and abs(row['POSIX_BYTES_WRITTEN_max'] - row['POSIX_BYTES_WRITTEN_min']) / row['POSIX_BYTES_WRITTEN_max'] > thresholds.IMBALANCE:
+                    imbalance_count += 1
 
-        plt.ylim(0, 100)  # Set the y-axis limit from 0 to 100 for percentage representation
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig('graph4.png')
+                    detected_files.append([
+                        row['id'], abs(row['POSIX_BYTES_WRITTEN_max'] - row['POSIX_BYTES_WRITTEN_min']) / row['POSIX_BYTES_WRITTEN_max'] * 100
+                    ])
 
-        if total_reads:
-            if read_random and read_random / total_reads > THRESHOLD_RANDOM_OPERATIONS and read_random > THRESHOLD_RANDOM_OPERATIONS_ABSOLUTE:
-                issue = 'Application is issuing a high number ({}) of random read operations ({:.2f}%)'.format(
-                    read_random, read_random / total_reads * 100.0
+            if imbalance_count:
+                issue = 'Detected write imbalance when accessing {} individual files'.format(
+                    imbalance_count
                 )
 
+                detail = []
+            
+                for file in detected_files:
+                    detail.append(
+                        {
+                            'id': int(file[0]),
+                            'path': file_map[int(file[0])],
+                            'message': 'Load imbalance of {:.2f}% detected while accessing "{}"',
+                            'values': (
+                                file[1],
+                            ),
+                            'graph' : 'graph9.png'
+                        }
+                    )
+
                 recommendation = [
                     {
-                        'message': 'Consider changing your data model to have consecutive or sequential reads',
-                        'graph' : 'graph4.png'
+                        'message': 'Consider better balancing the data transfer between the application ranks',
+                        'graph' : 'graph9.png'
+                    },
+                    {
+                        'message': 'Consider tuning the stripe size and count to better distribute the data',
+                        'sample': 'lustre-striping.bash',
+                        'graph' : 'graph9.png'
+                    },
+                    {
+                        'message': 'If the application uses netCDF and HDF5 double-check the need to set NO_FILL values',
+                        'sample': 'pnetcdf-hdf5-no-fill.c',
+                        'graph' : 'graph9.png'
+                    },
+                    {
+                        'message': 'If rank 0 is the only one opening the file, consider using MPI-IO collectives',
+                        'graph' : 'graph9.png'
                     }
                 ]
 
                 insights_operation.append(
-                    message(INSIGHTS_POSIX_HIGH_RANDOM_READ_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation)
-                )
-            else:
-                issue = 'Application mostly uses consecutive ({:.2f}%) and sequential ({:.2f}%) read requests'.format(
-                    read_consecutive / total_reads * 100.0,
-                    read_sequential / total_reads * 100.0
+                    message(INSIGHTS_POSIX_INDIVIDUAL_WRITE_SIZE_IMBALANCE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail, metrics={
+                        'files': imbalance_count
+                    })
                 )
 
-                insights_operation.append(
-                    message(INSIGHTS_POSIX_HIGH_SEQUENTIAL_READ_USAGE, TARGET_DEVELOPER, OK, issue, None)
-                )
+            imbalance_count = 0
 
-        write_consecutive = df['counters']['POSIX_CONSEC_WRITES'].sum()
-        #print('WRITE Consecutive: {} ({:.2f}%)'.format(write_consecutive, write_consecutive / total_writes * 100))
+            detected_files = []
 
-        write_sequential = df['counters']['POSIX_SEQ_WRITES'].sum()
-        write_sequential -= write_consecutive
-        #print('WRITE Sequential: {} ({:.2f}%)'.format(write_sequential, write_sequential / total_writes * 100))
+            for index, row in aggregated.iterrows():
+                if int(row['id']) not in varied and row['POSIX_BYTES_READ_max'] and abs(row['POSIX_BYTES_READ_max'] - row['POSIX_BYTES_READ_min']) / row['POSIX_BYTES_READ_max'] > thresholds.IMBALANCE:
+                    imbalance_count += 1
 
-        write_random = total_writes - write_consecutive - write_sequential
-        #print('WRITE Random: {} ({:.2f}%)'.format(write_random, write_random / total_writes * 100))
+                    detected_files.append([
+                        row['id'], abs(row['POSIX_BYTES_READ_max'] - row['POSIX_BYTES_READ_min']) / row['POSIX_BYTES_READ_max'] * 100
+                    ])
 
-        if total_writes:
-            if write_random and write_random / total_writes > THRESHOLD_RANDOM_OPERATIONS and write_random > THRESHOLD_RANDOM_OPERATIONS_ABSOLUTE:
-                issue = 'Application is issuing a high number ({}) of random write operations ({:.2f}%)'.format(
-                    write_random, write_random / total_writes * 100.0
+            if imbalance_count:
+                issue = 'Detected read imbalance when accessing {} individual files.'.format(
+                    imbalance_count
                 )
 
+                detail = []
+            
+                for file in detected_files:
+                    detail.append(
+                        {
+                            'id': int(file[0]),
+                            'path': file_map[int(file[0])],
+                            'message': 'Load imbalance of {:.2f}% detected while accessing "{}"',
+                            'values': (
+                                file[1],
+                            ),
+                            'graph' : 'graph9.png'
+                        }
+                    )
+
                 recommendation = [
                     {
-                        'message': 'Consider changing your data model to have consecutive or sequential writes',
-                        'graph' : 'graph4.png'
+                        'message': 'Consider better balancing the data transfer between the application ranks',
+                        'graph' : 'graph9.png'
 
+                    },
+                    {
+                        'message': 'Consider tuning the stripe size and count to better distribute the data',
+                        'sample': 'lustre-striping.bash',
+                        'graph' : 'graph9.png'
+                    },
+                    {
+                        'message': 'If the application uses netCDF and HDF5 double-check the need to set NO_FILL values',
+                        'sample': 'pnetcdf-hdf5-no-fill.c',
+                        'graph' : 'graph9.png'
+                    },
+                    {
+                        'message': 'If rank 0 is the only one opening the file, consider using MPI-IO collectives',
+                        'graph' : 'graph9.png'
                     }
                 ]
 
                 insights_operation.append(
-                    message(INSIGHTS_POSIX_HIGH_RANDOM_WRITE_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation)
-                )
-            else:
-                issue = 'Application mostly uses consecutive ({:.2f}%) and sequential ({:.2f}%) write requests'.format(
-                    write_consecutive / total_writes * 100.0,
-                    write_sequential / total_writes * 100.0
+                    message(INSIGHTS_POSIX_INDIVIDUAL_READ_SIZE_IMBALANCE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail, metrics={
+                        'files': imbalance_count
+                    })
                 )
 
-                insights_operation.append(
-                    message(INSIGHTS_POSIX_HIGH_SEQUENTIAL_WRITE_USAGE, TARGET_DEVELOPER, OK, issue, None)
-                )
+        budget.checkpoint('file-imbalance')
 
         #########################################################################################################################################################################
 
-    
-            # Shared file with small operations
-            # print(df['counters'].loc[(df['counters']['rank'] == -1)])
 
-            shared_files = df['counters'].loc[(df['counters']['rank'] == -1)]
+        # Timeline of the I/O activity, rebuilt from the timestamps of the first and last operations of each record
+        if needed(INSIGHTS_POSIX_SERIALIZED_IO) or args.timeline:
+            job_timeline = timeline.reconstruct(df['counters'], df['fcounters'], job['job']['nprocs'])
 
-            shared_files = shared_files.assign(id=lambda d: d['id'].astype(str))
+            summary['timeline'] = job_timeline
 
-            if not shared_files.empty:
-                total_shared_reads = shared_files['POSIX_READS'].sum()
-                total_shared_reads_small = (
-                    shared_files['POSIX_SIZE_READ_0_100'].sum() +
-                    shared_files['POSIX_SIZE_READ_100_1K'].sum() +
-                    shared_files['POSIX_SIZE_READ_1K_10K'].sum() +
-                    shared_files['POSIX_SIZE_READ_10K_100K'].sum() +
-                    shared_files['POSIX_SIZE_READ_100K_1M'].sum()
+            if args.timeline:
+                timeline.plot(job_timeline, args.timeline)
+
+            job_phases = timeline.phases(job_timeline)
+            job_serialized = timeline.serialized(job_timeline)
+
+            io_time = sum(end - start for start, end, transferred, peak in job_phases)
+            serialized_time = sum(end - start for start, end in job_serialized)
+
+            if job['job']['nprocs'] > 1 and io_time and serialized_time / io_time > thresholds.SERIALIZED_IO:
+                issue = 'Application has I/O done by at most one rank at a time for {:.2f}% of the time spent in I/O phases'.format(
+                    serialized_time / io_time * 100.0
                 )
 
-                shared_files['INSIGHTS_POSIX_SMALL_READS'] = (
-                    shared_files['POSIX_SIZE_READ_0_100'] +
-                    shared_files['POSIX_SIZE_READ_100_1K'] +
-                    shared_files['POSIX_SIZE_READ_1K_10K'] +
-                    shared_files['POSIX_SIZE_READ_10K_100K'] +
-                    shared_files['POSIX_SIZE_READ_100K_1M']
+                detail = []
+
+                for start, end in job_serialized:
+                    detail.append(
+                        {
+                            'message': 'From {:.2f} to {:.2f} seconds',
+                            'values': (
+                                start,
+                                end
+                            )
+                        }
+                    )
+
+                recommendation = [
+                    {
+                        'message': 'Consider distributing the I/O across ranks or using MPI-IO collective operations so ranks access files concurrently',
+                        'sample': 'mpi-io-collective-write.c'
+                    }
+                ]
+
+                insights_operation.append(
+                    message(INSIGHTS_POSIX_SERIALIZED_IO, TARGET_DEVELOPER, WARN, issue, recommendation, detail, metrics={
+                        'phases': len(job_phases),
+                        'io_seconds': io_time,
+                        'serialized_seconds': serialized_time
+                    })
                 )
 
-    
-            # Create the KDE plot
-            plt.figure(figsize=(8, 6))
-            sns.kdeplot(data=total_shared_reads_small, color='blue', shade=True)
+        budget.checkpoint('timeline')
+
+    #########################################################################################################################################################################
+
+    if 'MPI-IO' in report.records:
+        # Check if application uses MPI-IO and collective operations
+        df_mpiio = report.records['MPI-IO'].to_df()
+
+        df_mpiio['counters'] = df_mpiio['counters'].assign(id=lambda d: d['id'].astype(str))
+
+        #print(df_mpiio)
 
-            # Calculate x and y values for markers
-            x_values = [sum(total_shared_reads_small) / len(total_shared_reads_small)] * len(total_shared_reads_small)
-            y_values = [0] * len(total_shared_reads_small)
+        collective_reads = df_mpiio['counters']['MPIIO_COLL_READS'].sum()
+        independent_reads = df_mpiio['counters']['MPIIO_INDEP_READS'].sum()
 
-            # Overlay a histogram on top of the KDE plot
-            sns.histplot(data=total_shared_reads_small, color='lightblue', bins=10, kde=False)
+        if collective_reads + independent_reads:
+            # Calculate the percentage of collective read operations
+            percentage_coll_reads = collective_reads / (collective_reads + independent_reads) * 100
 
-            # Plot x and y value markers
-            for x, y, value in zip(x_values, y_values, total_shared_reads_small):
-                plt.text(x, y, str(value), ha='center', va='bottom', fontsize=10)
+            if charts():
+                # Plot the bar chart
+                plt.figure(figsize=(8, 6))
+                plt.bar(['Collective Reads', 'Independent Reads'], [percentage_coll_reads, 100 - percentage_coll_reads], color=['blue', 'orange'])
+                plt.xlabel('Read Operations')
+                plt.ylabel('Percentage')
+                plt.title('Percentage of Collective Reads vs. Independent Reads')
+                plt.ylim(0, 100)
+                plt.xticks(rotation=45, ha='right')
+                plt.tight_layout()
+                plt.savefig('graph10.png')
 
-            # Add x and y labels
-            plt.xlabel('Total Shared Reads (Small)')
-            plt.ylabel('Density')
-            plt.title('Kernel Density Estimation of Total Shared Reads (Small)')
+                # Plotting the pie chart
+                plt.figure(figsize=(6, 6))
+                plt.pie([collective_reads, independent_reads], labels=['Collective Reads', 'Independent Reads'], autopct='%1.1f%%', startangle=90, colors=['lightskyblue', 'lightcoral'])
 
-            plt.tight_layout()
-            plt.savefig('graph5.png')
+                plt.title('MPI-IO Read Operations')
+                plt.axis('equal')
+                plt.savefig('graph13.png')
 
 
+        # Get the files responsible
+        detected_files = []
 
-            if total_shared_reads and total_shared_reads_small / total_shared_reads > THRESHOLD_SMALL_REQUESTS and total_shared_reads_small > THRESHOLD_SMALL_REQUESTS_ABSOLUTE:
-                issue = 'Application issues a high number ({}) of small read requests to a shared file (i.e., < 1MB) which represents {:.2f}% of all shared file read requests'.format(
-                    total_shared_reads_small, total_shared_reads_small / total_shared_reads * 100.0
+        df_mpiio_collective_reads = df_mpiio['counters']  #.loc[(df_mpiio['counters']['MPIIO_COLL_READS'] > 0)]
+
+        total_mpiio_read_operations = df_mpiio['counters']['MPIIO_INDEP_READS'].sum() + df_mpiio['counters']['MPIIO_COLL_READS'].sum()
+
+        if df_mpiio['counters']['MPIIO_COLL_READS'].sum() == 0:
+            if total_mpiio_read_operations and total_mpiio_read_operations > thresholds.COLLECTIVE_OPERATIONS_ABSOLUTE:
+                issue = 'Application uses MPI-IO but it does not use collective read operations, instead it issues {} ({:.2f}%) independent read calls'.format(
+                    df_mpiio['counters']['MPIIO_INDEP_READS'].sum(),
+                    df_mpiio['counters']['MPIIO_INDEP_READS'].sum() / (total_mpiio_read_operations) * 100
                 )
 
                 detail = []
 
-                for index, row in shared_files.iterrows():
-                    if row['INSIGHTS_POSIX_SMALL_READS'] > (total_shared_reads * THRESHOLD_SMALL_REQUESTS / 2):
+                files = pd.DataFrame(df_mpiio_collective_reads.groupby('id').sum()).reset_index()
+
+                for index, row in df_mpiio_collective_reads.iterrows():
+                    if (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) and row['MPIIO_INDEP_READS'] / (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) > thresholds.COLLECTIVE_OPERATIONS and (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) > thresholds.COLLECTIVE_OPERATIONS_ABSOLUTE:
                         detail.append(
                             {
-                                'message': '{} ({:.2f}%) small read requests are to "{}"'.format(
-                                    row['INSIGHTS_POSIX_SMALL_READS'],
-                                    row['INSIGHTS_POSIX_SMALL_READS'] / total_shared_reads * 100.0,
-                                    file_map[int(row['id'])] if args.full_path else os.path.basename(file_map[int(row['id'])])
-                                ) 
+                                'id': int(row['id']),
+                                'path': file_map[int(row['id'])],
+                                'message': '{} ({}%) of independent reads to "{}"',
+                                'values': (
+                                    row['MPIIO_INDEP_READS'],
+                                    row['MPIIO_INDEP_READS'] / (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) * 100
+                                ),
+                                'graph' : 'graph13.png'
                             }
                         )
 
                 recommendation = [
                     {
-                        'message': 'Consider coalesceing read requests into larger more contiguous ones using MPI-IO collective operations',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/mpi-io-collective-read.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph5.png'
+                        'message': 'Use collective read operations (e.g. MPI_File_read_all() or MPI_File_read_at_all()) and set one aggregator per compute node',
+                        'sample': 'mpi-io-collective-read.c',
+                        'graph' : 'graph13.png'
                     }
                 ]
 
                 insights_operation.append(
-                    message(INSIGHTS_POSIX_HIGH_SMALL_READ_REQUESTS_SHARED_FILE_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail)
+                    message(INSIGHTS_MPI_IO_NO_COLLECTIVE_READ_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail, metrics={
+                        'reads': total_mpiio_read_operations,
+                        'independent_reads': df_mpiio['counters']['MPIIO_INDEP_READS'].sum()
+                    })
                 )
-
-            total_shared_writes = shared_files['POSIX_WRITES'].sum()
-            total_shared_writes_small = (
-                shared_files['POSIX_SIZE_WRITE_0_100'].sum() +
-                shared_files['POSIX_SIZE_WRITE_100_1K'].sum() +
-                shared_files['POSIX_SIZE_WRITE_1K_10K'].sum() +
-                shared_files['POSIX_SIZE_WRITE_10K_100K'].sum() +
-                shared_files['POSIX_SIZE_WRITE_100K_1M'].sum()
+        else:
+            issue = 'Application uses MPI-IO and read data using {} ({:.2f}%) collective operations'.format(
+                df_mpiio['counters']['MPIIO_COLL_READS'].sum(),
+                df_mpiio['counters']['MPIIO_COLL_READS'].sum() / (df_mpiio['counters']['MPIIO_INDEP_READS'].sum() + df_mpiio['counters']['MPIIO_COLL_READS'].sum()) * 100
             )
 
-            shared_files['INSIGHTS_POSIX_SMALL_WRITES'] = (
-                shared_files['POSIX_SIZE_WRITE_0_100'] +
-                shared_files['POSIX_SIZE_WRITE_100_1K'] +
-                shared_files['POSIX_SIZE_WRITE_1K_10K'] +
-                shared_files['POSIX_SIZE_WRITE_10K_100K'] +
-                shared_files['POSIX_SIZE_WRITE_100K_1M']
+            insights_operation.append(
+                message(INSIGHTS_MPI_IO_COLLECTIVE_READ_USAGE, TARGET_DEVELOPER, OK, issue, metrics={
+                    'reads': total_mpiio_read_operations,
+                    'collective_reads': df_mpiio['counters']['MPIIO_COLL_READS'].sum()
+                })
             )
 
-            # Create the KDE plot
-            plt.figure(figsize=(8, 6))
-            sns.kdeplot(data=total_shared_writes_small, color='blue', shade=True)
-
-            # Calculate x and y values for markers
-            x_values = [sum(total_shared_writes_small) / len(total_shared_writes_small)] * len(total_shared_writes_small)
-            y_values = [0] * len(total_shared_writes_small)
-
-            # Overlay a histogram on top of the KDE plot
-            sns.histplot(data=total_shared_writes_small, color='lightblue', bins=10, kde=False)
-
-            # Plot x and y value markers
-            for x, y, value in zip(x_values, y_values, total_shared_reads_small):
-                plt.text(x, y, str(value), ha='center', va='bottom', fontsize=10)
+        df_mpiio_collective_writes = df_mpiio['counters']  #.loc[(df_mpiio['counters']['MPIIO_COLL_WRITES'] > 0)]
 
-            # Add x and y labels
-            plt.xlabel('Total Shared Writes (Small)')
-            plt.ylabel('Density')
-            plt.title('Kernel Density Estimation of Total Shared Writes (Small)')
+        total_mpiio_write_operations = df_mpiio['counters']['MPIIO_INDEP_WRITES'].sum() + df_mpiio['counters']['MPIIO_COLL_WRITES'].sum()
 
-            plt.tight_layout()
-            plt.savefig('graph55.png')
-            if total_shared_writes and total_shared_writes_small / total_shared_writes > THRESHOLD_SMALL_REQUESTS and total_shared_writes_small > THRESHOLD_SMALL_REQUESTS_ABSOLUTE:
-                issue = 'Application issues a high number ({}) of small write requests to a shared file (i.e., < 1MB) which represents {:.2f}% of all shared file write requests'.format(
-                    total_shared_writes_small, total_shared_writes_small / total_shared_writes * 100.0
+        if df_mpiio['counters']['MPIIO_COLL_WRITES'].sum() == 0:
+            if total_mpiio_write_operations and total_mpiio_write_operations > thresholds.COLLECTIVE_OPERATIONS_ABSOLUTE:
+                issue = 'Application uses MPI-IO but it does not use collective write operations, instead it issues {} ({:.2f}%) independent write calls'.format(
+                    df_mpiio['counters']['MPIIO_INDEP_WRITES'].sum(),
+                    df_mpiio['counters']['MPIIO_INDEP_WRITES'].sum() / (total_mpiio_write_operations) * 100
                 )
 
                 detail = []
 
-                for index, row in shared_files.iterrows():
-                    if row['INSIGHTS_POSIX_SMALL_WRITES'] > (total_shared_writes * THRESHOLD_SMALL_REQUESTS / 2):
+                files = pd.DataFrame(df_mpiio_collective_writes.groupby('id').sum()).reset_index()
+
+                for index, row in df_mpiio_collective_writes.iterrows():
+                    if (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) and row['MPIIO_INDEP_WRITES'] / (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) > thresholds.COLLECTIVE_OPERATIONS and (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) > thresholds.COLLECTIVE_OPERATIONS_ABSOLUTE:
                         detail.append(
                             {
-                                'message': '{} ({:.2f}%) small writes requests are to "{}"'.format(
-                                    row['INSIGHTS_POSIX_SMALL_WRITES'],
-                                    row['INSIGHTS_POSIX_SMALL_WRITES'] / total_shared_writes * 100.0,
-                                    file_map[int(row['id'])] if args.full_path else os.path.basename(file_map[int(row['id'])])
+                                'id': int(row['id']),
+                                'path': file_map[int(row['id'])],
+                                'message': '{} ({}%) independent writes to "{}"',
+                                'values': (
+                                    row['MPIIO_INDEP_WRITES'],
+                                    row['MPIIO_INDEP_WRITES'] / (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) * 100
                                 ),
-                                'graph' : 'graph55.png'
+                                'graph' : 'graph13.png'
                             }
                         )
 
                 recommendation = [
                     {
-                        'message': 'Consider coalescing write requests into larger more contiguous ones using MPI-IO collective operations',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/mpi-io-collective-write.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph55.png'
-
+                        'message': 'Use collective write operations (e.g. MPI_File_write_all() or MPI_File_write_at_all()) and set one aggregator per compute node',
+                        'sample': 'mpi-io-collective-write.c',
+                        'graph' : 'graph13.png'
                     }
                 ]
 
                 insights_operation.append(
-                    message(INSIGHTS_POSIX_HIGH_SMALL_WRITE_REQUESTS_SHARED_FILE_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail)
+                    message(INSIGHTS_MPI_IO_NO_COLLECTIVE_WRITE_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail, metrics={
+                        'writes': total_mpiio_write_operations,
+                        'independent_writes': df_mpiio['counters']['MPIIO_INDEP_WRITES'].sum()
+                    })
                 )
+        else:
+            issue = 'Application uses MPI-IO and write data using {} ({:.2f}%) collective operations'.format(
+                df_mpiio['counters']['MPIIO_COLL_WRITES'].sum(),
+                df_mpiio['counters']['MPIIO_COLL_WRITES'].sum() / (df_mpiio['counters']['MPIIO_INDEP_WRITES'].sum() + df_mpiio['counters']['MPIIO_COLL_WRITES'].sum()) * 100
+            )
+
+            insights_operation.append(
+                message(INSIGHTS_MPI_IO_COLLECTIVE_WRITE_USAGE, TARGET_DEVELOPER, OK, issue, metrics={
+                    'writes': total_mpiio_write_operations,
+                    'collective_writes': df_mpiio['counters']['MPIIO_COLL_WRITES'].sum()
+                })
+            )
 
         #########################################################################################################################################################################
+        # MPI-IO read and write operations, blocking (independent and collective) and non-blocking
+        nonblocking_reads = df_mpiio['counters']['MPIIO_NB_READS'].sum()
+        nonblocking_writes = df_mpiio['counters']['MPIIO_NB_WRITES'].sum()
 
-        
-        has_long_metadata = df['fcounters'][(df['fcounters']['POSIX_F_META_TIME'] > THRESHOLD_METADATA_TIME_RANK)]
+        blocking_reads = df_mpiio['counters']['MPIIO_INDEP_READS'].sum() + df_mpiio['counters']['MPIIO_COLL_READS'].sum()
+        blocking_writes = df_mpiio['counters']['MPIIO_INDEP_WRITES'].sum() + df_mpiio['counters']['MPIIO_COLL_WRITES'].sum()
 
+        # Plotting the graph
+        labels = ['Blocking Reads', 'Non-blocking (Async) Reads', 'Blocking Writes', 'Non-blocking (Async) Writes']
+        values = [blocking_reads, nonblocking_reads, blocking_writes, nonblocking_writes]
+        colors = ['lightcoral', 'lightskyblue', 'lightcoral', 'lightskyblue']
 
-        # Create the grouped bar chart
-        metrics = ['Number of Ranks with Long Metadata']
-        values = [has_long_metadata]
+        if sum(values) and charts():
+            plt.figure(figsize=(10, 6))
+            plt.pie(values, labels=labels, colors=colors, autopct='%.1f%%', startangle=140)
+            plt.title('MPI-IO Read and Write Operations - Blocking vs. Non-blocking (Async)')
+            plt.axis('equal')
+            plt.savefig('graph11.png')
+        # Look for usage of non-block operations
 
-        plt.figure(figsize=(6, 6))
-        plt.bar(metrics, values, color='b')
-        plt.xlabel('Metrics')
-        plt.ylabel('Counts')
-        plt.title('Number of Ranks with Long Metadata Operations')
-        plt.ylim(0, max(values) * 1.2)  # Set the y-axis limit with some buffer space
+        # Look for HDF5 file extension
 
-        # Add annotations with specific Darshan counter information
-        plt.annotate('Threshold: {} seconds'.format(THRESHOLD_METADATA_TIME_RANK), xy=(0, has_long_metadata), xytext=(0.5, has_long_metadata_ranks + 0.2),
-                    arrowprops=dict(arrowstyle='->'), ha='center')
+        has_hdf5_extension = False
 
-        plt.tight_layout()
-        plt.savefig('graph6.png')
-        has_long_metadata = df['fcounters'][(df['fcounters']['POSIX_F_META_TIME'] > THRESHOLD_METADATA_TIME_RANK)]
+        for index, row in df_mpiio['counters'].iterrows():
+            if file_map[int(row['id'])].endswith('.h5') or file_map[int(row['id'])].endswith('.hdf5'):
+                has_hdf5_extension = True
 
-        if not has_long_metadata.empty:
-            issue = 'There are {} ranks where metadata operations take over {} seconds'.format(
-                len(has_long_metadata), THRESHOLD_METADATA_TIME_RANK
-            )
+        if df_mpiio['counters']['MPIIO_NB_READS'].sum() == 0:
+            issue = 'Application could benefit from non-blocking (asynchronous) reads'
 
-            recommendation = [
-                {
-                    'message': 'Attempt to combine files, reduce, or cache metadata operations',
-                    'graph' : 'graph6.png'
-                }
-            ]
+            recommendation = []
 
-            if 'HF5' in modules:
+            if 'H5F' in modules or has_hdf5_extension:
                 recommendation.append(
                     {
-                        'message': 'Since your appplication uses HDF5, try enabling collective metadata calls with H5Pset_coll_metadata_write() and H5Pset_all_coll_metadata_ops()',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/hdf5-collective-metadata.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph6.png'
-
-                    },
-                    {
-                        'message': 'Since your appplication uses HDF5, try using metadata cache to defer metadata operations',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/hdf5-cache.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph6.png'
-
-                    }
-                )
-
-            insights_metadata.append(
-                message(INSIGHTS_POSIX_HIGH_METADATA_TIME, TARGET_DEVELOPER, HIGH, issue, recommendation)
-            )
-
-        # We already have a single line for each shared-file access
-        # To check for stragglers, we can check the difference between the 
-
-        # POSIX_FASTEST_RANK_BYTES
-        # POSIX_SLOWEST_RANK_BYTES
-        # POSIX_F_VARIANCE_RANK_BYTES
-# Hypothetical data (replace with actual Darshan counter data)
-        shared_files = pd.DataFrame({
-            'rank': df['counters']['rank'].tolist(),
-            'POSIX_BYTES_WRITTEN': df['counters']['POSIX_BYTES_WRITTEN'].tolist(),
-            'POSIX_BYTES_READ': df['counters']['POSIX_BYTES_READ'].tolist(),
-            'POSIX_FASTEST_RANK_BYTES': df['counters']['POSIX_FASTEST_RANK_BYTES'].tolist(),
-            'POSIX_SLOWEST_RANK_BYTES': df['counters']['POSIX_SLOWEST_RANK_BYTES'].tolist()
-        })
-
-        # Calculate total transfer size for each shared file access
-        shared_files['TOTAL_TRANSFER_SIZE'] = shared_files['POSIX_BYTES_WRITTEN'] + shared_files['POSIX_BYTES_READ']
-
-        # Calculate the load imbalance percentage for each shared file access
-        shared_files['LOAD_IMBALANCE'] = abs(shared_files['POSIX_SLOWEST_RANK_BYTES'] - shared_files['POSIX_FASTEST_RANK_BYTES']) / shared_files['TOTAL_TRANSFER_SIZE']
-
-        # Create a heatmap to visualize the load imbalance for each shared file access
-        plt.figure(figsize=(10, 6))
-        heatmap_data = shared_files.pivot('id', 'TOTAL_TRANSFER_SIZE', 'LOAD_IMBALANCE')
-        sns.heatmap(heatmap_data, cmap='coolwarm', annot=True, fmt=".2f", cbar_kws={'label': 'Load Imbalance Percentage'})
-        plt.title('Load Imbalance caused by Stragglers for Shared File Accesses')
-        plt.xlabel('Total Transfer Size')
-        plt.ylabel('Shared File ID')
-        plt.tight_layout()
-        plt.savefig('graph7.png')
-        stragglers_count = 0
-
-        shared_files = shared_files.assign(id=lambda d: d['id'].astype(str))
-
-        # Get the files responsible
-        detected_files = []
+                        'message': 'Since you use HDF5, consider using the ASYNC I/O VOL connector (https://github.com/hpc-io/vol-async)',
+                        'sample': 'hdf5-vol-async-read.c',
+                        'graph' : 'graph11.png'
+                    }
+                )
 
-        for index, row in shared_files.iterrows():
-            total_transfer_size = row['POSIX_BYTES_WRITTEN'] + row['POSIX_BYTES_READ']
+            if 'MPI-IO' in modules:
+                recommendation.append(
+                    {
+                        'message': 'Since you use MPI-IO, consider non-blocking/asynchronous I/O operations', # (e.g., MPI_File_iread(), MPI_File_read_all_begin/end(), or MPI_File_read_at_all_begin/end())',
+                        'sample': 'mpi-io-iread.c',
+                        'graph' : 'graph11.png'
+                    }
+                )
 
-            if total_transfer_size and abs(row['POSIX_SLOWEST_RANK_BYTES'] - row['POSIX_FASTEST_RANK_BYTES']) / total_transfer_size > THRESHOLD_STRAGGLERS:
-                stragglers_count += 1
+            insights_operation.append(
+                message(INSIGHTS_MPI_IO_BLOCKING_READ_USAGE, TARGET_DEVELOPER, WARN, issue, recommendation, metrics={
+                    'reads': total_mpiio_read_operations,
+                    'nonblocking_reads': 0
+                })
+            )
 
-                detected_files.append([
-                    row['id'], abs(row['POSIX_SLOWEST_RANK_BYTES'] - row['POSIX_FASTEST_RANK_BYTES']) / total_transfer_size * 100
-                ])
+        if df_mpiio['counters']['MPIIO_NB_WRITES'].sum() == 0:
+            issue = 'Application could benefit from non-blocking (asynchronous) writes'
 
-        if stragglers_count:
-            issue = 'Detected data transfer imbalance caused by stragglers when accessing {} shared file.'.format(
-                stragglers_count
-            )
+            recommendation = []
 
-            detail = []
-            
-            for file in detected_files:
-                detail.append(
+            if 'H5F' in modules or has_hdf5_extension:
+                recommendation.append(
                     {
-                        'message': 'Load imbalance of {:.2f}% detected while accessing "{}"'.format(
-                            file[1],
-                            file_map[int(file[0])] if args.full_path else os.path.basename(file_map[int(file[0])])
-                        ),
-                        'graph' : 'graph7.png'
+                        'message': 'Since you use HDF5, consider using the ASYNC I/O VOL connector (https://github.com/hpc-io/vol-async)',
+                        'sample': 'hdf5-vol-async-write.c',
+                        'graph' : 'graph11.png'
                     }
                 )
 
-            recommendation = [
-                {
-                    'message': 'Consider better balancing the data transfer between the application ranks',
-                    'graph' : 'graph7.png'
-                },
-                {
-                    'message': 'Consider tuning how your data is distributed in the file system by changing the stripe size and count',
-                    'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/lustre-striping.bash'), line_numbers=True, background_color='default'),
-                    'graph' : 'graph7.png'
-                }
-            ]
+            if 'MPI-IO' in modules:
+                recommendation.append(
+                    {
+                        'message': 'Since you use MPI-IO, consider non-blocking/asynchronous I/O operations',  # (e.g., MPI_File_iwrite(), MPI_File_write_all_begin/end(), or MPI_File_write_at_all_begin/end())',
+                        'sample': 'mpi-io-iwrite.c',
+                        'graph' : 'graph11.png'
+                    }
+                )
 
             insights_operation.append(
-                message(INSIGHTS_POSIX_SIZE_IMBALANCE, TARGET_USER, HIGH, issue, recommendation, detail)
+                message(INSIGHTS_MPI_IO_BLOCKING_WRITE_USAGE, TARGET_DEVELOPER, WARN, issue, recommendation, metrics={
+                    'writes': total_mpiio_write_operations,
+                    'nonblocking_writes': 0
+                })
             )
 
-        # POSIX_F_FASTEST_RANK_TIME
-        # POSIX_F_SLOWEST_RANK_TIME
-        # POSIX_F_VARIANCE_RANK_TIME
+    budget.checkpoint('mpiio')
 
+    #########################################################################################################################################################################
 
-        # Hypothetical data (replace with actual Darshan counter data)
-        shared_files_times = pd.DataFrame({
-            'id': df['counters']['jobid'].tolist(),
-            'POSIX_F_WRITE_TIME': df['counters']['POSIX_F_WRITE_TIME'].tolist(),
-            'POSIX_F_READ_TIME': df['counters']['POSIX_F_READ_TIME'].tolist(),
-            'POSIX_F_META_TIME': df['counters']['POSIX_F_META_TIME'].tolist(),
-            'POSIX_F_FASTEST_RANK_TIME': df['counters']['POSIX_F_FASTEST_RANK_TIME'].tolist(),
-            'POSIX_F_SLOWEST_RANK_TIME': df['counters']['POSIX_F_SLOWEST_RANK_TIME'].tolist()
-        })
 
 
-        # Calculate total transfer time for each shared file access
-        shared_files_times['TOTAL_TRANSFER_TIME'] = shared_files_times['POSIX_F_WRITE_TIME'] + shared_files_times['POSIX_F_READ_TIME'] + shared_files_times['POSIX_F_META_TIME']
+    # Time-binned bytes of each rank, a cheap view of the I/O over time when there are no DXT traces
+    if needed(INSIGHTS_HEATMAP_BURSTY_IO, INSIGHTS_HEATMAP_IDLE_IO, INSIGHTS_HEATMAP_RANK_SKEWED_IO):
+        for module, module_heatmap in report.heatmaps.items():
+            if module not in heatmap.HEATMAP_MODULES:
+                continue
 
-        # Calculate the time imbalance percentage for each shared file access
-        shared_files_times['TIME_IMBALANCE'] = abs(shared_files_times['POSIX_F_SLOWEST_RANK_TIME'] - shared_files_times['POSIX_F_FASTEST_RANK_TIME']) / shared_files_times['TOTAL_TRANSFER_TIME']
+            intensity = heatmap.analyze(module_heatmap, thresholds.HEATMAP_RANK_SKEW)
 
-        # Create a heatmap to visualize the time imbalance for each shared file access
-        plt.figure(figsize=(10, 6))
-        heatmap_data = shared_files_times.pivot('id', 'TOTAL_TRANSFER_TIME', 'TIME_IMBALANCE')
-        sns.heatmap(heatmap_data, cmap='coolwarm', annot=True, fmt=".2f", cbar_kws={'label': 'Time Imbalance Percentage'})
-        plt.title('Time Imbalance caused by Stragglers for Shared File Accesses')
-        plt.xlabel('Total Transfer Time')
-        plt.ylabel('Shared File ID')
-        plt.tight_layout()
-        plt.savefig('graph8.png')
-        shared_files_times = df['fcounters'].loc[(df['fcounters']['rank'] == -1)]
+            if intensity is None:
+                continue
 
-        # Get the files responsible
-        detected_files = []
+            if intensity['bins'] > 1 and intensity['burstiness'] > thresholds.HEATMAP_BURSTINESS:
+                issue = '{} heatmap shows bursty I/O: the busiest {:.2f} seconds transfer {:.2f}x the average'.format(
+                    module, intensity['bin_width'], intensity['burstiness']
+                )
 
-        stragglers_count = 0
-        stragglers_imbalance = {}
+                recommendation = [
+                    {
+                        'message': 'Consider spreading the I/O over the computation, for instance with asynchronous or non-blocking I/O, to avoid contention during the bursts'
+                    }
+                ]
 
-        shared_files_times = shared_files_times.assign(id=lambda d: d['id'].astype(str))
+                insights_operation.append(
+                    message(INSIGHTS_HEATMAP_BURSTY_IO, TARGET_DEVELOPER, INFO, issue, recommendation, metrics={
+                        'module': module,
+                        'bin_width_seconds': intensity['bin_width'],
+                        'bins': intensity['bins'],
+                        'burstiness': intensity['burstiness'],
+                        'peak_bytes': intensity['bytes'].max()
+                    })
+                )
 
-        for index, row in shared_files_times.iterrows():
-            total_transfer_time = row['POSIX_F_WRITE_TIME'] + row['POSIX_F_READ_TIME'] + row['POSIX_F_META_TIME']
+            if intensity['idle_bins'] / intensity['bins'] > thresholds.HEATMAP_IDLE:
+                issue = '{} heatmap shows no I/O for {:.2f}% of the time between {:.2f} and {:.2f} seconds (longest idle period of {:.2f} seconds)'.format(
+                    module, intensity['idle_bins'] / intensity['bins'] * 100.0, intensity['start'], intensity['end'], intensity['longest_idle']
+                )
 
-            if total_transfer_time and abs(row['POSIX_F_SLOWEST_RANK_TIME'] - row['POSIX_F_FASTEST_RANK_TIME']) / total_transfer_time > THRESHOLD_STRAGGLERS:
-                stragglers_count += 1
+                insights_operation.append(
+                    message(INSIGHTS_HEATMAP_IDLE_IO, TARGET_USER, INFO, issue, metrics={
+                        'module': module,
+                        'idle_bins': intensity['idle_bins'],
+                        'bins': intensity['bins'],
+                        'longest_idle_seconds': intensity['longest_idle']
+                    })
+                )
 
-                detected_files.append([
-                    row['id'], abs(row['POSIX_F_SLOWEST_RANK_TIME'] - row['POSIX_F_FASTEST_RANK_TIME']) / total_transfer_time * 100
-                ])
+            if intensity['ranks'] > 1 and intensity['skewed_bins'] / intensity['bins'] > thresholds.HEATMAP_SKEWED_BINS:
+                issue = '{} heatmap shows {} time bins where a single rank transferred over {:.0f}% of the data'.format(
+                    module, intensity['skewed_bins'], thresholds.HEATMAP_RANK_SKEW * 100.0
+                )
 
-        if stragglers_count:
-            issue = 'Detected time imbalance caused by stragglers when accessing {} shared file.'.format(
-                stragglers_count
-            )
+                detail = [
+                    {
+                        'message': 'Ranks that dominated those bins: {}',
+                        'values': (
+                            ', '.join(str(rank) for rank in intensity['skewed_ranks']),
+                        )
+                    }
+                ]
 
-            detail = []
-            
-            for file in detected_files:
-                detail.append(
+                recommendation = [
                     {
-                        'message': 'Load imbalance of {:.2f}% detected while accessing "{}"'.format(
-                            file[1],
-                            file_map[int(file[0])] if args.full_path else os.path.basename(file_map[int(file[0])])
-                        ),
-                        'graph' : 'graph8.png'
+                        'message': 'Consider balancing the I/O across ranks or using MPI-IO collective operations to aggregate it',
+                        'sample': 'mpi-io-collective-write.c'
                     }
+                ]
+
+                insights_operation.append(
+                    message(INSIGHTS_HEATMAP_RANK_SKEWED_IO, TARGET_DEVELOPER, WARN, issue, recommendation, detail, metrics={
+                        'module': module,
+                        'skewed_bins': intensity['skewed_bins'],
+                        'bins': intensity['bins'],
+                        'ranks': intensity['skewed_ranks']
+                    })
                 )
 
+    budget.checkpoint('heatmap')
+
+    #########################################################################################################################################################################
+
+    # Striping of the files in Lustre, compared with how the application accessed them
+    if 'LUSTRE' in report.records and df_posix and needed(
+        INSIGHTS_LUSTRE_OST_IMBALANCE, INSIGHTS_LUSTRE_STRIPE_SIZE_MISMATCH, INSIGHTS_LUSTRE_SHARED_FILE_FEW_OSTS
+    ):
+        striped_files = lustre.files(report.records['LUSTRE'].to_df()['counters'], df_posix['counters'], job['job']['nprocs'])
+        striped_files = striped_files.loc[file_map.contains(striped_files.index)]
+
+        ost_bytes = lustre.ost_load(striped_files)
+
+        if len(ost_bytes) > 1 and ost_bytes.max() and (ost_bytes.max() - ost_bytes.min()) / ost_bytes.max() > thresholds.IMBALANCE:
+            issue = 'Data is unevenly spread over the {} OSTs used by the application: the busiest OST stores {} and the least used {}'.format(
+                len(ost_bytes), convert_bytes(ost_bytes.max()), convert_bytes(ost_bytes.min())
+            )
+
             recommendation = [
                 {
-                    'message': 'Consider better distributing the data in the parallel file system',
-                    'graph' : 'graph8.png' # needs to review what suggestion to give
-                },
-                {
-                    'message': 'Consider tuning how your data is distributed in the file system by changing the stripe size and count',
-                    'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/lustre-striping.bash'), line_numbers=True, background_color='default'),
-                    'graph' : 'graph8.png'
+                    'message': 'Consider striping the most accessed files over more OSTs or starting their stripes at different OSTs',
+                    'sample': 'lustre-striping.bash'
                 }
             ]
 
             insights_operation.append(
-                message(INSIGHTS_POSIX_TIME_IMBALANCE, TARGET_USER, HIGH, issue, recommendation, detail)
+                message(INSIGHTS_LUSTRE_OST_IMBALANCE, TARGET_USER, WARN, issue, recommendation, metrics={
+                    'osts': len(ost_bytes),
+                    'ost_bytes': dict(zip(ost_bytes.index.tolist(), ost_bytes.tolist()))
+                })
             )
 
-        aggregated = df['counters'].loc[(df['counters']['rank'] != -1)][
-            ['rank', 'id', 'POSIX_BYTES_WRITTEN', 'POSIX_BYTES_READ']
-        ].groupby('id', as_index=False).agg({
-            'rank': 'nunique',
-            'POSIX_BYTES_WRITTEN': ['sum', 'min', 'max'],
-            'POSIX_BYTES_READ': ['sum', 'min', 'max']
-        })
-
-        aggregated.columns = list(map('_'.join, aggregated.columns.values))
-
-        aggregated = aggregated.assign(id=lambda d: d['id_'].astype(str))
-        shared_files_times = pd.DataFrame({
-            'id': df['counters']['jobid'].tolist(),
-            'POSIX_F_WRITE_TIME': df['counters']['POSIX_F_WRITE_TIME'].tolist(),
-            'POSIX_F_READ_TIME': df['counters']['POSIX_F_READ_TIME'].tolist(),
-            'POSIX_F_META_TIME': df['counters']['POSIX_F_META_TIME'].tolist(),
-            'POSIX_F_FASTEST_RANK_TIME': df['counters']['POSIX_F_FASTEST_RANK_TIME'].tolist(),
-            'POSIX_F_SLOWEST_RANK_TIME': df['counters']['POSIX_F_SLOWEST_RANK_TIME'].tolist(),
-        })
-        # Calculate total transfer time for each shared file access
-        shared_files_times['TOTAL_TRANSFER_TIME'] = shared_files_times['POSIX_F_WRITE_TIME'] + shared_files_times['POSIX_F_READ_TIME'] + shared_files_times['POSIX_F_META_TIME']
-
-        # Calculate the time imbalance percentage for each shared file access
-        shared_files_times['TIME_IMBALANCE'] = abs(shared_files_times['POSIX_F_SLOWEST_RANK_TIME'] - shared_files_times['POSIX_F_FASTEST_RANK_TIME']) / shared_files_times['TOTAL_TRANSFER_TIME']
-
-        # Create a heatmap to visualize the time imbalance for each shared file access
-        plt.figure(figsize=(10, 6))
-        heatmap_data = shared_files_times.pivot('id', 'TOTAL_TRANSFER_TIME', 'TIME_IMBALANCE')
-        sns.heatmap(heatmap_data, cmap='coolwarm', annot=True, fmt=".2f", cbar_kws={'label': 'Time Imbalance Percentage'})
-        plt.title('Time Imbalance caused by Stragglers for Shared File Accesses')
-        plt.xlabel('Total Transfer Time')
-        plt.ylabel('Shared File ID')
-        plt.tight_layout()
-        plt.savefig('graph9.png')
-        # Get the files responsible
-        imbalance_count = 0
-
-        detected_files = []
-
-        for index, row in aggregated.iterrows():
-            if row['POSIX_BYTES_WRITTEN_max'] and abs(row['POSIX_BYTES_WRITTEN_max'] - row['POSIX_BYTES_WRITTEN_min']) / row['POSIX_BYTES_WRITTEN_max'] > THRESHOLD_IMBALANCE:
-                imbalance_count += 1
+        misfit_files = lustre.misfit(striped_files.loc[striped_files['bytes'] > 0])
 
-                detected_files.append([
-                    row['id'], abs(row['POSIX_BYTES_WRITTEN_max'] - row['POSIX_BYTES_WRITTEN_min']) / row['POSIX_BYTES_WRITTEN_max'] * 100
-                ])
-
-        if imbalance_count:
-            issue = 'Detected write imbalance when accessing {} individual files'.format(
-                imbalance_count
+        if not misfit_files.empty:
+            issue = 'Application issues requests that do not fit the stripe size in {} files'.format(
+                len(misfit_files)
             )
 
             detail = []
-            
-            for file in detected_files:
+
+            for id, row in misfit_files.iterrows():
                 detail.append(
                     {
-                        'message': 'Load imbalance of {:.2f}% detected while accessing "{}"'.format(
-                            file[1],
-                            file_map[int(file[0])] if args.full_path else os.path.basename(file_map[int(file[0])])
+                        'id': int(id),
+                        'path': file_map[int(id)],
+                        'message': 'Most requests are {} with a stripe size of {} in "{}"',
+                        'values': (
+                            convert_bytes(row['request_size']),
+                            convert_bytes(row['LUSTRE_STRIPE_SIZE'])
                         ),
-                        'graph' : 'graph9.png'
+                        'impact': row['bytes']
                     }
                 )
 
             recommendation = [
                 {
-                    'message': 'Consider better balancing the data transfer between the application ranks',
-                    'graph' : 'graph9.png'
-                },
-                {
-                    'message': 'Consider tuning the stripe size and count to better distribute the data',
-                    'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/lustre-striping.bash'), line_numbers=True, background_color='default'),
-                    'graph' : 'graph9.png'
-                },
-                {
-                    'message': 'If the application uses netCDF and HDF5 double-check the need to set NO_FILL values',
-                    'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/pnetcdf-hdf5-no-fill.c'), line_numbers=True, background_color='default'),
-                    'graph' : 'graph9.png'
-                },
-                {
-                    'message': 'If rank 0 is the only one opening the file, consider using MPI-IO collectives',
-                    'graph' : 'graph9.png'
+                    'message': 'Consider setting the stripe size to a multiple of the request size, or requesting whole stripes',
+                    'sample': 'lustre-striping.bash'
                 }
             ]
 
             insights_operation.append(
-                message(INSIGHTS_POSIX_INDIVIDUAL_WRITE_SIZE_IMBALANCE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail)
+                message(INSIGHTS_LUSTRE_STRIPE_SIZE_MISMATCH, TARGET_USER, WARN, issue, recommendation, detail, metrics={
+                    'files': len(misfit_files),
+                    'bytes': misfit_files['bytes'].sum()
+                })
             )
 
-        imbalance_count = 0
-
-        detected_files = []
-
-        for index, row in aggregated.iterrows():
-            if row['POSIX_BYTES_READ_max'] and abs(row['POSIX_BYTES_READ_max'] - row['POSIX_BYTES_READ_min']) / row['POSIX_BYTES_READ_max'] > THRESHOLD_IMBALANCE:
-                imbalance_count += 1
-
-                detected_files.append([
-                    row['id'], abs(row['POSIX_BYTES_READ_max'] - row['POSIX_BYTES_READ_min']) / row['POSIX_BYTES_READ_max'] * 100
-                ])
+        understriped_files = lustre.understriped(striped_files, thresholds.LUSTRE_RANKS_PER_OST)
 
-        if imbalance_count:
-            issue = 'Detected read imbalance when accessing {} individual files.'.format(
-                imbalance_count
+        if not understriped_files.empty:
+            issue = 'Application has {} shared files striped over too few OSTs for the number of ranks accessing them'.format(
+                len(understriped_files)
             )
 
             detail = []
-            
-            for file in detected_files:
+
+            for id, row in understriped_files.iterrows():
                 detail.append(
                     {
-                        'message': 'Load imbalance of {:.2f}% detected while accessing "{}"'.format(
-                            file[1],
-                            file_map[int(file[0])] if args.full_path else os.path.basename(file_map[int(file[0])])
-                        ),
-                        'graph' : 'graph9.png'
+                        'id': int(id),
+                        'path': file_map[int(id)],
+                        'message': '{} ranks share {} OSTs in "{}"',
+                        'values': (
+                            row['ranks'],
+                            row['LUSTRE_STRIPE_WIDTH']
+                        )
                     }
                 )
 
             recommendation = [
                 {
-                    'message': 'Consider better balancing the data transfer between the application ranks',
-                    'graph' : 'graph9.png'
-
-                },
-                {
-                    'message': 'Consider tuning the stripe size and count to better distribute the data',
-                    'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/lustre-striping.bash'), line_numbers=True, background_color='default'),
-                    'graph' : 'graph9.png'
-                },
-                {
-                    'message': 'If the application uses netCDF and HDF5 double-check the need to set NO_FILL values',
-                    'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/pnetcdf-hdf5-no-fill.c'), line_numbers=True, background_color='default'),
-                    'graph' : 'graph9.png'
-                },
-                {
-                    'message': 'If rank 0 is the only one opening the file, consider using MPI-IO collectives',
-                    'graph' : 'graph9.png'
+                    'message': 'Consider increasing the stripe count of the shared files (e.g. lfs setstripe -c) up to one OST per {} ranks'.format(
+                        thresholds.LUSTRE_RANKS_PER_OST
+                    ),
+                    'sample': 'lustre-striping.bash'
                 }
             ]
 
             insights_operation.append(
-                message(INSIGHTS_POSIX_INDIVIDUAL_READ_SIZE_IMBALANCE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail)
+                message(INSIGHTS_LUSTRE_SHARED_FILE_FEW_OSTS, TARGET_USER, WARN, issue, recommendation, detail, metrics={
+                    'files': len(understriped_files),
+                    'ranks_per_ost': thresholds.LUSTRE_RANKS_PER_OST
+                })
             )
 
-    #########################################################################################################################################################################
-
-        # Hypothetical data (replace with actual data from the code snippet)
-        # Calculate the percentage of collective read operations
-        total_indep_reads = df_mpiio['counters']['MPIIO_INDEP_READS'].sum()
-        total_coll_reads = df_mpiio['counters']['MPIIO_COLL_READS'].sum()
-        total_reads = total_indep_reads + total_coll_reads
-
-        # Calculate the percentage of collective read operations
-        percentage_coll_reads = (total_coll_reads / total_reads) * 100
-
-        # Plot the bar chart
-        plt.figure(figsize=(8, 6))
-        plt.bar(['Collective Reads', 'Independent Reads'], [percentage_coll_reads, 100 - percentage_coll_reads], color=['blue', 'orange'])
-        plt.xlabel('Read Operations')
-        plt.ylabel('Percentage')
-        plt.title('Percentage of Collective Reads vs. Independent Reads')
-        plt.ylim(0, 100)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        plt.savefig('graph10.png')
-        
-        # Assuming df_mpiio['counters']['MPIIO_COLL_READS'].sum() and df_mpiio['counters']['MPIIO_INDEP_READS'].sum() are already defined
-
-        # Total MPI-IO read operations
-        total_mpiio_read_operations = df_mpiio['counters']['MPIIO_COLL_READS'].sum() + df_mpiio['counters']['MPIIO_INDEP_READS'].sum()
+    budget.checkpoint('lustre')
 
-        # Count of collective read operations
-        collective_reads = df_mpiio['counters']['MPIIO_COLL_READS'].sum()
+    #########################################################################################################################################################################
 
-        # Count of independent read operations
-        independent_reads = df_mpiio['counters']['MPIIO_INDEP_READS'].sum()
+    # Requests issued to POSIX for each MPI-IO request, per file
+    if df_mpiio and df_posix and needed(INSIGHTS_MPI_IO_REQUEST_AMPLIFICATION, INSIGHTS_MPI_IO_BYTE_AMPLIFICATION):
+        layered_files = layers.amplification(df_mpiio['counters'], df_posix['counters'])
+        layered_files = layered_files.loc[file_map.contains(layered_files.index)]
 
-        # Create labels and sizes for the pie chart
-        labels = ['Collective Reads', 'Independent Reads']
-        sizes = [collective_reads, independent_reads]
+        for operation in layers.OPERATIONS:
+            requests = 'posix_{}_requests'.format(operation)
+            mpiio_requests = 'mpiio_{}_requests'.format(operation)
 
-        # Plotting the pie chart
-        plt.figure(figsize=(6, 6))
-        plt.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, colors=['lightskyblue', 'lightcoral'])
+            amplified = layered_files.loc[
+                (layered_files[mpiio_requests] > 0) &
+                (layered_files['{}_request_amplification'.format(operation)] > thresholds.REQUEST_AMPLIFICATION)
+            ]
 
-        plt.title('MPI-IO Read Operations')
-        plt.axis('equal')
-        plt.savefig('graph13.png')
-    if 'MPI-IO' in report.records:
-        # Check if application uses MPI-IO and collective operations
-        df_mpiio = report.records['MPI-IO'].to_df()
+            if not amplified.empty:
+                issue = 'Application issues {:.2f}x more POSIX than MPI-IO {} requests in {} files'.format(
+                    amplified[requests].sum() / amplified[mpiio_requests].sum(), operation, len(amplified)
+                )
 
-        df_mpiio['counters'] = df_mpiio['counters'].assign(id=lambda d: d['id'].astype(str))
+                detail = []
 
-        #print(df_mpiio)
+                for id, row in amplified.iterrows():
+                    detail.append(
+                        {
+                            'id': int(id),
+                            'path': file_map[int(id)],
+                            'message': '{} MPI-IO {} requests ({:.2f}% collective) became {} POSIX requests in "{}"',
+                            'values': (
+                                int(row[mpiio_requests]),
+                                operation,
+                                row['mpiio_{}_collective'.format(operation)] / row[mpiio_requests] * 100.0,
+                                int(row[requests])
+                            ),
+                            'impact': row[requests] - row[mpiio_requests]
+                        }
+                    )
 
+                recommendation = [
+                    {
+                        'message': 'Consider tuning the collective buffering hints (e.g. cb_buffer_size and cb_nodes) so aggregators issue fewer and larger requests',
+                        'sample': 'mpi-io-hints.bash'
+                    }
+                ]
 
-        # Get the files responsible
-        detected_files = []
+                insights_operation.append(
+                    message(INSIGHTS_MPI_IO_REQUEST_AMPLIFICATION, TARGET_DEVELOPER, WARN, issue, recommendation, detail, metrics={
+                        'operation': operation,
+                        'files': len(amplified),
+                        'mpiio_requests': amplified[mpiio_requests].sum(),
+                        'posix_requests': amplified[requests].sum()
+                    })
+                )
 
-        df_mpiio_collective_reads = df_mpiio['counters']  #.loc[(df_mpiio['counters']['MPIIO_COLL_READS'] > 0)]
+            transferred = 'posix_{}_bytes'.format(operation)
+            mpiio_transferred = 'mpiio_{}_bytes'.format(operation)
 
-        total_mpiio_read_operations = df_mpiio['counters']['MPIIO_INDEP_READS'].sum() + df_mpiio['counters']['MPIIO_COLL_READS'].sum()
+            amplified = layered_files.loc[
+                (layered_files[mpiio_transferred] > 0) &
+                (layered_files['{}_byte_amplification'.format(operation)] > 1.0 + thresholds.BYTE_AMPLIFICATION)
+            ]
 
-        if df_mpiio['counters']['MPIIO_COLL_READS'].sum() == 0:
-            if total_mpiio_read_operations and total_mpiio_read_operations > THRESHOLD_COLLECTIVE_OPERATIONS_ABSOLUTE:
-                issue = 'Application uses MPI-IO but it does not use collective read operations, instead it issues {} ({:.2f}%) independent read calls'.format(
-                    df_mpiio['counters']['MPIIO_INDEP_READS'].sum(),
-                    df_mpiio['counters']['MPIIO_INDEP_READS'].sum() / (total_mpiio_read_operations) * 100
+            if not amplified.empty:
+                issue = 'Application moves {} more at the POSIX level than requested through MPI-IO {} operations in {} files'.format(
+                    convert_bytes(amplified[transferred].sum() - amplified[mpiio_transferred].sum()), operation, len(amplified)
                 )
 
                 detail = []
 
-                files = pd.DataFrame(df_mpiio_collective_reads.groupby('id').sum()).reset_index()
-
-                for index, row in df_mpiio_collective_reads.iterrows():
-                    if (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) and row['MPIIO_INDEP_READS'] / (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) > THRESHOLD_COLLECTIVE_OPERATIONS and (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) > THRESHOLD_COLLECTIVE_OPERATIONS_ABSOLUTE:
-                        detail.append(
-                            {
-                                'message': '{} ({}%) of independent reads to "{}"'.format(
-                                    row['MPIIO_INDEP_READS'],
-                                    row['MPIIO_INDEP_READS'] / (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) * 100,
-                                    file_map[int(row['id'])] if args.full_path else os.path.basename(file_map[int(row['id'])])
-                                ),
-                                'graph' : 'graph13.png'
-                            }
-                        )
+                for id, row in amplified.iterrows():
+                    detail.append(
+                        {
+                            'id': int(id),
+                            'path': file_map[int(id)],
+                            'message': '{} requested through MPI-IO became {} ({:.2f}x) at the POSIX level in "{}"',
+                            'values': (
+                                convert_bytes(row[mpiio_transferred]),
+                                convert_bytes(row[transferred]),
+                                row['{}_byte_amplification'.format(operation)]
+                            ),
+                            'impact': row[transferred] - row[mpiio_transferred]
+                        }
+                    )
 
                 recommendation = [
                     {
-                        'message': 'Use collective read operations (e.g. MPI_File_read_all() or MPI_File_read_at_all()) and set one aggregator per compute node',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/mpi-io-collective-read.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph13.png'
+                        'message': 'Consider disabling data sieving (e.g. romio_ds_{}=disable) or aligning the requests to the file system blocks'.format(operation),
+                        'sample': 'mpi-io-hints.bash'
                     }
                 ]
 
                 insights_operation.append(
-                    message(INSIGHTS_MPI_IO_NO_COLLECTIVE_READ_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail)
+                    message(INSIGHTS_MPI_IO_BYTE_AMPLIFICATION, TARGET_DEVELOPER, WARN, issue, recommendation, detail, metrics={
+                        'operation': operation,
+                        'files': len(amplified),
+                        'mpiio_bytes': amplified[mpiio_transferred].sum(),
+                        'posix_bytes': amplified[transferred].sum()
+                    })
                 )
-        else:
-            issue = 'Application uses MPI-IO and read data using {} ({:.2f}%) collective operations'.format(
-                df_mpiio['counters']['MPIIO_COLL_READS'].sum(),
-                df_mpiio['counters']['MPIIO_COLL_READS'].sum() / (df_mpiio['counters']['MPIIO_INDEP_READS'].sum() + df_mpiio['counters']['MPIIO_COLL_READS'].sum()) * 100
-            )
 
-            insights_operation.append(
-                message(INSIGHTS_MPI_IO_COLLECTIVE_READ_USAGE, TARGET_DEVELOPER, OK, issue)
-            )
+    budget.checkpoint('amplification')
 
-        df_mpiio_collective_writes = df_mpiio['counters']  #.loc[(df_mpiio['counters']['MPIIO_COLL_WRITES'] > 0)]
+    #########################################################################################################################################################################
 
-        total_mpiio_write_operations = df_mpiio['counters']['MPIIO_INDEP_WRITES'].sum() + df_mpiio['counters']['MPIIO_COLL_WRITES'].sum()
+    # Rolling baseline of the runs of the same executable with a similar number of processes
+    if args.baselines and df_posix and needed(INSIGHTS_BASELINE_REGRESSION):
+        history = baselines.Baselines(args.baselines)
 
-        if df_mpiio['counters']['MPIIO_COLL_WRITES'].sum() == 0:
-            if total_mpiio_write_operations and total_mpiio_write_operations > THRESHOLD_COLLECTIVE_OPERATIONS_ABSOLUTE:
-                issue = 'Application uses MPI-IO but it does not use collective write operations, instead it issues {} ({:.2f}%) independent write calls'.format(
-                    df_mpiio['counters']['MPIIO_INDEP_WRITES'].sum(),
-                    df_mpiio['counters']['MPIIO_INDEP_WRITES'].sum() / (total_mpiio_write_operations) * 100
-                )
+        baseline_key = baselines.key(job['exe'].split()[0], job['job']['nprocs'])
+        baseline_values = baselines.metrics(df_posix['counters'], df_posix['fcounters'], job['job']['nprocs'])
 
-                detail = []
+        # The run only joins its baseline with the metrics that did not regress, and a CI gate only compares it
+        if args.fail_on:
+            baseline = history.get(baseline_key)
+            deviating = baselines.deviations(baseline, baseline_values, thresholds.BASELINE_DEVIATION, thresholds.BASELINE_RUNS)
+        else:
+            baseline, deviating = history.check(baseline_key, baseline_values, thresholds.BASELINE_DEVIATION, thresholds.BASELINE_RUNS)
 
-                files = pd.DataFrame(df_mpiio_collective_writes.groupby('id').sum()).reset_index()
+        if deviating:
+            issue = 'Application I/O regressed from the baseline of the previous {} runs of this executable in {} metrics'.format(
+                max(baseline[metric].runs for metric, value, mean, deviation in deviating), len(deviating)
+            )
 
-                for index, row in df_mpiio_collective_writes.iterrows():
-                    if (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) and row['MPIIO_INDEP_WRITES'] / (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) > THRESHOLD_COLLECTIVE_OPERATIONS and (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) > THRESHOLD_COLLECTIVE_OPERATIONS_ABSOLUTE:
-                        detail.append(
-                            {
-                                'message': '{} ({}%) independent writes to "{}"'.format(
-                                    row['MPIIO_INDEP_WRITES'],
-                                    row['MPIIO_INDEP_WRITES'] / (row['MPIIO_INDEP_READS'] + row['MPIIO_INDEP_WRITES']) * 100,
-                                    file_map[int(row['id'])] if args.full_path else os.path.basename(file_map[int(row['id'])])
-                                ),
-                                'graph' : 'graph13.png'
-                            }
-                        )
+            detail = []
 
-                recommendation = [
+            for metric, value, mean, deviation in deviating:
+                detail.append(
                     {
-                        'message': 'Use collective write operations (e.g. MPI_File_write_all() or MPI_File_write_at_all()) and set one aggregator per compute node',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/mpi-io-collective-write.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph13.png'
+                        'message': 'The {} is {:.2f} ({:+.2f} standard deviations from the baseline mean of {:.2f})',
+                        'values': (
+                            baselines.METRICS[metric],
+                            value,
+                            deviation,
+                            mean
+                        )
                     }
-                ]
-
-                insights_operation.append(
-                    message(INSIGHTS_MPI_IO_NO_COLLECTIVE_WRITE_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail)
                 )
-        else:
-            issue = 'Application uses MPI-IO and write data using {} ({:.2f}%) collective operations'.format(
-                df_mpiio['counters']['MPIIO_COLL_WRITES'].sum(),
-                df_mpiio['counters']['MPIIO_COLL_WRITES'].sum() / (df_mpiio['counters']['MPIIO_INDEP_WRITES'].sum() + df_mpiio['counters']['MPIIO_COLL_WRITES'].sum()) * 100
-            )
+
+            recommendation = [
+                {
+                    'message': 'Check for recent changes in the application, I/O libraries, or file system settings (e.g. striping) since the previous runs'
+                }
+            ]
 
             insights_operation.append(
-                message(INSIGHTS_MPI_IO_COLLECTIVE_WRITE_USAGE, TARGET_DEVELOPER, OK, issue)
+                message(INSIGHTS_BASELINE_REGRESSION, TARGET_USER, WARN, issue, recommendation, detail, metrics={
+                    'baseline': baseline_key,
+                    'deviations': {metric: deviation for metric, value, mean, deviation in deviating}
+                })
             )
 
-        #########################################################################################################################################################################
-        # Total MPI-IO read operations (blocking + non-blocking)
-        total_mpiio_reads = df_mpiio['counters']['MPIIO_NB_READS'].sum() + df_mpiio['counters']['MPIIO_IND_READS'].sum()
+    budget.checkpoint('baselines')
 
-        # Total MPI-IO write operations (blocking + non-blocking)
-        total_mpiio_writes = df_mpiio['counters']['MPIIO_NB_WRITES'].sum() + df_mpiio['counters']['MPIIO_IND_WRITES'].sum()
+    #########################################################################################################################################################################
 
-        # Percentage of non-blocking reads and blocking reads
-        percentage_nb_reads = df_mpiio['counters']['MPIIO_NB_READS'].sum() / total_mpiio_reads * 100
+    # The DXT traces are decoded last, with the time left by the rules on the module counters. A CI gate only
+    # decodes them when it checks the insights that need them
+    if needed(*TRACED_INSIGHTS):
+        dxt_features, hosts = traces(filename, modules, job['job']['nprocs'], budget, summary)
+    else:
+        dxt_features, hosts = {}, {}
 
-        # Percentage of non-blocking writes and blocking writes
-        percentage_nb_writes = df_mpiio['counters']['MPIIO_NB_WRITES'].sum() / total_mpiio_writes * 100
+    budget.checkpoint('dxt-traces')
 
-        # Plotting the graph
-        labels = ['Blocking Reads', 'Non-blocking (Async) Reads', 'Blocking Writes', 'Non-blocking (Async) Writes']
-        values = [total_mpiio_reads - df_mpiio['counters']['MPIIO_NB_READS'].sum(), df_mpiio['counters']['MPIIO_NB_READS'].sum(),
-                total_mpiio_writes - df_mpiio['counters']['MPIIO_NB_WRITES'].sum(), df_mpiio['counters']['MPIIO_NB_WRITES'].sum()]
-        colors = ['lightcoral', 'lightskyblue', 'lightcoral', 'lightskyblue']
+    #########################################################################################################################################################################
 
-        plt.figure(figsize=(10, 6))
-        plt.pie(values, labels=labels, colors=colors, autopct='%.1f%%', startangle=140)
-        plt.title('MPI-IO Read and Write Operations - Blocking vs. Non-blocking (Async)')
-        plt.axis('equal')
-        plt.savefig('graph11.png')
-        # Look for usage of non-block operations
+    if df_posix:
+        # Redundant read-traffic (based on Phill)
+        exact_redundancy = 'DXT_POSIX' in dxt_features and not dxt_features['DXT_POSIX'].empty
 
-        # Look for HDF5 file extension
+        if exact_redundancy:
+            # The traces have every byte range, so bytes accessed more than once are counted exactly
+            dxt_files = dxt_features['DXT_POSIX']
+            dxt_files = dxt_files.loc[file_map.contains(dxt_files.index)]
 
-        has_hdf5_extension = False
+            for operation, code, verb in (
+                ('read', INSIGHTS_POSIX_REDUNDANT_READ_USAGE, 'read'),
+                ('write', INSIGHTS_POSIX_REDUNDANT_WRITE_USAGE, 'written')
+            ):
+                total_bytes = dxt_files['{}_bytes'.format(operation)].sum()
+                total_redundant = dxt_files['{}_redundant'.format(operation)].sum()
 
-        for index, row in df_mpiio['counters'].iterrows():
-            if file_map[int(row['id'])].endswith('.h5') or file_map[int(row['id'])].endswith('.hdf5'):
-                has_hdf5_extension = True
+                if not total_bytes or total_redundant / total_bytes <= thresholds.REDUNDANT_TRAFFIC:
+                    continue
 
-        if df_mpiio['counters']['MPIIO_NB_READS'].sum() == 0:
-            issue = 'Application could benefit from DYINGGGGG non-blocking (asynchronous) reads'
+                issue = 'Application has redundant {} traffic: {} ({:.2f}%) of the data was {} more than once'.format(
+                    operation, convert_bytes(total_redundant), total_redundant / total_bytes * 100.0, verb
+                )
 
-            recommendation = []
+                detail = []
 
-            if 'H5F' in modules or has_hdf5_extension:
-                recommendation.append(
-                    {
-                        'message': 'Since you use HDF5, consider using the ASYNC I/O VOL connector (https://github.com/hpc-io/vol-async)',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/hdf5-vol-async-read.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph11.png'
-                    }
-                )
+                for id, row in dxt_files.loc[dxt_files['{}_redundant'.format(operation)] > 0].iterrows():
+                    detail.append(
+                        {
+                            'id': int(id),
+                            'path': file_map[int(id)],
+                            'message': '{} ' + verb + ' more than once, by up to {} ranks in bytes {}-{} of "{}"',
+                            'values': (
+                                convert_bytes(row['{}_redundant'.format(operation)]),
+                                int(row['{}_hottest_ranks'.format(operation)]),
+                                int(row['{}_hottest_start'.format(operation)]),
+                                int(row['{}_hottest_end'.format(operation)])
+                            ),
+                            'impact': row['{}_redundant'.format(operation)]
+                        }
+                    )
 
-            if 'MPI-IO' in modules:
-                recommendation.append(
+                recommendation = [
                     {
-                        'message': 'Since you use MPI-IO, consider non-blocking/asynchronous I/O operations', # (e.g., MPI_File_iread(), MPI_File_read_all_begin/end(), or MPI_File_read_at_all_begin/end())',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/mpi-io-iread.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph11.png'
+                        'message': 'Consider keeping the data in memory or exchanging it between ranks instead of accessing the same bytes again'
                     }
+                ]
+
+                insights_metadata.append(
+                    message(code, TARGET_DEVELOPER, WARN, issue, recommendation, detail, metrics={
+                        'bytes': total_bytes,
+                        'unique_bytes': dxt_files['{}_unique'.format(operation)].sum(),
+                        'redundant_bytes': total_redundant
+                    })
                 )
 
-            insights_operation.append(
-                message(INSIGHTS_MPI_IO_BLOCKING_READ_USAGE, TARGET_DEVELOPER, WARN, issue, recommendation)
+        # POSIX_MAX_BYTE_READ (Highest offset in the file that was read)
+        max_read_offset = df_posix['counters']['POSIX_MAX_BYTE_READ'].max()
+
+        if not exact_redundancy and max_read_offset > total_read_size_posix:
+            issue = 'Application might have redundant read traffic (more data read than the highest offset)'
+
+            insights_metadata.append(
+                message(INSIGHTS_POSIX_REDUNDANT_READ_USAGE, TARGET_DEVELOPER, WARN, issue, None, metrics={
+                    'max_byte_read': max_read_offset,
+                    'bytes_read': total_read_size_posix
+                })
             )
 
-        if df_mpiio['counters']['MPIIO_NB_WRITES'].sum() == 0:
-            issue = 'Application could benefit from non-blocking (asynchronous) writes'
 
-            recommendation = []
+        max_write_offset = df_posix['counters']['POSIX_MAX_BYTE_WRITTEN'].max()
+        if not exact_redundancy and max_write_offset > total_write_size_posix:
+            issue = 'Application might have redundant write traffic (more data written than the highest offset)'
 
-            if 'H5F' in modules or has_hdf5_extension:
-                recommendation.append(
-                    {
-                        'message': 'Since you use HDF5, consider using the ASYNC I/O VOL connector (https://github.com/hpc-io/vol-async)',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/hdf5-vol-async-write.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph11.png'
-                    }
-                )
+            insights_metadata.append(
+                message(INSIGHTS_POSIX_REDUNDANT_WRITE_USAGE, TARGET_DEVELOPER, WARN, issue, None, metrics={
+                    'max_byte_written': max_write_offset,
+                    'bytes_written': total_write_size_posix
+                })
+            )
+        budget.checkpoint('redundant')
 
-            if 'MPI-IO' in modules:
-                recommendation.append(
+    #########################################################################################################################################################################
+
+    if df_posix and hosts and needed(INSIGHTS_POSIX_NODE_IMBALANCE):
+        node_io = nodes.per_node(df_posix['counters'], df_posix['fcounters'], hosts)
+
+        for metric, description, unit in (
+            ('bytes', 'data transferred', convert_bytes),
+            ('time', 'I/O time', '{:.2f} seconds'.format)
+        ):
+            busiest = node_io[metric].max()
+
+            if len(node_io) < 2 or not busiest or (busiest - node_io[metric].min()) / busiest <= thresholds.IMBALANCE:
+                continue
+
+            issue = 'Detected {} imbalance across the {} compute nodes: the busiest node has {} and the least busy {}'.format(
+                description, len(node_io), unit(busiest), unit(node_io[metric].min())
+            )
+
+            detail = []
+
+            for node in (node_io[metric].idxmax(), node_io[metric].idxmin()):
+                detail.append(
                     {
-                        'message': 'Since you use MPI-IO, consider non-blocking/asynchronous I/O operations',  # (e.g., MPI_File_iwrite(), MPI_File_write_all_begin/end(), or MPI_File_write_at_all_begin/end())',
-                        'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/mpi-io-iwrite.c'), line_numbers=True, background_color='default'),
-                        'graph' : 'graph11.png'
+                        'message': 'Node {} with {} ranks has {:.2f}% of the {}',
+                        'values': (
+                            node,
+                            node_io.loc[node, 'ranks'],
+                            node_io.loc[node, metric] / node_io[metric].sum() * 100.0,
+                            description
+                        )
                     }
                 )
 
+            recommendation = [
+                {
+                    'message': 'Consider distributing the I/O evenly across the compute nodes, for instance by mapping the I/O ranks to different nodes'
+                }
+            ]
+
             insights_operation.append(
-                message(INSIGHTS_MPI_IO_BLOCKING_WRITE_USAGE, TARGET_DEVELOPER, WARN, issue, recommendation)
+                message(INSIGHTS_POSIX_NODE_IMBALANCE, TARGET_USER, WARN, issue, recommendation, detail, metrics={
+                    'metric': metric,
+                    'nodes': len(node_io),
+                    'max': busiest,
+                    'min': node_io[metric].min(),
+                    'per_node': node_io[metric].to_dict()
+                })
             )
 
-    #########################################################################################################################################################################
-
-    # Assuming cb_nodes and NUMBER_OF_COMPUTE_NODES are already defined correctly
-
-    # Number of compute nodes
-    x = ['Number of Aggregators', 'Number of Compute Nodes']
-    values = [cb_nodes, NUMBER_OF_COMPUTE_NODES]
+    budget.checkpoint('nodes')
 
-    # Plotting the graph
-    plt.figure(figsize=(8, 6))
-    plt.bar(x, values, color=['lightcoral', 'lightskyblue'])
+    #########################################################################################################################################################################
 
-    plt.xlabel('Status')
-    plt.ylabel('Count')
-    plt.title('MPI-IO Aggregators per Compute Node')
-    plt.savefig('graph12.png')
     # Nodes and MPI-IO aggregators
     # If the application uses collective reads or collective writes, look for the number of aggregators
     hints = ''
@@ -1827,308 +3485,228 @@ def main():
 
     #########################################################################################################################################################################
 
-    NUMBER_OF_COMPUTE_NODES = 0
+    NUMBER_OF_COMPUTE_NODES = len(set(hosts.values()))
 
-    if 'MPI-IO' in modules:
+    if 'MPI-IO' in modules and needed(INSIGHTS_MPI_IO_AGGREGATORS_INTRA, INSIGHTS_MPI_IO_AGGREGATORS_INTER, INSIGHTS_MPI_IO_AGGREGATORS_OK):
         cb_nodes = None
 
         for hint in hints:
-            (key, value) = hint.split('=')
+            (key, _, value) = hint.partition('=')
             
             if key == 'cb_nodes':
-                cb_nodes = value
+                cb_nodes = int(value)
 
-        # Try to get the number of compute nodes from SLURM, if not found, set as information
-        command = 'sacct --job {} --format=JobID,JobIDRaw,NNodes,NCPUs --parsable2 --delimiter ","'.format(
-            job['job']['jobid']
-        )
+        if not NUMBER_OF_COMPUTE_NODES:
+            # Try to get the number of compute nodes from SLURM, if not found, set as information
+            found = jobs.provider(args.job_info, args.sacct_timeout).lookup([job['job']['jobid']])
 
-        arguments = shlex.split(command)
+            if found is None:
+                summary['failed_lookups'].append('sacct')
 
-        try:
-            result = subprocess.run(arguments, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-            if result.returncode == 0:
-                # We have successfully fetched the information from SLURM
-                db = csv.DictReader(io.StringIO(result.stdout.decode('utf-8')))
-
-                try:
-                    first = next(db)
-
-                    if 'NNodes' in first:
-                        NUMBER_OF_COMPUTE_NODES = first['NNodes']
-
-                        # Do we have one MPI-IO aggregator per node?
-                        if cb_nodes > NUMBER_OF_COMPUTE_NODES:
-                            issue = 'Application is using inter-node aggregators (which require network communication)'
-
-                            recommendation = [
-                                {
-                                    'message': 'Set the MPI hints for the number of aggregators as one per compute node (e.g., cb_nodes={})'.format(
-                                        NUMBER_OF_COMPUTE_NODES
-                                    ),
-                                    'sample': Syntax.from_path(os.path.join(ROOT, 'snippets/mpi-io-hints.bash'), line_numbers=True, background_color='default'),
-                                    'graph' : 'graph12.png'
-                                }
-                            ]
-
-                            insights_operation.append(
-                                message(INSIGHTS_MPI_IO_AGGREGATORS_INTER, TARGET_USER, HIGH, issue, recommendation)
-                            )
+            job_info = found.get(str(job['job']['jobid'])) if found else None
 
-                        if cb_nodes < NUMBER_OF_COMPUTE_NODES:
-                            issue = 'Application is using intra-node aggregators'
+            if job_info:
+                NUMBER_OF_COMPUTE_NODES = job_info['nodes']
 
-                            insights_operation.append(
-                                message(INSIGHTS_MPI_IO_AGGREGATORS_INTRA, TARGET_USER, OK, issue)
-                            )
+        if cb_nodes and NUMBER_OF_COMPUTE_NODES:
+            if charts():
+                # Number of aggregators and of compute nodes
+                plt.figure(figsize=(8, 6))
+                plt.bar(['Number of Aggregators', 'Number of Compute Nodes'], [cb_nodes, NUMBER_OF_COMPUTE_NODES], color=['lightcoral', 'lightskyblue'])
 
-                        if cb_nodes == NUMBER_OF_COMPUTE_NODES:
-                            issue = 'Application is using one aggregator per compute node'
+                plt.xlabel('Status')
+                plt.ylabel('Count')
+                plt.title('MPI-IO Aggregators per Compute Node')
+                plt.savefig('graph12.png')
 
-                            insights_operation.append(
-                                message(INSIGHTS_MPI_IO_AGGREGATORS_OK, TARGET_USER, OK, issue)
-                            )
+            # Do we have one MPI-IO aggregator per node?
+            if cb_nodes > NUMBER_OF_COMPUTE_NODES:
+                issue = 'Application is using inter-node aggregators (which require network communication)'
 
+                recommendation = [
+                    {
+                        'message': 'Set the MPI hints for the number of aggregators as one per compute node (e.g., cb_nodes={})'.format(
+                            NUMBER_OF_COMPUTE_NODES
+                        ),
+                        'sample': 'mpi-io-hints.bash',
+                        'graph' : 'graph12.png'
+                    }
+                ]
 
-                except StopIteration:
-                    pass
-        except FileNotFoundError:
-            pass
-    
-    #########################################################################################################################################################################
-    
-    codes = []
-    if args.json:
-        f = open(args.json)
-        data = json.load(f)
+                insights_operation.append(
+                    message(INSIGHTS_MPI_IO_AGGREGATORS_INTER, TARGET_USER, HIGH, issue, recommendation, metrics={
+                        'aggregators': cb_nodes,
+                        'compute_nodes': NUMBER_OF_COMPUTE_NODES
+                    })
+                )
 
-        for key, values in data.items():
-            for value in values:
-                code = value['code']
-                codes.append(code)
+            if cb_nodes < NUMBER_OF_COMPUTE_NODES:
+                issue = 'Application is using intra-node aggregators'
 
-                level = value['level']
-                issue = value['issue']
-                recommendation = []
-                for rec in value['recommendations']:
-                    new_message = {'message': rec}
-                    recommendation.append(new_message)
+                insights_operation.append(
+                    message(INSIGHTS_MPI_IO_AGGREGATORS_INTRA, TARGET_USER, OK, issue, None, metrics={
+                        'aggregators': cb_nodes,
+                        'compute_nodes': NUMBER_OF_COMPUTE_NODES
+                    })
+                )
 
-                insights_dxt.append(
-                    message(code, TARGET_DEVELOPER, level, issue, recommendation)
+            if cb_nodes == NUMBER_OF_COMPUTE_NODES:
+                issue = 'Application is using one aggregator per compute node'
+
+                insights_operation.append(
+                    message(INSIGHTS_MPI_IO_AGGREGATORS_OK, TARGET_USER, OK, issue, None, metrics={
+                        'aggregators': cb_nodes,
+                        'compute_nodes': NUMBER_OF_COMPUTE_NODES
+                    })
                 )
+    
+    summary['compute_nodes'] = NUMBER_OF_COMPUTE_NODES
 
-    #########################################################################################################################################################################
+    budget.checkpoint('aggregators')
 
-    insights_end_time = time.time()
+    #########################################################################################################################################################################
 
-    # Version 3.4.1 of py-darshan changed the contents on what is reported in 'job'
-    if 'start_time' in job['job']:
-        job_start = datetime.datetime.fromtimestamp(job['job']['start_time'], datetime.timezone.utc)
-        job_end = datetime.datetime.fromtimestamp(job['job']['end_time'], datetime.timezone.utc)
-    else:
-        job_start = datetime.datetime.fromtimestamp(job['job']['start_time_sec'], datetime.timezone.utc)
-        job_end = datetime.datetime.fromtimestamp(job['job']['end_time_sec'], datetime.timezone.utc)
+    for module, dxt_files in dxt_features.items():
+        if dxt_files.empty:
+            continue
 
-    console.print()
+        dxt_files = dxt_files.loc[file_map.contains(dxt_files.index)]
 
-    console.print(
-        Panel(
-            '\n'.join([
-                ' [b]JOB[/b]:            [white]{}[/white]'.format(
-                    job['job']['jobid']
-                ),
-                ' [b]EXECUTABLE[/b]:     [white]{}[/white]'.format(
-                    job['exe'].split()[0]
-                ),
-                ' [b]DARSHAN[/b]:        [white]{}[/white]'.format(
-                    os.path.basename(args.darshan)
-                ),
-                ' [b]EXECUTION TIME[/b]: [white]{} to {} ({:.2f} hours)[/white]'.format(
-                    job_start,
-                    job_end,
-                    (job_end - job_start).total_seconds() / 3600
-                ),
-                ' [b]FILES[/b]:          [white]{} files ({} use STDIO, {} use POSIX, {} use MPI-IO)[/white]'.format(
-                    total_files,
-                    total_files_stdio,
-                    total_files_posix - total_files_mpiio,  # Since MPI-IO files will always use POSIX, we can decrement to get a unique count
-                    total_files_mpiio
-                ),
-                ' [b]COMPUTE NODES[/b]   [white]{}[/white]'.format(
-                    NUMBER_OF_COMPUTE_NODES
-                ),
-                ' [b]PROCESSES[/b]       [white]{}[/white]'.format(
-                    job['job']['nprocs']
-                ),
-                ' [b]HINTS[/b]:          [white]{}[/white]'.format(
-                    ' '.join(hints)
-                )
-            ]),
-            title='[b][slate_blue3]DRISHTI[/slate_blue3] v.0.3[/b]',
-            title_align='left',
-            subtitle='[red][b]{} critical issues[/b][/red], [orange1][b]{} warnings[/b][/orange1], and [white][b]{} recommendations[/b][/white]'.format(
-                insights_total[HIGH],
-                insights_total[WARN],
-                insights_total[RECOMMENDATIONS],
-            ),
-            subtitle_align='left',
-            padding=1
+        # Access pattern of each file, as observed in the traces
+        dxt_files['classified'] = sum(
+            dxt_files['{}_{}'.format(operation, pattern)] for operation in dxt.OPERATIONS for pattern in dxt.PATTERNS
         )
-    )
+        dxt_files['random'] = dxt_files['read_random'] + dxt_files['write_random']
+        dxt_files['strided'] = dxt_files['read_strided'] + dxt_files['write_strided']
 
-    console.print()
+        # Most common request size of each file, from its request size distribution
+        dxt_sizes = dxt.request_sizes(dxt_files)
+        dxt_files['size'] = dxt_sizes.idxmax(axis=1)
 
-    if insights_metadata:
-        console.print(
-            Panel(
-                Padding(
-                    Group(
-                        *insights_metadata
-                    ),
-                    (1, 1)
-                ),
-                title='METADATA',
-                title_align='left'
+        dxt_random = dxt_files.loc[
+            (dxt_files['classified'] > 0) &
+            (dxt_files['random'] > dxt_files['classified'] * thresholds.RANDOM_OPERATIONS) &
+            (dxt_files['random'] > thresholds.RANDOM_OPERATIONS_ABSOLUTE)
+        ]
+
+        if not dxt_random.empty:
+            issue = '{} traces show a high number ({}) of random requests in {} files'.format(
+                module, int(dxt_random['random'].sum()), len(dxt_random)
             )
-        )
 
-    if insights_operation:
-        console.print(
-            Panel(
-                Padding(
-                    Group(
-                        *insights_operation
-                    ),
-                    (1, 1)
-                ),
-                title='OPERATIONS',
-                title_align='left'
+            detail = []
+
+            for id, row in dxt_random.iterrows():
+                detail.append(
+                    {
+                        'id': int(id),
+                        'path': file_map[int(id)],
+                        'message': '{} ({:.2f}%) random requests, mostly of {}, to "{}"',
+                        'values': (
+                            int(row['random']),
+                            row['random'] / row['classified'] * 100.0,
+                            row['size']
+                        )
+                    }
+                )
+
+            recommendation = [
+                {
+                    'message': 'Consider changing your data model to have consecutive or sequential requests'
+                }
+            ]
+
+            insights_dxt.append(
+                message(INSIGHTS_DXT_HIGH_RANDOM_USAGE, TARGET_DEVELOPER, HIGH, issue, recommendation, detail, metrics={
+                    'module': module,
+                    'files': len(dxt_random),
+                    'random_requests': dxt_random['random'].sum(),
+                    'requests': dxt_random['classified'].sum(),
+                    'request_sizes': dxt_sizes.loc[dxt_random.index].sum().to_dict()
+                })
             )
-        )
 
-    if insights_dxt:
-        console.print(
-            Panel(
-                Padding(
-                    Group(
-                        *insights_dxt
-                    ),
-                    (1, 1)
-                ),
-                title='DXT',
-                title_align='left'
+        dxt_strided = dxt_files.loc[
+            (dxt_files['classified'] > 0) &
+            (dxt_files['strided'] > dxt_files['classified'] * thresholds.STRIDED_OPERATIONS) &
+            (dxt_files['strided'] > thresholds.STRIDED_OPERATIONS_ABSOLUTE)
+        ]
+
+        if not dxt_strided.empty:
+            issue = '{} traces show a high number ({}) of strided requests in {} files'.format(
+                module, int(dxt_strided['strided'].sum()), len(dxt_strided)
             )
-        )
-        
-    console.print(
-        Panel(
-            ' {} | [white]LBNL[/white] | [white]Drishti report generated at {} in[/white] {:.3f} seconds'.format(
-                datetime.datetime.now().year,
-                datetime.datetime.now(),
-                insights_end_time - insights_start_time
-            ),
-            box=box.SIMPLE
-        )
-    )
 
-    if args.export_theme_light:
-        export_theme = TerminalTheme(
-            (255, 255, 255),
-            (0, 0, 0),
-            [
-                (26, 26, 26),
-                (244, 0, 95),
-                (152, 224, 36),
-                (253, 151, 31),
-                (157, 101, 255),
-                (244, 0, 95),
-                (88, 209, 235),
-                (120, 120, 120),
-                (98, 94, 76),
-            ],
-            [
-                (244, 0, 95),
-                (152, 224, 36),
-                (224, 213, 97),
-                (157, 101, 255),
-                (244, 0, 95),
-                (88, 209, 235),
-                (246, 246, 239),
-            ],
-        )
-    else:
-        export_theme = MONOKAI
+            detail = []
 
-    if args.export_html:
-        console.save_html(
-            '{}.html'.format(args.darshan),
-            theme=export_theme,
-            clear=False
-        )
+            for id, row in dxt_strided.iterrows():
+                detail.append(
+                    {
+                        'id': int(id),
+                        'path': file_map[int(id)],
+                        'message': '{} ({:.2f}%) strided requests, mostly of {}, to "{}"',
+                        'values': (
+                            int(row['strided']),
+                            row['strided'] / row['classified'] * 100.0,
+                            row['size']
+                        )
+                    }
+                )
 
-    if args.export_svg:
-        console.save_svg(
-            '{}.svg'.format(args.darshan),
-            title='Drishti',
-            theme=export_theme,
-            clear=False
-        )
+            recommendation = [
+                {
+                    'message': 'Consider describing the strided layout with an MPI-IO file view and using collective operations, so the requests are aggregated into large contiguous ones',
+                    'sample': 'mpi-io-collective-write.c'
+                }
+            ]
 
-    if args.export_csv:
-        issues = [
-            'JOB',
-            INSIGHTS_STDIO_HIGH_USAGE,
-            INSIGHTS_POSIX_WRITE_COUNT_INTENSIVE,
-            INSIGHTS_POSIX_READ_COUNT_INTENSIVE,
-            INSIGHTS_POSIX_WRITE_SIZE_INTENSIVE,
-            INSIGHTS_POSIX_READ_SIZE_INTENSIVE,
-            INSIGHTS_POSIX_HIGH_SMALL_READ_REQUESTS_USAGE,
-            INSIGHTS_POSIX_HIGH_SMALL_WRITE_REQUESTS_USAGE,
-            INSIGHTS_POSIX_HIGH_MISALIGNED_MEMORY_USAGE,
-            INSIGHTS_POSIX_HIGH_MISALIGNED_FILE_USAGE,
-            INSIGHTS_POSIX_REDUNDANT_READ_USAGE,
-            INSIGHTS_POSIX_REDUNDANT_WRITE_USAGE,
-            INSIGHTS_POSIX_HIGH_RANDOM_READ_USAGE,
-            INSIGHTS_POSIX_HIGH_SEQUENTIAL_READ_USAGE,
-            INSIGHTS_POSIX_HIGH_RANDOM_WRITE_USAGE,
-            INSIGHTS_POSIX_HIGH_SEQUENTIAL_WRITE_USAGE,
-            INSIGHTS_POSIX_HIGH_SMALL_READ_REQUESTS_SHARED_FILE_USAGE,
-            INSIGHTS_POSIX_HIGH_SMALL_WRITE_REQUESTS_SHARED_FILE_USAGE,
-            INSIGHTS_POSIX_HIGH_METADATA_TIME,
-            INSIGHTS_POSIX_SIZE_IMBALANCE,
-            INSIGHTS_POSIX_TIME_IMBALANCE,
-            INSIGHTS_POSIX_INDIVIDUAL_WRITE_SIZE_IMBALANCE,
-            INSIGHTS_POSIX_INDIVIDUAL_READ_SIZE_IMBALANCE,
-            INSIGHTS_MPI_IO_NO_USAGE,
-            INSIGHTS_MPI_IO_NO_COLLECTIVE_READ_USAGE,
-            INSIGHTS_MPI_IO_NO_COLLECTIVE_WRITE_USAGE,
-            INSIGHTS_MPI_IO_COLLECTIVE_READ_USAGE,
-            INSIGHTS_MPI_IO_COLLECTIVE_WRITE_USAGE,
-            INSIGHTS_MPI_IO_BLOCKING_READ_USAGE,
-            INSIGHTS_MPI_IO_BLOCKING_WRITE_USAGE,
-            INSIGHTS_MPI_IO_AGGREGATORS_INTRA,
-            INSIGHTS_MPI_IO_AGGREGATORS_INTER,
-            INSIGHTS_MPI_IO_AGGREGATORS_OK
-        ]
-        if codes:
-            issues.extend(codes)
+            insights_dxt.append(
+                message(INSIGHTS_DXT_STRIDED_USAGE, TARGET_DEVELOPER, WARN, issue, recommendation, detail, metrics={
+                    'module': module,
+                    'files': len(dxt_strided),
+                    'strided_requests': dxt_strided['strided'].sum(),
+                    'requests': dxt_strided['classified'].sum(),
+                    'request_sizes': dxt_sizes.loc[dxt_strided.index].sum().to_dict()
+                })
+            )
 
-        detected_issues = dict.fromkeys(issues, False)
-        detected_issues['JOB'] = job['job']['jobid']
+        # Shared files where ranks never overlap their accesses
+        dxt_serialized = dxt_files.loc[(dxt_files['ranks'] > 1) & (dxt_files['concurrency'] == 1)]
 
-        for report in csv_report:
-            detected_issues[report] = True
+        if not dxt_serialized.empty:
+            issue = '{} traces show {} shared files accessed by one rank at a time'.format(
+                module, len(dxt_serialized)
+            )
 
-        filename = '{}-summary.csv'.format(
-            args.darshan.replace('.darshan', '')
-        )
+            detail = []
 
-        with open(filename, 'w') as f:
-            w = csv.writer(f)
-            w.writerow(detected_issues.keys())
-            w.writerow(detected_issues.values())
+            for id, row in dxt_serialized.iterrows():
+                detail.append(
+                    {
+                        'id': int(id),
+                        'path': file_map[int(id)],
+                        'message': '{} ranks took turns accessing "{}"',
+                        'values': (
+                            int(row['ranks']),
+                        )
+                    }
+                )
+
+            recommendation = [
+                {
+                    'message': 'Consider accessing the shared file concurrently from all ranks, for instance with MPI-IO collective operations',
+                    'sample': 'mpi-io-collective-write.c'
+                }
+            ]
+
+            insights_dxt.append(
+                message(INSIGHTS_DXT_SERIALIZED_SHARED_FILE_USAGE, TARGET_DEVELOPER, WARN, issue, recommendation, detail, metrics={
+                    'module': module,
+                    'files': len(dxt_serialized)
+                })
+            )
+
+    budget.checkpoint('dxt')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+
+
+def per_node(counters, fcounters, hosts):
+    """
+    Aggregate the bytes and I/O time of the ranks running on each node.
+
+    Records of ranks without a known hostname and shared records (rank -1) cannot be attributed to a node
+    and are left out. Returns a DataFrame indexed by hostname with the number of ranks, bytes, and time.
+    """
+    ranks = pd.Series(hosts, dtype=object)
+
+    records = pd.DataFrame({
+        'rank': counters['rank'].to_numpy(dtype=np.int64),
+        'bytes': (counters['POSIX_BYTES_READ'] + counters['POSIX_BYTES_WRITTEN']).to_numpy(dtype=np.float64),
+        'time': (fcounters['POSIX_F_READ_TIME'] + fcounters['POSIX_F_WRITE_TIME'] + fcounters['POSIX_F_META_TIME']).to_numpy(dtype=np.float64)
+    })
+
+    records['node'] = records['rank'].map(ranks)
+
+    nodes = records.dropna(subset=['node']).groupby('node').agg(
+        bytes=('bytes', 'sum'),
+        time=('time', 'sum')
+    )
+
+    # Ranks that did no I/O still count towards their node
+    nodes = nodes.reindex(ranks.unique(), fill_value=0.0)
+    nodes['ranks'] = ranks.value_counts()
+
+    return nodes
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+import multiprocessing
+
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+
+AGGREGATIONS = ('sum', 'min', 'max', 'nunique')
+
+
+def aggregate_by_id(df, aggregations, workers=1):
+    """
+    Group the per-rank records of a module by file id and reduce the requested columns.
+
+    The aggregations are given as a dictionary that maps a column to the list of functions
+    to apply ('sum', 'min', 'max', or 'nunique'). The result has one row per file id and
+    flattened column names ('<column>_<function>'), plus an 'id_' column with the file id.
+
+    With more than one worker, the counter arrays are copied once into shared memory buffers,
+    sharded by rank, and each worker reduces its own shard through views of those buffers
+    instead of receiving a pickled copy. Workers only compute the requested reductions, with
+    np.bincount for sums and ufunc.reduceat over the records sorted by file for the others.
+    Because the ranks of each shard are disjoint, the partial aggregates are merged by summing
+    the partial sums and unique counts and by taking the minimum of minimums and maximum of
+    maximums. The reductions keep the dtypes of the columns, as the single-process path does.
+    """
+    columns = list(aggregations.keys())
+
+    for column in columns:
+        for function in aggregations[column]:
+            assert(function in AGGREGATIONS)
+
+            # Unique counts can only be merged across shards for the column used to shard the records
+            assert(function != 'nunique' or column == 'rank')
+
+    functions = set(function for column in columns for function in aggregations[column])
+
+    # Sums alone are bound by memory bandwidth, so sharding them only adds the copy into shared memory
+    if workers <= 1 or len(df) < workers or functions == {'sum'}:
+        return _aggregate_pandas(df, aggregations)
+
+    keys = df['id'].to_numpy(dtype=np.uint64)
+    ranks = df['rank'].to_numpy(dtype=np.int64)
+
+    # Columns reduced by sum, min, or max, the distinct ranks are counted from the ranks themselves
+    reduced = [column for column in columns if set(aggregations[column]) - {'nunique'}]
+
+    # Integer counters are reduced as integers, so large sums stay exact, unless they are reduced together
+    # with floating-point counters, in which case they are only cast back to their dtype
+    dtypes = df[columns].dtypes
+    dtype = np.result_type(*dtypes[reduced]) if reduced else np.dtype(np.int64)
+
+    if dtype.kind not in 'iu':
+        dtype = np.dtype(np.float64)
+
+    values = df[reduced].to_numpy(dtype=dtype)
+
+    # Shard by rank range, so the records of a given rank always end up in the same shard
+    shards = _shard_by_rank(ranks, workers)
+    order = np.argsort(shards, kind='stable')
+    bounds = np.searchsorted(shards[order], np.arange(workers + 1))
+
+    # Only the requested reductions are computed, as (function, column index) pairs
+    reductions = [
+        (function, index)
+        for index, column in enumerate(reduced) for function in aggregations[column] if function != 'nunique'
+    ]
+
+    buffers = []
+
+    try:
+        shm_keys = _share(keys, order, buffers)
+        shm_ranks = _share(ranks, order, buffers) if 'nunique' in functions else None
+        shm_values = _share(values, order, buffers)
+
+        tasks = [
+            (shm_keys, shm_ranks, shm_values, len(keys), len(reduced), bounds[i], bounds[i + 1], reductions)
+            for i in range(workers) if bounds[i + 1] > bounds[i]
+        ]
+
+        with multiprocessing.Pool(processes=len(tasks)) as pool:
+            partials = pool.map(_aggregate_shard, tasks)
+    finally:
+        for buffer in buffers:
+            buffer.close()
+            buffer.unlink()
+
+    return _merge(partials, columns, reduced, aggregations, dtypes)
+
+
+def _aggregate_pandas(df, aggregations):
+    """
+    Single-process reduction with pandas.
+    """
+    aggregated = df[['id'] + list(aggregations.keys())].groupby('id', as_index=False).agg(
+        aggregations
+    )
+
+    aggregated.columns = list(map('_'.join, aggregated.columns.values))
+
+    return aggregated
+
+
+def _shard_by_rank(ranks, workers):
+    """
+    Assign each record to a shard based on its rank (shared records with rank -1 go to the first shard).
+    """
+    highest = max(int(ranks.max()), 0) + 1
+
+    # Few shards fit in 16 bits, which numpy sorts stably with a radix sort
+    return (np.clip(ranks, 0, None) * workers // highest).astype(np.int16)
+
+
+def _share(array, order, buffers):
+    """
+    Copy the rows of an array, in the given order, into a new shared memory block and return the information
+    needed to attach to it.
+    """
+    buffer = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    buffers.append(buffer)
+
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=buffer.buf)
+    np.take(array, order, axis=0, out=view)
+
+    return (buffer.name, array.dtype.str)
+
+
+def _attach(shared, shape, buffers):
+    """
+    Attach to a shared memory block, kept in buffers to close it, and return a view of its contents.
+    """
+    name, dtype = shared
+
+    buffer = shared_memory.SharedMemory(name=name)
+    buffers.append(buffer)
+
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=buffer.buf)
+
+
+def _aggregate_shard(task):
+    """
+    Compute the partial per-file aggregates of one shard, only for the requested reductions.
+    """
+    shm_keys, shm_ranks, shm_values, rows, width, start, end, reductions = task
+
+    buffers = []
+
+    try:
+        keys = _attach(shm_keys, (rows,), buffers)
+        values = _attach(shm_values, (rows, width), buffers)
+
+        codes, ids = pd.factorize(keys[start:end])
+
+        # The records sorted by file, shared by the reductions that need them
+        sorting = {}
+
+        partial = {
+            (function, index): _reduce(function, codes, values[start:end, index], len(ids), sorting)
+            for function, index in reductions
+        }
+
+        # The ranks are only shared when their distinct counts were requested
+        if shm_ranks is not None:
+            ranks = _attach(shm_ranks, (rows,), buffers)
+
+            partial['nunique'] = _distinct(codes, ranks[start:end], len(ids))
+
+            del ranks
+
+        partial['id'] = np.asarray(ids, dtype=np.uint64)
+
+        del keys, values
+    finally:
+        for buffer in buffers:
+            buffer.close()
+
+    return partial
+
+
+def _reduce(function, codes, values, groups, sorting):
+    """
+    Sum, minimum, or maximum of the values of each group, given the group code of each value.
+
+    Sums are computed with np.bincount when its float64 accumulator is exact for the values, and every other
+    reduction with ufunc.reduceat over the values sorted by group. The sort is done once and kept in sorting
+    for the other reductions of the same groups.
+    """
+    exact = values.dtype.kind == 'f' or not len(values) or float(np.abs(values).max()) * len(values) < 2 ** 53
+
+    if function == 'sum' and exact:
+        return np.bincount(codes, weights=values, minlength=groups).astype(values.dtype)
+
+    if not sorting:
+        sorting['order'] = np.argsort(codes)
+        sorting['starts'] = np.flatnonzero(np.diff(codes[sorting['order']], prepend=-1))
+
+    ufunc = {'sum': np.add, 'min': np.minimum, 'max': np.maximum}[function]
+
+    return ufunc.reduceat(values[sorting['order']], sorting['starts'])
+
+
+def _distinct(codes, ranks, groups):
+    """
+    Number of distinct ranks of each group, from one sort of a combined (group, rank) key.
+    """
+    if not len(ranks):
+        return np.zeros(groups, dtype=np.int64)
+
+    lowest = int(ranks.min())
+    span = int(ranks.max()) - lowest + 1
+
+    pairs = np.sort(codes.astype(np.int64) * span + (ranks - lowest))
+
+    first = np.diff(pairs, prepend=-1) != 0
+
+    return np.bincount(pairs[first] // span, minlength=groups)
+
+
+def _merge(partials, columns, reduced, aggregations, dtypes):
+    """
+    Merge the partial aggregates of all shards into one row per file, with the dtypes of the columns.
+
+    The ranks of the shards are disjoint, so the partial sums and distinct counts add up, and the minimum of
+    the minimums (and maximum of the maximums) is the one of all the records.
+    """
+    codes, ids = pd.factorize(np.concatenate([partial['id'] for partial in partials]))
+
+    sorting = {}
+
+    result = {
+        'id_': np.asarray(ids, dtype=np.uint64)
+    }
+
+    for column in columns:
+        for function in aggregations[column]:
+            if function == 'nunique':
+                values = np.concatenate([partial['nunique'] for partial in partials])
+
+                merged = np.bincount(codes, weights=values, minlength=len(ids)).astype(np.int64)
+            else:
+                values = np.concatenate([partial[(function, reduced.index(column))] for partial in partials])
+
+                merged = _reduce(function, codes, values, len(ids), sorting).astype(dtypes[column])
+
+            result['{}_{}'.format(column, function)] = merged
+
+    return pd.DataFrame(result)
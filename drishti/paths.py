@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+
+class PathTrie:
+    """
+    Prefix-compressed trie with the paths of the files recorded in a Darshan log.
+
+    Nodes are kept in flat arrays in depth-first order, so a parent always comes before its
+    children. Chains of directories with a single child are merged into one node, and shared
+    prefixes are stored only once. File ids are mapped to their nodes through sorted arrays.
+    """
+
+    def __init__(self, name_records):
+        # Uncompressed trie used only while building: each node is [children, file id]
+        root = [{}, None]
+
+        for id, path in name_records.items():
+            node = root
+
+            for component in path.split('/'):
+                node = node[0].setdefault(component, [{}, None])
+
+            node[1] = id
+
+        self._parent = []
+        self._label = []
+        self._depth = []
+        self._children = []
+
+        ids = []
+        nodes = []
+
+        stack = [(child, component, -1) for component, child in reversed(list(root[0].items()))]
+
+        while stack:
+            node, label, parent = stack.pop()
+
+            # Merge chains of directories that only have one entry
+            while node[1] is None and len(node[0]) == 1:
+                component, child = next(iter(node[0].items()))
+
+                label = label + '/' + component
+                node = child
+
+            index = len(self._parent)
+
+            self._parent.append(parent)
+            self._label.append(label)
+            self._depth.append(self._depth[parent] + 1 if parent >= 0 else 0)
+            self._children.append(len(node[0]))
+
+            if node[1] is not None:
+                ids.append(node[1])
+                nodes.append(index)
+
+            for component, child in reversed(list(node[0].items())):
+                stack.append((child, component, index))
+
+        self._parent = np.array(self._parent, dtype=np.int64)
+        self._depth = np.array(self._depth, dtype=np.int64)
+        self._children = np.array(self._children, dtype=np.int64)
+
+        order = np.argsort(np.array(ids, dtype=np.uint64))
+
+        self._ids = np.array(ids, dtype=np.uint64)[order]
+        self._nodes = np.array(nodes, dtype=np.int64)[order]
+
+        # Nodes grouped by depth, deepest first, to aggregate values one level at a time
+        self._levels = [
+            np.flatnonzero(self._depth == depth) for depth in range(int(self._depth.max(initial=0)), 0, -1)
+        ]
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, id):
+        position = np.searchsorted(self._ids, np.uint64(id))
+
+        return position < len(self._ids) and self._ids[position] == np.uint64(id)
+
+    def contains(self, ids):
+        """
+        Whether each of the file ids has a path, as a boolean array.
+        """
+        return np.isin(np.asarray(ids, dtype=np.uint64), self._ids)
+
+    def __getitem__(self, id):
+        if id not in self:
+            raise KeyError(id)
+
+        return self.path(self._node(id))
+
+    def items(self):
+        """
+        Iterate over the (id, path) pairs of all files.
+        """
+        for id, node in zip(self._ids, self._nodes):
+            yield int(id), self.path(node)
+
+    def path(self, node):
+        """
+        Full path of a node.
+        """
+        labels = []
+
+        while node >= 0:
+            labels.append(self._label[node])
+            node = self._parent[node]
+
+        return '/'.join(reversed(labels))
+
+    def _node(self, id):
+        """
+        Node of a file id.
+        """
+        return self._nodes[np.searchsorted(self._ids, np.uint64(id))]
+
+    def rollup(self, ids, values):
+        """
+        Aggregate per-file values up to every directory prefix, returning the total of each node.
+        """
+        nodes = self._nodes[np.searchsorted(self._ids, np.asarray(ids, dtype=np.uint64))]
+
+        totals = np.bincount(nodes, weights=np.asarray(values, dtype=np.float64), minlength=len(self._parent))
+
+        for level in self._levels:
+            np.add.at(totals, self._parent[level], totals[level])
+
+        return totals
+
+    def dominant(self, ids, values, threshold):
+        """
+        Find the deepest directory that accounts for at least a share (threshold) of the values of more than one file.
+
+        Returns a tuple with the directory path and its share, or None.
+        """
+        values = np.asarray(values, dtype=np.float64)
+
+        total = values.sum()
+
+        if not total:
+            return None
+
+        totals = self.rollup(ids, values)
+        files = self.rollup(ids, values > 0)
+
+        candidates = np.flatnonzero((self._children > 0) & (files > 1) & (totals >= total * threshold))
+
+        if not len(candidates):
+            return None
+
+        # The deepest directory is the most specific one
+        directory = candidates[np.argmax(self._depth[candidates])]
+
+        return self.path(directory), float(totals[directory] / total)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+
+import heapq
+
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+# Binary logs are sampled while their records are decoded, which needs the Darshan library
+try:
+    import darshan.backend.cffi_backend as darshanll
+except (ImportError, RuntimeError):
+    darshanll = None
+
+
+SMALL_BINS = ('0_100', '100_1K', '1K_10K', '10K_100K', '100K_1M')
+
+# Records sampled from every stratum, the fewest that give a sample variance
+MINIMUM = 2
+
+
+def sample(df, size, by='rank', seed=0):
+    """
+    Pick a random sample of the records of a module, uniform or stratified by rank.
+
+    Stratified samples give each rank a share of the sample proportional to its number of records, with at
+    least two records per rank (or all of them), so the variance of every stratum can be estimated. Returns the sampled counters and fcounters, the stratum of each sampled record,
+    and the number of records and the sample size of each stratum.
+    """
+    rng = np.random.default_rng(seed)
+
+    records = len(df['counters'])
+
+    if by == 'rank':
+        _, strata = np.unique(df['counters']['rank'].to_numpy(), return_inverse=True)
+    else:
+        strata = np.zeros(records, dtype=np.int64)
+
+    population = np.bincount(strata)
+
+    sizes = np.minimum(np.maximum(np.round(size * population / records), MINIMUM), population).astype(np.int64)
+
+    # Shuffle within each stratum and keep the first records of each
+    order = np.lexsort((rng.random(records), strata))
+
+    starts = np.concatenate([[0], np.cumsum(population)[:-1]])
+    positions = np.arange(records) - starts[strata[order]]
+
+    selected = np.sort(order[positions < sizes[strata[order]]])
+
+    return {
+        'counters': df['counters'].iloc[selected],
+        'fcounters': df['fcounters'].iloc[selected]
+    }, strata[selected], population, sizes
+
+
+def reservoir(records, size, by='rank', seed=0):
+    """
+    Pick a random sample of the records of a module while they are decoded, uniform or stratified by rank.
+
+    Each record gets a random key, and the sample keeps the records with the smallest keys: size of them, plus,
+    when stratified, the two with the smallest keys of each rank. Memory is then bounded by the sample and the
+    number of ranks instead of the number of records. The sampled records of each stratum are a uniform random
+    subset of it, so they are weighted by the number of records of their stratum, which is counted on the way.
+
+    The records are dictionaries with the id, the rank, and the counters and fcounters arrays, as the Darshan
+    library decodes them. Returns the sampled records in their order in the log, the stratum of each, the number
+    of records and the sample size of each stratum, and the ids of all the records.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Largest keys first, as negative keys, so the record to replace is always at the top
+    heap = []
+    smallest = {}
+    population = {}
+    ids = set()
+
+    for index, record in enumerate(records):
+        key = rng.random()
+        stratum = record['rank'] if by == 'rank' else 0
+
+        population[stratum] = population.get(stratum, 0) + 1
+        ids.add(record['id'])
+
+        # Largest key first in the records kept for each rank, as in the sample
+        if by == 'rank':
+            kept = smallest.setdefault(stratum, [])
+
+            if len(kept) < MINIMUM:
+                heapq.heappush(kept, (-key, index, record))
+            elif -kept[0][0] > key:
+                heapq.heapreplace(kept, (-key, index, record))
+
+        if len(heap) < size:
+            heapq.heappush(heap, (-key, index, record))
+        elif heap and -heap[0][0] > key:
+            heapq.heapreplace(heap, (-key, index, record))
+
+    selected = {index: record for _, index, record in heap}
+    selected.update((index, record) for kept in smallest.values() for _, index, record in kept)
+
+    strata = sorted(population)
+    positions = {stratum: position for position, stratum in enumerate(strata)}
+
+    sampled = [selected[index] for index in sorted(selected)]
+    sampled_strata = np.array(
+        [positions[record['rank'] if by == 'rank' else 0] for record in sampled], dtype=np.int64
+    )
+
+    return (
+        sampled,
+        sampled_strata,
+        np.array([population[stratum] for stratum in strata], dtype=np.int64),
+        np.bincount(sampled_strata, minlength=len(strata)),
+        ids
+    )
+
+
+class Sample:
+    """
+    Records of a module sampled by rank or uniformly, with the same DataFrames as the records of a DarshanReport.
+
+    Besides the sampled counters, it keeps the stratum of each sampled record, the number of records and the sample
+    size of each stratum, which weight the estimates, and the ids of all the records, which count the files.
+    """
+
+    def __init__(self, counters, fcounters, strata, population, sizes, ids):
+        self.counters = counters
+        self.fcounters = fcounters
+        self.strata = strata
+        self.population = population
+        self.sizes = sizes
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.counters)
+
+    def to_df(self):
+        return {
+            'counters': self.counters.copy(),
+            'fcounters': self.fcounters.copy()
+        }
+
+    @classmethod
+    def from_df(cls, df, size, by='rank', seed=0):
+        """
+        Sample the records of a module that were already read into DataFrames.
+        """
+        sampled, strata, population, sizes = sample(df, size, by, seed)
+
+        return cls(sampled['counters'], sampled['fcounters'], strata, population, sizes, set(df['counters']['id']))
+
+    @classmethod
+    def from_log(cls, filename, module, size, by='rank', seed=0):
+        """
+        Sample the records of a module of a binary log while they are decoded, so only the sample becomes DataFrames.
+        """
+        log = darshanll.log_open(filename)
+
+        try:
+            records = iter(lambda: darshanll.log_get_record(log, module), None)
+
+            sampled, strata, population, sizes, ids = reservoir(records, size, by, seed)
+        finally:
+            darshanll.log_close(log)
+
+        frames = []
+
+        for kind, names in (('counters', darshanll.counter_names(module)), ('fcounters', darshanll.fcounter_names(module))):
+            frame = pd.DataFrame(
+                np.stack([record[kind] for record in sampled]) if sampled else np.zeros((0, len(names))),
+                columns=names
+            )
+
+            # Same id and rank columns as the records of a DarshanReport, with the ids always unsigned
+            frame.insert(0, 'id', pd.Series([record['id'] for record in sampled], dtype=np.uint64))
+            frame.insert(0, 'rank', pd.Series([record['rank'] for record in sampled], dtype=np.int64))
+
+            frames.append(frame)
+
+        return cls(frames[0], frames[1], strata, population, sizes, ids)
+
+
+def ratio(numerator, denominator, strata, population, sizes, confidence=0.95):
+    """
+    Estimate the ratio of two totals from a stratified sample, with its confidence interval.
+
+    Uses the combined ratio estimator and its linearized variance, with the finite population correction of
+    each stratum. Returns the estimate, the bounds of the interval, and the estimated total of the numerator.
+    """
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+
+    weights = (population / sizes)[strata]
+
+    total_numerator = float((weights * numerator).sum())
+    total_denominator = float((weights * denominator).sum())
+
+    if not total_denominator:
+        return 0.0, 0.0, 0.0, total_numerator
+
+    estimate = total_numerator / total_denominator
+
+    residuals = numerator - estimate * denominator
+
+    # Sample variance of the residuals in each stratum
+    counts = np.bincount(strata, minlength=len(population)).astype(np.float64)
+    sums = np.bincount(strata, weights=residuals, minlength=len(population))
+    squares = np.bincount(strata, weights=residuals ** 2, minlength=len(population))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variances = np.where(counts > 1, (squares - sums ** 2 / counts) / (counts - 1), 0.0)
+
+    variance = np.sum(population ** 2 * (1 - sizes / population) * np.maximum(variances, 0.0) / sizes) / total_denominator ** 2
+
+    margin = NormalDist().inv_cdf(0.5 + confidence / 2) * np.sqrt(variance)
+
+    return estimate, max(estimate - margin, 0.0), estimate + margin, total_numerator
+
+
+def certain(low, high, threshold):
+    """
+    Whether the decision of comparing the estimate with the threshold holds for the whole confidence interval.
+    """
+    return low > threshold or high <= threshold
+
+
+def estimates(posix, mpiio, confidence=0.95):
+    """
+    Estimate the ratios used by the insights from the samples of the POSIX and MPI-IO records (or None).
+
+    Returns a dictionary that maps each ratio to its estimate, interval bounds, estimated total of the
+    numerator, and the sample and population sizes.
+    """
+    result = {}
+
+    if posix:
+        counters, strata, population, sizes = posix.counters, posix.strata, posix.population, posix.sizes
+
+        reads = counters['POSIX_READS']
+        writes = counters['POSIX_WRITES']
+
+        ratios = {
+            'small_reads': (sum(counters['POSIX_SIZE_READ_{}'.format(bin)] for bin in SMALL_BINS), reads),
+            'small_writes': (sum(counters['POSIX_SIZE_WRITE_{}'.format(bin)] for bin in SMALL_BINS), writes),
+            'random_reads': (reads - counters['POSIX_SEQ_READS'], reads),
+            'random_writes': (writes - counters['POSIX_SEQ_WRITES'], writes),
+            'misaligned_memory': (counters['POSIX_MEM_NOT_ALIGNED'], reads + writes),
+            'misaligned_file': (counters['POSIX_FILE_NOT_ALIGNED'], reads + writes)
+        }
+
+        for name, (numerator, denominator) in ratios.items():
+            result[name] = ratio(numerator, denominator, strata, population, sizes, confidence) + (int(sizes.sum()), int(population.sum()))
+
+    if mpiio:
+        counters, strata, population, sizes = mpiio.counters, mpiio.strata, mpiio.population, mpiio.sizes
+
+        ratios = {
+            'independent_reads': (counters['MPIIO_INDEP_READS'], counters['MPIIO_INDEP_READS'] + counters['MPIIO_COLL_READS']),
+            'independent_writes': (counters['MPIIO_INDEP_WRITES'], counters['MPIIO_INDEP_WRITES'] + counters['MPIIO_COLL_WRITES'])
+        }
+
+        for name, (numerator, denominator) in ratios.items():
+            result[name] = ratio(numerator, denominator, strata, population, sizes, confidence) + (int(sizes.sum()), int(population.sum()))
+
+    return result
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+
+import sys
+import json
+import base64
+import argparse
+
+import numpy as np
+
+
+MASK = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+# Files kept as candidates for the hottest ones, with their paths, ranked by their estimated bytes
+HOTTEST = 100
+
+
+def mix(keys, seed=0):
+    """
+    Scramble 64-bit keys with the SplitMix64 finalizer, so ids and counters spread evenly over the registers.
+    """
+    with np.errstate(over='ignore'):
+        z = (np.asarray(keys, dtype=np.uint64) + np.uint64(0x9E3779B97F4A7C15) * np.uint64(seed + 1)) & MASK
+        z = ((z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)) & MASK
+        z = ((z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)) & MASK
+
+    return z ^ (z >> np.uint64(31))
+
+
+def _encode(array):
+    return base64.b64encode(np.ascontiguousarray(array).tobytes()).decode('ascii')
+
+
+def _decode(text, dtype):
+    return np.frombuffer(base64.b64decode(text), dtype=dtype).copy()
+
+
+class HyperLogLog:
+    """
+    Estimate of the number of distinct keys, with 2^precision one-byte registers.
+
+    Merging two sketches keeps the largest value of each register, so the result is the same as adding
+    all keys to a single sketch.
+    """
+
+    def __init__(self, precision=12, registers=None):
+        self.precision = precision
+        self.registers = registers if registers is not None else np.zeros(1 << precision, dtype=np.uint8)
+
+    def add(self, keys):
+        hashes = mix(keys)
+
+        if not len(hashes):
+            return
+
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+
+        # Position of the first set bit in the remaining bits
+        remaining = (hashes << np.uint64(self.precision)) & MASK
+
+        rank = np.full(len(hashes), 64 - self.precision + 1, dtype=np.uint8)
+        nonzero = remaining > 0
+        rank[nonzero] = 64 - np.minimum(np.floor(np.log2(remaining[nonzero].astype(np.float64))), 63).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        assert(self.precision == other.precision)
+
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self):
+        m = len(self.registers)
+
+        alpha = 0.7213 / (1 + 1.079 / m)
+
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+
+        zeros = np.count_nonzero(self.registers == 0)
+
+        # Linear counting is more accurate for small cardinalities
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+
+        return int(round(estimate))
+
+    def to_dict(self):
+        return {'precision': self.precision, 'registers': _encode(self.registers)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['precision'], _decode(data['registers'], np.uint8))
+
+
+class DDSketch:
+    """
+    Quantiles of positive values with a bounded relative error, in logarithmic buckets.
+
+    Buckets are kept sparse, so the memory depends on the range of the values and not on their number,
+    and merging two sketches adds their bucket counts.
+    """
+
+    def __init__(self, relative_accuracy=0.01, buckets=None, zeros=0.0):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.buckets = buckets if buckets is not None else {}
+        self.zeros = zeros
+
+    def add(self, values, weights=None):
+        values = np.asarray(values, dtype=np.float64)
+        weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype=np.float64)
+
+        positive = values > 0
+
+        self.zeros += float(weights[~positive].sum())
+
+        indexes = np.ceil(np.log(values[positive]) / np.log(self.gamma)).astype(np.int64)
+
+        unique, inverse = np.unique(indexes, return_inverse=True)
+        counts = np.bincount(inverse, weights=weights[positive], minlength=len(unique))
+
+        for index, count in zip(unique.tolist(), counts.tolist()):
+            self.buckets[index] = self.buckets.get(index, 0.0) + count
+
+    def merge(self, other):
+        assert(self.relative_accuracy == other.relative_accuracy)
+
+        self.zeros += other.zeros
+
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0.0) + count
+
+    def count(self):
+        return self.zeros + sum(self.buckets.values())
+
+    def quantile(self, q):
+        total = self.count()
+
+        if not total:
+            return None
+
+        target = q * (total - 1)
+
+        if target < self.zeros:
+            return 0.0
+
+        indexes = np.array(sorted(self.buckets), dtype=np.int64)
+        cumulative = self.zeros + np.cumsum([self.buckets[index] for index in indexes])
+
+        index = indexes[min(np.searchsorted(cumulative, target, side='right'), len(indexes) - 1)]
+
+        return float(2 * self.gamma ** index / (self.gamma + 1))
+
+    def to_dict(self):
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'zeros': self.zeros,
+            'buckets': {str(index): count for index, count in self.buckets.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data['relative_accuracy'],
+            {int(index): count for index, count in data['buckets'].items()},
+            data['zeros']
+        )
+
+
+class CountMin:
+    """
+    Over-estimate of the total weight of each key, with one row of counters per hash function.
+    """
+
+    def __init__(self, width=2048, depth=4, table=None):
+        self.width = width
+        self.depth = depth
+        self.table = table if table is not None else np.zeros((depth, width), dtype=np.float64)
+
+    def _columns(self, keys):
+        return [(mix(keys, seed=row + 1) % np.uint64(self.width)).astype(np.int64) for row in range(self.depth)]
+
+    def add(self, keys, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+
+        for row, columns in enumerate(self._columns(keys)):
+            np.add.at(self.table[row], columns, weights)
+
+    def estimate(self, keys):
+        return np.min([self.table[row][columns] for row, columns in enumerate(self._columns(keys))], axis=0)
+
+    def merge(self, other):
+        assert(self.table.shape == other.table.shape)
+
+        self.table += other.table
+
+    def to_dict(self):
+        return {'width': self.width, 'depth': self.depth, 'table': _encode(self.table)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['width'], data['depth'], _decode(data['table'], np.float64).reshape(data['depth'], data['width']))
+
+
+class Fleet:
+    """
+    Aggregates of many logs: distinct files per executable, request size and I/O time distributions, and bytes per file.
+
+    Since the bytes per file cannot list the files, the paths of the hottest files of each log are kept as candidates,
+    and only the ones with the most estimated bytes remain after each merge.
+    """
+
+    def __init__(self, paths=None, sizes=None, times=None, hotness=None, logs=0, hottest=None):
+        self.paths = paths if paths is not None else {}
+        self.sizes = sizes if sizes is not None else DDSketch()
+        self.times = times if times is not None else DDSketch()
+        self.hotness = hotness if hotness is not None else CountMin()
+        self.logs = logs
+        self.hottest = hottest if hottest is not None else {}
+
+    def add(self, executable, counters, fcounters, names=None, weights=None, files=None):
+        """
+        Add the POSIX records of a log. File ids are already hashes of the paths, so they are used as keys.
+
+        The names map the ids to the paths of the files. The records of a sample are weighted by the number of
+        records each of them stands for, and the ids of all the files (files) are counted instead of the sampled ones.
+        """
+        ids = counters['id'].to_numpy(dtype=np.uint64)
+        weights = np.ones(len(ids)) if weights is None else np.asarray(weights, dtype=np.float64)
+
+        self.paths.setdefault(executable, HyperLogLog()).add(np.unique(ids) if files is None else np.asarray(files, dtype=np.uint64))
+
+        # The four most common access sizes of each record, weighted by how often they were used
+        for slot in range(1, 5):
+            self.sizes.add(
+                counters['POSIX_ACCESS{}_ACCESS'.format(slot)].to_numpy(),
+                counters['POSIX_ACCESS{}_COUNT'.format(slot)].to_numpy() * weights
+            )
+
+        self.times.add(
+            (fcounters['POSIX_F_READ_TIME'] + fcounters['POSIX_F_WRITE_TIME'] + fcounters['POSIX_F_META_TIME']).to_numpy(),
+            weights
+        )
+
+        transferred = (counters['POSIX_BYTES_READ'] + counters['POSIX_BYTES_WRITTEN']).to_numpy() * weights
+
+        self.hotness.add(ids, transferred)
+
+        if names is not None:
+            unique, inverse = np.unique(ids, return_inverse=True)
+            totals = np.bincount(inverse, weights=transferred, minlength=len(unique))
+
+            for id in unique[np.argsort(-totals, kind='stable')[:HOTTEST]].tolist():
+                self.hottest[id] = names.get(id, str(id))
+
+            self.prune()
+
+        self.logs += 1
+
+    def prune(self):
+        """
+        Keep the candidate files with the most estimated bytes.
+        """
+        if len(self.hottest) <= HOTTEST:
+            return
+
+        ids = np.array(list(self.hottest), dtype=np.uint64)
+        kept = ids[np.argsort(-self.hotness.estimate(ids), kind='stable')[:HOTTEST]]
+
+        self.hottest = {id: self.hottest[id] for id in kept.tolist()}
+
+    def hot(self, count):
+        """
+        Paths of the hottest candidate files, with their estimated bytes.
+        """
+        if not self.hottest:
+            return []
+
+        ids = np.array(list(self.hottest), dtype=np.uint64)
+        estimates = self.hotness.estimate(ids)
+
+        return [
+            (self.hottest[id], float(estimate))
+            for id, estimate in sorted(zip(ids.tolist(), estimates.tolist()), key=lambda item: -item[1])[:count]
+        ]
+
+    def merge(self, other):
+        for executable, sketch in other.paths.items():
+            if executable in self.paths:
+                self.paths[executable].merge(sketch)
+            else:
+                self.paths[executable] = HyperLogLog.from_dict(sketch.to_dict())
+
+        self.sizes.merge(other.sizes)
+        self.times.merge(other.times)
+        self.hotness.merge(other.hotness)
+
+        self.hottest.update(other.hottest)
+        self.prune()
+
+        self.logs += other.logs
+
+    def to_dict(self):
+        return {
+            'logs': self.logs,
+            'paths': {executable: sketch.to_dict() for executable, sketch in self.paths.items()},
+            'sizes': self.sizes.to_dict(),
+            'times': self.times.to_dict(),
+            'hotness': self.hotness.to_dict(),
+            'hottest': {str(id): path for id, path in self.hottest.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            {executable: HyperLogLog.from_dict(sketch) for executable, sketch in data['paths'].items()},
+            DDSketch.from_dict(data['sizes']),
+            DDSketch.from_dict(data['times']),
+            CountMin.from_dict(data['hotness']),
+            data['logs'],
+            {int(id): path for id, path in data.get('hottest', {}).items()}
+        )
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='drishti sketch',
+        description='Drishti: merge the sketches of many logs (saved with --sketch) and summarize them'
+    )
+
+    parser.add_argument(
+        'sketches',
+        nargs='+',
+        help='Input sketch files'
+    )
+
+    parser.add_argument(
+        '--output',
+        default=None,
+        dest='output',
+        help='Save the merged sketch to a file'
+    )
+
+    parser.add_argument(
+        '--top',
+        default=10,
+        type=int,
+        dest='top',
+        help='Number of hottest files to list, by their estimated bytes transferred (default: 10)'
+    )
+
+    args = parser.parse_args(argv)
+
+    fleet = Fleet()
+
+    for path in args.sketches:
+        fleet.merge(Fleet.load(path))
+
+    if args.output:
+        fleet.save(args.output)
+
+    summary = {
+        'logs': fleet.logs,
+        'distinct_files': {executable: sketch.count() for executable, sketch in fleet.paths.items()},
+        'request_size': {'p{}'.format(q): fleet.sizes.quantile(q / 100) for q in (50, 90, 99)},
+        'io_time': {'p{}'.format(q): fleet.times.quantile(q / 100) for q in (50, 90, 99)},
+        'hottest_files': [{'path': path, 'bytes': transferred} for path, transferred in fleet.hot(args.top)]
+    }
+
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
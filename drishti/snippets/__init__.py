@@ -0,0 +1,39 @@
+import os
+import functools
+
+from rich.syntax import Syntax
+
+
+ROOT = os.path.abspath(os.path.dirname(__file__))
+
+
+class CachedSyntax(Syntax):
+    """
+    Syntax renderable that only lexes and highlights its code once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._highlighted = {}
+
+    def highlight(self, code, line_range=None):
+        key = (code, line_range)
+
+        if key not in self._highlighted:
+            self._highlighted[key] = super().highlight(code, line_range)
+
+        # Rendering stylizes the returned text, so never hand out the cached instance
+        return self._highlighted[key].copy()
+
+
+@functools.lru_cache(maxsize=None)
+def load(name):
+    """
+    Load a solution example snippet from the snippets directory, once per process.
+    """
+    return CachedSyntax.from_path(
+        os.path.join(ROOT, name),
+        line_numbers=True,
+        background_color='default'
+    )
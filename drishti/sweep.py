@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import zipfile
+import tarfile
+import argparse
+import itertools
+
+import numpy as np
+import pandas as pd
+
+# Without the Darshan library only darshan-parser output can be swept
+try:
+    import darshan
+except (ImportError, RuntimeError):
+    darshan = None
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+from rich import box
+
+from drishti import archives
+from drishti import jobs
+from drishti import textlog
+from drishti import thresholds
+
+
+SMALL_BINS = ('0_100', '100_1K', '1K_10K', '10K_100K', '100K_1M')
+
+# Ratio-based insights evaluated by the sweep: the counters of the numerator and the denominator of the ratio,
+# the threshold of the ratio, and the threshold of the numerator (None when there is none)
+RULES = {
+    'P05': ('small_reads', 'reads', 'SMALL_REQUESTS', 'SMALL_REQUESTS_ABSOLUTE'),
+    'P06': ('small_writes', 'writes', 'SMALL_REQUESTS', 'SMALL_REQUESTS_ABSOLUTE'),
+    'P07': ('mem_not_aligned', 'operations', 'MISALIGNED_REQUESTS', None),
+    'P08': ('file_not_aligned', 'operations', 'MISALIGNED_REQUESTS', None),
+    'P11': ('random_reads', 'reads', 'RANDOM_OPERATIONS', 'RANDOM_OPERATIONS_ABSOLUTE'),
+    'P13': ('random_writes', 'writes', 'RANDOM_OPERATIONS', 'RANDOM_OPERATIONS_ABSOLUTE')
+}
+
+FEATURES = sorted(set(feature for rule in RULES.values() for feature in rule[:2]))
+
+# Largest number of (setting, rule, file) flags computed at once, to bound memory on large sweeps
+BLOCK = 64 * 1024 ** 2
+
+
+def features(filename):
+    """
+    Job id of a log, and the counters used by the ratio-based insights for each file of the log, from its POSIX records.
+    """
+    if textlog.is_text(filename):
+        report = textlog.TextReport(filename)
+    else:
+        report = darshan.DarshanReport(filename, read_all=False)
+
+        report.mod_read_all_records('POSIX')
+
+    jobid = report.metadata['job']['jobid']
+
+    if 'POSIX' not in report.records:
+        return jobid, pd.DataFrame(columns=FEATURES)
+
+    counters = report.records['POSIX'].to_df()['counters']
+
+    reads = counters['POSIX_READS']
+    writes = counters['POSIX_WRITES']
+
+    table = pd.DataFrame({
+        'id': counters['id'],
+        'reads': reads,
+        'writes': writes,
+        'operations': reads + writes,
+        'small_reads': sum(counters['POSIX_SIZE_READ_{}'.format(bin)] for bin in SMALL_BINS),
+        'small_writes': sum(counters['POSIX_SIZE_WRITE_{}'.format(bin)] for bin in SMALL_BINS),
+        'mem_not_aligned': counters['POSIX_MEM_NOT_ALIGNED'],
+        'file_not_aligned': counters['POSIX_FILE_NOT_ALIGNED'],
+        # Sequential requests include the consecutive ones
+        'random_reads': reads - counters['POSIX_SEQ_READS'],
+        'random_writes': writes - counters['POSIX_SEQ_WRITES']
+    })
+
+    return jobid, table.groupby('id')[FEATURES].sum()
+
+
+def grid(document, base):
+    """
+    Threshold sets of a grid: a list of sets, or a mapping of thresholds to the values to combine, where a single
+    value is the same as a list with only that value.
+
+    Thresholds missing from a set keep their base value. Every set is validated like the configuration file.
+    """
+    if isinstance(document, dict):
+        names = [thresholds.name(key) for key in document]
+        axes = [values if isinstance(values, list) else [values] for values in document.values()]
+        sets = [dict(zip(names, values)) for values in itertools.product(*axes)]
+    elif isinstance(document, list) and all(isinstance(entry, dict) for entry in document):
+        sets = [{thresholds.name(key): value for key, value in entry.items()} for entry in document]
+    else:
+        raise ValueError('The grid must be a list of threshold sets, or map the thresholds to their values')
+
+    settings = []
+
+    for entry in sets:
+        values = dict(base, **entry)
+
+        thresholds.validate(values)
+
+        settings.append(values)
+
+    return settings
+
+
+def flags(numerators, denominators, ratios, absolutes):
+    """
+    Which rows cross the thresholds of each setting, with one (setting, rule, row) boolean for every combination.
+
+    The numerators and denominators have one row per rule, and the thresholds one row per setting and a column
+    per rule. A row is flagged when its ratio is above the threshold and its numerator above the absolute threshold.
+    """
+    return (
+        (numerators[np.newaxis] > ratios[:, :, np.newaxis] * denominators[np.newaxis]) &
+        (numerators[np.newaxis] > absolutes[:, :, np.newaxis])
+    )
+
+
+def evaluate(table, logs, settings):
+    """
+    Count the logs and files flagged by each setting, for all the settings at once.
+
+    The table has the features of every file, and the logs the index of the log of each file. Logs are flagged
+    from their totals, as the insights of the report are, and files from their own counters.
+    """
+    codes = list(RULES)
+
+    numerators = np.array([table[RULES[code][0]].to_numpy(dtype=np.float64) for code in codes])
+    denominators = np.array([table[RULES[code][1]].to_numpy(dtype=np.float64) for code in codes])
+
+    ratios = np.array([[values[RULES[code][2]] for code in codes] for values in settings], dtype=np.float64)
+    absolutes = np.array([
+        [values[RULES[code][3]] if RULES[code][3] else 0.0 for code in codes] for values in settings
+    ], dtype=np.float64)
+
+    count = int(logs.max()) + 1 if len(logs) else 0
+
+    # Totals of each log, one row per rule
+    totals_numerators = np.array([np.bincount(logs, weights=row, minlength=count) for row in numerators]).reshape(len(codes), count)
+    totals_denominators = np.array([np.bincount(logs, weights=row, minlength=count) for row in denominators]).reshape(len(codes), count)
+
+    flagged_logs = flags(totals_numerators, totals_denominators, ratios, absolutes)
+
+    files_per_rule = np.zeros((len(settings), len(codes)), dtype=np.int64)
+    files_any = np.zeros(len(settings), dtype=np.int64)
+
+    block = max(BLOCK // max(len(codes) * len(table), 1), 1)
+
+    for start in range(0, len(settings), block):
+        flagged = flags(numerators, denominators, ratios[start:start + block], absolutes[start:start + block])
+
+        files_per_rule[start:start + block] = flagged.sum(axis=2)
+        files_any[start:start + block] = flagged.any(axis=1).sum(axis=1)
+
+    return {
+        'codes': codes,
+        'logs': flagged_logs.any(axis=1).sum(axis=1),
+        'logs_per_rule': flagged_logs.sum(axis=2),
+        'files': files_any,
+        'files_per_rule': files_per_rule
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='drishti sweep',
+        description='Drishti: count the logs and files that each set of thresholds would flag'
+    )
+
+    parser.add_argument(
+        'grid',
+        help='JSON file with a list of threshold sets, or a mapping of thresholds to the values to combine (e.g., {"small_requests": [0.05, 0.1, 0.2]})'
+    )
+
+    parser.add_argument(
+        'logs',
+        nargs='+',
+        help='Input .darshan files or darshan-parser output, or tar/zip archives of them (optionally gzip or zstd-compressed)'
+    )
+
+    parser.add_argument(
+        '--prefetch',
+        default=archives.PREFETCH,
+        type=int,
+        dest='prefetch',
+        metavar='N',
+        help='Number of logs extracted from the archives ahead of the analysis (default: {})'.format(archives.PREFETCH)
+    )
+
+    parser.add_argument(
+        '--config',
+        default=None,
+        dest='config',
+        metavar='PATH',
+        help='Read the thresholds that are not swept from a JSON file, instead of using the defaults'
+    )
+
+    parser.add_argument(
+        '--job-info',
+        default=None,
+        dest='job_info',
+        metavar='PATH',
+        help='Read the number of compute nodes of the jobs from a file with sacct output (--parsable2 --delimiter ",") instead of querying SLURM'
+    )
+
+    parser.add_argument(
+        '--sacct-timeout',
+        default=10,
+        type=int,
+        dest='sacct_timeout',
+        help='Maximum number of seconds to wait for SLURM to answer the compute nodes query of all the jobs'
+    )
+
+    parser.add_argument(
+        '--format',
+        default='rich',
+        choices=['rich', 'json'],
+        dest='format',
+        help='Output format: a rich table (default) or a JSON document'
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        base = dict(thresholds.current(), **thresholds.read(args.config)) if args.config else thresholds.current()
+
+        with open(args.grid) as f:
+            settings = grid(json.load(f), base)
+    except (OSError, ValueError) as e:
+        sys.stderr.write('Unable to read the thresholds: {}\n'.format(e))
+
+        sys.exit(os.EX_CONFIG)
+
+    # One feature table for all the logs, so every setting is evaluated on the same data. Logs in archives are
+    # read from temporary buffers, while the next ones are being decompressed
+    try:
+        names, jobids, tables = [], [], []
+
+        for name, filename in archives.logs(args.logs, args.prefetch):
+            jobid, table = features(filename)
+
+            names.append(name)
+            jobids.append(jobid)
+            tables.append(table)
+    except (OSError, RuntimeError, tarfile.TarError, zipfile.BadZipFile) as e:
+        sys.stderr.write('Unable to read the logs: {}\n'.format(e))
+
+        sys.exit(os.EX_DATAERR)
+
+    # Compute nodes of every job with a single query, which also fills the cache of the reports of these logs.
+    # Logs of runs outside a scheduler have no job id
+    found = jobs.provider(args.job_info, args.sacct_timeout).lookup(sorted(set(str(jobid) for jobid in jobids if jobid)))
+
+    if found is None:
+        sys.stderr.write('Unable to look up the compute nodes of the jobs\n')
+
+        found = {}
+
+    nodes = [found[str(jobid)]['nodes'] if str(jobid) in found else None for jobid in jobids]
+
+    table = pd.concat(tables) if tables else pd.DataFrame(columns=FEATURES)
+    logs = np.repeat(np.arange(len(tables)), [len(t) for t in tables])
+
+    result = evaluate(table, logs, settings)
+
+    # Only show the thresholds that change across the settings
+    swept = [name for name in base if len(set(values[name] for values in settings)) > 1]
+
+    if args.format == 'json':
+        document = {
+            'logs': len(tables),
+            'files': len(table),
+            'jobs': [
+                {'log': name, 'jobid': jobid, 'compute_nodes': count} for name, jobid, count in zip(names, jobids, nodes)
+            ],
+            'settings': [
+                {
+                    'thresholds': {name.lower(): values[name] for name in swept},
+                    'logs': int(result['logs'][index]),
+                    'files': int(result['files'][index]),
+                    'insights': {
+                        code: {
+                            'logs': int(result['logs_per_rule'][index][column]),
+                            'files': int(result['files_per_rule'][index][column])
+                        } for column, code in enumerate(result['codes'])
+                    }
+                } for index, values in enumerate(settings)
+            ]
+        }
+
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+        return
+
+    table_view = Table(box=box.SIMPLE)
+
+    for name in swept:
+        table_view.add_column(name.lower(), justify='right')
+
+    table_view.add_column('LOGS', justify='right')
+    table_view.add_column('FILES', justify='right')
+
+    for code in result['codes']:
+        table_view.add_column(code, justify='right')
+
+    for index, values in enumerate(settings):
+        table_view.add_row(
+            *['{:g}'.format(values[name]) for name in swept],
+            '{}/{}'.format(result['logs'][index], len(tables)),
+            '{}/{}'.format(result['files'][index], len(table)),
+            *['{}/{}'.format(result['logs_per_rule'][index][column], result['files_per_rule'][index][column]) for column in range(len(result['codes']))]
+        )
+
+    Console().print(
+        Panel(
+            table_view,
+            title='[b][slate_blue3]DRISHTI[/slate_blue3] SWEEP[/b]',
+            title_align='left',
+            subtitle='logs and files flagged by each setting, in total and per insight, from {} jobs on {} compute nodes'.format(
+                len(found), sum(info['nodes'] for info in found.values())
+            ) if found else 'logs and files flagged by each setting, in total and per insight',
+            subtitle_align='left'
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+
+import io
+import sys
+import csv
+import gzip
+
+import numpy as np
+import pandas as pd
+
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Lines parsed at once, so memory is bounded by the size of a chunk and the counters it becomes
+CHUNK = 16 * 1024 ** 2
+
+FIELDS = ['module', 'rank', 'id', 'counter', 'value', 'path', 'mount', 'fs']
+
+# Modules of darshan-parser without a counter store in the report
+SKIPPED_MODULES = ('HEATMAP',)
+
+
+def peek(path, size):
+    """
+    First bytes of a log, without consuming them when it is read from the standard input.
+    """
+    if path == '-':
+        return sys.stdin.buffer.peek(size)[:size]
+
+    with open(path, 'rb') as f:
+        return f.read(size)
+
+
+def is_text(path):
+    """
+    Whether a log is darshan-parser output (plain or gzip-compressed) instead of a binary .darshan log.
+
+    The standard input (-) is always text, since the Darshan library can only open binary logs from a file.
+    """
+    if path == '-':
+        return True
+
+    head = peek(path, 2)
+
+    if head == GZIP_MAGIC:
+        with gzip.open(path, 'rb') as f:
+            head = f.read(1)
+
+    return head.startswith(b'#')
+
+
+def open_text(path):
+    """
+    Stream of the lines of a darshan-parser output, decompressed on the fly when it is gzip-compressed.
+    """
+    stream = sys.stdin.buffer if path == '-' else open(path, 'rb')
+
+    if peek(path, 2) == GZIP_MAGIC:
+        stream = gzip.GzipFile(fileobj=stream)
+
+    return io.TextIOWrapper(stream, encoding='utf-8', errors='replace')
+
+
+class Records:
+    """
+    Records of a module, with the same DataFrames as the records of a DarshanReport.
+    """
+
+    def __init__(self, counters, fcounters):
+        self.counters = counters
+        self.fcounters = fcounters
+
+    def __len__(self):
+        return len(self.counters)
+
+    def to_df(self):
+        return {
+            'counters': self.counters.copy(),
+            'fcounters': self.fcounters.copy()
+        }
+
+
+class TextReport:
+    """
+    Report of a log read from darshan-parser output, for hosts without the Darshan library.
+
+    The output is parsed a chunk of lines at a time, and each chunk is pivoted into one row of counters per
+    rank and file, so the records, names, and job metadata are the ones a DarshanReport would have. The DXT
+    traces and heatmaps are not part of darshan-parser output, so there are none.
+    """
+
+    def __init__(self, path, chunk=CHUNK):
+        self.path = path
+
+        self.name_records = {}
+        self.records = {}
+        self.heatmaps = {}
+
+        self.metadata = {
+            'job': {
+                'uid': 0,
+                'start_time_sec': 0,
+                'start_time_nsec': 0,
+                'end_time_sec': 0,
+                'end_time_nsec': 0,
+                'nprocs': 0,
+                'jobid': 0,
+                'run_time': 0.0,
+                'log_ver': '',
+                'metadata': {}
+            },
+            'exe': ''
+        }
+
+        self.parse(chunk)
+
+        self.modules = {module: {'len': len(records)} for module, records in self.records.items()}
+        self.data = {'modules': self.modules}
+
+    def header(self, line):
+        """
+        Read the job metadata from a comment line of the header.
+        """
+        job = self.metadata['job']
+
+        key, separator, value = line[1:].strip().partition(': ')
+
+        if not separator:
+            return
+
+        if key == 'exe':
+            self.metadata['exe'] = value
+        elif key == 'darshan log version':
+            job['log_ver'] = value
+        elif key in ('uid', 'jobid', 'nprocs'):
+            job[key] = int(value)
+        elif key in ('start_time', 'end_time'):
+            # Newer versions print the nanoseconds as a fraction of the seconds
+            seconds, _, fraction = value.partition('.')
+
+            job['{}_sec'.format(key)] = int(seconds)
+            job['{}_nsec'.format(key)] = int(fraction.ljust(9, '0')[:9]) if fraction else 0
+        elif key == 'run time':
+            job['run_time'] = float(value)
+        elif key == 'metadata':
+            name, _, value = value.partition(' = ')
+
+            job['metadata'][name] = value
+
+    def parse(self, chunk):
+        frames = {}
+        carry = []
+
+        with open_text(self.path) as stream:
+            while True:
+                lines = stream.readlines(chunk)
+
+                data = carry
+
+                for line in lines:
+                    if line.startswith('#'):
+                        self.header(line)
+                    elif line.strip():
+                        data.append(line)
+
+                if not lines:
+                    carry = []
+                elif data:
+                    # The counters of a record may continue in the next chunk, so its lines are kept for it
+                    last = data[-1].split('\t', 3)[:3]
+
+                    split = len(data)
+
+                    while split > 0 and data[split - 1].split('\t', 3)[:3] == last:
+                        split -= 1
+
+                    if split > 0:
+                        data, carry = data[:split], data[split:]
+                    else:
+                        data, carry = [], data
+
+                if data:
+                    for module, (counters, fcounters) in self.pivot(data).items():
+                        frames.setdefault(module, []).append((counters, fcounters))
+
+                if not lines:
+                    break
+
+        for module, chunks in frames.items():
+            self.records[module] = Records(
+                pd.concat([counters for counters, _ in chunks], ignore_index=True),
+                pd.concat([fcounters for _, fcounters in chunks], ignore_index=True)
+            )
+
+    def pivot(self, lines):
+        """
+        One row of integer counters and one row of floating-point counters per record, for each module of a chunk.
+        """
+        table = pd.read_csv(
+            io.StringIO(''.join(lines)),
+            sep='\t',
+            names=FIELDS,
+            dtype={'module': str, 'rank': np.int64, 'id': np.uint64, 'counter': str, 'value': str, 'path': str},
+            usecols=range(len(FIELDS) - 2),
+            quoting=csv.QUOTE_NONE,
+            keep_default_na=False,
+            engine='c'
+        )
+
+        names = table.drop_duplicates('id')
+
+        self.name_records.update(zip(names['id'].tolist(), names['path'].tolist()))
+
+        result = {}
+
+        for module, rows in table.groupby('module', sort=False):
+            if module in SKIPPED_MODULES:
+                continue
+
+            keys = rows[['rank', 'id']].drop_duplicates()
+
+            # Counters keep the order they are printed in, which is the order of the report
+            values = rows.set_index(['rank', 'id', 'counter'])['value'].unstack('counter')
+            values = values.reindex(index=pd.MultiIndex.from_frame(keys), columns=pd.unique(rows['counter']))
+            values.columns.name = None
+
+            # Files are striped over different numbers of OSTs, so their ids are kept as a list, as the report does
+            osts = [name for name in values.columns if name.startswith('LUSTRE_OST_ID_')]
+
+            floating = [name for name in values.columns if '_F_' in name]
+            integer = [name for name in values.columns if '_F_' not in name and name not in osts]
+
+            counters = values[integer].apply(pd.to_numeric).astype(np.int64).reset_index()
+            fcounters = values[floating].apply(pd.to_numeric).astype(np.float64).reset_index()
+
+            if osts:
+                counters['ost_ids'] = [
+                    np.array([int(ost) for ost in row if isinstance(ost, str)], dtype=np.int64)
+                    for row in values[osts].to_numpy()
+                ]
+
+            result[module] = (counters, fcounters)
+
+        return result
+
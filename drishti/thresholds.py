@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+import json
+
+
+OPERATION_IMBALANCE = 0.1
+SMALL_REQUESTS = 0.1
+SMALL_REQUESTS_ABSOLUTE = 1000
+MISALIGNED_REQUESTS = 0.1
+METADATA = 0.1
+METADATA_TIME_RANK = 30  # seconds
+RANDOM_OPERATIONS = 0.2
+RANDOM_OPERATIONS_ABSOLUTE = 1000
+STRIDED_OPERATIONS = 0.5
+STRIDED_OPERATIONS_ABSOLUTE = 1000
+STRAGGLERS = 0.15
+IMBALANCE = 0.30
+INTERFACE_STDIO = 0.1
+COLLECTIVE_OPERATIONS = 0.5
+COLLECTIVE_OPERATIONS_ABSOLUTE = 1000
+DIRECTORY_ROLLUP = 0.75
+REDUNDANT_TRAFFIC = 0.1
+SERIALIZED_IO = 0.25
+HEATMAP_BURSTINESS = 4.0
+HEATMAP_IDLE = 0.5
+HEATMAP_RANK_SKEW = 0.5
+HEATMAP_SKEWED_BINS = 0.25
+LUSTRE_RANKS_PER_OST = 16
+REQUEST_AMPLIFICATION = 4.0
+BYTE_AMPLIFICATION = 0.1
+RANK_VARIATION = 0.5
+BASELINE_DEVIATION = 3.0
+BASELINE_RUNS = 5
+
+DEFAULTS = {name: value for name, value in globals().items() if name.isupper()}
+
+# Thresholds that are fractions, between 0 and 1
+RATIOS = (
+    'OPERATION_IMBALANCE',
+    'SMALL_REQUESTS',
+    'MISALIGNED_REQUESTS',
+    'METADATA',
+    'RANDOM_OPERATIONS',
+    'STRIDED_OPERATIONS',
+    'STRAGGLERS',
+    'IMBALANCE',
+    'INTERFACE_STDIO',
+    'COLLECTIVE_OPERATIONS',
+    'DIRECTORY_ROLLUP',
+    'REDUNDANT_TRAFFIC',
+    'SERIALIZED_IO',
+    'HEATMAP_IDLE',
+    'HEATMAP_RANK_SKEW',
+    'HEATMAP_SKEWED_BINS'
+)
+
+# Smallest value of the other thresholds
+MINIMUMS = {
+    'SMALL_REQUESTS_ABSOLUTE': 0,
+    'RANDOM_OPERATIONS_ABSOLUTE': 0,
+    'STRIDED_OPERATIONS_ABSOLUTE': 0,
+    'COLLECTIVE_OPERATIONS_ABSOLUTE': 0,
+    'METADATA_TIME_RANK': 0.0,
+    'HEATMAP_BURSTINESS': 1.0,
+    'LUSTRE_RANKS_PER_OST': 1,
+    'REQUEST_AMPLIFICATION': 1.0,
+    'BYTE_AMPLIFICATION': 0.0,
+    'RANK_VARIATION': 0.0,
+    'BASELINE_DEVIATION': 0.0,
+    'BASELINE_RUNS': 2
+}
+
+
+def current():
+    """
+    Value of every threshold, as used by the analysis.
+    """
+    return {name: globals()[name] for name in DEFAULTS}
+
+
+def name(key):
+    """
+    Name of a threshold from a key of a configuration file, case-insensitive and with an optional THRESHOLD_ prefix.
+    """
+    key = key.upper()
+
+    if key.startswith('THRESHOLD_'):
+        key = key[len('THRESHOLD_'):]
+
+    if key not in DEFAULTS:
+        raise ValueError('Unknown threshold: {}'.format(key.lower()))
+
+    return key
+
+
+def validate(values):
+    """
+    Check that every threshold is a number within its range, raising a ValueError for the first one that is not.
+    """
+    for key, value in values.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError('Threshold {} must be a number, not {!r}'.format(key.lower(), value))
+
+        if key in RATIOS and not 0.0 <= value <= 1.0:
+            raise ValueError('Threshold {} must be between 0 and 1, not {}'.format(key.lower(), value))
+
+        if key in MINIMUMS and value < MINIMUMS[key]:
+            raise ValueError('Threshold {} must be at least {}, not {}'.format(key.lower(), MINIMUMS[key], value))
+
+
+def read(path):
+    """
+    Read the thresholds of a JSON configuration file, e.g., {"small_requests": 0.2, "random_operations": 0.3}.
+    """
+    with open(path) as f:
+        document = json.load(f)
+
+    if not isinstance(document, dict):
+        raise ValueError('The configuration must map the names of the thresholds to their values')
+
+    return {name(key): value for key, value in document.items()}
+
+
+def load(path):
+    """
+    Override the defaults with the thresholds of a configuration file, after validating all of them.
+    """
+    values = dict(current(), **read(path))
+
+    validate(values)
+
+    globals().update(values)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+from drishti.dxt import union
+
+
+BINS = 100
+
+BIN = np.dtype([
+    ('start', np.float64),
+    ('end', np.float64),
+    ('ranks', np.float64),
+    ('files', np.float64),
+    ('read_bandwidth', np.float64),
+    ('write_bandwidth', np.float64)
+])
+
+
+def reconstruct(counters, fcounters, nprocs, bins=BINS):
+    """
+    Rebuild a binned timeline of the job I/O from the POSIX start and end timestamps of each record.
+
+    Each bin has the average number of ranks doing I/O, the average number of open files, and the
+    read and write bandwidth, estimated by spreading the bytes of each record evenly over the time
+    between its first and last operation. Shared records (rank -1) count as all ranks. Every quantity
+    is a step function built with a sweep over the sorted interval bounds, so the cost is
+    O(records log records) regardless of the number of bins.
+    """
+    ranks = fcounters['rank'].to_numpy(dtype=np.int64)
+    files = np.unique(fcounters['id'].to_numpy(dtype=np.uint64), return_inverse=True)[1]
+
+    intervals = {}
+
+    for operation, column in (('read', 'READ'), ('write', 'WRITE'), ('open', 'OPEN')):
+        start = fcounters['POSIX_F_{}_START_TIMESTAMP'.format(column)].to_numpy(dtype=np.float64)
+
+        if operation == 'open':
+            end = fcounters['POSIX_F_CLOSE_END_TIMESTAMP'].to_numpy(dtype=np.float64)
+        else:
+            end = fcounters['POSIX_F_{}_END_TIMESTAMP'.format(column)].to_numpy(dtype=np.float64)
+
+        # Records without the operation have both timestamps set to zero
+        intervals[operation] = (start, end, (end >= start) & (end > 0))
+
+    read_bytes = counters['POSIX_BYTES_READ'].to_numpy(dtype=np.float64)
+    written_bytes = counters['POSIX_BYTES_WRITTEN'].to_numpy(dtype=np.float64)
+
+    runtime = max(
+        [float(end[valid].max()) for start, end, valid in intervals.values() if valid.any()],
+        default=0.0
+    )
+
+    edges = np.linspace(0.0, runtime, bins + 1)
+
+    timeline = np.zeros(bins, dtype=BIN)
+
+    timeline['start'] = edges[:-1]
+    timeline['end'] = edges[1:]
+
+    if not runtime:
+        return timeline
+
+    # Ranks doing I/O, with the overlapping reads and writes of a rank merged so it counts only once
+    starts = np.concatenate([intervals[operation][0][intervals[operation][2]] for operation in ('read', 'write')])
+    ends = np.concatenate([intervals[operation][1][intervals[operation][2]] for operation in ('read', 'write')])
+    owners = np.concatenate([ranks[intervals[operation][2]] for operation in ('read', 'write')])
+
+    shared = owners < 0
+
+    private_starts, private_ends = _union_by(starts[~shared], ends[~shared], owners[~shared], runtime)
+
+    timeline['ranks'] = np.minimum(
+        _average(
+            np.concatenate([private_starts, starts[shared]]),
+            np.concatenate([private_ends, ends[shared]]),
+            np.concatenate([np.ones(len(private_starts)), np.full(np.count_nonzero(shared), float(nprocs))]),
+            edges
+        ),
+        nprocs
+    )
+
+    # Files open at the same time, no matter how many ranks opened them
+    start, end, valid = intervals['open']
+
+    open_starts, open_ends = _union_by(start[valid], end[valid], files[valid], runtime)
+
+    timeline['files'] = _average(open_starts, open_ends, np.ones(len(open_starts)), edges)
+
+    for operation, transferred in (('read', read_bytes), ('write', written_bytes)):
+        start, end, valid = intervals[operation]
+
+        valid = valid & (transferred > 0)
+
+        timeline['{}_bandwidth'.format(operation)] = _bandwidth(start[valid], end[valid], transferred[valid], edges)
+
+    return timeline
+
+
+def phases(timeline):
+    """
+    Periods of the job with I/O activity, as a list of (start, end, bytes, peak bandwidth) tuples.
+    """
+    bandwidth = timeline['read_bandwidth'] + timeline['write_bandwidth']
+
+    result = []
+
+    for first, last in _runs(bandwidth > 0):
+        widths = timeline['end'][first:last] - timeline['start'][first:last]
+
+        result.append((
+            float(timeline['start'][first]),
+            float(timeline['end'][last - 1]),
+            float((bandwidth[first:last] * widths).sum()),
+            float(bandwidth[first:last].max())
+        ))
+
+    return result
+
+
+def serialized(timeline):
+    """
+    Periods with I/O activity where, on average, at most one rank was doing I/O, as (start, end) tuples.
+    """
+    bandwidth = timeline['read_bandwidth'] + timeline['write_bandwidth']
+
+    return [
+        (float(timeline['start'][first]), float(timeline['end'][last - 1]))
+        for first, last in _runs((bandwidth > 0) & (timeline['ranks'] <= 1.0))
+    ]
+
+
+def plot(timeline, path):
+    """
+    Save a chart with the bandwidth and the number of active ranks over time.
+    """
+    import matplotlib.pyplot as plt
+
+    figure, bandwidth = plt.subplots(figsize=(12, 5))
+
+    middle = (timeline['start'] + timeline['end']) / 2
+    width = timeline['end'] - timeline['start']
+
+    bandwidth.bar(middle, timeline['read_bandwidth'] / 1024 ** 2, width=width, color='blue', alpha=0.7, label='Read')
+    bandwidth.bar(middle, timeline['write_bandwidth'] / 1024 ** 2, width=width, bottom=timeline['read_bandwidth'] / 1024 ** 2, color='red', alpha=0.7, label='Write')
+    bandwidth.set_xlabel('Time since the job started (seconds)')
+    bandwidth.set_ylabel('Estimated bandwidth (MB/s)')
+
+    ranks = bandwidth.twinx()
+    ranks.step(middle, timeline['ranks'], where='mid', color='black', label='Active ranks')
+    ranks.set_ylabel('Active ranks')
+
+    figure.legend(loc='upper right')
+    figure.tight_layout()
+    figure.savefig(path)
+
+    plt.close(figure)
+
+
+def _union_by(starts, ends, groups, runtime):
+    """
+    Merge the overlapping intervals of each group, shifting every group to its own time range so one pass merges them all.
+    """
+    if not len(starts):
+        return starts, ends
+
+    shift = groups.astype(np.float64) * (runtime + 1.0)
+
+    merged_starts, merged_ends = union(starts + shift, ends + shift)
+
+    shift = np.floor(merged_starts / (runtime + 1.0)) * (runtime + 1.0)
+
+    return merged_starts - shift, merged_ends - shift
+
+
+def _average(starts, ends, weights, edges):
+    """
+    Average over each bin of the total weight of the intervals open at each instant.
+    """
+    if not len(starts):
+        return np.zeros(len(edges) - 1)
+
+    positions = np.concatenate([starts, ends])
+    deltas = np.concatenate([weights, -weights])
+
+    order = np.argsort(positions, kind='stable')
+
+    positions = positions[order]
+    levels = np.cumsum(deltas[order])
+
+    # Area under the step function at each bound, then at each bin edge
+    areas = np.zeros(len(positions))
+    areas[1:] = np.cumsum(levels[:-1] * np.diff(positions))
+
+    previous = np.searchsorted(positions, edges, side='right') - 1
+    clipped = np.clip(previous, 0, None)
+
+    at_edges = np.where(previous >= 0, areas[clipped] + levels[clipped] * (edges - positions[clipped]), 0.0)
+
+    return np.diff(at_edges) / np.diff(edges)
+
+
+def _bandwidth(starts, ends, transferred, edges):
+    """
+    Bytes per second in each bin, spreading the bytes of each interval evenly over its duration.
+    """
+    durations = ends - starts
+
+    spread = durations > 0
+
+    bandwidth = _average(starts[spread], ends[spread], transferred[spread] / durations[spread], edges)
+
+    # Transfers too fast to have a duration are placed in the bin where they happened
+    instants = np.clip(np.searchsorted(edges, starts[~spread], side='right') - 1, 0, len(edges) - 2)
+
+    bandwidth += np.bincount(instants, weights=transferred[~spread], minlength=len(edges) - 1) / np.diff(edges)
+
+    return bandwidth
+
+
+def _runs(mask):
+    """
+    Contiguous runs of True values, as (first, last + 1) index pairs.
+    """
+    changes = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+
+    return list(zip(np.flatnonzero(changes == 1), np.flatnonzero(changes == -1)))
@@ -20,8 +20,16 @@ setuptools.setup(
         'argparse',
         'pandas',
         'darshan',
+        'matplotlib',
+        'numpy',
         'rich ==12.5.1',
+        'seaborn',
     ],
+    extras_require={
+        'zstd': [
+            'zstandard'
+        ]
+    },
     packages=[
         'drishti'
     ],
@@ -33,7 +41,7 @@ setuptools.setup(
     include_package_data=True,
     entry_points={
         "console_scripts": [
-            "drishti=drishti.main:main"
+            "drishti=drishti.cli:main"
         ]
     },
     classifiers=[
@@ -44,5 +52,5 @@ setuptools.setup(
         "License :: Other/Proprietary License",
         "Programming Language :: Python :: 3 :: Only"
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.8',
 )
@@ -0,0 +1,105 @@
+import os
+import sys
+import glob
+import shutil
+import subprocess
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = glob.glob(os.path.join(ROOT, 'sample', '*.darshan'))[0]
+
+
+@pytest.fixture
+def sample():
+    return SAMPLE
+
+
+@pytest.fixture
+def drishti(tmp_path):
+    """
+    Run the drishti command in a temporary directory, where it writes its charts and converted logs.
+
+    The sample log uses an old format that the report converts with darshan-convert first. PyDarshan reads that
+    format as well, so when darshan-convert is not installed a copy of the log stands in for the converted one.
+    Like the real one, the stand-in prints to the standard output, which must not end up in the report.
+    """
+    environment = dict(os.environ, PYTHONPATH=ROOT, XDG_CACHE_HOME=str(tmp_path / 'cache'))
+
+    if shutil.which('darshan-convert') is None:
+        converter = tmp_path / 'bin' / 'darshan-convert'
+        converter.parent.mkdir()
+        converter.write_text('#!/bin/sh\necho "Converting $1"\ncp "$1" "$2"\n')
+        converter.chmod(0o755)
+
+        environment['PATH'] = '{}{}{}'.format(converter.parent, os.pathsep, environment.get('PATH', ''))
+
+    def run(*args, stdin=None):
+        return subprocess.run(
+            [sys.executable, '-m', 'drishti.cli'] + [str(arg) for arg in args],
+            cwd=tmp_path,
+            env=environment,
+            stdin=stdin,
+            capture_output=True,
+            text=True,
+            timeout=600
+        )
+
+    return run
+
+
+def write_parser_output(path):
+    """
+    Write the sample log as darshan-parser would print it, from the records read by PyDarshan.
+    """
+    import darshan
+
+    report = darshan.DarshanReport(SAMPLE, read_all=False)
+    report.read_all_generic_records()
+
+    job = report.metadata['job']
+
+    with open(path, 'w') as f:
+        f.write('# darshan log version: {}\n'.format(job['log_ver']))
+        f.write('# exe: {}\n'.format(report.metadata['exe']))
+        f.write('# uid: {}\n'.format(job['uid']))
+        f.write('# jobid: {}\n'.format(job['jobid']))
+        f.write('# start_time: {}\n'.format(job['start_time_sec']))
+        f.write('# end_time: {}\n'.format(job['end_time_sec']))
+        f.write('# nprocs: {}\n'.format(job['nprocs']))
+        f.write('# run time: {}\n'.format(job['run_time']))
+
+        for key, value in job['metadata'].items():
+            f.write('# metadata: {} = {}\n'.format(key, value))
+
+        for module, records in report.records.items():
+            df = records.to_df()
+
+            f.write('\n# {} module data\n'.format(module))
+
+            for counters, fcounters in zip(df['counters'].to_dict('records'), df['fcounters'].to_dict('records')):
+                rank = counters.pop('rank')
+                id = counters.pop('id')
+
+                del fcounters['rank'], fcounters['id']
+
+                for name, value in list(counters.items()) + list(fcounters.items()):
+                    f.write('{}\t{}\t{}\t{}\t{}\t{}\t/\tlustre\n'.format(
+                        module, rank, id & 0xffffffffffffffff, name, value, report.name_records[id]
+                    ))
+
+
+@pytest.fixture(scope='session')
+def parser_output(tmp_path_factory):
+    """
+    Path of the sample log as darshan-parser output.
+    """
+    pytest.importorskip('darshan')
+
+    path = tmp_path_factory.mktemp('parser') / 'sample.txt'
+
+    write_parser_output(path)
+
+    return path
@@ -0,0 +1,106 @@
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from drishti import archives
+
+
+LOGS = {'a.darshan': b'first log', 'logs/b.txt': b'# darshan-parser output', 'notes.md': b'not a log'}
+
+
+@pytest.fixture(params=['w', 'w:gz', 'zip'])
+def archive(request, tmp_path):
+    if request.param == 'zip':
+        path = tmp_path / 'logs.zip'
+
+        with zipfile.ZipFile(path, 'w') as f:
+            for name, data in LOGS.items():
+                f.writestr(name, data)
+    else:
+        path = tmp_path / ('logs.tar.gz' if request.param == 'w:gz' else 'logs.tar')
+
+        with tarfile.open(path, request.param) as f:
+            for name, data in LOGS.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+
+                f.addfile(info, io.BytesIO(data))
+
+    return str(path)
+
+
+def test_is_archive(archive, tmp_path):
+    log = tmp_path / 'job.darshan'
+    log.write_bytes(b'not an archive')
+
+    assert archives.is_archive(archive)
+    assert not archives.is_archive(str(log))
+    assert not archives.is_archive(str(tmp_path / 'missing.tar'))
+
+
+def test_members(archive):
+    # Only the logs are read, in the order of the archive
+    assert [(name, source.read()) for name, source in archives.members(archive)] == [
+        ('a.darshan', b'first log'),
+        ('logs/b.txt', b'# darshan-parser output')
+    ]
+
+
+def test_logs(archive, tmp_path):
+    log = tmp_path / 'job.darshan'
+    log.write_bytes(b'in place')
+
+    buffers = []
+
+    for name, path in archives.logs([str(log), archive], prefetch=1):
+        with open(path, 'rb') as f:
+            buffers.append((name, f.read()))
+
+        if name != str(log):
+            temporary = path
+
+    assert buffers == [
+        (str(log), b'in place'),
+        ('{}:a.darshan'.format(archive), b'first log'),
+        ('{}:logs/b.txt'.format(archive), b'# darshan-parser output')
+    ]
+
+    # The temporary buffers are removed, the logs that are not in an archive are not
+    assert not os.path.exists(temporary)
+    assert log.exists()
+
+
+def test_logs_stopped(archive):
+    logs = archives.logs([archive], prefetch=1)
+
+    _, path = next(logs)
+
+    logs.close()
+
+    assert not os.path.exists(path)
+
+
+def test_locate(archive, tmp_path):
+    assert archives.locate('{}:logs/b.txt'.format(archive)) == (archive, 'logs/b.txt')
+    assert archives.locate(archive) is None
+    assert archives.locate(str(tmp_path / 'missing.tar:a.darshan')) is None
+
+
+def test_opened(archive):
+    with archives.opened('{}:logs/b.txt'.format(archive)) as path:
+        assert path.endswith('.txt')
+
+        with open(path, 'rb') as f:
+            assert f.read() == b'# darshan-parser output'
+
+    assert not os.path.exists(path)
+
+    with archives.opened(archive) as path:
+        assert path == archive
+
+    with pytest.raises(FileNotFoundError):
+        with archives.opened('{}:notes.md'.format(archive)):
+            pass
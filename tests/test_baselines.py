@@ -0,0 +1,128 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from drishti import baselines
+
+
+def test_running_stats():
+    values = [3.0, 5.0, 4.0, 10.0, 7.0]
+
+    stats = baselines.RunningStats()
+
+    for value in values:
+        stats.update(value)
+
+    assert stats.count == 5
+    assert stats.mean == pytest.approx(np.mean(values))
+    assert stats.std == pytest.approx(np.std(values, ddof=1))
+    assert stats.deviation(np.mean(values) + 2 * np.std(values, ddof=1)) == pytest.approx(2.0)
+
+
+def test_running_stats_window():
+    stats = baselines.RunningStats()
+
+    for _ in range(100):
+        stats.update(1.0, window=10)
+
+    for _ in range(100):
+        stats.update(2.0, window=10)
+
+    # Only the recent runs matter once the window is full
+    assert stats.count == 10
+    assert stats.mean == pytest.approx(2.0, rel=1e-3)
+
+
+def test_key():
+    assert baselines.key('app', 100) == 'app:128'
+    assert baselines.key('app', 128) == 'app:128'
+    assert baselines.key('app', 0) == 'app:1'
+
+
+def test_check_leaves_out_regressions(tmp_path):
+    history = baselines.Baselines(str(tmp_path / 'baselines.json'))
+
+    for value in (10.0, 11.0, 9.0, 10.0, 11.0, 9.0):
+        _, deviating = history.check('app:4', {'bytes': value, 'operations': value}, threshold=3.0, runs=5)
+
+        assert deviating == []
+
+    # An occasional regression is reported, and never shifts the baseline towards it
+    baseline, deviating = history.check('app:4', {'bytes': 100.0, 'operations': 10.0}, threshold=3.0, runs=5)
+
+    assert [metric for metric, _, _, _ in deviating] == ['bytes']
+    assert baseline['bytes'].runs == 6
+
+    stats = baselines.Baselines(str(tmp_path / 'baselines.json')).get('app:4')
+
+    assert stats['bytes'].count == 6
+    assert stats['bytes'].mean == pytest.approx(10.0)
+    assert stats['operations'].count == 7
+
+    # The metrics that did not regress break the streak
+    _, deviating = history.check('app:4', {'bytes': 10.0, 'operations': 10.0}, threshold=3.0, runs=5)
+
+    assert deviating == []
+    assert history.get('app:4')['bytes'].regressed == []
+
+
+def test_check_rebaselines_lasting_changes(tmp_path):
+    history = baselines.Baselines(str(tmp_path / 'baselines.json'))
+
+    for value in (10.0, 11.0, 9.0, 10.0, 11.0, 9.0):
+        history.check('app:4', {'bytes': value}, threshold=3.0, runs=5)
+
+    # A lasting change is reported until it has as many runs as a new baseline needs
+    reported = [bool(history.check('app:4', {'bytes': value}, threshold=3.0, runs=5)[1]) for value in (100.0, 101.0, 99.0, 100.0, 101.0, 99.0, 100.0)]
+
+    assert reported == [True] * 5 + [False] * 2
+
+    stats = history.get('app:4')['bytes']
+
+    assert stats.runs == 7
+    assert stats.mean == pytest.approx(100.0)
+
+
+def test_check_only_reports_growth(tmp_path):
+    history = baselines.Baselines(str(tmp_path / 'baselines.json'))
+
+    for value in (10.0, 11.0, 9.0, 10.0, 11.0, 9.0):
+        history.check('app:4', {'metadata_time': value}, threshold=3.0, runs=5)
+
+    # Spending less time in metadata operations is no regression
+    _, deviating = history.check('app:4', {'metadata_time': 1.0}, threshold=3.0, runs=5)
+
+    assert deviating == []
+
+
+def test_runs_beyond_the_window(tmp_path):
+    history = baselines.Baselines(str(tmp_path / 'baselines.json'))
+
+    for _ in range(baselines.WINDOW + 10):
+        history.update('app:4', {'bytes': 1.0})
+
+    stats = history.get('app:4')['bytes']
+
+    assert stats.count == baselines.WINDOW
+    assert stats.runs == baselines.WINDOW + 10
+
+
+def add_runs(path):
+    for _ in range(5):
+        baselines.Baselines(path).update('app:4', {'bytes': 1.0})
+
+
+def test_concurrent_updates(tmp_path):
+    path = str(tmp_path / 'baselines.json')
+
+    processes = [multiprocessing.Process(target=add_runs, args=(path,)) for _ in range(4)]
+
+    for process in processes:
+        process.start()
+
+    for process in processes:
+        process.join()
+
+    # Each update re-reads the baselines under the lock, so none is lost
+    assert baselines.Baselines(path).get('app:4')['bytes'].count == 20
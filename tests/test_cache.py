@@ -0,0 +1,95 @@
+import os
+import shutil
+
+import pytest
+
+from drishti import cache
+
+
+def test_key(tmp_path):
+    log = tmp_path / 'job.darshan'
+    log.write_bytes(b'log')
+
+    other = tmp_path / 'other.darshan'
+    other.write_bytes(b'other log')
+
+    base = cache.key(str(log), {'SMALL_REQUESTS': 0.1}, '0.5', {'sample': None})
+
+    # Only the contents of the log matter, not its path
+    shutil.copy(log, tmp_path / 'copy.darshan')
+
+    assert cache.key(str(tmp_path / 'copy.darshan'), {'SMALL_REQUESTS': 0.1}, '0.5', {'sample': None}) == base
+
+    assert cache.key(str(other), {'SMALL_REQUESTS': 0.1}, '0.5', {'sample': None}) != base
+    assert cache.key(str(log), {'SMALL_REQUESTS': 0.2}, '0.5', {'sample': None}) != base
+    assert cache.key(str(log), {'SMALL_REQUESTS': 0.1}, '0.6', {'sample': None}) != base
+    assert cache.key(str(log), {'SMALL_REQUESTS': 0.1}, '0.5', {'sample': 100}) != base
+
+
+def test_get_put(tmp_path):
+    results = cache.ResultCache(str(tmp_path))
+
+    assert results.get('key') is None
+
+    results.put('key', {'insights': [1, 2]})
+
+    assert results.get('key') == {'insights': [1, 2]}
+
+
+def test_evict_least_recently_used(tmp_path):
+    results = cache.ResultCache(str(tmp_path), max_bytes=130)
+
+    results.put('old', {'value': 'x' * 40})
+    results.put('used', {'value': 'x' * 40})
+
+    os.utime(results.path('old'), (1, 1))
+    os.utime(results.path('used'), (2, 2))
+
+    # Using an entry makes it the most recent one
+    results.get('old')
+
+    results.put('new', {'value': 'x' * 40})
+
+    assert results.get('old') is not None
+    assert results.get('new') is not None
+    assert results.get('used') is None
+
+
+def test_evict_old(tmp_path):
+    results = cache.ResultCache(str(tmp_path), max_age=60)
+
+    results.put('old', {})
+
+    os.utime(results.path('old'), (1, 1))
+
+    results.put('new', {})
+
+    assert results.get('old') is None
+    assert results.get('new') == {}
+
+
+def entries(tmp_path):
+    directory = tmp_path / 'cache' / 'drishti' / 'results'
+
+    return list(directory.glob('*.json')) if directory.exists() else []
+
+
+def test_report_cached(drishti, parser_output, tmp_path):
+    sacct = tmp_path / 'sacct.txt'
+    sacct.write_text('JobID,JobIDRaw,NNodes,NCPUs\n1322696,1322696,4,128\n')
+
+    # darshan-parser output has no DXT traces, so the compute nodes come from the job information
+    result = drishti(parser_output, '--job-info', sacct, '--format', 'json')
+
+    assert result.returncode == 0, result.stderr
+    assert len(entries(tmp_path)) == 1
+
+
+def test_report_not_cached_after_failed_lookup(drishti, parser_output, tmp_path):
+    if shutil.which('sacct'):
+        pytest.skip('SLURM answers the compute nodes query')
+
+    result = drishti(parser_output, '--format', 'json')
+
+    assert result.returncode == 0, result.stderr
+    assert entries(tmp_path) == []
@@ -0,0 +1,183 @@
+import json
+import os
+import tarfile
+
+import pytest
+
+pytest.importorskip('darshan')
+
+
+def test_report(drishti, sample):
+    result = drishti(sample, '--no-cache')
+
+    assert result.returncode == 0, result.stderr
+    assert 'DRISHTI' in result.stdout
+    assert 'Traceback' not in result.stderr
+
+
+def test_report_json(drishti, sample, tmp_path):
+    result = drishti(sample, '--no-cache', '--format', 'json')
+
+    assert result.returncode == 0, result.stderr
+
+    # Warnings go to the standard error, so the standard output is a single JSON document
+    document = json.loads(result.stdout)
+
+    assert document['job'] == 1322696
+    assert document['partial'] is False
+    codes = {insight['code'] for insight in document['insights']}
+
+    # The aggregators (M08) and the DXT traces (D01) are analyzed last, so every stage ran
+    assert {'P01', 'M08', 'D01'} <= codes
+
+    # Counts in the details are printed as integers
+    variation = next(insight for insight in document['insights'] if insight['code'] == 'P24')
+
+    assert 'across 384 ranks' in variation['details'][0]
+
+    # The file is reported once with the distribution of its bytes, not again with its write and read imbalance
+    assert not {'P21', 'P22'} & codes
+
+    # Only the rich report shows the charts
+    assert not list(tmp_path.glob('graph*.png'))
+
+
+def test_errors_outside_the_document(drishti, sample, tmp_path):
+    config = tmp_path / 'thresholds.json'
+    config.write_text('{"small_requests": 2}')
+
+    result = drishti(sample, '--no-cache', '--format', 'json', '--config', config)
+
+    assert result.returncode == os.EX_CONFIG
+    assert result.stdout == ''
+    assert 'small_requests' in result.stderr
+
+
+def test_report_sample(drishti, sample):
+    result = drishti(sample, '--no-cache', '--format', 'json', '--sample', 100)
+
+    assert result.returncode == 0, result.stderr
+
+    document = json.loads(result.stdout)
+
+    # Only the ratio-based insights are estimated from a sample
+    assert all(insight['code'] in {'P05', 'P06', 'P07', 'P08', 'P11', 'P13', 'M02', 'M03'} for insight in document['insights'])
+
+
+def test_report_deadline(drishti, sample):
+    result = drishti(sample, '--no-cache', '--format', 'json', '--deadline', 0)
+
+    assert result.returncode == 0, result.stderr
+
+    document = json.loads(result.stdout)
+
+    # The budget starts before the log is read, so reading it uses all of a budget of zero
+    assert document['partial'] is True
+    assert document['stopped_by'] == 'deadline'
+    assert document['completed_stages'] == ['log']
+    assert document['insights'] == []
+
+
+@pytest.mark.parametrize('gate, code', [
+    ('HIGH', 4),
+    # Redundant traffic is counted exactly from the DXT traces, which the gate decodes when it checks it
+    ('WARN:P09', 3),
+    ('WARN:X99', 0)
+])
+def test_gate(drishti, sample, gate, code):
+    result = drishti(sample, '--no-cache', '--fail-on', gate)
+
+    assert result.returncode == code, result.stderr
+    assert 'Traceback' not in result.stderr
+
+    if gate == 'WARN:P09':
+        assert 'more than once' in result.stderr
+
+
+def test_gate_side_effects(drishti, sample, tmp_path):
+    result = drishti(sample, '--no-cache', '--fail-on', 'WARN:B01', '--baselines', tmp_path / 'baselines.json')
+
+    assert result.returncode == 0, result.stderr
+
+    # A gate only compares the run with its baseline, and draws no charts
+    assert not (tmp_path / 'baselines.json').exists()
+    assert not list(tmp_path.glob('graph*.png'))
+
+
+def test_gate_deadline(drishti, sample):
+    result = drishti(sample, '--no-cache', '--fail-on', 'WARN', '--deadline', 0)
+
+    assert result.returncode == 5
+    assert 'stopped by the deadline' in result.stderr
+
+
+def test_report_top(drishti, parser_output, tmp_path):
+    lines = parser_output.read_text().splitlines()
+
+    # A second file, accessed by the ranks as the file of the sample
+    copies = []
+
+    for line in lines:
+        fields = line.split('\t')
+
+        if fields[0] == 'POSIX':
+            fields[2] = str(int(fields[2]) + 1)
+            fields[5] = '{}.copy'.format(fields[5])
+
+            copies.append('\t'.join(fields))
+
+    log = tmp_path / 'copies.txt'
+    log.write_text('\n'.join(lines + copies) + '\n')
+
+    result = drishti(log, '--no-cache', '--top', 1)
+
+    assert result.returncode == 0, result.stderr
+    assert '... and 1 more files' in result.stdout
+
+    # The machine-readable outputs keep every file
+    result = drishti(log, '--no-cache', '--top', 1, '--format', 'json')
+
+    assert result.returncode == 0, result.stderr
+
+    variation = next(insight for insight in json.loads(result.stdout)['insights'] if insight['code'] == 'P24')
+
+    assert len(variation['details']) == 2
+
+
+@pytest.mark.parametrize('options', [['--deadline', 0], ['--sample', 100]])
+def test_sketch(drishti, sample, tmp_path, options):
+    result = drishti(sample, '--no-cache', '--format', 'json', '--sketch', tmp_path / 'sketch.json', *options)
+
+    assert result.returncode == 0, result.stderr
+
+    # The sketch is saved before the analysis can stop, and a sample is weighted back to the whole log
+    result = drishti('sketch', tmp_path / 'sketch.json', '--top', 1)
+
+    assert result.returncode == 0, result.stderr
+
+    summary = json.loads(result.stdout)
+
+    assert summary['logs'] == 1
+    assert list(summary['distinct_files'].values()) == [3]
+    assert len(summary['hottest_files']) == 1
+    assert summary['hottest_files'][0]['path'].endswith('8a_parallel_3Db_0000001.h5')
+
+
+def test_report_archive_member(drishti, sample, tmp_path):
+    archive = tmp_path / 'logs.tar.gz'
+
+    with tarfile.open(archive, 'w:gz') as f:
+        f.add(sample, arcname='app/job.darshan')
+
+    result = drishti('{}:app/job.darshan'.format(archive), '--no-cache', '--format', 'json')
+
+    assert result.returncode == 0, result.stderr
+
+    document = json.loads(result.stdout)
+
+    assert document['darshan'] == 'job.darshan'
+    assert document['job'] == 1322696
+
+    missing = drishti('{}:app/other.darshan'.format(archive), '--no-cache')
+
+    assert missing.returncode == os.EX_NOINPUT
@@ -0,0 +1,59 @@
+import pytest
+
+from drishti import deadline
+
+
+def test_no_budget():
+    budget = deadline.Deadline()
+
+    assert budget.remaining() == float('inf')
+    assert not budget.expired()
+
+    budget.checkpoint('first')
+
+    assert budget.completed == ['first']
+    assert budget.share(0.5).remaining() == float('inf')
+
+
+def test_checkpoint_after_the_budget():
+    budget = deadline.Deadline(0.0)
+
+    assert budget.expired()
+
+    with pytest.raises(deadline.DeadlineExceeded) as error:
+        budget.checkpoint('first')
+
+    # The stage that ran over the budget still completed
+    assert error.value.stage == 'first'
+    assert budget.completed == ['first']
+
+
+def test_share():
+    budget = deadline.Deadline(100.0)
+
+    share = budget.share(0.5)
+
+    assert share.remaining() == pytest.approx(50.0, abs=1.0)
+    assert budget.remaining() == pytest.approx(100.0, abs=1.0)
+
+
+def test_check():
+    class Stop(Exception):
+        pass
+
+    calls = []
+
+    def check():
+        calls.append(len(calls))
+
+        if len(calls) == 2:
+            raise Stop()
+
+    budget = deadline.Deadline(check=check)
+
+    budget.checkpoint('first')
+
+    with pytest.raises(Stop):
+        budget.checkpoint('second')
+
+    assert budget.completed == ['first', 'second']
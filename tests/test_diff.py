@@ -0,0 +1,64 @@
+import json
+import zipfile
+
+from drishti import diff
+
+
+def test_changes():
+    old = [('P05', '10 small read requests'), ('D01', 'DXT_POSIX random'), ('D01', 'DXT_MPIIO random')]
+    new = [('P05', '20 small read requests'), ('D01', 'DXT_MPIIO random'), ('P06', '5 small write requests')]
+
+    appeared, cleared = diff.changes(old, new)
+
+    # The same insight with other figures persisted, and each insight of a code is compared on its own
+    assert appeared == [('P06', '5 small write requests')]
+    assert cleared == [('D01', 'DXT_POSIX random')]
+
+
+def test_changes_same_code():
+    appeared, cleared = diff.changes([('D01', 'a')], [('D01', 'a'), ('D01', 'b')])
+
+    assert appeared == [('D01', 'b')]
+    assert cleared == []
+
+
+def test_variation():
+    assert diff.variation(0.5, 0.25) == '0.50 to 0.25'
+    assert diff.variation(float('nan'), 0.25) == '- to 0.25'
+
+
+def test_diff(drishti, parser_output, tmp_path):
+    result = drishti('diff', parser_output, parser_output, '--format', 'json', '--timeout', 300, '--top', 1)
+
+    assert result.returncode == 0, result.stderr
+
+    document = json.loads(result.stdout)
+
+    # The analyses of both logs leave no files in the working directory, nor results in the cache
+    assert not [path for path in tmp_path.iterdir() if path.is_file()]
+    assert not (tmp_path / 'cache' / 'drishti').exists()
+    assert len(document['files']) == len(document['ranks']) == 1
+
+    assert document['totals']['bytes_written']['delta'] == 0
+    assert document['totals']['bytes_written']['old'] > 0
+
+    # Both logs were analyzed, and have the same insights
+    assert document['appeared'] == []
+    assert document['cleared'] == []
+
+
+def test_diff_archive_member(drishti, parser_output, tmp_path):
+    archive = tmp_path / 'logs.zip'
+
+    with zipfile.ZipFile(archive, 'w') as f:
+        f.write(parser_output, 'old.txt')
+
+    result = drishti('diff', '{}:old.txt'.format(archive), parser_output, '--format', 'json', '--timeout', 300)
+
+    assert result.returncode == 0, result.stderr
+
+    document = json.loads(result.stdout)
+
+    assert document['old'] == 'logs.zip:old.txt'
+    assert document['totals']['bytes_written']['delta'] == 0
+    assert document['appeared'] == []
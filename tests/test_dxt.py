@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from drishti import dxt
+
+
+def segments(offsets, lengths):
+    result = np.zeros(len(offsets), dtype=dxt.SEGMENT)
+    result['offset'] = offsets
+    result['length'] = lengths
+
+    return result
+
+
+def ranges(*pairs):
+    return np.array([start for start, _ in pairs], dtype=np.int64), np.array([end for _, end in pairs], dtype=np.int64)
+
+
+def test_union():
+    starts, ends = dxt.union(*ranges((50, 60), (0, 10), (10, 20), (5, 15), (70, 80), (55, 75)))
+
+    assert starts.tolist() == [0, 50]
+    assert ends.tolist() == [20, 80]
+
+
+def test_union_empty():
+    starts, ends = dxt.union(*ranges())
+
+    assert len(starts) == 0 and len(ends) == 0
+
+
+def test_coverage():
+    starts, ends, depth = dxt.coverage(*ranges((0, 100), (50, 150), (200, 300)))
+
+    assert starts.tolist() == [0, 50, 100, 200]
+    assert ends.tolist() == [50, 100, 150, 300]
+    assert depth.tolist() == [1, 2, 1, 1]
+
+
+def test_redundancy():
+    assert dxt.redundancy(*ranges((0, 100), (50, 150))) == (150, (50, 100, 2))
+    assert dxt.redundancy(*ranges((0, 100), (100, 200))) == (200, (0, 0, 1))
+    assert dxt.redundancy(*ranges()) == (0, (0, 0, 0))
+
+
+def test_redundancy_abutting_ranges():
+    # The ranges that open and close at 100 leave no zero-width piece between two pieces of the same depth
+    assert dxt.redundancy(*ranges((0, 100), (50, 150), (100, 200), (0, 10))) == (200, (50, 150, 2))
+
+
+def test_redundancy_of_profile():
+    starts, ends = ranges((0, 100), (50, 150), (100, 200), (0, 10), (120, 130))
+
+    profile = dxt.coverage(starts[:3], ends[:3])
+
+    # Folding more ranges into a coverage profile is the same as measuring all of them at once
+    folded = dxt.redundancy(
+        np.concatenate([profile[0], starts[3:]]),
+        np.concatenate([profile[1], ends[3:]]),
+        np.concatenate([profile[2], np.ones(2, dtype=np.int64)])
+    )
+
+    assert folded == dxt.redundancy(starts, ends)
+
+
+def test_accumulate_compacts(monkeypatch):
+    monkeypatch.setattr(dxt, 'COMPACT_RANGES', 8)
+
+    generator = np.random.default_rng(0)
+
+    accumulated = {'starts': [], 'ends': [], 'weights': [], 'count': 0, 'compacted': 0}
+    every_start, every_end = [], []
+
+    for rank in range(64):
+        starts = generator.integers(0, 1000, 10)
+        ends = starts + generator.integers(1, 50, 10)
+
+        starts, ends = dxt.union(starts, ends)
+
+        dxt._accumulate(accumulated, starts, ends)
+
+        every_start.append(starts)
+        every_end.append(ends)
+
+    # The re-accessed ranges were folded into a profile, which only depends on the 1000 bytes of the file
+    assert accumulated['count'] < 2 * 1000
+
+    assert dxt.redundancy(
+        np.concatenate(accumulated['starts']), np.concatenate(accumulated['ends']), np.concatenate(accumulated['weights'])
+    ) == dxt.redundancy(np.concatenate(every_start), np.concatenate(every_end))
+
+
+@pytest.mark.parametrize('offsets, lengths, expected', [
+    ([0, 10, 20, 30], [10, 10, 10, 10], (3, 0, 0, 0)),
+    ([0, 100, 200, 300, 400], [10, 10, 10, 10, 10], (0, 3, 1, 0)),
+    ([400, 300, 200, 100], [10, 10, 10, 10], (0, 2, 0, 1)),
+    ([0, 500, 20, 900], [10, 10, 10, 10], (0, 0, 2, 1)),
+    ([0], [10], (0, 0, 0, 0))
+])
+def test_access_pattern(offsets, lengths, expected):
+    assert dxt.access_pattern(segments(offsets, lengths)) == expected
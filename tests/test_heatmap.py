@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from drishti import heatmap
+
+
+class Heatmap:
+    """
+    Stand-in for the heatmaps of a DarshanReport, with the same to_df().
+    """
+
+    def __init__(self, width, read, write):
+        self.width = width
+        self.data = {'read': read, 'write': write}
+
+    def to_df(self, ops, interval_index=True):
+        bins = len(next(iter(self.data['read'].values())))
+
+        if interval_index:
+            columns = pd.IntervalIndex.from_breaks(np.linspace(0, bins * self.width, bins + 1))
+        else:
+            columns = np.arange(bins)
+
+        return sum(pd.DataFrame.from_dict(self.data[op], orient='index', columns=columns) for op in ops)
+
+
+def test_analyze():
+    read = {
+        0: [0, 0, 10, 0, 0, 0, 10, 0],
+        1: [0, 0, 10, 0, 0, 0, 90, 0]
+    }
+    write = {
+        0: [0, 0, 0, 0, 0, 0, 0, 0],
+        1: [0, 0, 0, 0, 0, 0, 0, 0]
+    }
+
+    intensity = heatmap.analyze(Heatmap(0.5, read, write), skew=0.5)
+
+    assert intensity['bin_width'] == 0.5
+
+    # The window spans from the first to the last bin with I/O
+    assert intensity['start'] == 1.0
+    assert intensity['end'] == 3.5
+    assert intensity['bins'] == 5
+    assert intensity['bytes'].tolist() == [20, 0, 0, 0, 100]
+
+    assert intensity['burstiness'] == 100 / 24
+    assert intensity['idle_bins'] == 3
+    assert intensity['longest_idle'] == 1.5
+
+    assert intensity['skewed_bins'] == 1
+    assert intensity['skewed_ranks'].tolist() == [1]
+
+
+def test_analyze_without_io():
+    idle = {0: [0, 0, 0]}
+
+    assert heatmap.analyze(Heatmap(1.0, idle, idle), skew=0.5) is None
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from drishti import imbalance
+
+
+def frames(records):
+    """
+    POSIX counters and fcounters of (id, rank, bytes, time, variance of the bytes) records.
+    """
+    counters = pd.DataFrame({
+        'id': np.array([id for id, _, _, _, _ in records], dtype=np.uint64),
+        'rank': [rank for _, rank, _, _, _ in records],
+        'POSIX_BYTES_READ': [transferred for _, _, transferred, _, _ in records],
+        'POSIX_BYTES_WRITTEN': 0
+    })
+
+    fcounters = pd.DataFrame({
+        'id': counters['id'],
+        'rank': counters['rank'],
+        'POSIX_F_READ_TIME': [time for _, _, _, time, _ in records],
+        'POSIX_F_WRITE_TIME': 0.0,
+        'POSIX_F_META_TIME': 0.0,
+        'POSIX_F_VARIANCE_RANK_BYTES': [variance for _, _, _, _, variance in records],
+        'POSIX_F_VARIANCE_RANK_TIME': 0.0
+    })
+
+    return counters, fcounters
+
+
+def test_distribution():
+    values = [10.0, 0.0, 30.0, 20.0, 40.0]
+
+    counters, fcounters = frames(
+        [(1, rank, value, 1.0, 0.0) for rank, value in enumerate(values)] + [(2, 0, 7.0, 2.0, 0.0)]
+    )
+
+    result = imbalance.distribution(counters, fcounters, 8)
+
+    first = result.loc[1]
+
+    assert first['ranks'] == 5
+    assert first['bytes_p50'] == np.percentile(values, 50)
+    assert first['bytes_p90'] == pytest.approx(np.percentile(values, 90))
+    assert first['bytes_cv'] == pytest.approx(np.std(values) / np.mean(values))
+
+    ordered = np.sort(values)
+    gini = ((2 * np.arange(1, 6) - 5 - 1) * ordered).sum() / (5 * ordered.sum())
+
+    assert first['bytes_gini'] == pytest.approx(gini)
+
+    # The same time on every rank, and a single rank, do not vary
+    assert first['time_cv'] == 0.0
+    assert first['time_gini'] == 0.0
+    assert result.loc[2, 'bytes_cv'] == 0.0
+
+
+def test_distribution_shared():
+    counters, fcounters = frames([(3, -1, 800.0, 4.0, 400.0)])
+
+    result = imbalance.distribution(counters, fcounters, 8)
+
+    # Shared records only have the variance across ranks, around the mean of all ranks
+    assert result.loc[3, 'ranks'] == 8
+    assert result.loc[3, 'bytes_cv'] == pytest.approx(np.sqrt(400.0) / 100.0)
+    assert np.isnan(result.loc[3, 'bytes_p50'])
+    assert np.isnan(result.loc[3, 'bytes_gini'])
+
+
+def test_distribution_empty():
+    counters, fcounters = frames([])
+
+    assert imbalance.distribution(counters, fcounters, 8).empty
@@ -0,0 +1,13 @@
+from drishti.insights import Insight
+
+
+def test_files():
+    insight = Insight(
+        'P05', 0, 1, 'Small requests', [],
+        [{'id': 7, 'message': '{} in "{}"', 'values': (1,)}, {'message': 'Overall'}],
+        {}
+    )
+
+    # Details that are not about a file are left out
+    assert insight.files == [7]
+    assert not hasattr(insight, '__dict__')
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from drishti import jobs
+
+
+SACCT = '''JobID,JobIDRaw,NNodes,NCPUs
+1322696,1322696,4,128
+1322696.batch,1322696.batch,1,32
+1322697,1322697,2,64
+'''
+
+
+class Recorder(jobs.Provider):
+    """
+    Provider that answers from a dictionary, or fails, and records the job ids it was asked for.
+    """
+
+    name = 'recorder'
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def lookup(self, jobids):
+        self.calls.append(list(jobids))
+
+        if self.answers is None:
+            return None
+
+        return {jobid: self.answers[jobid] for jobid in jobids if jobid in self.answers}
+
+
+def test_parse(tmp_path):
+    path = tmp_path / 'sacct.txt'
+    path.write_text(SACCT)
+
+    found = jobs.FileProvider(str(path)).lookup([1322696, 1322697, 1])
+
+    assert found == {'1322696': {'nodes': 4, 'cpus': 128}, '1322697': {'nodes': 2, 'cpus': 64}}
+
+
+def test_missing_file(tmp_path):
+    assert jobs.FileProvider(str(tmp_path / 'missing.txt')).lookup([1]) is None
+
+
+def test_provider_is_abstract():
+    with pytest.raises(TypeError):
+        jobs.Provider()
+
+
+def test_cache_batches_and_keeps_answers(tmp_path):
+    path = str(tmp_path / 'jobs.json')
+
+    provider = Recorder({'1': {'nodes': 4, 'cpus': 128}})
+
+    assert jobs.CachedProvider(provider, path).lookup([1, 2]) == {'1': {'nodes': 4, 'cpus': 128}}
+
+    # Both job ids were asked in one lookup, and the answer is kept across instances
+    assert provider.calls == [['1', '2']]
+    assert jobs.CachedProvider(provider, path).lookup([1]) == {'1': {'nodes': 4, 'cpus': 128}}
+    assert provider.calls == [['1', '2']]
+
+
+def test_cache_expires_unknown_jobs(tmp_path, monkeypatch):
+    path = str(tmp_path / 'jobs.json')
+
+    provider = Recorder({})
+
+    jobs.CachedProvider(provider, path, negative_ttl=60).lookup([2])
+    jobs.CachedProvider(provider, path, negative_ttl=60).lookup([2])
+
+    assert provider.calls == [['2']]
+
+    now = jobs.time.time()
+    monkeypatch.setattr(jobs.time, 'time', lambda: now + 61)
+
+    jobs.CachedProvider(provider, path, negative_ttl=60).lookup([2])
+
+    assert provider.calls == [['2'], ['2']]
+
+
+def test_cache_skips_failures(tmp_path):
+    path = str(tmp_path / 'jobs.json')
+
+    failing = Recorder(None)
+
+    assert jobs.CachedProvider(failing, path).lookup([1]) is None
+
+    # A failed lookup is asked again, instead of becoming an unknown job
+    answering = Recorder({'1': {'nodes': 4, 'cpus': 128}})
+
+    assert jobs.CachedProvider(answering, path).lookup([1]) == {'1': {'nodes': 4, 'cpus': 128}}
+
+
+def test_cache_keeps_providers_apart(tmp_path):
+    path = str(tmp_path / 'jobs.json')
+
+    jobs.CachedProvider(Recorder({'1': {'nodes': 4, 'cpus': 128}}), path).lookup([1])
+
+    other = Recorder({'1': {'nodes': 8, 'cpus': 256}})
+    other.name = 'other'
+
+    assert jobs.CachedProvider(other, path).lookup([1]) == {'1': {'nodes': 8, 'cpus': 256}}
+
+    with open(path) as f:
+        assert set(json.load(f)) == {'recorder', 'other'}
+
+
+def test_provider(tmp_path):
+    assert isinstance(jobs.provider(str(tmp_path / 'sacct.txt')), jobs.FileProvider)
+    assert isinstance(jobs.provider(timeout=1).provider, jobs.SlurmProvider)
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from drishti import layers
+
+
+def test_amplification():
+    mpiio = pd.DataFrame({
+        'id': [1, 1, 2],
+        'MPIIO_INDEP_READS': [0, 0, 2],
+        'MPIIO_COLL_READS': [5, 5, 0],
+        'MPIIO_SPLIT_READS': [0, 0, 0],
+        'MPIIO_NB_READS': [0, 0, 0],
+        'MPIIO_BYTES_READ': [500, 500, 20],
+        'MPIIO_INDEP_WRITES': [0, 0, 0],
+        'MPIIO_COLL_WRITES': [0, 0, 0],
+        'MPIIO_SPLIT_WRITES': [0, 0, 0],
+        'MPIIO_NB_WRITES': [0, 0, 0],
+        'MPIIO_BYTES_WRITTEN': [0, 0, 0]
+    })
+
+    posix = pd.DataFrame({
+        'id': [1, 2, 3],
+        'POSIX_READS': [40, 2, 7],
+        'POSIX_BYTES_READ': [2000, 20, 70],
+        'POSIX_WRITES': [0, 0, 1],
+        'POSIX_BYTES_WRITTEN': [0, 0, 10]
+    })
+
+    result = layers.amplification(mpiio, posix)
+
+    # Files only accessed through POSIX are left out, the ranks of a file are added up
+    assert result.index.tolist() == [1, 2]
+
+    assert result.loc[1, 'mpiio_read_requests'] == 10
+    assert result.loc[1, 'mpiio_read_collective'] == 10
+    assert result.loc[1, 'read_request_amplification'] == pytest.approx(4.0)
+    assert result.loc[1, 'read_byte_amplification'] == pytest.approx(2.0)
+    assert result.loc[2, 'read_request_amplification'] == pytest.approx(1.0)
+
+    # Without MPI-IO requests there is nothing to amplify
+    assert result.loc[1, 'write_request_amplification'] == 0.0
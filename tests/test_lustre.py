@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from drishti import lustre
+
+
+MB = 1024 ** 2
+
+
+def striped():
+    striping = pd.DataFrame({
+        'id': [1, 1, 2, 3],
+        'LUSTRE_OSTS': [16, 16, 16, 16],
+        'LUSTRE_STRIPE_SIZE': [MB, MB, MB, 4 * MB],
+        'LUSTRE_STRIPE_WIDTH': [2, 2, 1, 4],
+        'ost_ids': [np.array([0, 1]), np.array([0, 1]), np.array([1]), np.array([0, 1, 2, 3])]
+    })
+
+    posix = pd.DataFrame({
+        'id': [1, 2, 2, 2, 4],
+        'rank': [-1, 0, 1, 2, 0],
+        'POSIX_BYTES_READ': [800, 100, 100, 100, 5],
+        'POSIX_BYTES_WRITTEN': [0, 0, 0, 100, 0],
+        'POSIX_ACCESS1_ACCESS': [4 * MB, 3 * MB, 3 * MB, 512 * 1024, 10],
+        'POSIX_ACCESS1_COUNT': [10, 5, 5, 20, 1]
+    })
+
+    return lustre.files(striping, posix, 64)
+
+
+def test_files():
+    result = striped()
+
+    # Files without a POSIX record or without striping are left out
+    assert result.index.tolist() == [1, 2]
+    assert result['bytes'].tolist() == [800, 400]
+    assert result['ranks'].tolist() == [64, 3]
+
+    # The access size of the record with the most accesses
+    assert result['request_size'].tolist() == [4 * MB, 512 * 1024]
+
+
+def test_ost_load():
+    load = lustre.ost_load(striped())
+
+    assert load.to_dict() == {0: 400.0, 1: 800.0}
+
+
+def test_misfit_and_understriped():
+    result = striped()
+
+    # Requests of 1.5 MB cross the boundaries of 1 MB stripes, requests of 4 MB do not
+    result.loc[2, 'request_size'] = 3 * MB // 2
+
+    assert lustre.misfit(result).index.tolist() == [2]
+    assert lustre.understriped(result, 8).index.tolist() == [1]
+    assert lustre.understriped(result, 64).empty
+
+
+def test_ost_load_without_osts():
+    files = pd.DataFrame({'ost_ids': [np.array([], dtype=np.int64)], 'bytes': [10]})
+
+    assert lustre.ost_load(files).empty
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+from drishti import nodes
+
+
+def test_per_node():
+    counters = pd.DataFrame({
+        'rank': [0, 1, 2, -1, 5],
+        'POSIX_BYTES_READ': [100, 0, 50, 1000, 10],
+        'POSIX_BYTES_WRITTEN': [0, 200, 0, 0, 0]
+    })
+
+    fcounters = pd.DataFrame({
+        'rank': counters['rank'],
+        'POSIX_F_READ_TIME': [1.0, 0.0, 0.5, 10.0, 0.1],
+        'POSIX_F_WRITE_TIME': [0.0, 2.0, 0.0, 0.0, 0.0],
+        'POSIX_F_META_TIME': [0.5, 0.0, 0.0, 0.0, 0.0]
+    })
+
+    hosts = {0: 'a', 1: 'a', 2: 'b', 3: 'c'}
+
+    result = nodes.per_node(counters, fcounters, hosts)
+
+    # Shared records and ranks without a hostname are left out, nodes without I/O are kept
+    assert result['bytes'].to_dict() == {'a': 300.0, 'b': 50.0, 'c': 0.0}
+    assert result['time'].to_dict() == {'a': 3.5, 'b': 0.5, 'c': 0.0}
+    assert result['ranks'].to_dict() == {'a': 2, 'b': 1, 'c': 1}
+    assert result['ranks'].dtype == np.int64
@@ -0,0 +1,104 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from drishti.parallel import aggregate_by_id
+
+
+INTEGER = {
+    'rank': ['nunique'],
+    'POSIX_BYTES_WRITTEN': ['sum', 'min', 'max']
+}
+
+MIXED = {
+    'rank': ['nunique'],
+    'POSIX_WRITES': ['sum', 'min', 'max'],
+    'POSIX_F_WRITE_TIME': ['sum', 'max']
+}
+
+
+def records():
+    generator = np.random.default_rng(0)
+
+    size = 1000
+
+    return pd.DataFrame({
+        'id': generator.integers(0, 20, size).astype(np.uint64) + np.uint64(2 ** 63),
+        'rank': generator.integers(-1, 64, size),
+        # Beyond the integers that a float64 represents exactly
+        'POSIX_BYTES_WRITTEN': generator.integers(0, 2 ** 10, size) + 2 ** 53,
+        'POSIX_WRITES': generator.integers(0, 2 ** 10, size),
+        'POSIX_F_WRITE_TIME': generator.random(size)
+    })
+
+
+def by_id(df, aggregations, workers):
+    return aggregate_by_id(df, aggregations, workers=workers).sort_values('id_').reset_index(drop=True)
+
+
+@pytest.mark.parametrize('aggregations', [INTEGER, MIXED])
+def test_workers_match_pandas(aggregations):
+    df = records()
+
+    serial = by_id(df, aggregations, 1)
+    parallel = by_id(df, aggregations, 4)
+
+    assert list(parallel.columns) == list(serial.columns)
+
+    for column in serial.columns:
+        assert parallel[column].dtype == serial[column].dtype, column
+
+        if serial[column].dtype.kind == 'f':
+            np.testing.assert_allclose(parallel[column], serial[column])
+        else:
+            np.testing.assert_array_equal(parallel[column], serial[column])
+
+
+def test_few_records_use_pandas():
+    df = records().head(3)
+
+    aggregated = aggregate_by_id(df, INTEGER, workers=4)
+
+    assert aggregated['POSIX_BYTES_WRITTEN_sum'].sum() == df['POSIX_BYTES_WRITTEN'].sum()
+
+
+@pytest.mark.parametrize('aggregations', [{'rank': ['nunique']}, {'POSIX_WRITES': ['min']}])
+def test_single_reduction(aggregations):
+    df = records()
+
+    pd.testing.assert_frame_equal(by_id(df, aggregations, 4), by_id(df, aggregations, 1))
+
+
+def test_speedup():
+    generator = np.random.default_rng(0)
+
+    size = 2000000
+
+    df = pd.DataFrame({
+        'id': generator.integers(0, 100000, size).astype(np.uint64),
+        'rank': generator.integers(0, 400, size),
+        'POSIX_BYTES_WRITTEN': generator.integers(0, 2 ** 30, size),
+        'POSIX_BYTES_READ': generator.integers(0, 2 ** 30, size)
+    })
+
+    aggregations = {
+        'rank': ['nunique'],
+        'POSIX_BYTES_WRITTEN': ['sum', 'min', 'max'],
+        'POSIX_BYTES_READ': ['sum', 'min', 'max']
+    }
+
+    def elapsed(workers):
+        start = time.perf_counter()
+
+        aggregate_by_id(df, aggregations, workers=workers)
+
+        return time.perf_counter() - start
+
+    serial = min(elapsed(1) for _ in range(2))
+    parallel = min(elapsed(4) for _ in range(2))
+
+    # On a single core the shards run one after the other, and still do no more work than pandas
+    assert parallel < serial * (1.25 if (os.cpu_count() or 1) == 1 else 0.8)
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from drishti.paths import PathTrie
+
+
+NAMES = {
+    1: '/scratch/run/out/a.h5',
+    2: '/scratch/run/out/b.h5',
+    3: '/scratch/run/input.nc',
+    18446744073709551615: '/home/user/.bashrc'
+}
+
+
+def test_lookup():
+    trie = PathTrie(NAMES)
+
+    assert len(trie) == 4
+    assert 2 in trie
+    assert 4 not in trie
+    assert trie[18446744073709551615] == '/home/user/.bashrc'
+    assert dict(trie.items()) == NAMES
+
+    with pytest.raises(KeyError):
+        trie[4]
+
+    assert trie.contains(pd.Index([2, 4, 18446744073709551615], dtype=np.uint64)).tolist() == [True, False, True]
+
+
+def test_rollup():
+    trie = PathTrie(NAMES)
+
+    totals = trie.rollup([1, 2, 3], [10, 20, 5])
+
+    # Single-child chains are merged, so /scratch/run is one node below the root
+    assert sorted(
+        (trie.path(node), total) for node, total in enumerate(totals) if total
+    ) == [('', 35.0), ('/scratch/run', 35.0), ('/scratch/run/input.nc', 5.0), ('/scratch/run/out', 30.0),
+          ('/scratch/run/out/a.h5', 10.0), ('/scratch/run/out/b.h5', 20.0)]
+
+
+def test_dominant():
+    trie = PathTrie(NAMES)
+
+    # The deepest directory with enough of the total
+    assert trie.dominant([1, 2, 3], [10, 20, 5], 0.8) == ('/scratch/run/out', pytest.approx(30 / 35))
+    assert trie.dominant([1, 2, 3], [10, 20, 5], 0.9) == ('/scratch/run', 1.0)
+
+    # A directory with only one file that matters is not dominant
+    assert trie.dominant([1, 2, 3], [10, 0, 0], 0.5) is None
+    assert trie.dominant([1, 2], [0, 0], 0.5) is None
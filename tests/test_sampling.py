@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from drishti import sampling
+
+
+def records(count, ranks, seed=1):
+    generator = np.random.default_rng(seed)
+
+    for index in range(count):
+        yield {
+            'id': index % 7,
+            'rank': index % ranks,
+            'counters': generator.integers(0, 100, 3),
+            'fcounters': generator.random(2)
+        }
+
+
+def test_reservoir_stratified():
+    sampled, strata, population, sizes, ids = sampling.reservoir(records(1000, 50), 20)
+
+    # The smallest keys, plus two records of every rank
+    assert 100 <= len(sampled) <= 120
+    assert sizes.min() >= 2
+    assert set(record['rank'] for record in sampled) == set(range(50))
+
+    assert population.tolist() == [20] * 50
+    assert sizes.sum() == len(sampled)
+    assert np.bincount(strata, minlength=50).tolist() == sizes.tolist()
+    assert ids == set(range(7))
+
+
+def test_reservoir_uniform():
+    sampled, strata, population, sizes, _ = sampling.reservoir(records(1000, 50), 20, by='uniform')
+
+    assert len(sampled) == 20
+    assert population.tolist() == [1000]
+    assert sizes.tolist() == [20]
+    assert strata.tolist() == [0] * 20
+
+
+def test_reservoir_small_module():
+    sampled, _, population, sizes, _ = sampling.reservoir(records(10, 2), 100)
+
+    assert len(sampled) == 10
+    assert population.tolist() == sizes.tolist() == [5, 5]
+
+
+def test_reservoir_is_random_within_strata():
+    # Every record is as likely to be picked, whatever its position in the log
+    picked = np.zeros(100)
+
+    for seed in range(300):
+        sampled, *_ = sampling.reservoir(({'id': index, 'rank': 0} for index in range(100)), 10, seed=seed)
+
+        for record in sampled:
+            picked[record['id']] += 1
+
+    assert picked.sum() == 3000
+    assert picked.min() > 10 and picked.max() < 60
+
+
+def test_estimates():
+    generator = np.random.default_rng(0)
+
+    size = 20000
+
+    reads = generator.integers(1, 100, size)
+    small = generator.binomial(reads, 0.3)
+
+    counters = pd.DataFrame({
+        'rank': np.arange(size) % 16,
+        'id': np.arange(size),
+        'POSIX_READS': reads,
+        'POSIX_WRITES': reads,
+        'POSIX_SEQ_READS': reads,
+        'POSIX_SEQ_WRITES': reads,
+        'POSIX_MEM_NOT_ALIGNED': 0,
+        'POSIX_FILE_NOT_ALIGNED': 0
+    })
+
+    for operation in ('READ', 'WRITE'):
+        for bin in sampling.SMALL_BINS:
+            counters['POSIX_SIZE_{}_{}'.format(operation, bin)] = 0
+
+    counters['POSIX_SIZE_READ_0_100'] = small
+
+    posix = sampling.Sample.from_df({'counters': counters, 'fcounters': counters[['rank', 'id']]}, 2000)
+
+    estimate, low, high, total, sampled, population = sampling.estimates(posix, None)['small_reads']
+
+    truth = small.sum() / reads.sum()
+
+    assert low <= truth <= high
+    assert estimate == pytest.approx(truth, abs=0.02)
+    assert population == size
+    assert len(posix.ids) == size
+
+
+@pytest.mark.parametrize('method', ['sample', 'reservoir'])
+def test_ratio_coverage(method):
+    # Ranks with very different ratios, sampled with fewer records than ranks
+    generator = np.random.default_rng(5)
+
+    rank = np.repeat(np.arange(100), 20)
+    denominator = generator.integers(1, 100, len(rank))
+    numerator = generator.binomial(denominator, generator.random(100)[rank])
+
+    truth = numerator.sum() / denominator.sum()
+
+    counters = pd.DataFrame({'rank': rank, 'id': np.arange(len(rank)), 'numerator': numerator, 'denominator': denominator})
+
+    covered = 0
+
+    for seed in range(200):
+        if method == 'sample':
+            sampled, strata, population, sizes = sampling.sample({'counters': counters, 'fcounters': counters}, 50, seed=seed)
+
+            values = sampled['counters'][['numerator', 'denominator']].to_numpy().T
+        else:
+            sampled, strata, population, sizes, _ = sampling.reservoir((
+                {'id': index, 'rank': rank[index], 'counters': np.array([numerator[index], denominator[index]])}
+                for index in range(len(rank))
+            ), 50, seed=seed)
+
+            values = np.array([record['counters'] for record in sampled]).T
+
+        _, low, high, _ = sampling.ratio(values[0], values[1], strata, population, sizes)
+
+        covered += low <= truth <= high
+
+    # Close to the 95% of the intervals
+    assert covered / 200 >= 0.9
+
+
+def test_from_log(sample):
+    darshan = pytest.importorskip('darshan')
+
+    posix = sampling.Sample.from_log(sample, 'POSIX', 50)
+
+    report = darshan.DarshanReport(sample, read_all=False)
+    report.mod_read_all_records('POSIX')
+
+    df = report.records['POSIX'].to_df()
+
+    for kind in ('counters', 'fcounters'):
+        assert list(posix.to_df()[kind].columns) == list(df[kind].columns)
+        assert posix.to_df()[kind].drop(columns='id').dtypes.tolist() == df[kind].drop(columns='id').dtypes.tolist()
+        assert posix.to_df()[kind]['id'].dtype == np.uint64
+
+    assert posix.population.sum() == len(df['counters'])
+    assert posix.ids == set(df['counters']['id'])
+
+    # Each sampled record is one of the log, with all its counters
+    merged = posix.counters.merge(df['counters'], how='left', indicator=True)
+
+    assert (merged['_merge'] == 'both').all()
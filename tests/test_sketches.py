@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from drishti import sketches
+
+
+def test_hyperloglog():
+    first = sketches.HyperLogLog()
+    second = sketches.HyperLogLog()
+
+    first.add(np.arange(0, 60000, dtype=np.uint64))
+    second.add(np.arange(40000, 100000, dtype=np.uint64))
+
+    # Keys in both sketches are counted once
+    first.merge(second)
+
+    assert first.count() == pytest.approx(100000, rel=0.05)
+
+    small = sketches.HyperLogLog()
+    small.add(np.array([1, 2, 3, 3], dtype=np.uint64))
+
+    assert small.count() == 3
+
+
+def test_ddsketch():
+    values = np.arange(1, 10001, dtype=np.float64)
+
+    sketch = sketches.DDSketch()
+    sketch.add(values[:5000])
+
+    other = sketches.DDSketch()
+    other.add(values[5000:])
+    other.add([0.0, 0.0])
+
+    sketch.merge(other)
+
+    assert sketch.count() == 10002
+    assert sketch.quantile(0.0) == 0.0
+
+    for q in (0.5, 0.9, 0.99):
+        assert sketch.quantile(q) == pytest.approx(np.quantile(values, q), rel=0.02)
+
+    assert sketches.DDSketch().quantile(0.5) is None
+
+
+def test_countmin():
+    sketch = sketches.CountMin()
+
+    sketch.add(np.array([1, 2, 1], dtype=np.uint64), [10.0, 5.0, 20.0])
+
+    # With so few keys no column collides in every row, so the estimates are exact
+    assert sketch.estimate(np.array([1, 2, 3], dtype=np.uint64)).tolist() == [30.0, 5.0, 0.0]
+
+
+def test_fleet(tmp_path):
+    counters = pd.DataFrame({
+        'id': np.array([1, 2, 2], dtype=np.uint64),
+        'POSIX_BYTES_READ': [100, 0, 50],
+        'POSIX_BYTES_WRITTEN': [0, 10, 0]
+    })
+
+    for slot in range(1, 5):
+        counters['POSIX_ACCESS{}_ACCESS'.format(slot)] = 1024 if slot == 1 else 0
+        counters['POSIX_ACCESS{}_COUNT'.format(slot)] = 4 if slot == 1 else 0
+
+    fcounters = pd.DataFrame({
+        'POSIX_F_READ_TIME': [1.0, 0.0, 2.0],
+        'POSIX_F_WRITE_TIME': [0.0, 0.5, 0.0],
+        'POSIX_F_META_TIME': [0.0, 0.0, 0.0]
+    })
+
+    fleet = sketches.Fleet()
+    fleet.add('app', counters, fcounters, {1: '/data/first', 2: '/data/second'})
+    fleet.save(tmp_path / 'first.json')
+
+    merged = sketches.Fleet()
+    merged.merge(sketches.Fleet.load(tmp_path / 'first.json'))
+    merged.merge(fleet)
+
+    assert merged.logs == 2
+    assert merged.paths['app'].count() == 2
+    assert merged.sizes.quantile(0.5) == pytest.approx(1024, rel=0.02)
+    assert merged.hotness.estimate(np.array([2], dtype=np.uint64))[0] >= 120.0
+    assert merged.hot(1) == [('/data/first', pytest.approx(200.0))]
+
+
+def records(count):
+    generator = np.random.default_rng(0)
+
+    counters = pd.DataFrame({
+        'id': generator.integers(0, 50, count).astype(np.uint64),
+        'POSIX_BYTES_READ': generator.integers(0, 1000, count),
+        'POSIX_BYTES_WRITTEN': 0
+    })
+
+    for slot in range(1, 5):
+        counters['POSIX_ACCESS{}_ACCESS'.format(slot)] = generator.integers(1, 1 << 20, count)
+        counters['POSIX_ACCESS{}_COUNT'.format(slot)] = 1
+
+    fcounters = pd.DataFrame({
+        'POSIX_F_READ_TIME': generator.random(count),
+        'POSIX_F_WRITE_TIME': 0.0,
+        'POSIX_F_META_TIME': 0.0
+    })
+
+    return counters, fcounters
+
+
+def test_fleet_weights():
+    counters, fcounters = records(1000)
+
+    full = sketches.Fleet()
+    full.add('app', counters, fcounters, {})
+
+    # One record in ten, standing for ten records each
+    sampled = sketches.Fleet()
+    sampled.add('app', counters.iloc[::10], fcounters.iloc[::10], {}, np.full(100, 10.0), counters['id'].unique())
+
+    assert sampled.paths['app'].count() == full.paths['app'].count()
+    assert sampled.sizes.count() == full.sizes.count()
+    assert sampled.times.count() == full.times.count()
+    assert sampled.hotness.table.sum() == pytest.approx(full.hotness.table.sum(), rel=0.1)
+
+
+def test_fleet_prunes_candidates(monkeypatch):
+    monkeypatch.setattr(sketches, 'HOTTEST', 5)
+
+    counters, fcounters = records(1000)
+
+    fleet = sketches.Fleet()
+    fleet.add('app', counters, fcounters, {id: '/data/{}'.format(id) for id in range(50)})
+
+    totals = counters.groupby('id')['POSIX_BYTES_READ'].sum().sort_values(ascending=False)
+
+    assert len(fleet.hottest) == 5
+    assert [path for path, _ in fleet.hot(3)] == ['/data/{}'.format(id) for id in totals.index[:3]]
@@ -0,0 +1,29 @@
+from rich.console import Console
+
+from drishti import snippets
+
+
+def test_load():
+    snippet = snippets.load('mpi-io-hints.bash')
+
+    # Loaded once per process
+    assert snippets.load('mpi-io-hints.bash') is snippet
+    assert 'cb_nodes' in snippet.code
+
+
+def test_highlight_once():
+    snippet = snippets.load('lustre-striping.bash')
+
+    first = snippet.highlight(snippet.code)
+    second = snippet.highlight(snippet.code)
+
+    # Each rendering gets its own copy of the highlighted text
+    assert first is not second
+    assert first.plain == second.plain
+    assert len(snippet._highlighted) == 1
+
+    console = Console(record=True, width=120)
+    console.print(snippet)
+    console.print(snippet)
+
+    assert console.export_text().count('lfs') >= 2
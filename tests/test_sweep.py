@@ -0,0 +1,92 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from drishti import sweep
+from drishti import thresholds
+
+
+def test_compute_nodes_of_the_jobs(sample, tmp_path, capsys):
+    pytest.importorskip('darshan')
+
+    grid = tmp_path / 'grid.json'
+    grid.write_text('{"small_requests": [0.1, 0.2]}')
+
+    sacct = tmp_path / 'sacct.txt'
+    sacct.write_text('JobID,JobIDRaw,NNodes,NCPUs\n1322696,1322696,4,128\n')
+
+    sweep.main([str(grid), sample, sample, '--job-info', str(sacct), '--format', 'json'])
+
+    document = json.loads(capsys.readouterr().out)
+
+    assert document['logs'] == 2
+    assert [job['compute_nodes'] for job in document['jobs']] == [4, 4]
+    assert [setting['thresholds'] for setting in document['settings']] == [{'small_requests': 0.1}, {'small_requests': 0.2}]
+
+
+BASE = {'SMALL_REQUESTS': 0.1, 'SMALL_REQUESTS_ABSOLUTE': 1000, 'RANDOM_OPERATIONS': 0.2}
+
+
+def test_grid_product():
+    settings = sweep.grid({'small_requests': [0.1, 0.2], 'THRESHOLD_RANDOM_OPERATIONS': [0.3, 0.4]}, BASE)
+
+    assert [(values['SMALL_REQUESTS'], values['RANDOM_OPERATIONS']) for values in settings] == [
+        (0.1, 0.3), (0.1, 0.4), (0.2, 0.3), (0.2, 0.4)
+    ]
+    assert all(values['SMALL_REQUESTS_ABSOLUTE'] == 1000 for values in settings)
+
+
+def test_grid_scalar():
+    settings = sweep.grid({'small_requests': [0.1, 0.2], 'small_requests_absolute': 10}, BASE)
+
+    assert [(values['SMALL_REQUESTS'], values['SMALL_REQUESTS_ABSOLUTE']) for values in settings] == [(0.1, 10), (0.2, 10)]
+
+
+def test_grid_sets():
+    settings = sweep.grid([{'small_requests': 0.3}, {'random_operations': 0.5}], BASE)
+
+    assert [(values['SMALL_REQUESTS'], values['RANDOM_OPERATIONS']) for values in settings] == [(0.3, 0.2), (0.1, 0.5)]
+
+
+@pytest.mark.parametrize('document', [
+    {'small_requests': [2.0]},
+    {'small_requests': 'high'},
+    {'unknown_threshold': [0.1]},
+    [0.1, 0.2],
+    0.1
+])
+def test_grid_invalid(document):
+    with pytest.raises(ValueError):
+        sweep.grid(document, BASE)
+
+
+def test_evaluate():
+    table = pd.DataFrame({
+        'reads': [100, 100, 100],
+        'writes': [0, 0, 0],
+        'operations': [100, 100, 100],
+        'small_reads': [50, 15, 0],
+        'small_writes': [0, 0, 0],
+        'mem_not_aligned': [0, 0, 0],
+        'file_not_aligned': [0, 0, 0],
+        'random_reads': [0, 0, 0],
+        'random_writes': [0, 0, 0]
+    })
+
+    # The first two files are in the first log, the last one in the second
+    logs = np.array([0, 0, 1])
+
+    base = dict(thresholds.DEFAULTS, SMALL_REQUESTS_ABSOLUTE=0)
+    settings = sweep.grid({'small_requests': [0.1, 0.2, 0.5]}, base)
+
+    result = sweep.evaluate(table, logs, settings)
+
+    column = result['codes'].index('P05')
+
+    assert result['files_per_rule'][:, column].tolist() == [2, 1, 0]
+
+    # The first log has 65 small reads out of 200
+    assert result['logs_per_rule'][:, column].tolist() == [1, 1, 0]
+    assert result['logs'].tolist() == [1, 1, 0]
@@ -0,0 +1,107 @@
+import gzip
+
+import numpy as np
+import pandas as pd
+
+from drishti import textlog
+
+
+HEADER = '''# darshan log version: 3.41
+# exe: ./app --input data
+# uid: 1000
+# jobid: 42
+# start_time: 1629532919.250
+# end_time: 1629532930
+# nprocs: 2
+# run time: 11.75
+# metadata: h = romio_no_indep_rw=true;cb_nodes=4
+'''
+
+RECORDS = [
+    ('POSIX', 0, 7, '/out/a'),
+    ('POSIX', 1, 7, '/out/a'),
+    ('POSIX', -1, 18446744073709551615, '/out/shared')
+]
+
+
+def write(path, compress=False):
+    lines = [HEADER, '\n# POSIX module data\n']
+
+    for module, rank, id, name in RECORDS:
+        for counter, value in (('POSIX_OPENS', rank + 2), ('POSIX_BYTES_WRITTEN', 100 * (rank + 2)), ('POSIX_F_WRITE_TIME', 0.5)):
+            lines.append('{}\t{}\t{}\t{}\t{}\t{}\t/out\tlustre\n'.format(module, rank, id, counter, value, name))
+
+    text = ''.join(lines).encode('utf-8')
+
+    if compress:
+        text = gzip.compress(text)
+
+    path.write_bytes(text)
+
+    return str(path)
+
+
+def test_is_text(tmp_path, sample):
+    assert textlog.is_text(write(tmp_path / 'job.txt'))
+    assert textlog.is_text(write(tmp_path / 'job.txt.gz', compress=True))
+    assert textlog.is_text('-')
+    assert not textlog.is_text(sample)
+
+
+def test_header(tmp_path):
+    report = textlog.TextReport(write(tmp_path / 'job.txt'))
+
+    job = report.metadata['job']
+
+    assert report.metadata['exe'] == './app --input data'
+    assert job['jobid'] == 42
+    assert job['nprocs'] == 2
+    assert job['start_time_sec'] == 1629532919
+    assert job['start_time_nsec'] == 250000000
+    assert job['end_time_nsec'] == 0
+    assert job['run_time'] == 11.75
+    assert job['metadata']['h'] == 'romio_no_indep_rw=true;cb_nodes=4'
+
+
+def test_records(tmp_path):
+    report = textlog.TextReport(write(tmp_path / 'job.txt.gz', compress=True))
+
+    df = report.records['POSIX'].to_df()
+
+    assert report.modules == {'POSIX': {'len': 3}}
+    assert report.name_records == {7: '/out/a', 18446744073709551615: '/out/shared'}
+
+    assert df['counters']['rank'].tolist() == [0, 1, -1]
+    assert df['counters']['id'].dtype == np.uint64
+    assert df['counters']['POSIX_BYTES_WRITTEN'].tolist() == [200, 300, 100]
+    assert df['counters']['POSIX_OPENS'].dtype == np.int64
+    assert df['fcounters']['POSIX_F_WRITE_TIME'].tolist() == [0.5, 0.5, 0.5]
+
+
+def test_chunks(tmp_path):
+    path = write(tmp_path / 'job.txt')
+
+    whole = textlog.TextReport(path).records['POSIX']
+
+    # Chunks of a few lines split the counters of every record, which carry over to the next chunk
+    for chunk in (1, 150, 400):
+        report = textlog.TextReport(path, chunk=chunk)
+
+        pd.testing.assert_frame_equal(report.records['POSIX'].counters, whole.counters)
+        pd.testing.assert_frame_equal(report.records['POSIX'].fcounters, whole.fcounters)
+
+
+def test_parser_output(parser_output, sample):
+    import darshan
+
+    expected = darshan.DarshanReport(sample, read_all=False)
+    expected.read_all_generic_records()
+
+    report = textlog.TextReport(str(parser_output), chunk=1024 ** 2)
+
+    for module in ('POSIX', 'MPI-IO', 'STDIO'):
+        df = report.records[module].to_df()
+        reference = expected.records[module].to_df()
+
+        assert len(df['counters']) == len(reference['counters'])
+        assert df['counters'].drop(columns='id').equals(reference['counters'].drop(columns='id'))
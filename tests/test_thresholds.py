@@ -0,0 +1,62 @@
+import pytest
+
+from drishti import thresholds
+
+
+@pytest.fixture
+def restore():
+    values = thresholds.current()
+
+    yield
+
+    vars(thresholds).update(values)
+
+
+def test_name():
+    assert thresholds.name('small_requests') == 'SMALL_REQUESTS'
+    assert thresholds.name('threshold_small_requests') == 'SMALL_REQUESTS'
+
+    with pytest.raises(ValueError):
+        thresholds.name('unknown')
+
+
+@pytest.mark.parametrize('values', [
+    {'SMALL_REQUESTS': 1.5},
+    {'SMALL_REQUESTS': True},
+    {'SMALL_REQUESTS': '0.1'},
+    {'BASELINE_RUNS': 1},
+    {'HEATMAP_BURSTINESS': 0.5}
+])
+def test_validate(values):
+    with pytest.raises(ValueError):
+        thresholds.validate(values)
+
+
+def test_load(tmp_path, restore):
+    config = tmp_path / 'thresholds.json'
+    config.write_text('{"small_requests": 0.2, "THRESHOLD_RANDOM_OPERATIONS_ABSOLUTE": 5000}')
+
+    thresholds.load(str(config))
+
+    assert thresholds.SMALL_REQUESTS == 0.2
+    assert thresholds.RANDOM_OPERATIONS_ABSOLUTE == 5000
+    assert thresholds.current()['METADATA'] == thresholds.DEFAULTS['METADATA']
+
+
+def test_load_invalid(tmp_path, restore):
+    config = tmp_path / 'thresholds.json'
+    config.write_text('{"small_requests": 0.2, "metadata": 2}')
+
+    with pytest.raises(ValueError):
+        thresholds.load(str(config))
+
+    # Nothing is overridden when any threshold is invalid
+    assert thresholds.SMALL_REQUESTS == thresholds.DEFAULTS['SMALL_REQUESTS']
+
+
+def test_read_not_a_mapping(tmp_path):
+    config = tmp_path / 'thresholds.json'
+    config.write_text('[0.2]')
+
+    with pytest.raises(ValueError):
+        thresholds.read(str(config))
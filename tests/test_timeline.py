@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from drishti import timeline
+
+
+def test_average():
+    edges = np.array([0.0, 2.0, 4.0, 6.0])
+
+    # Weight 1 over [1, 5) and weight 2 over [3, 4)
+    result = timeline._average(np.array([1.0, 3.0]), np.array([5.0, 4.0]), np.array([1.0, 2.0]), edges)
+
+    assert result.tolist() == pytest.approx([0.5, 2.0, 0.5])
+    assert timeline._average(np.array([]), np.array([]), np.array([]), edges).tolist() == [0.0, 0.0, 0.0]
+
+
+def test_union_by():
+    starts = np.array([0.0, 2.0, 1.0, 8.0])
+    ends = np.array([3.0, 5.0, 4.0, 9.0])
+    groups = np.array([0, 0, 1, 1])
+
+    merged_starts, merged_ends = timeline._union_by(starts, ends, groups, 10.0)
+
+    # Intervals only merge within their group
+    assert sorted(zip(merged_starts.tolist(), merged_ends.tolist())) == [(0.0, 5.0), (1.0, 4.0), (8.0, 9.0)]
+
+
+def test_bandwidth():
+    edges = np.array([0.0, 1.0, 2.0])
+
+    # 100 bytes spread over [0, 2), and 30 bytes too fast to have a duration at 1.5
+    result = timeline._bandwidth(np.array([0.0, 1.5]), np.array([2.0, 1.5]), np.array([100.0, 30.0]), edges)
+
+    assert result.tolist() == pytest.approx([50.0, 80.0])
+
+
+def test_runs():
+    assert timeline._runs(np.array([False, True, True, False, True])) == [(1, 3), (4, 5)]
+    assert timeline._runs(np.array([], dtype=bool)) == []
+
+
+def test_reconstruct():
+    counters = pd.DataFrame({
+        'id': np.array([1, 1, 2], dtype=np.uint64),
+        'rank': [0, 1, -1],
+        'POSIX_BYTES_READ': [0, 0, 400],
+        'POSIX_BYTES_WRITTEN': [100, 100, 0]
+    })
+
+    fcounters = pd.DataFrame({
+        'id': counters['id'],
+        'rank': counters['rank'],
+        'POSIX_F_OPEN_START_TIMESTAMP': [0.0, 0.0, 4.0],
+        'POSIX_F_CLOSE_END_TIMESTAMP': [2.0, 2.0, 10.0],
+        'POSIX_F_READ_START_TIMESTAMP': [0.0, 0.0, 6.0],
+        'POSIX_F_READ_END_TIMESTAMP': [0.0, 0.0, 10.0],
+        'POSIX_F_WRITE_START_TIMESTAMP': [0.0, 1.0, 0.0],
+        'POSIX_F_WRITE_END_TIMESTAMP': [1.0, 2.0, 0.0]
+    })
+
+    result = timeline.reconstruct(counters, fcounters, 4, bins=5)
+
+    assert result['end'][-1] == 10.0
+
+    # One rank writes at a time, then the shared record counts as all the ranks
+    assert result['ranks'].tolist() == pytest.approx([1.0, 0.0, 0.0, 4.0, 4.0])
+    assert result['files'].tolist() == pytest.approx([1.0, 0.0, 1.0, 1.0, 1.0])
+    assert result['write_bandwidth'].tolist() == pytest.approx([100.0, 0.0, 0.0, 0.0, 0.0])
+    assert result['read_bandwidth'].tolist() == pytest.approx([0.0, 0.0, 0.0, 100.0, 100.0])
+
+    assert timeline.phases(result) == [(0.0, 2.0, 200.0, 100.0), (6.0, 10.0, 400.0, 100.0)]
+    assert timeline.serialized(result) == [(0.0, 2.0)]